@@ -0,0 +1,6 @@
+# benchmarks/__init__.py
+"""
+Bancs de performance et de vérification de la calculatrice (voir
+benchmarks.suite, benchmarks.comparer, benchmarks.precision et
+benchmarks.differentiel).
+"""
@@ -0,0 +1,187 @@
+# benchmarks/comparer.py
+"""
+================================================================================
+Comparaison de deux mesures des bancs : détection des régressions - VERSION 4.0
+================================================================================
+
+    $ python -m benchmarks.comparer benchmarks/reference.json actuel.json
+    banc                               référence      actuel   rapport        p  verdict
+    analyse.tokenize                    135.5 µs    136.0 µs     1.00x   0.4210  stable
+    noyau.exponentielle                  20.0 ms     25.1 ms     1.26x   0.0000  RÉGRESSION
+    ...
+
+Code de sortie : 1 si un banc a régressé (utilisable comme barrière
+d'intégration continue), 0 sinon.
+
+RÉGRESSION :
+------------
+    Un banc régresse si ses deux conditions sont remplies :
+        - SIGNIFICATIVE : le test de Mann-Whitney unilatéral (les temps
+          actuels sont-ils plus grands ?) donne p < alpha (défaut 0.01) ;
+          ce test de rangs ne suppose pas de loi normale et résiste aux
+          répétitions aberrantes (interruption du système...) ;
+        - IMPORTANTE : le rapport des médianes dépasse 1 + seuil (défaut
+          5 %) : un écart minuscule mais certain n'arrête pas l'intégration.
+    Symétriquement, un banc nettement et significativement plus rapide
+    est une AMÉLIORATION.
+
+Les deux fichiers doivent venir de la même machine : si leurs
+environnements diffèrent, un avertissement est affiché.
+
+================================================================================
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+
+# Niveau du test de Mann-Whitney
+ALPHA = 0.01
+
+# Écart relatif minimal des médianes
+SEUIL = 0.05
+
+
+def mann_whitney(reference: list, actuel: list) -> float:
+    """
+    Probabilité p (test de Mann-Whitney unilatéral, approximation normale
+    avec correction des ex-aequo et de continuité) d'observer des temps
+    actuels au moins aussi grands si les deux séries avaient la même loi.
+
+    Examples:
+        >>> mann_whitney([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) < 0.01
+        True
+        >>> mann_whitney([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) > 0.99
+        True
+    """
+    n1, n2 = len(reference), len(actuel)
+    if not n1 or not n2:
+        return 1.0
+    valeurs = sorted([(v, 0) for v in reference] + [(v, 1) for v in actuel])
+    n = n1 + n2
+
+    # Rangs moyens des ex-aequo
+    rangs_actuel = 0.0
+    correction = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and valeurs[j + 1][0] == valeurs[i][0]:
+            j += 1
+        rang = (i + j) / 2 + 1
+        egaux = j - i + 1
+        correction += egaux ** 3 - egaux
+        rangs_actuel += rang * sum(1 for k in range(i, j + 1) if valeurs[k][1])
+        i = j + 1
+
+    u = rangs_actuel - n2 * (n2 + 1) / 2
+    moyenne = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - correction / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0  # Toutes les valeurs égales
+    z = (u - moyenne - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mediane(valeurs: list) -> float:
+    valeurs = sorted(valeurs)
+    milieu = len(valeurs) // 2
+    return valeurs[milieu] if len(valeurs) % 2 else (valeurs[milieu - 1] + valeurs[milieu]) / 2
+
+
+def comparer(reference: dict, actuel: dict, alpha=ALPHA, seuil=SEUIL) -> list:
+    """
+    Compare deux fichiers de benchmarks.suite.
+
+    Returns:
+        list: Un dict par banc : nom, reference et actuel (médianes, en
+              secondes par appel, None si absent), rapport, p, verdict
+              ('regression', 'amelioration', 'stable', 'nouveau', 'absent')
+    """
+    bancs_reference = reference.get('bancs', {})
+    bancs_actuel = actuel.get('bancs', {})
+    lignes = []
+    for nom in list(bancs_reference) + [nom for nom in bancs_actuel if nom not in bancs_reference]:
+        avant = bancs_reference.get(nom)
+        apres = bancs_actuel.get(nom)
+        ligne = {'nom': nom, 'reference': None, 'actuel': None, 'rapport': None, 'p': None}
+        if avant is not None:
+            ligne['reference'] = mediane(avant['temps'])
+        if apres is not None:
+            ligne['actuel'] = mediane(apres['temps'])
+        if avant is None or apres is None:
+            ligne['verdict'] = 'nouveau' if avant is None else 'absent'
+            lignes.append(ligne)
+            continue
+
+        ligne['rapport'] = ligne['actuel'] / ligne['reference'] if ligne['reference'] else math.inf
+        p_plus_lent = mann_whitney(avant['temps'], apres['temps'])
+        p_plus_rapide = mann_whitney(apres['temps'], avant['temps'])
+        if p_plus_lent < alpha and ligne['rapport'] > 1 + seuil:
+            ligne['verdict'], ligne['p'] = 'regression', p_plus_lent
+        elif p_plus_rapide < alpha and ligne['rapport'] < 1 / (1 + seuil):
+            ligne['verdict'], ligne['p'] = 'amelioration', p_plus_rapide
+        else:
+            ligne['verdict'], ligne['p'] = 'stable', min(p_plus_lent, p_plus_rapide)
+        lignes.append(ligne)
+    return lignes
+
+
+def formater_duree(secondes) -> str:
+    """
+    Examples:
+        >>> formater_duree(0.0001355)
+        '135.5 µs'
+    """
+    if secondes is None:
+        return '-'
+    for unite, facteur in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if secondes >= facteur:
+            return f"{secondes / facteur:.1f} {unite}"
+    return f"{secondes / 1e-9:.1f} ns"
+
+
+def formater_rapport(lignes: list) -> str:
+    """Tableau texte des comparaisons."""
+    verdicts = {'regression': 'RÉGRESSION', 'amelioration': 'amélioration', 'stable': 'stable',
+                'nouveau': 'nouveau', 'absent': 'absent'}
+    largeur = max([len(ligne['nom']) for ligne in lignes] + [4])
+    texte = [f"{'banc':<{largeur}}  {'référence':>10}  {'actuel':>10}  {'rapport':>8}  {'p':>7}  verdict"]
+    for ligne in lignes:
+        rapport = f"{ligne['rapport']:.2f}x" if ligne['rapport'] is not None else '-'
+        p = f"{ligne['p']:.4f}" if ligne['p'] is not None else '-'
+        texte.append(f"{ligne['nom']:<{largeur}}  {formater_duree(ligne['reference']):>10}  "
+                     f"{formater_duree(ligne['actuel']):>10}  {rapport:>8}  {p:>7}  {verdicts[ligne['verdict']]}")
+    return '\n'.join(texte)
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée de python -m benchmarks.comparer."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(prog='python -m benchmarks.comparer',
+                                        description="Compare deux mesures ; échoue sur une régression.")
+    analyseur.add_argument('reference', help="fichier JSON de référence")
+    analyseur.add_argument('actuel', help="fichier JSON mesuré")
+    analyseur.add_argument('--alpha', type=float, default=ALPHA, help="niveau du test statistique")
+    analyseur.add_argument('--seuil', type=float, default=SEUIL, help="écart relatif minimal des médianes")
+    options = analyseur.parse_args(arguments)
+
+    reference = json.loads(Path(options.reference).read_text(encoding='utf-8'))
+    actuel = json.loads(Path(options.actuel).read_text(encoding='utf-8'))
+    if reference.get('environnement') != actuel.get('environnement'):
+        print("Attention : les deux mesures viennent d'environnements différents", file=sys.stderr)
+
+    lignes = comparer(reference, actuel, options.alpha, options.seuil)
+    print(formater_rapport(lignes))
+    regressions = [ligne['nom'] for ligne in lignes if ligne['verdict'] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) : {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
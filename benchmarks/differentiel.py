@@ -0,0 +1,1141 @@
+# benchmarks/differentiel.py
+"""
+================================================================================
+Test différentiel : expressions aléatoires contre une référence - VERSION 4.0
+================================================================================
+
+Tire au hasard des expressions valides (grammaire des fonctions réelles
+de la calculatrice), les calcule avec calculer() et avec une évaluation
+de référence en haute précision, et compare les résultats ET les classes
+d'erreur. Chaque désaccord est réduit automatiquement à la plus petite
+expression qui le reproduit.
+
+    $ python -m benchmarks.differentiel -n 1000000            # tous les cœurs
+    $ python -m benchmarks.differentiel -n 100000 --sans exp,ln,log
+    $ python -m benchmarks.differentiel --cible session --reference interpreteur
+
+    5000 expressions en 28.8 s (173/s, 2 processus)
+      accords : 4435   non comparées : 28   désaccords : 537
+
+    10 ^ 317.6 : 18 fois
+        obtenu    : plantage (OverflowError: (34, 'Numerical result out of range'))
+        attendu   : inf (± 0)
+        exemple   : (median(10 + 9543222775672, 32405893185, ...) - 320.4139) ^ (5 - 317.65)
+
+    ln(265) : 15 fois
+        obtenu    : 5.481105972365066
+        attendu   : 5.579729825986222 (± 1.67e-08)
+        exemple   : -(ln(265.90350) - 0)
+    ...
+
+Les désaccords réduits sont regroupés par gabarit (ln(265) et ln(899)
+sont un même désaccord) ; « N fois » compte les désaccords réduits du
+groupe. Code de sortie : 1 s'il y a un désaccord.
+
+MOTEURS :
+---------
+    calculer      src.calculateur.calculer (caches d'analyse, optimisations)
+    session       une Session avec le mémo des résultats (src.memo)
+    interpreteur  evaluer_rpn(infix_to_rpn(tokenize(...))) : l'interpréteur
+                  actuel, sans cache ni optimisation
+    decimal       la référence : chaque opération est calculée exactement
+                  (module decimal) puis arrondie au flottant le plus proche,
+                  comme le ferait un interpréteur flottant idéal
+
+    --cible choisit le moteur vérifié (défaut : calculer), --reference
+    celui auquel il est comparé (défaut : decimal). Une future voie rapide
+    s'ajoute à MOTEURS et se vérifie contre l'interpréteur actuel.
+
+ACCORD :
+--------
+    Les deux moteurs doivent donner la même classe de résultat : une
+    valeur (±inf et NaN compris), ou la même erreur (DivisionParZeroError,
+    LogarithmeError...). Un résultat complexe, un délai dépassé (boucle
+    infinie : DELAI secondes par expression, sous Unix) ou toute autre
+    exception sont aussi des classes.
+
+    Entre deux moteurs, les valeurs s'accordent à la tolérance relative
+    près (défaut 1e-9). Contre la référence decimal, la tolérance vaut
+    pour CHAQUE opération : la référence est recalculée en décalant chaque
+    résultat intermédiaire de ±tolérance, et l'écart admis grandit avec
+    la sensibilité de l'expression (10000000000000000 + 1 - 10000000000000000).
+    Si un décalage change la classe du résultat (condition limite, pôle de
+    la tangente...), l'expression est instable : elle n'est pas comparée,
+    comme celles dont la référence est complexe ((-8)^0.3).
+
+RÉDUCTION :
+-----------
+    Tant qu'une expression plus courte reproduit le même désaccord, elle
+    la remplace : un sous-arbre remonté à la place de son parent, une
+    sous-expression remplacée par sa valeur, un nombre raccourci, un
+    argument retiré (même désaccord : mêmes classes de résultat des deux
+    moteurs). Seuls les REDUCTIONS_PAR_LOT premiers désaccords d'un lot
+    sont réduits ; les suivants sont comptés.
+
+PROCESSUS :
+-----------
+    Les expressions sont tirées par lots de TAILLE_LOT, chaque lot avec sa
+    graine (graine du test, numéro du lot) : les mêmes expressions sont
+    vérifiées quel que soit le nombre de processus. Chaque lot est vérifié
+    et réduit dans un processus (comme src.lot) ; au plus 2 lots par
+    processus sont en cours.
+
+Hors de la grammaire : nombres complexes, matrices, tirages aléatoires,
+fonctions de l'utilisateur, mode programmeur.
+
+================================================================================
+"""
+
+import importlib
+import math
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Context, Decimal, MAX_EMAX, MIN_EMIN
+from pathlib import Path
+
+# Exécutable depuis la racine du dépôt (python -m benchmarks.differentiel)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.precision import sin_cos, valeur_pi
+from src import calculateur
+from src.exceptions import CalculatriceError
+
+
+# Expressions tirées avec la même graine, vérifiées par un même processus
+TAILLE_LOT = 500
+
+# Profondeur maximale des arbres d'expression
+PROFONDEUR = 4
+
+# Écart relatif admis par opération
+TOLERANCE = 1e-9
+
+# Secondes allouées au calcul d'une expression par le moteur vérifié
+DELAI = 0.1
+
+# Chiffres de la référence exacte
+CHIFFRES = 30
+
+# Recalculs décalés de la référence (sensibilité de l'expression)
+DECALAGES = 2
+
+# Désaccords réduits par lot (les suivants sont seulement comptés)
+REDUCTIONS_PAR_LOT = 10
+
+# Essais au plus pour réduire un désaccord
+ESSAIS_REDUCTION = 400
+
+GRAINE = 20240101
+
+
+#=============================================================================
+# GRAMMAIRE
+#=============================================================================
+
+# Arbre d'expression : genre ('nombre', 'constante', 'variable', 'neg',
+# 'parentheses', 'operateur', 'fonction'), valeur (texte du nombre, nom de
+# l'opérateur ou de la fonction) et enfants (tuple de Noeud)
+Noeud = namedtuple('Noeud', ['genre', 'valeur', 'enfants'])
+
+OPERATEURS = ('+', '-', '*', '/', '%', '^')
+COMPARAISONS = ('<', '>', '<=', '>=', '==', '!=')
+FONCTIONS_REELLES = ('sqrt', 'abs', 'sin', 'cos', 'tan', 'sind', 'cosd', 'tand',
+                     'ln', 'log', 'exp', 'inv', 'sqr')
+FONCTIONS_STATISTIQUES = ('min', 'max', 'sum', 'mean', 'var', 'stdev', 'median')
+FONCTIONS_CONDITIONNELLES = ('if', 'piecewise')
+FONCTIONS_ENTIERES = ('fact', 'isprime', 'gcd', 'lcm', 'ncr', 'npr', 'powmod')
+FONCTIONS_INDICEES = ('sigma', 'prod')
+
+# Familles de la grammaire et leur poids dans le tirage d'un nœud
+FAMILLES = (
+    (OPERATEURS, 40),
+    (FONCTIONS_REELLES, 22),
+    (FONCTIONS_STATISTIQUES, 10),
+    (COMPARAISONS, 6),
+    (FONCTIONS_CONDITIONNELLES, 6),
+    (FONCTIONS_ENTIERES, 6),
+    (FONCTIONS_INDICEES, 3),
+    (('neg',), 7),
+)
+
+# Tout ce que --sans et --avec peuvent nommer
+CONSTRUCTIONS = tuple(nom for famille, _ in FAMILLES for nom in famille)
+
+# Priorités de l'analyseur (voir calculateur.infix_to_rpn)
+PRIORITES = {**{comparaison: 0 for comparaison in COMPARAISONS},
+             '+': 5, '-': 5, '*': 6, '/': 6, '%': 6, '^': 7}
+PRIORITE_NEG = 8
+PRIORITE_ATOME = 9
+
+# Indice des sommes et produits indicés
+INDICE = 'k'
+
+
+class Generateur:
+    """
+    Tire des arbres d'expressions valides, reproductibles par leur graine.
+
+    Examples:
+        >>> ecrire(Generateur(1).expression()) == ecrire(Generateur(1).expression())
+        True
+    """
+
+    def __init__(self, graine, profondeur=PROFONDEUR, constructions=CONSTRUCTIONS):
+        self.aleatoire = random.Random(graine)
+        self.profondeur = profondeur
+        self.familles = [(tuple(nom for nom in famille if nom in constructions), poids)
+                         for famille, poids in FAMILLES]
+        self.familles = [(famille, poids) for famille, poids in self.familles if famille]
+
+    def expression(self) -> Noeud:
+        return self._noeud(0, indice=False)
+
+    def _noeud(self, profondeur: int, indice: bool) -> Noeud:
+        """Nœud quelconque ; indice : dans le corps d'un sigma ou d'un prod."""
+        aleatoire = self.aleatoire
+        if (not self.familles or profondeur >= self.profondeur
+                or aleatoire.random() < 0.2 + 0.15 * profondeur):
+            return self._feuille(indice)
+        if aleatoire.random() < 0.04:
+            return Noeud('parentheses', None, (self._noeud(profondeur + 1, indice),))
+
+        familles, poids = zip(*self.familles)
+        famille = aleatoire.choices(familles, poids)[0]
+        nom = aleatoire.choice(famille)
+        suivant = profondeur + 1
+
+        if nom == 'neg':
+            return Noeud('neg', None, (self._noeud(suivant, indice),))
+        if nom in OPERATEURS or nom in COMPARAISONS:
+            gauche = self._noeud(suivant, indice)
+            if nom == '^' and aleatoire.random() < 0.5:
+                droite = self._entier(-3, 10)  # Exposants entiers : chemin propre du noyau
+            else:
+                droite = self._noeud(suivant, indice)
+            return Noeud('operateur', nom, (gauche, droite))
+        if nom in FONCTIONS_REELLES:
+            return Noeud('fonction', nom, (self._noeud(suivant, indice),))
+        if nom in FONCTIONS_STATISTIQUES:
+            nombre = aleatoire.randint(1, 4)
+            return Noeud('fonction', nom, tuple(self._noeud(suivant, indice) for _ in range(nombre)))
+        if nom == 'if':
+            return Noeud('fonction', nom, (self._condition(suivant, indice),
+                                           self._noeud(suivant, indice), self._noeud(suivant, indice)))
+        if nom == 'piecewise':
+            morceaux = []
+            for _ in range(aleatoire.randint(1, 2)):
+                morceaux += [self._condition(suivant, indice), self._noeud(suivant, indice)]
+            if aleatoire.random() < 0.8:
+                morceaux.append(self._noeud(suivant, indice))
+            return Noeud('fonction', nom, tuple(morceaux))
+        if nom in FONCTIONS_INDICEES:
+            if indice:  # Pas de somme indicée dans une autre : même indice
+                return self._feuille(indice)
+            debut = aleatoire.randint(-3, 5)
+            return Noeud('fonction', nom, (self._noeud(suivant, indice=True), Noeud('variable', INDICE, ()),
+                                           self._entier(debut, debut), self._entier(debut - 1, debut + 10)))
+        return self._fonction_entiere(nom)
+
+    def _condition(self, profondeur: int, indice: bool) -> Noeud:
+        """Comparaison le plus souvent, expression quelconque sinon."""
+        if self.aleatoire.random() < 0.7:
+            comparaison = self.aleatoire.choice(COMPARAISONS)
+            return Noeud('operateur', comparaison, (self._noeud(profondeur + 1, indice),
+                                                    self._noeud(profondeur + 1, indice)))
+        return self._noeud(profondeur, indice)
+
+    def _fonction_entiere(self, nom: str) -> Noeud:
+        """Fonction arithmétique, sur des littéraux entiers (parfois non entiers)."""
+        aleatoire = self.aleatoire
+        if nom == 'fact':
+            arguments = (self._entier(-1, 20),)
+        elif nom == 'isprime':
+            arguments = (self._entier(-10, 1000),)
+        elif nom in ('gcd', 'lcm'):
+            arguments = tuple(self._entier(-100, 100) for _ in range(aleatoire.randint(1, 3)))
+        elif nom in ('ncr', 'npr'):
+            arguments = (self._entier(-1, 30), self._entier(-1, 30))
+        else:  # powmod
+            arguments = (self._entier(0, 1000), self._entier(-1, 50), self._entier(0, 100))
+        return Noeud('fonction', nom, arguments)
+
+    def _entier(self, bas: int, haut: int) -> Noeud:
+        """Littéral entier de [bas, haut], une fois sur dix non entier."""
+        valeur = self.aleatoire.randint(bas, haut)
+        texte = str(abs(valeur))
+        if self.aleatoire.random() < 0.1:
+            texte += '.5'
+        feuille = Noeud('nombre', texte, ())
+        return Noeud('neg', None, (feuille,)) if valeur < 0 else feuille
+
+    def _feuille(self, indice: bool) -> Noeud:
+        aleatoire = self.aleatoire
+        tirage = aleatoire.random()
+        if indice and tirage < 0.3:
+            return Noeud('variable', INDICE, ())
+        if tirage < 0.05:
+            return Noeud('constante', aleatoire.choice(('pi', 'e')), ())
+        return Noeud('nombre', self._nombre(), ())
+
+    def _nombre(self) -> str:
+        """Texte d'un nombre positif, de toutes les grandeurs (sans exposant)."""
+        aleatoire = self.aleatoire
+        forme = aleatoire.random()
+        if forme < 0.35:
+            return str(aleatoire.randint(0, 10))
+        if forme < 0.5:
+            return str(aleatoire.randint(0, 10 ** aleatoire.randint(2, 15)))
+        if forme < 0.8:
+            return f"{aleatoire.randint(0, 999)}.{aleatoire.randint(1, 10 ** aleatoire.randint(1, 6) - 1)}"
+        if forme < 0.9:
+            return f"0.{'0' * aleatoire.randint(1, 12)}{aleatoire.randint(1, 9999)}"
+        return f"{aleatoire.randint(10 ** 8, 10 ** 12)}.{aleatoire.randint(0, 99)}"
+
+
+def ecrire(noeud: Noeud) -> str:
+    """
+    Texte d'un arbre, avec les seules parenthèses nécessaires (et celles
+    des nœuds 'parentheses').
+
+    Examples:
+        >>> ecrire(Noeud('operateur', '^', (Noeud('neg', None, (Noeud('nombre', '2', ()),)),
+        ...                                  Noeud('nombre', '2', ()))))
+        '-2 ^ 2'
+    """
+    genre = noeud.genre
+    if genre in ('nombre', 'constante', 'variable'):
+        return noeud.valeur
+    if genre == 'parentheses':
+        return f"({ecrire(noeud.enfants[0])})"
+    if genre == 'fonction':
+        return f"{noeud.valeur}({', '.join(ecrire(enfant) for enfant in noeud.enfants)})"
+    if genre == 'neg':
+        enfant = noeud.enfants[0]
+        # --3 est refusé : le moins unaire s'applique à un atome
+        texte = ecrire(enfant)
+        return f"-{texte}" if _priorite(enfant) == PRIORITE_ATOME else f"-({texte})"
+
+    gauche, droite = noeud.enfants
+    priorite = PRIORITES[noeud.valeur]
+    texte_gauche, texte_droite = ecrire(gauche), ecrire(droite)
+    # '^' est associatif à droite, les autres à gauche
+    if _priorite(gauche) < priorite or (_priorite(gauche) == priorite and noeud.valeur == '^'):
+        texte_gauche = f"({texte_gauche})"
+    if _priorite(droite) < priorite or (_priorite(droite) == priorite and noeud.valeur != '^'):
+        texte_droite = f"({texte_droite})"
+    return f"{texte_gauche} {noeud.valeur} {texte_droite}"
+
+
+def _priorite(noeud: Noeud) -> int:
+    if noeud.genre == 'operateur':
+        return PRIORITES[noeud.valeur]
+    if noeud.genre == 'neg':
+        return PRIORITE_NEG
+    return PRIORITE_ATOME
+
+
+#=============================================================================
+# RÉFÉRENCE
+#=============================================================================
+
+# Résultat d'un moteur : classe ('valeur', 'complexe', nom de l'erreur
+# levée, 'delai', 'plantage') et valeur (float pour 'valeur', sinon détail)
+Resultat = namedtuple('Resultat', ['classe', 'valeur'])
+
+
+class _Erreur(Exception):
+    """Erreur de la référence, de la classe de celle que doit lever le moteur."""
+
+    def __init__(self, classe: str):
+        super().__init__(classe)
+        self.classe = classe
+
+
+class _Exacte:
+    """Opérations exactes (decimal), arrondies ensuite au flottant le plus proche."""
+
+    def __init__(self, chiffres=CHIFFRES):
+        self.chiffres = chiffres
+        # Sans exception : un dépassement donne Infinity, une forme indéterminée NaN
+        self.contexte = Context(prec=chiffres, Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[])
+
+    def operation(self, operateur: str, a: float, b: float) -> float:
+        c = self.contexte
+        x, y = Decimal(a), Decimal(b)
+        if operateur == '+':
+            return float(c.add(x, y))
+        if operateur == '-':
+            return float(c.subtract(x, y))
+        if operateur == '*':
+            return float(c.multiply(x, y))
+        if operateur == '/':
+            return float(c.divide(x, y))
+        return float(c.power(x, y))
+
+    def fonction(self, nom: str, x: float) -> float:
+        c = self.contexte
+        if nom == 'sqrt':
+            return float(c.sqrt(Decimal(x)))
+        if nom == 'exp':
+            return float(c.exp(Decimal(x)))
+        if nom == 'ln':
+            return float(c.ln(Decimal(x)))
+        return float(c.log10(Decimal(x)))
+
+    def sin_cos(self, x: float, degres=False) -> tuple:
+        if degres:
+            contexte = self.contexte.copy()
+            contexte.prec = self.chiffres + 10 + len(str(int(abs(x))))
+            x = contexte.divide(contexte.multiply(Decimal(x), valeur_pi(contexte.prec)), 180)
+        return sin_cos(x, self.chiffres)
+
+    def somme(self, valeurs: list) -> float:
+        return float(self._somme(valeurs))
+
+    def _somme(self, valeurs: list) -> Decimal:
+        # Somme exacte : la précision suffit pour tous les chiffres des termes
+        contexte = self.contexte.copy()
+        contexte.prec = 700
+        total = Decimal(0)
+        for valeur in valeurs:
+            total = contexte.add(total, Decimal(valeur))
+        return total
+
+    def moyenne(self, valeurs: list) -> float:
+        return float(self.contexte.divide(self._somme(valeurs), len(valeurs)))
+
+    def variance(self, valeurs: list) -> float:
+        c = self.contexte.copy()
+        c.prec = 2 * self.chiffres
+        moyenne = c.divide(self._somme(valeurs), len(valeurs))
+        carres = sum((c.power(c.subtract(Decimal(v), moyenne), 2) for v in valeurs), Decimal(0))
+        return c.divide(carres, len(valeurs) - 1)
+
+    def ecart_type(self, valeurs: list) -> float:
+        return float(self.contexte.sqrt(self.variance(valeurs)))
+
+    def produit(self, valeurs: list) -> float:
+        total = Decimal(1)
+        for valeur in valeurs:
+            total = self.contexte.multiply(total, Decimal(valeur))
+        return float(total)
+
+
+class _Flottante:
+    """Mêmes opérations en flottants (libm) : pour les recalculs décalés."""
+
+    def operation(self, operateur: str, a: float, b: float) -> float:
+        try:
+            if operateur == '+':
+                return a + b
+            if operateur == '-':
+                return a - b
+            if operateur == '*':
+                return a * b
+            if operateur == '/':
+                return a / b
+            return math.pow(a, b)
+        except OverflowError:
+            return math.inf
+
+    def fonction(self, nom: str, x: float) -> float:
+        if math.isinf(x) or math.isnan(x):
+            return _Exacte().fonction(nom, x)
+        try:
+            return {'sqrt': math.sqrt, 'exp': math.exp, 'ln': math.log, 'log': math.log10}[nom](x)
+        except OverflowError:
+            return math.inf
+
+    def sin_cos(self, x: float, degres=False) -> tuple:
+        if degres:
+            x = math.radians(x)
+        return math.sin(x), math.cos(x)
+
+    def somme(self, valeurs: list) -> float:
+        return math.fsum(valeurs) if all(map(math.isfinite, valeurs)) else sum(valeurs)
+
+    def moyenne(self, valeurs: list) -> float:
+        return self.somme(valeurs) / len(valeurs)
+
+    def variance(self, valeurs: list) -> float:
+        moyenne = self.moyenne(valeurs)
+        return math.fsum((v - moyenne) ** 2 for v in valeurs) / (len(valeurs) - 1)
+
+    def ecart_type(self, valeurs: list) -> float:
+        return math.sqrt(self.variance(valeurs))
+
+    def produit(self, valeurs: list) -> float:
+        return math.prod(valeurs)
+
+
+class Reference:
+    """
+    Évaluation de référence d'un arbre : chaque opération exacte, arrondie
+    au flottant le plus proche, avec les conventions de la calculatrice
+    (0^0 = 1, a % b du signe de b, tan non définie si |cos| < 1e-10...).
+
+    Examples:
+        >>> arbre = Noeud('fonction', 'sqrt', (Noeud('nombre', '2', ()),))
+        >>> Reference().evaluer(arbre)
+        Resultat(classe='valeur', valeur=1.4142135623730951)
+    """
+
+    def __init__(self, tolerance=0.0, graine=None, chiffres=CHIFFRES):
+        """
+        Args:
+            tolerance: Si non nulle, chaque résultat intermédiaire est
+                       décalé de ±tolerance (signe tiré avec la graine), et
+                       les opérations sont celles de libm
+        """
+        self.tolerance = tolerance
+        self.aleatoire = random.Random(graine)
+        self.arithmetique = _Flottante() if tolerance else _Exacte(chiffres)
+
+    def evaluer(self, noeud: Noeud) -> Resultat:
+        try:
+            return Resultat('valeur', self._evaluer(noeud, {}))
+        except _Erreur as e:
+            return Resultat(e.classe, None)
+
+    def _decaler(self, valeur: float) -> float:
+        if not self.tolerance:
+            return valeur
+        return valeur * (1 + self.aleatoire.choice((-1, 1)) * self.tolerance)
+
+    def _evaluer(self, noeud: Noeud, indices: dict) -> float:
+        genre = noeud.genre
+        if genre == 'nombre':
+            return float(noeud.valeur)
+        if genre == 'constante':
+            return math.pi if noeud.valeur == 'pi' else math.e
+        if genre == 'variable':
+            return indices[noeud.valeur]
+        if genre == 'parentheses':
+            return self._evaluer(noeud.enfants[0], indices)
+        if genre == 'neg':
+            return -self._evaluer(noeud.enfants[0], indices)
+        if genre == 'operateur':
+            a = self._evaluer(noeud.enfants[0], indices)
+            b = self._evaluer(noeud.enfants[1], indices)
+            if noeud.valeur in COMPARAISONS:
+                return _comparer(noeud.valeur, a, b)
+            return self._decaler(self._operation(noeud.valeur, a, b))
+
+        nom = noeud.valeur
+        if nom == 'if':
+            condition = self._evaluer(noeud.enfants[0], indices)
+            return self._evaluer(noeud.enfants[1 if condition != 0 else 2], indices)
+        if nom == 'piecewise':
+            morceaux = noeud.enfants
+            for i in range(0, len(morceaux) - 1, 2):
+                if self._evaluer(morceaux[i], indices) != 0:
+                    return self._evaluer(morceaux[i + 1], indices)
+            if len(morceaux) % 2 == 1:
+                return self._evaluer(morceaux[-1], indices)
+            raise _Erreur('ArgumentFonctionError')
+        if nom in FONCTIONS_INDICEES:
+            return self._decaler(self._indicee(noeud, indices))
+
+        arguments = [self._evaluer(enfant, indices) for enfant in noeud.enfants]
+        if nom in FONCTIONS_ENTIERES:
+            return _fonction_entiere(nom, arguments)
+        if nom in ('min', 'max', 'median', 'abs'):
+            if any(map(math.isnan, arguments)):
+                return math.nan
+            if nom == 'median':
+                return self._decaler(_mediane(arguments, self.arithmetique))
+            if nom == 'abs':
+                return abs(arguments[0])
+            return min(arguments) if nom == 'min' else max(arguments)
+        return self._decaler(self._fonction(nom, arguments))
+
+    def _operation(self, operateur: str, a: float, b: float) -> float:
+        if operateur == '/':
+            if b == 0:
+                raise _Erreur('DivisionParZeroError')
+        elif operateur == '%':
+            if b == 0:
+                raise _Erreur('ModuloParZeroError')
+            # fmod est exact ; le seul arrondi est l'ajout de b (signe de b)
+            return a % b if math.isfinite(a) else math.nan
+        elif operateur == '^':
+            if b == 0:
+                return 1.0
+            if a == 0:
+                if b < 0:
+                    raise _Erreur('DivisionParZeroError')
+                return 0.0
+            if a < 0 and math.isfinite(b) and b != int(b):
+                raise _Erreur('complexe')
+        return self.arithmetique.operation(operateur, a, b)
+
+    def _fonction(self, nom: str, arguments: list) -> float:
+        arithmetique = self.arithmetique
+        x = arguments[0]
+        if nom == 'sqrt':
+            if x < 0:
+                raise _Erreur('RacineNegativeError')
+            return arithmetique.fonction('sqrt', x)
+        if nom in ('ln', 'log'):
+            if x <= 0:
+                raise _Erreur('LogarithmeError')
+            return arithmetique.fonction(nom, x)
+        if nom == 'exp':
+            return arithmetique.fonction('exp', x)
+        if nom == 'inv':
+            if x == 0:
+                raise _Erreur('DivisionParZeroError')
+            return arithmetique.operation('/', 1.0, x)
+        if nom == 'sqr':
+            return arithmetique.operation('*', x, x)
+        if nom in ('sin', 'cos', 'tan', 'sind', 'cosd', 'tand'):
+            if not math.isfinite(x):
+                return math.nan
+            sinus, cosinus = arithmetique.sin_cos(x, degres=nom.endswith('d'))
+            if nom.startswith('sin'):
+                return float(sinus)
+            if nom.startswith('cos'):
+                return float(cosinus)
+            if abs(cosinus) < 1e-10:
+                raise _Erreur('TangenteDomainError')
+            return float(sinus / cosinus)
+        if nom in ('var', 'stdev') and len(arguments) < 2:
+            raise _Erreur('ArgumentFonctionError')
+        if not all(map(math.isfinite, arguments)):
+            # inf - inf donne NaN ; une variance infinie est indéterminée
+            return sum(arguments) if nom in ('sum', 'mean') else math.nan
+        if nom == 'sum':
+            return arithmetique.somme(arguments)
+        if nom == 'mean':
+            return arithmetique.moyenne(arguments)
+        if nom == 'var':
+            return float(arithmetique.variance(arguments))
+        return arithmetique.ecart_type(arguments)
+
+    def _indicee(self, noeud: Noeud, indices: dict) -> float:
+        """sigma(corps, k, a, b) ou prod(corps, k, a, b)."""
+        corps, variable, debut, fin = noeud.enfants
+        debut, fin = self._evaluer(debut, indices), self._evaluer(fin, indices)
+        if debut != int(debut) or fin != int(fin):
+            raise _Erreur('ArgumentFonctionError')
+        termes = [self._evaluer(corps, {**indices, variable.valeur: float(k)})
+                  for k in range(int(debut), int(fin) + 1)]
+        if noeud.valeur == 'sigma':
+            return self.arithmetique.somme(termes) if termes else 0.0
+        return self.arithmetique.produit(termes)
+
+
+def _comparer(operateur: str, a: float, b: float) -> float:
+    vrai = {'<': a < b, '>': a > b, '<=': a <= b, '>=': a >= b, '==': a == b, '!=': a != b}[operateur]
+    return 1.0 if vrai else 0.0
+
+
+def _mediane(valeurs: list, arithmetique) -> float:
+    valeurs = sorted(valeurs)
+    milieu = len(valeurs) // 2
+    if len(valeurs) % 2:
+        return valeurs[milieu]
+    return arithmetique.moyenne(valeurs[milieu - 1:milieu + 1])
+
+
+def _fonction_entiere(nom: str, arguments: list) -> float:
+    """Fonctions de src.arithmetique, en entiers exacts."""
+    if not all(math.isfinite(a) and a == int(a) for a in arguments):
+        raise _Erreur('ArgumentFonctionError')
+    entiers = [int(a) for a in arguments]
+    if nom == 'gcd':
+        return float(math.gcd(*entiers))
+    if nom == 'lcm':
+        return float(math.lcm(*entiers))
+    if nom == 'isprime':
+        n = entiers[0]
+        return 1.0 if n >= 2 and all(n % d for d in range(2, math.isqrt(n) + 1)) else 0.0
+    if nom == 'powmod':
+        a, b, m = entiers
+        if m == 0:
+            raise _Erreur('ModuloParZeroError')
+        try:
+            return float(pow(a, b, m))
+        except ValueError:  # Exposant négatif, a non inversible modulo m
+            raise _Erreur('ArgumentFonctionError')
+    if any(n < 0 for n in entiers):
+        raise _Erreur('ArgumentFonctionError')
+    if nom == 'fact':
+        return float(math.factorial(entiers[0]))
+    if nom == 'ncr':
+        return float(math.comb(*entiers))
+    return float(math.perm(*entiers))
+
+
+#=============================================================================
+# MOTEURS ET COMPARAISON
+#=============================================================================
+
+def _interpreteur(expression: str):
+    return calculateur.evaluer_rpn(calculateur.infix_to_rpn(calculateur.tokenize(expression)))
+
+
+def _session():
+    """Une Session avec mémo par processus, gardée d'une expression à l'autre."""
+    from src.memo import MemoResultats
+    from src.session import Session
+
+    session = Session(taille_cache=10000, memo=MemoResultats())
+    return session.calculer
+
+
+# Moteurs vérifiables : nom -> fabrique de la fonction expression -> valeur
+MOTEURS = {
+    'calculer': lambda: calculateur.calculer,
+    'session': _session,
+    'interpreteur': lambda: _interpreteur,
+}
+
+REFERENCE_DECIMALE = 'decimal'
+
+# Modules importés à la demande par le calculateur : chargés avant le
+# premier délai, qui sinon pourrait interrompre un import (NumPy à moitié
+# chargé fait ensuite échouer toutes les expressions du processus)
+MODULES_A_LA_DEMANDE = (
+    'src.aleatoire', 'src.arithmetique', 'src.canonique', 'src.complexes', 'src.intervalles',
+    'src.matrices', 'src.memo', 'src.mesures', 'src.polynomes', 'src.programmeur', 'src.session',
+    'src.vectoriel',
+)
+
+# Fonctions des moteurs de ce processus (créées à la première utilisation)
+_moteurs = {}
+
+
+def moteur(nom: str):
+    if nom not in _moteurs:
+        for module in MODULES_A_LA_DEMANDE:
+            importlib.import_module(module)
+        _moteurs[nom] = MOTEURS[nom]()
+    return _moteurs[nom]
+
+
+class _Delai(Exception):
+    """Le moteur n'a pas fini dans le délai alloué."""
+
+
+def _interrompre(signal_recu, pile):
+    raise _Delai()
+
+
+def executer(nom: str, expression: str, delai=DELAI) -> Resultat:
+    """
+    Calcule une expression avec un moteur, sans lever d'erreur.
+
+    Examples:
+        >>> executer('calculer', '1/0')
+        Resultat(classe='DivisionParZeroError', valeur=None)
+    """
+    fonction = moteur(nom)
+    # Délai par SIGALRM : Unix, et seulement dans le fil principal
+    minuterie = (delai and hasattr(signal, 'setitimer')
+                 and threading.current_thread() is threading.main_thread())
+    if minuterie:
+        precedent = signal.signal(signal.SIGALRM, _interrompre)
+        signal.setitimer(signal.ITIMER_REAL, delai)
+    try:
+        valeur = fonction(expression)
+    except _Delai:
+        return Resultat('delai', None)
+    except CalculatriceError as e:
+        return Resultat(type(e).__name__, None)
+    except Exception as e:  # Tout autre échec est un défaut du moteur
+        return Resultat('plantage', f"{type(e).__name__}: {e}")
+    finally:
+        if minuterie:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, precedent)
+
+    if isinstance(valeur, complex):
+        return Resultat('complexe', valeur)
+    try:
+        return Resultat('valeur', float(valeur))
+    except OverflowError:  # Entier exact trop grand pour un flottant
+        return Resultat('valeur', math.copysign(math.inf, valeur))
+    except (TypeError, ValueError):
+        return Resultat('plantage', f"résultat {valeur!r}")
+
+
+def verifier(arbre: Noeud, cible='calculer', reference=REFERENCE_DECIMALE, tolerance=TOLERANCE,
+             delai=DELAI) -> tuple:
+    """
+    Compare la cible à la référence sur un arbre.
+
+    Returns:
+        tuple: (statut, obtenu, attendu) ; statut : 'accord', 'desaccord'
+               ou 'ignore' (expression instable, ou référence complexe) ;
+               attendu est un Resultat, avec l'écart admis en valeur pour
+               la référence decimal : ('valeur', (valeur, ecart))
+    """
+    expression = ecrire(arbre)
+    obtenu = executer(cible, expression, delai)
+    if reference != REFERENCE_DECIMALE:
+        attendu = executer(reference, expression, delai)
+        if attendu.classe != obtenu.classe:
+            return 'desaccord', obtenu, attendu
+        if attendu.classe == 'valeur' and not _proches(obtenu.valeur, attendu.valeur, tolerance * max(
+                abs(obtenu.valeur), abs(attendu.valeur))):
+            return 'desaccord', obtenu, attendu
+        return 'accord', obtenu, attendu
+
+    exacte = Reference().evaluer(arbre)
+    decalees = [Reference(tolerance, graine=f"{expression}:{i}").evaluer(arbre) for i in range(DECALAGES)]
+    if exacte.classe == 'complexe' or any(r.classe != exacte.classe for r in decalees):
+        return 'ignore', obtenu, exacte
+    if exacte.classe != 'valeur':
+        statut = 'accord' if obtenu.classe == exacte.classe else 'desaccord'
+        return statut, obtenu, exacte
+
+    valeur = exacte.valeur
+    if math.isfinite(valeur) and not all(math.isfinite(r.valeur) for r in decalees):
+        return 'ignore', obtenu, exacte
+    if not math.isfinite(valeur):
+        ecart = 0.0
+    else:
+        # Sensibilité aux décalages, et quelques ULP pour les valeurs minuscules
+        bruit = max((abs(r.valeur - valeur) for r in decalees), default=0.0)
+        ecart = tolerance * abs(valeur) + 2 * bruit + 4 * math.ulp(valeur)
+    attendu = Resultat('valeur', (valeur, ecart))
+    if obtenu.classe != 'valeur' or not _proches(obtenu.valeur, valeur, ecart):
+        return 'desaccord', obtenu, attendu
+    return 'accord', obtenu, attendu
+
+
+def _proches(a: float, b: float, ecart: float) -> bool:
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    if math.isinf(a) or math.isinf(b):
+        return a == b
+    return abs(a - b) <= ecart
+
+
+def _nature(obtenu: Resultat, attendu: Resultat) -> tuple:
+    """Ce qu'une expression réduite doit reproduire : les deux classes."""
+    return obtenu.classe, attendu.classe
+
+
+#=============================================================================
+# RÉDUCTION
+#=============================================================================
+
+def reduire(arbre: Noeud, echoue, essais=ESSAIS_REDUCTION) -> Noeud:
+    """
+    Plus petite expression trouvée qui échoue encore.
+
+    Args:
+        arbre: Expression qui échoue
+        echoue: Fonction arbre -> bool
+        essais: Nombre maximal d'appels à echoue
+
+    Examples:
+        >>> deux, zero = Noeud('nombre', '2', ()), Noeud('nombre', '0', ())
+        >>> arbre = Noeud('operateur', '+', (deux, Noeud('operateur', '/', (deux, zero))))
+        >>> ecrire(reduire(arbre, lambda candidat: '/' in ecrire(candidat)))
+        '2 / 0'
+    """
+    restants = essais
+    progres = True
+    while progres and restants > 0:
+        progres = False
+        taille = len(ecrire(arbre))
+        for candidat in _candidats(arbre):
+            if len(ecrire(candidat)) >= taille or _variables_libres(candidat):
+                continue
+            restants -= 1
+            if echoue(candidat):
+                arbre, progres = candidat, True
+                break
+            if restants <= 0:
+                break
+    return arbre
+
+
+def _candidats(arbre: Noeud):
+    """Variantes plus simples de l'arbre, les plus petites d'abord."""
+    sous_arbres = list(_sous_arbres(arbre, ()))
+    # 1. Un sous-arbre seul, puis à la place de son parent
+    for chemin, noeud in sous_arbres[1:]:
+        yield noeud
+    for chemin, noeud in sous_arbres[1:]:
+        for enfant in noeud.enfants:
+            yield _remplacer(arbre, chemin, enfant)
+    # 2. Un sous-arbre remplacé par sa valeur
+    for chemin, noeud in sous_arbres:
+        if noeud.enfants and not _variables_libres(noeud):
+            resultat = Reference().evaluer(noeud)
+            if resultat.classe == 'valeur':
+                litteral = _litteral(resultat.valeur)
+                if litteral is not None:
+                    yield _remplacer(arbre, chemin, litteral)
+    # 3. Un argument de moins
+    for chemin, noeud in sous_arbres:
+        if noeud.genre == 'fonction' and noeud.valeur in FONCTIONS_STATISTIQUES + ('gcd', 'lcm'):
+            for i in range(len(noeud.enfants)):
+                if len(noeud.enfants) > 1:
+                    yield _remplacer(arbre, chemin, noeud._replace(enfants=noeud.enfants[:i] + noeud.enfants[i + 1:]))
+    # 4. Un nombre plus court
+    for chemin, noeud in sous_arbres:
+        if noeud.genre == 'nombre':
+            for texte in _raccourcis(noeud.valeur):
+                yield _remplacer(arbre, chemin, Noeud('nombre', texte, ()))
+
+
+def gabarit(arbre: Noeud) -> str:
+    """
+    Texte de l'arbre, nombres remplacés par # : ln(265) et ln(899) sont un
+    même désaccord.
+
+    Examples:
+        >>> gabarit(Noeud('fonction', 'ln', (Noeud('nombre', '265', ()),)))
+        'ln(#)'
+    """
+    return ecrire(_remplacer_nombres(arbre))
+
+
+def _remplacer_nombres(noeud: Noeud) -> Noeud:
+    if noeud.genre == 'nombre':
+        return noeud._replace(valeur='#')
+    return noeud._replace(enfants=tuple(_remplacer_nombres(enfant) for enfant in noeud.enfants))
+
+
+def _sous_arbres(noeud: Noeud, chemin: tuple):
+    """(chemin, nœud) de chaque nœud, en préfixe."""
+    yield chemin, noeud
+    for i, enfant in enumerate(noeud.enfants):
+        yield from _sous_arbres(enfant, chemin + (i,))
+
+
+def _remplacer(noeud: Noeud, chemin: tuple, nouveau: Noeud) -> Noeud:
+    if not chemin:
+        return nouveau
+    i = chemin[0]
+    enfants = noeud.enfants[:i] + (_remplacer(noeud.enfants[i], chemin[1:], nouveau),) + noeud.enfants[i + 1:]
+    return noeud._replace(enfants=enfants)
+
+
+def _variables_libres(noeud: Noeud) -> bool:
+    """Vrai si l'indice apparaît hors d'une somme ou d'un produit indicé."""
+    if noeud.genre == 'variable':
+        return True
+    if noeud.genre == 'fonction' and noeud.valeur in FONCTIONS_INDICEES:
+        return any(_variables_libres(enfant) for enfant in noeud.enfants[2:])
+    return any(_variables_libres(enfant) for enfant in noeud.enfants)
+
+
+def _litteral(valeur: float):
+    """Nœud d'un flottant fini écrit sans exposant, ou None s'il est trop long."""
+    if not math.isfinite(valeur):
+        return None
+    texte = format(Decimal(repr(abs(valeur))), 'f')
+    if len(texte) > 24:
+        return None
+    feuille = Noeud('nombre', texte, ())
+    return Noeud('neg', None, (feuille,)) if valeur < 0 else feuille
+
+
+def _raccourcis(texte: str) -> list:
+    """
+    Nombres plus courts : 0, 1, partie entière, moins de décimales.
+
+    Examples:
+        >>> _raccourcis('12.375')
+        ['0', '1', '12', '12.4', '12.38']
+    """
+    entier, _, decimales = texte.partition('.')
+    variantes = ['0', '1', entier]
+    if decimales:
+        valeur = Decimal(texte)
+        variantes += [format(round(valeur, n), 'f') for n in range(1, len(decimales))]
+    vus = []
+    for variante in variantes:
+        if len(variante) < len(texte) and variante not in vus:
+            vus.append(variante)
+    return vus
+
+
+#=============================================================================
+# EXPLORATION
+#=============================================================================
+
+def explorer_lot(numero: int, taille=TAILLE_LOT, graine=GRAINE, cible='calculer',
+                 reference=REFERENCE_DECIMALE, tolerance=TOLERANCE, profondeur=PROFONDEUR,
+                 constructions=CONSTRUCTIONS, delai=DELAI) -> dict:
+    """
+    Vérifie un lot d'expressions et réduit ses premiers désaccords.
+
+    Returns:
+        dict: expressions, accords, ignorees, desaccords, et echecs : un dict
+              (reduite, gabarit, exemple, obtenu, attendu, reproduit) par
+              désaccord réduit ; reproduit est faux si le désaccord n'a pas
+              lieu une seconde fois (état du moteur, délai limite)
+    """
+    generateur = Generateur(f"{graine}:{numero}", profondeur, constructions)
+    bilan = {'expressions': taille, 'accords': 0, 'ignorees': 0, 'desaccords': 0, 'echecs': []}
+    statuts = {'accord': 'accords', 'ignore': 'ignorees', 'desaccord': 'desaccords'}
+    for _ in range(taille):
+        arbre = generateur.expression()
+        statut, obtenu, attendu = verifier(arbre, cible, reference, tolerance, delai)
+        bilan[statuts[statut]] += 1
+        if statut != 'desaccord' or len(bilan['echecs']) >= REDUCTIONS_PAR_LOT:
+            continue
+
+        nature = _nature(obtenu, attendu)
+
+        def echoue(candidat):
+            resultat = verifier(candidat, cible, reference, tolerance, delai)
+            return resultat[0] == 'desaccord' and _nature(*resultat[1:]) == nature
+
+        reduit = reduire(arbre, echoue)
+        statut, obtenu_reduit, attendu_reduit = verifier(reduit, cible, reference, tolerance, delai)
+        if statut == 'desaccord':
+            obtenu, attendu = obtenu_reduit, attendu_reduit
+        bilan['echecs'].append({'reduite': ecrire(reduit), 'gabarit': gabarit(reduit),
+                                'exemple': ecrire(arbre), 'obtenu': obtenu, 'attendu': attendu,
+                                'reproduit': statut == 'desaccord'})
+    return bilan
+
+
+def explorer(nombre: int, processus=None, graine=GRAINE, taille_lot=TAILLE_LOT, progression=None,
+             **options) -> dict:
+    """
+    Vérifie nombre expressions sur plusieurs processus.
+
+    Args:
+        nombre: Nombre d'expressions
+        processus: Nombre de processus (défaut : nombre de cœurs ; 1 : dans
+                   le processus courant)
+        progression: Fonction appelée avec le bilan cumulé après chaque lot
+        **options: cible, reference, tolerance, profondeur, constructions,
+                   delai (voir explorer_lot)
+
+    Returns:
+        dict: expressions, accords, ignorees, desaccords, duree, processus,
+              et echecs : (gabarit, classe obtenue, classe attendue) ->
+              {nombre, reduite, exemple, obtenu, attendu}, avec la plus
+              courte des expressions réduites du groupe
+    """
+    processus = processus or os.cpu_count() or 1
+    lots = range(-(-nombre // taille_lot))
+    bilan = {'expressions': 0, 'accords': 0, 'ignorees': 0, 'desaccords': 0, 'echecs': {},
+             'processus': processus}
+    debut = time.perf_counter()
+
+    def cumuler(lot):
+        for cle in ('expressions', 'accords', 'ignorees', 'desaccords'):
+            bilan[cle] += lot[cle]
+        for echec in lot['echecs']:
+            cle = (echec['gabarit'], echec['obtenu'].classe, echec['attendu'].classe)
+            groupe = bilan['echecs'].setdefault(cle, {**echec, 'nombre': 0})
+            if len(echec['reduite']) < len(groupe['reduite']):
+                groupe.update(echec)
+            groupe['nombre'] += 1
+        bilan['duree'] = time.perf_counter() - debut
+        if progression is not None:
+            progression(bilan)
+
+    def taille(numero):
+        return min(taille_lot, nombre - numero * taille_lot)
+
+    if processus == 1:
+        for numero in lots:
+            cumuler(explorer_lot(numero, taille(numero), graine, **options))
+        return bilan
+
+    with ProcessPoolExecutor(processus) as executeur:
+        en_cours = deque()
+        for numero in lots:
+            en_cours.append(executeur.submit(explorer_lot, numero, taille(numero), graine, **options))
+            if len(en_cours) >= 2 * processus:
+                cumuler(en_cours.popleft().result())
+        while en_cours:
+            cumuler(en_cours.popleft().result())
+    return bilan
+
+
+#=============================================================================
+# RAPPORT
+#=============================================================================
+
+def formater_rapport(bilan: dict, maximum=20) -> str:
+    """Totaux, puis les désaccords réduits les plus fréquents."""
+    duree = bilan.get('duree', 0.0)
+    debit = bilan['expressions'] / duree if duree else 0.0
+    lignes = [
+        f"{bilan['expressions']} expressions en {duree:.1f} s ({debit:.0f}/s, {bilan['processus']} processus)",
+        f"  accords : {bilan['accords']}   non comparées : {bilan['ignorees']}   "
+        f"désaccords : {bilan['desaccords']}",
+    ]
+    echecs = sorted(bilan['echecs'].values(), key=lambda e: (-e['nombre'], len(e['reduite'])))
+    for echec in echecs[:maximum]:
+        lignes += [
+            '',
+            f"{echec['reduite']} : {echec['nombre']} fois" + ('' if echec['reproduit'] else ' (non reproduit)'),
+            f"    obtenu    : {_formater_resultat(echec['obtenu'])}",
+            f"    attendu   : {_formater_resultat(echec['attendu'])}",
+            f"    exemple   : {echec['exemple']}",
+        ]
+    if len(echecs) > maximum:
+        lignes += ['', f"... et {len(echecs) - maximum} autres désaccords réduits"]
+    return '\n'.join(lignes)
+
+
+def _formater_resultat(resultat: Resultat) -> str:
+    if resultat.classe != 'valeur':
+        return resultat.classe if resultat.valeur is None else f"{resultat.classe} ({resultat.valeur})"
+    if isinstance(resultat.valeur, tuple):
+        valeur, ecart = resultat.valeur
+        return f"{valeur!r} (± {ecart:.3g})"
+    return repr(resultat.valeur)
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée de python -m benchmarks.differentiel."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(prog='python -m benchmarks.differentiel',
+                                        description="Expressions aléatoires : un moteur contre une référence.")
+    analyseur.add_argument('-n', '--nombre', type=int, default=10000, help="nombre d'expressions")
+    analyseur.add_argument('--processus', type=int, help="nombre de processus (défaut : nombre de cœurs)")
+    analyseur.add_argument('--graine', type=int, default=GRAINE, help="graine des tirages")
+    analyseur.add_argument('--cible', choices=list(MOTEURS), default='calculer', help="moteur vérifié")
+    analyseur.add_argument('--reference', choices=[REFERENCE_DECIMALE] + list(MOTEURS),
+                           default=REFERENCE_DECIMALE, help="moteur de référence")
+    analyseur.add_argument('--tolerance', type=float, default=TOLERANCE, help="écart relatif admis par opération")
+    analyseur.add_argument('--profondeur', type=int, default=PROFONDEUR, help="profondeur des expressions")
+    analyseur.add_argument('--delai', type=float, default=DELAI, help="secondes allouées par expression")
+    analyseur.add_argument('--sans', default='', help="opérateurs et fonctions exclus (ex: exp,ln,^)")
+    analyseur.add_argument('--avec', default='', help="seuls opérateurs et fonctions tirés")
+    analyseur.add_argument('--afficher', type=int, default=20, help="désaccords réduits affichés")
+    options = analyseur.parse_args(arguments)
+
+    avec = [nom for nom in options.avec.split(',') if nom] or list(CONSTRUCTIONS)
+    sans = {nom for nom in options.sans.split(',') if nom}
+    inconnus = (set(avec) | sans) - set(CONSTRUCTIONS)
+    if inconnus:
+        analyseur.error(f"inconnus : {', '.join(sorted(inconnus))} (possibles : {' '.join(CONSTRUCTIONS)})")
+    constructions = tuple(nom for nom in avec if nom not in sans)
+
+    def progression(bilan):
+        print(f"\r{bilan['expressions']} / {options.nombre}  désaccords : {bilan['desaccords']}",
+              end='', file=sys.stderr, flush=True)
+
+    bilan = explorer(options.nombre, options.processus, options.graine, progression=progression,
+                     cible=options.cible, reference=options.reference, tolerance=options.tolerance,
+                     profondeur=options.profondeur, constructions=constructions, delai=options.delai)
+    print(file=sys.stderr)
+    print(formater_rapport(bilan, options.afficher))
+    return 1 if bilan['desaccords'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,441 @@
+# benchmarks/precision.py
+"""
+================================================================================
+Précision (erreur en ULP) et vitesse des noyaux mathématiques - VERSION 4.0
+================================================================================
+
+Pour chaque noyau de src.calculateur (racine_carree, sinus, cosinus,
+tangente, exponentielle, logarithme_neperien, logarithme_base10,
+puissance), balaie des entrées de toutes les grandeurs et mesure :
+
+    - l'erreur en ULP (unités de dernière position) par rapport à une
+      référence calculée en haute précision (module decimal, 50 chiffres) :
+      erreur maximale, moyenne, et l'entrée la pire ;
+    - le temps par appel, en nanosecondes.
+
+Les mêmes mesures sont prises pour les autres moteurs possibles : le
+module math de Python (libm du système) et NumPy s'il est installé
+(temps par élément d'un calcul sur tableau, comme dans src.vectoriel).
+
+    $ python -m benchmarks.precision                      # tableau résumé
+    $ python -m benchmarks.precision --detail             # par grandeur
+    $ python -m benchmarks.precision --csv precision.csv  # données du tracé
+    $ python -m benchmarks.precision --noyau exponentielle --max-ulp 4
+
+Avec --max-ulp N, le code de sortie est 1 si un noyau de la calculatrice
+dépasse N ULP ou a des échecs (barrière contre une perte de précision) :
+c'est ce qui signale exponentielle, à ~4e15 ULP sur [10, 100[, ~9e15 sur
+[100, 700[, ~4e29 sur [-100, -10[, et fausse en dessous de -100.
+
+GRANDEURS :
+-----------
+    Chaque noyau a ses tranches d'entrées : [1e-6, 1e-5[, [1e-5, 1e-4[,
+    ... (des deux signes quand le domaine le permet), tirées
+    uniformément en échelle logarithmique avec une graine fixe. Le CSV a
+    une ligne par (noyau, moteur, tranche) : tracer max_ulp ou ns_par_appel
+    en fonction de la grandeur donne la courbe de chaque moteur.
+
+Une entrée pour laquelle le moteur lève une erreur ou rend NaN/inf alors
+que le résultat exact est fini, ou rend un résultat du mauvais signe ou
+trop loin pour que l'écart en ULP soit un flottant, est comptée dans
+« echecs », pas dans l'erreur en ULP (ni dans sa moyenne).
+
+================================================================================
+"""
+
+import csv
+import math
+import random
+import sys
+import time
+from decimal import Decimal, localcontext
+from functools import lru_cache
+from pathlib import Path
+
+# Exécutable depuis la racine du dépôt (python -m benchmarks.precision)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import calculateur
+from src.exceptions import CalculatriceError
+
+
+# Chiffres significatifs de la référence
+CHIFFRES = 50
+
+# Entrées par tranche de grandeur
+ECHANTILLONS = 200
+
+GRAINE = 20240101
+
+
+#=============================================================================
+# RÉFÉRENCES EN HAUTE PRÉCISION
+#=============================================================================
+
+@lru_cache(maxsize=None)
+def valeur_pi(chiffres: int) -> Decimal:
+    """π à chiffres décimales (formule de Machin)."""
+    with localcontext() as contexte:
+        contexte.prec = chiffres + 10
+        pi = 16 * _arctan_inverse(5) - 4 * _arctan_inverse(239)
+    return +pi
+
+
+def _arctan_inverse(n: int) -> Decimal:
+    """arctan(1/n) par sa série."""
+    x = Decimal(1) / n
+    x_carre = x * x
+    terme, total, k = x, x, 1
+    while True:
+        terme *= -x_carre
+        suivant = total + terme / (2 * k + 1)
+        if suivant == total:
+            return total
+        total, k = suivant, k + 1
+
+
+def sin_cos(x, chiffres=CHIFFRES) -> tuple:
+    """
+    (sin x, cos x) exacts à chiffres chiffres.
+
+    Args:
+        x: Angle en radians, float ou Decimal (fini)
+
+    Examples:
+        >>> [round(float(v), 12) for v in sin_cos(1e4)]
+        [-0.305614388888, -0.952155368259]
+    """
+    with localcontext() as contexte:
+        # Chiffres en plus pour la réduction d'un grand argument
+        contexte.prec = chiffres + 10 + max(0, int(math.log10(abs(x) + 1)))
+        deux_pi = 2 * valeur_pi(contexte.prec)
+        y = Decimal(x)
+        y -= deux_pi * (y / deux_pi).to_integral_value()
+        y_carre = y * y
+        sinus, cosinus = Decimal(0), Decimal(0)
+        terme_s, terme_c, n = y, Decimal(1), 0
+        negligeable = Decimal(10) ** -(contexte.prec + 5)
+        while terme_s or terme_c:
+            sinus += terme_s
+            cosinus += terme_c
+            terme_s = terme_s * -y_carre / ((2 * n + 2) * (2 * n + 3))
+            terme_c = terme_c * -y_carre / ((2 * n + 1) * (2 * n + 2))
+            n += 1
+            if abs(terme_s) + abs(terme_c) < negligeable:
+                break
+        return +sinus, +cosinus
+
+
+def _reference(noyau: str, arguments: tuple) -> Decimal:
+    """Valeur exacte (à CHIFFRES chiffres) du noyau en ces arguments."""
+    with localcontext() as contexte:
+        contexte.prec = CHIFFRES
+        x = Decimal(arguments[0])
+        if noyau == 'racine_carree':
+            return x.sqrt()
+        if noyau == 'exponentielle':
+            return x.exp()
+        if noyau == 'logarithme_neperien':
+            return x.ln()
+        if noyau == 'logarithme_base10':
+            return x.log10()
+        if noyau == 'puissance':
+            return x ** Decimal(arguments[1])
+        sinus, cosinus = sin_cos(arguments[0])
+        if noyau == 'sinus':
+            return +sinus
+        if noyau == 'cosinus':
+            return +cosinus
+        return sinus / cosinus  # tangente
+
+
+def erreur_ulp(valeur: float, exacte: Decimal) -> float:
+    """
+    Écart entre un résultat et la valeur exacte, en ULP du flottant le
+    plus proche de la valeur exacte.
+
+    Examples:
+        >>> erreur_ulp(0.1, Decimal(1) / 10)
+        0.4
+    """
+    flottant = float(exacte)
+    if math.isinf(flottant):
+        flottant = math.copysign(sys.float_info.max, flottant)
+    with localcontext() as contexte:
+        contexte.prec = CHIFFRES
+        return float(abs(Decimal(valeur) - exacte) / Decimal(math.ulp(flottant)))
+
+
+#=============================================================================
+# NOYAUX ET MOTEURS
+#=============================================================================
+
+def _tranches(exposants, positifs=True, negatifs=True, fin=None) -> list:
+    """Tranches [10^k, 10^(k+1)[ (et leurs opposées), la dernière bornée par fin."""
+    tranches = []
+    for k in exposants:
+        bas, haut = 10.0 ** k, 10.0 ** (k + 1)
+        if fin is not None:
+            if bas >= fin:
+                break
+            haut = min(haut, fin)
+        if positifs:
+            tranches.append((bas, haut))
+        if negatifs:
+            tranches.append((-haut, -bas))
+    return tranches
+
+
+# Tranches d'entrées de chaque noyau (premier argument)
+TRANCHES = {
+    'racine_carree': _tranches(range(-12, 13, 2), negatifs=False),
+    'sinus': _tranches(range(-6, 4)),
+    'cosinus': _tranches(range(-6, 4)),
+    'tangente': _tranches(range(-6, 4)),
+    'exponentielle': _tranches(range(-6, 3), fin=700.0),
+    'logarithme_neperien': _tranches(range(-12, 13, 2), negatifs=False),
+    'logarithme_base10': _tranches(range(-12, 13, 2), negatifs=False),
+    # Tranches de l'exposant ; la base est tirée dans [0.1, 10]
+    'puissance': _tranches(range(-2, 3), fin=300.0),
+}
+
+NOYAUX = tuple(TRANCHES)
+
+
+def moteurs() -> dict:
+    """
+    Moteurs disponibles : nom -> (fonctions {noyau: fonction}, vectoriel).
+    Un moteur vectoriel reçoit un tableau par argument.
+    """
+    disponibles = {
+        'calculatrice': ({noyau: getattr(calculateur, noyau) for noyau in NOYAUX}, False),
+        'math': ({
+            'racine_carree': math.sqrt, 'sinus': math.sin, 'cosinus': math.cos, 'tangente': math.tan,
+            'exponentielle': math.exp, 'logarithme_neperien': math.log,
+            'logarithme_base10': math.log10, 'puissance': math.pow,
+        }, False),
+    }
+    try:
+        import numpy
+    except ImportError:
+        return disponibles
+    disponibles['numpy'] = ({
+        'racine_carree': numpy.sqrt, 'sinus': numpy.sin, 'cosinus': numpy.cos, 'tangente': numpy.tan,
+        'exponentielle': numpy.exp, 'logarithme_neperien': numpy.log,
+        'logarithme_base10': numpy.log10, 'puissance': numpy.power,
+    }, True)
+    return disponibles
+
+
+def entrees(noyau: str, tranche: tuple, nombre=ECHANTILLONS) -> list:
+    """Arguments (tuples) tirés dans une tranche, reproductibles."""
+    generateur = random.Random(f"{GRAINE}:{noyau}:{tranche}")
+    bas, haut = sorted(map(abs, tranche))
+    signe = -1.0 if tranche[0] < 0 else 1.0
+    arguments = []
+    for i in range(nombre):
+        x = signe * math.exp(generateur.uniform(math.log(bas), math.log(haut)))
+        if noyau == 'puissance':
+            base = math.exp(generateur.uniform(math.log(0.1), math.log(10.0)))
+            if i % 2:
+                x = float(round(x)) or signe  # Exposants entiers : autre chemin du noyau
+            arguments.append((base, x))
+        else:
+            arguments.append((x,))
+    return arguments
+
+
+#=============================================================================
+# MESURE
+#=============================================================================
+
+def mesurer_tranche(noyau: str, tranche: tuple, fonction, vectoriel: bool, arguments: list,
+                    references: list) -> dict:
+    """Erreurs en ULP et temps d'un moteur sur une tranche."""
+    if vectoriel:
+        import numpy
+        colonnes = [numpy.array(colonne) for colonne in zip(*arguments)]
+        with numpy.errstate(all='ignore'):
+            resultats = fonction(*colonnes).tolist()
+        ns = _chronometrer(lambda: fonction(*colonnes), len(arguments), numpy=numpy)
+    else:
+        resultats = [_appeler(fonction, a) for a in arguments]
+        ns = _chronometrer(lambda: [_appeler(fonction, a) for a in arguments], len(arguments))
+
+    erreurs = []
+    echecs = 0
+    pire = None
+    for a, resultat, exacte in zip(arguments, resultats, references):
+        if exacte is None:
+            continue  # Hors du domaine (ex: tangente au pôle)
+        if resultat is None or not math.isfinite(resultat):
+            if math.isfinite(float(exacte)):
+                echecs += 1
+            continue
+        erreur = erreur_ulp(resultat, exacte)
+        if not math.isfinite(erreur) or (resultat < 0 < exacte) or (exacte < 0 < resultat):
+            echecs += 1  # Hors de toute mesure (ex: exp(-665) = -2.8e123)
+            continue
+        erreurs.append(erreur)
+        if pire is None or erreur > pire[0]:
+            pire = (erreur, a)
+    return {
+        'bas': tranche[0], 'haut': tranche[1],
+        'max_ulp': max(erreurs) if erreurs else None,
+        'moyenne_ulp': sum(erreurs) / len(erreurs) if erreurs else None,
+        'echecs': echecs,
+        'ns_par_appel': ns,
+        'pire_entree': list(pire[1]) if pire else None,
+    }
+
+
+def _appeler(fonction, arguments: tuple):
+    """Résultat, ou None si le noyau refuse l'entrée."""
+    try:
+        return float(fonction(*arguments))
+    except (CalculatriceError, ArithmeticError, ValueError):
+        return None
+
+
+def _chronometrer(fonction, nombre: int, repetitions=3, numpy=None) -> float:
+    """Meilleur temps par élément de plusieurs répétitions, en nanosecondes."""
+    meilleur = math.inf
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        if numpy is not None:
+            with numpy.errstate(all='ignore'):
+                fonction()
+        else:
+            fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur / nombre * 1e9
+
+
+def mesurer(noyaux=NOYAUX, noms_moteurs=None, echantillons=ECHANTILLONS, progression=None) -> list:
+    """
+    Balaye les tranches de chaque noyau pour chaque moteur.
+
+    Returns:
+        list: Une ligne (dict) par (noyau, moteur, tranche) : noyau, moteur,
+              bas, haut, max_ulp, moyenne_ulp, echecs, ns_par_appel,
+              pire_entree
+    """
+    disponibles = moteurs()
+    noms_moteurs = noms_moteurs or list(disponibles)
+    lignes = []
+    for noyau in noyaux:
+        if progression is not None:
+            progression(noyau)
+        for tranche in TRANCHES[noyau]:
+            arguments = entrees(noyau, tranche, echantillons)
+            references = [_reference_ou_none(noyau, a) for a in arguments]
+            for nom in noms_moteurs:
+                fonctions, vectoriel = disponibles[nom]
+                ligne = mesurer_tranche(noyau, tranche, fonctions[noyau], vectoriel, arguments, references)
+                lignes.append({'noyau': noyau, 'moteur': nom, **ligne})
+    return lignes
+
+
+def _reference_ou_none(noyau: str, arguments: tuple):
+    try:
+        return _reference(noyau, arguments)
+    except (ArithmeticError, ValueError):
+        return None
+
+
+def resumer(lignes: list) -> list:
+    """
+    Une ligne par (noyau, moteur) : max_ulp, moyenne_ulp (moyenne des
+    tranches), echecs, ns_par_appel (moyenne des tranches), pire_entree.
+    """
+    groupes = {}
+    for ligne in lignes:
+        groupes.setdefault((ligne['noyau'], ligne['moteur']), []).append(ligne)
+    resume = []
+    for (noyau, moteur), tranches in groupes.items():
+        mesurees = [t for t in tranches if t['max_ulp'] is not None]
+        pire = max(mesurees, key=lambda t: t['max_ulp']) if mesurees else None
+        resume.append({
+            'noyau': noyau, 'moteur': moteur,
+            'max_ulp': pire['max_ulp'] if pire else None,
+            'moyenne_ulp': sum(t['moyenne_ulp'] for t in mesurees) / len(mesurees) if mesurees else None,
+            'echecs': sum(t['echecs'] for t in tranches),
+            'ns_par_appel': sum(t['ns_par_appel'] for t in tranches) / len(tranches),
+            'pire_entree': pire['pire_entree'] if pire else None,
+        })
+    return resume
+
+
+#=============================================================================
+# SORTIES
+#=============================================================================
+
+def formater_tableau(lignes: list, detail=False) -> str:
+    """Tableau texte (résumé par noyau et moteur, ou détail par tranche)."""
+    colonnes = ['noyau', 'moteur'] + (['tranche'] if detail else []) + \
+               ['max ULP', 'moy. ULP', 'échecs', 'ns/appel', 'pire entrée']
+    rangees = []
+    for ligne in lignes:
+        rangee = [ligne['noyau'], ligne['moteur']]
+        if detail:
+            rangee.append(f"[{ligne['bas']:.0e}, {ligne['haut']:.0e}[")
+        rangee += [
+            _ulp(ligne['max_ulp']), _ulp(ligne['moyenne_ulp']), str(ligne['echecs']),
+            f"{ligne['ns_par_appel']:.0f}",
+            ', '.join(f"{v:.6g}" for v in ligne['pire_entree']) if ligne['pire_entree'] else '-',
+        ]
+        rangees.append(rangee)
+    largeurs = [max(len(str(x)) for x in colonne) for colonne in zip(colonnes, *rangees)]
+    texte = ['  '.join(f"{c:<{l}}" for c, l in zip(colonnes, largeurs))]
+    texte += ['  '.join(f"{c:<{l}}" for c, l in zip(rangee, largeurs)) for rangee in rangees]
+    return '\n'.join(texte)
+
+
+def _ulp(valeur) -> str:
+    if valeur is None:
+        return '-'
+    return f"{valeur:.2f}" if valeur < 1e4 else f"{valeur:.2e}"
+
+
+def ecrire_csv(lignes: list, fichier):
+    """Données du tracé : une ligne par (noyau, moteur, tranche)."""
+    champs = ['noyau', 'moteur', 'bas', 'haut', 'max_ulp', 'moyenne_ulp', 'echecs', 'ns_par_appel']
+    with open(fichier, 'w', newline='', encoding='utf-8') as f:
+        ecrivain = csv.DictWriter(f, fieldnames=champs, extrasaction='ignore')
+        ecrivain.writeheader()
+        ecrivain.writerows(lignes)
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée de python -m benchmarks.precision."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(prog='python -m benchmarks.precision',
+                                        description="Erreur en ULP et vitesse des noyaux mathématiques.")
+    analyseur.add_argument('--noyau', action='append', choices=NOYAUX, help="noyau mesuré (défaut : tous)")
+    analyseur.add_argument('--moteur', action='append', help="moteur mesuré (calculatrice, math, numpy)")
+    analyseur.add_argument('--echantillons', type=int, default=ECHANTILLONS, help="entrées par tranche")
+    analyseur.add_argument('--detail', action='store_true', help="une ligne par tranche de grandeur")
+    analyseur.add_argument('--csv', help="écrit les données du tracé dans ce fichier")
+    analyseur.add_argument('--max-ulp', type=float,
+                           help="code de sortie 1 si un noyau de la calculatrice dépasse cette erreur")
+    options = analyseur.parse_args(arguments)
+
+    lignes = mesurer(options.noyau or NOYAUX, options.moteur, options.echantillons,
+                     progression=lambda noyau: print(noyau, file=sys.stderr, flush=True))
+    print(formater_tableau(lignes if options.detail else resumer(lignes), options.detail))
+    if options.csv:
+        ecrire_csv(lignes, options.csv)
+
+    if options.max_ulp is not None:
+        hors_limite = [ligne for ligne in resumer(lignes) if ligne['moteur'] == 'calculatrice'
+                       and (ligne['echecs'] or (ligne['max_ulp'] or 0) > options.max_ulp)]
+        if hors_limite:
+            print(f"\nAu-delà de {options.max_ulp:g} ULP : "
+                  f"{', '.join(ligne['noyau'] for ligne in hors_limite)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+# benchmarks/suite.py
+"""
+================================================================================
+Suite de micro-bancs de performance - VERSION 4.0
+================================================================================
+
+Mesure les étapes et noyaux de la calculatrice et enregistre les temps
+dans un fichier JSON (référence ou mesure du jour) :
+
+    $ python -m benchmarks.suite --sortie benchmarks/reference.json
+    $ python -m benchmarks.suite --sortie actuel.json
+    $ python -m benchmarks.comparer benchmarks/reference.json actuel.json
+
+    $ python -m benchmarks.suite --liste               # noms des bancs
+    $ python -m benchmarks.suite --filtre noyau.       # une partie seulement
+
+BANCS :
+-------
+    analyse.tokenize, analyse.infix_to_rpn, analyse.evaluer_rpn
+    noyau.<fonction>          Chaque noyau de src.calculateur
+    validateur.valider_expression
+    fractions.decimal_vers_fraction
+    historique.ajouter.<n>    Historique de 10, 10 000 et 1 000 000 opérations
+    graphique.abscisses_adaptatives, graphique.evaluer_points
+    tableaux.vectoriel, tableaux.blocs
+                              La même expression sur le même tableau de
+                              TAILLE_TABLEAU valeurs : evaluer_rpn_vectoriel
+                              contre evaluer_par_blocs (avec NumPy)
+
+REPRODUCTIBILITÉ :
+------------------
+    - Entrées fixes (générateur de graine constante) ;
+    - aucun affichage : ni tkinter ni customtkinter ne sont importés, le
+      tracé de courbe est mesuré par ses fonctions de calcul ;
+    - ramasse-miettes désactivé pendant les mesures (comme timeit) ;
+    - le fichier garde l'environnement (Python, NumPy, processeur) :
+      benchmarks.comparer prévient si les deux mesures n'ont pas été
+      prises dans le même.
+
+Chaque banc est répété (REPETITIONS fois, moins pour les plus lents) ;
+chaque répétition enchaîne assez d'appels pour durer au moins DUREE_MIN.
+Le fichier garde le temps par appel de CHAQUE répétition : la
+comparaison est un test statistique, pas un écart entre deux moyennes.
+
+================================================================================
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Exécutable depuis la racine du dépôt (python -m benchmarks.suite)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import calculateur
+from src.calculateur import tokenize, infix_to_rpn, evaluer_rpn
+from src.fractions import decimal_vers_fraction
+from src.historique import Historique
+from src.intervalles import abscisses_adaptatives
+from src.polynomes import compiler
+from src.validateur import Validateur
+from src.vectoriel import evaluer_points, NUMPY_DISPONIBLE
+
+
+# Répétitions de chaque banc
+REPETITIONS = 15
+
+# Durée minimale d'une répétition, en secondes
+DUREE_MIN = 0.02
+
+# Graine des entrées générées
+GRAINE = 20240101
+
+# Format du fichier de résultats
+VERSION_FORMAT = 1
+
+# Expressions représentatives (analyse et évaluation)
+EXPRESSIONS = [
+    "2 + 3 * 4",
+    "(1 + 2) * (3 - 4) / 5",
+    "sqrt(16) + abs(-3) ^ 2",
+    "sin(PI / 4) * cos(PI / 3) + tan(0.5)",
+    "ln(E ^ 2) + log(1000) - exp(1.5)",
+    "max(3, 7, 1, 9, 2) + min(4, 8) + mean(1, 2, 3, 4)",
+    "if(3 > 2, 10, 20) + piecewise(0, 1, 1, 2, 3)",
+    "3 * 2 ^ 10 - 1000 % 7 + inv(4) + sqr(3)",
+    "sigma(k ^ 2, k, 1, 50)",
+    "stdev(2, 4, 4, 4, 5, 5, 7, 9) + median(5, 1, 3)",
+]
+
+# Noyaux numériques : (nom, fonction, arité, domaine des arguments)
+NOYAUX = [
+    ('racine_carree', calculateur.racine_carree, 1, (0.0, 1e6)),
+    ('valeur_absolue', calculateur.valeur_absolue, 1, (-1e6, 1e6)),
+    ('modulo', calculateur.modulo, 2, (1.0, 1e6)),
+    ('minimum', calculateur.minimum, 2, (-1e6, 1e6)),
+    ('maximum', calculateur.maximum, 2, (-1e6, 1e6)),
+    ('puissance', calculateur.puissance, 2, (0.5, 4.0)),
+    ('inverse', calculateur.inverse, 1, (1.0, 1e6)),
+    ('carre', calculateur.carre, 1, (-1e3, 1e3)),
+    ('sinus', calculateur.sinus, 1, (-100.0, 100.0)),
+    ('cosinus', calculateur.cosinus, 1, (-100.0, 100.0)),
+    ('tangente', calculateur.tangente, 1, (-1.5, 1.5)),
+    ('sinus_degres', calculateur.sinus_degres, 1, (-720.0, 720.0)),
+    ('cosinus_degres', calculateur.cosinus_degres, 1, (-720.0, 720.0)),
+    ('tangente_degres', calculateur.tangente_degres, 1, (-80.0, 80.0)),
+    ('logarithme_neperien', calculateur.logarithme_neperien, 1, (1e-3, 1e6)),
+    ('logarithme_base10', calculateur.logarithme_base10, 1, (1e-3, 1e6)),
+    ('exponentielle', calculateur.exponentielle, 1, (-50.0, 50.0)),
+]
+
+# Noyaux sur une liste de valeurs
+NOYAUX_LISTES = [
+    ('somme', calculateur.somme),
+    ('moyenne', calculateur.moyenne),
+    ('variance', calculateur.variance),
+    ('ecart_type', calculateur.ecart_type),
+    ('mediane', calculateur.mediane),
+    ('minimum_liste', calculateur.minimum_liste),
+    ('maximum_liste', calculateur.maximum_liste),
+]
+
+# Tailles d'historique mesurées (répétitions pour les plus grands)
+TAILLES_HISTORIQUE = {10: None, 10_000: None, 1_000_000: 5}
+
+# Courbes du banc graphique (fenêtre 800 x 600, x dans [-10, 10], y dans [-5, 5])
+COURBES = ["sin(x) * x", "ln(x)", "x ^ 3 - 2 * x", "1 / x"]
+
+# Bancs sur tableaux : expression et nombre de valeurs (x dans [-10, 10])
+EXPRESSION_TABLEAU = "sin(x) * exp(-x ^ 2 / 2) + sqrt(abs(x))"
+TAILLE_TABLEAU = 1_000_000
+
+# Bancs enregistrés : nom -> (préparation, répétitions ou None)
+BANCS = {}
+
+
+def banc(nom: str, repetitions=None):
+    """
+    Enregistre un banc. La préparation (appelée une fois, hors mesure)
+    rend la fonction mesurée, ou (fonction, nettoyage).
+    """
+    def enregistrer(preparation):
+        BANCS[nom] = (preparation, repetitions)
+        return preparation
+    return enregistrer
+
+
+def _generateur() -> random.Random:
+    return random.Random(GRAINE)
+
+
+#=============================================================================
+# BANCS
+#=============================================================================
+
+@banc('analyse.tokenize')
+def _tokenize():
+    return lambda: [tokenize(expression) for expression in EXPRESSIONS]
+
+
+@banc('analyse.infix_to_rpn')
+def _infix_to_rpn():
+    tokens = [tokenize(expression) for expression in EXPRESSIONS]
+    return lambda: [infix_to_rpn(t) for t in tokens]
+
+
+@banc('analyse.evaluer_rpn')
+def _evaluer_rpn():
+    programmes = [compiler(infix_to_rpn(tokenize(expression))) for expression in EXPRESSIONS]
+    return lambda: [evaluer_rpn(rpn) for rpn in programmes]
+
+
+def _banc_noyau(nom: str, noyau, arite: int, domaine: tuple):
+    """Banc d'un noyau : 1000 appels sur des arguments fixes du domaine."""
+    @banc(f'noyau.{nom}')
+    def preparation():
+        generateur = _generateur()
+        arguments = [tuple(generateur.uniform(*domaine) for _ in range(arite)) for _ in range(1000)]
+        return lambda: [noyau(*a) for a in arguments]
+
+
+def _banc_noyau_liste(nom: str, noyau):
+    """Banc d'un noyau sur liste : 100 listes de 100 valeurs."""
+    @banc(f'noyau.{nom}')
+    def preparation():
+        generateur = _generateur()
+        listes = [[generateur.uniform(-1e3, 1e3) for _ in range(100)] for _ in range(100)]
+        return lambda: [noyau(valeurs) for valeurs in listes]
+
+
+for _nom, _noyau, _arite, _domaine in NOYAUX:
+    _banc_noyau(_nom, _noyau, _arite, _domaine)
+for _nom, _noyau in NOYAUX_LISTES:
+    _banc_noyau_liste(_nom, _noyau)
+
+
+@banc('validateur.valider_expression')
+def _valider():
+    validateur = Validateur()
+    return lambda: [validateur.valider_expression(expression) for expression in EXPRESSIONS]
+
+
+@banc('fractions.decimal_vers_fraction')
+def _fractions():
+    generateur = _generateur()
+    decimaux = [round(generateur.uniform(-100, 100), generateur.randint(1, 6)) for _ in range(200)]
+    return lambda: [decimal_vers_fraction(d) for d in decimaux]
+
+
+def _banc_historique(taille: int, repetitions):
+    """Banc d'Historique.ajouter() sur un historique de taille opérations."""
+    @banc(f'historique.ajouter.{taille}', repetitions)
+    def preparation():
+        dossier = tempfile.mkdtemp(prefix='banc_historique_')
+        historique = Historique(fichier=os.path.join(dossier, 'historique.json'))
+        horodatage = '2024-01-01T00:00:00'
+        historique.operations = [
+            {'expression': f"{i} + 1", 'resultat': float(i + 1), 'timestamp': horodatage}
+            for i in range(taille)
+        ]
+        historique._indexer()
+        compteur = iter(range(taille, 10 ** 12))
+
+        def ajouter():
+            n = next(compteur)  # Expression nouvelle : jamais un doublon
+            historique.ajouter(f"{n} * 2", float(2 * n))
+
+        return ajouter, lambda: shutil.rmtree(dossier, ignore_errors=True)
+
+
+for _taille, _repetitions in TAILLES_HISTORIQUE.items():
+    _banc_historique(_taille, _repetitions)
+
+
+@banc('graphique.abscisses_adaptatives')
+def _abscisses():
+    programmes = [compiler(infix_to_rpn(tokenize(courbe))) for courbe in COURBES]
+    return lambda: [abscisses_adaptatives(rpn, 'x', -10, 10, -5, 5, 800, 600) for rpn in programmes]
+
+
+@banc('graphique.evaluer_points')
+def _points():
+    programmes = [compiler(infix_to_rpn(tokenize(courbe))) for courbe in COURBES]
+    xs = [-10 + 20 * i / 1000 for i in range(1001)]
+    return lambda: [evaluer_points(rpn, 'x', xs) for rpn in programmes]
+
+
+def _tableau() -> tuple:
+    """RPN et tableau d'entrée communs aux deux bancs sur tableaux."""
+    import numpy
+    rpn = compiler(infix_to_rpn(tokenize(EXPRESSION_TABLEAU)))
+    x = numpy.random.default_rng(GRAINE).uniform(-10, 10, TAILLE_TABLEAU)
+    return rpn, x
+
+
+if NUMPY_DISPONIBLE:
+    @banc('tableaux.vectoriel', 5)
+    def _tableaux_vectoriel():
+        from src.vectoriel import evaluer_rpn_vectoriel
+        rpn, x = _tableau()
+        return lambda: evaluer_rpn_vectoriel(rpn, {'x': x})
+
+    @banc('tableaux.blocs', 5)
+    def _tableaux_blocs():
+        import numpy
+        from src.blocs import evaluer_par_blocs
+        rpn, x = _tableau()
+        sortie = numpy.empty_like(x)  # Fournie par l'appelant, comme un memmap
+        return lambda: evaluer_par_blocs(rpn, {'x': x}, sortie=sortie)
+
+
+#=============================================================================
+# MESURE
+#=============================================================================
+
+def mesurer(fonction, repetitions=REPETITIONS, duree_min=DUREE_MIN) -> dict:
+    """
+    Temps par appel de chaque répétition.
+
+    Le nombre d'appels par répétition est doublé jusqu'à durer au moins
+    duree_min (étalonnage non compté).
+
+    Returns:
+        dict: appels (par répétition), temps (secondes par appel, une
+              valeur par répétition)
+    """
+    gc_actif = gc.isenabled()
+    gc.disable()
+    try:
+        appels = 1
+        while True:
+            debut = time.perf_counter()
+            for _ in range(appels):
+                fonction()
+            if time.perf_counter() - debut >= duree_min:
+                break
+            appels *= 2
+
+        temps = []
+        for _ in range(repetitions):
+            debut = time.perf_counter()
+            for _ in range(appels):
+                fonction()
+            temps.append((time.perf_counter() - debut) / appels)
+    finally:
+        if gc_actif:
+            gc.enable()
+    return {'appels': appels, 'temps': temps}
+
+
+def environnement() -> dict:
+    """Ce qui peut changer les temps d'une machine à l'autre."""
+    try:
+        import numpy
+        version_numpy = numpy.__version__
+    except ImportError:
+        version_numpy = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'systeme': platform.platform(),
+        'processeur': platform.processor() or platform.machine(),
+        'coeurs': os.cpu_count(),
+        'numpy': version_numpy if NUMPY_DISPONIBLE else None,
+    }
+
+
+def executer(filtre=None, repetitions=REPETITIONS, duree_min=DUREE_MIN, progression=None) -> dict:
+    """
+    Exécute les bancs dont le nom contient le motif filtre (expression
+    régulière, tous si None).
+
+    Args:
+        progression: Fonction optionnelle appelée avec le nom de chaque banc
+
+    Returns:
+        dict: version, date, environnement, bancs ({nom: {appels, temps}})
+    """
+    motif = re.compile(filtre) if filtre else None
+    resultats = {}
+    for nom, (preparation, repetitions_banc) in BANCS.items():
+        if motif is not None and not motif.search(nom):
+            continue
+        if progression is not None:
+            progression(nom)
+        preparee = preparation()
+        fonction, nettoyage = preparee if isinstance(preparee, tuple) else (preparee, None)
+        try:
+            resultats[nom] = mesurer(fonction, min(repetitions, repetitions_banc or repetitions), duree_min)
+        finally:
+            if nettoyage is not None:
+                nettoyage()
+    return {
+        'version': VERSION_FORMAT,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environnement': environnement(),
+        'bancs': resultats,
+    }
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée de python -m benchmarks.suite."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(prog='python -m benchmarks.suite',
+                                        description="Exécute les micro-bancs de performance.")
+    analyseur.add_argument('--sortie', help="fichier JSON des résultats (défaut : sortie standard)")
+    analyseur.add_argument('--filtre', help="expression régulière sur les noms des bancs")
+    analyseur.add_argument('--repetitions', type=int, default=REPETITIONS, help="répétitions par banc")
+    analyseur.add_argument('--duree-min', type=float, default=DUREE_MIN,
+                           help="durée minimale d'une répétition, en secondes")
+    analyseur.add_argument('--liste', action='store_true', help="affiche les noms des bancs")
+    options = analyseur.parse_args(arguments)
+
+    if options.liste:
+        print('\n'.join(BANCS))
+        return 0
+
+    resultats = executer(options.filtre, options.repetitions, options.duree_min,
+                         progression=lambda nom: print(nom, file=sys.stderr, flush=True))
+    texte = json.dumps(resultats, indent=1)
+    if options.sortie:
+        Path(options.sortie).write_text(texte + '\n', encoding='utf-8')
+    else:
+        print(texte)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
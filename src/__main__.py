@@ -0,0 +1,13 @@
+# src/__main__.py
+"""
+Point d'entrée de python -m src : calcul en flux (voir src.console).
+python -m src --interface lance l'interface graphique.
+"""
+
+import sys
+
+from src.console import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
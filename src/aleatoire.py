@@ -0,0 +1,240 @@
+# src/aleatoire.py
+"""
+================================================================================
+Module des tirages aléatoires et de Monte-Carlo - VERSION 4.0
+================================================================================
+
+    rand()          uniforme sur [0, 1[
+    randn()         loi normale centrée réduite
+    randint(a, b)   entier uniforme de a à b (inclus)
+    mc(expr, n)     estimation de Monte-Carlo : moyenne de expr sur n
+                    tirages, avec son intervalle de confiance à 95 %
+
+Chaque Session a son propre générateur : Session(graine=42) rejoue
+toujours les mêmes tirages. Les calculs sans session (calculer())
+partagent un générateur du module.
+
+MONTE-CARLO :
+-------------
+    mc(rand()^2, 1000000) -> [moyenne, bas, haut], environ [0.3333, 0.3328, 0.3339]
+
+    L'expression est compilée une seule fois (argument différé), puis
+    évaluée par lots de TAILLE_LOT tirages avec NumPy (src.vectoriel) :
+    rand() y renvoie un tableau d'un tirage par élément. La moyenne et la
+    variance des lots sont fusionnées (formule de Chan) : la mémoire reste
+    bornée par la taille d'un lot, même pour n = 10^7.
+
+    Sans NumPy (ou en mode complexe), les n tirages sont évalués un par un
+    par evaluer_rpn (algorithme de Welford).
+
+================================================================================
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from src.calculateur import evaluer_rpn
+from src.exceptions import CalculatriceError, ArgumentFonctionError
+from src.programmeur import _entier
+
+
+# Nombre de tirages évalués ensemble par NumPy dans mc()
+TAILLE_LOT = 65536
+
+# Nombre maximal de tirages de mc() (au-delà, le calcul ne finirait pas)
+TIRAGES_MAX = 10 ** 8
+
+# Quantile à 97.5 % de la loi normale : intervalle de confiance à 95 %
+QUANTILE_95 = 1.959963984540054
+
+# Générateurs des calculs sans session (calculer())
+_generateur = random.Random()
+_generateur_numpy = None
+
+
+#=============================================================================
+# GÉNÉRATEURS
+#=============================================================================
+
+def generateur(session=None) -> random.Random:
+    """Générateur Python de la session (ou du module)."""
+    return session.generateur if session is not None else _generateur
+
+
+def generateur_numpy(session=None):
+    """
+    Générateur NumPy de la session (ou du module).
+
+    Créé au premier besoin à partir du générateur Python : une seule
+    graine détermine les tirages scalaires et vectorisés.
+    """
+    global _generateur_numpy
+    if session is not None:
+        if session.generateur_numpy is None:
+            session.generateur_numpy = np.random.default_rng(session.generateur.getrandbits(128))
+        return session.generateur_numpy
+    if _generateur_numpy is None:
+        _generateur_numpy = np.random.default_rng(_generateur.getrandbits(128))
+    return _generateur_numpy
+
+
+#=============================================================================
+# TIRAGES
+#=============================================================================
+
+def tirage(nom: str, session=None) -> float:
+    """
+    Un tirage de rand() ou randn().
+
+    Examples:
+        >>> 0 <= tirage('rand') < 1
+        True
+    """
+    if nom == 'rand':
+        return generateur(session).random()
+    return generateur(session).gauss(0.0, 1.0)
+
+
+def entier_aleatoire(a, b, session=None) -> int:
+    """
+    randint(a, b) : entier uniforme de a à b inclus.
+
+    Raises:
+        ArgumentFonctionError: Bornes non entières ou a > b
+
+    Examples:
+        >>> entier_aleatoire(3, 3)
+        3
+    """
+    a = _entier('randint', a)
+    b = _entier('randint', b)
+    if a > b:
+        raise ArgumentFonctionError('randint', "nécessite a <= b")
+    return generateur(session).randint(a, b)
+
+
+def tirages(nom: str, forme: tuple, session=None):
+    """Tableau de tirages de rand() ou randn() (évaluation vectorisée)."""
+    if nom == 'rand':
+        return generateur_numpy(session).random(forme)
+    return generateur_numpy(session).standard_normal(forme)
+
+
+def entiers_aleatoires(a, b, forme: tuple, session=None):
+    """
+    Tableau de tirages de randint(a, b) ; a et b peuvent être des tableaux.
+
+    Raises:
+        ArgumentFonctionError: Bornes non entières ou a > b (l'évaluation
+                               scalaire donne alors le message exact)
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if not (np.all(a == np.floor(a)) and np.all(b == np.floor(b))):
+        raise ArgumentFonctionError('randint', "nécessite des nombres entiers")
+    if np.any(a > b):
+        raise ArgumentFonctionError('randint', "nécessite a <= b")
+    entiers = generateur_numpy(session).integers(
+        a.astype(np.int64), b.astype(np.int64), size=forme, endpoint=True
+    )
+    return entiers.astype(float)
+
+
+#=============================================================================
+# MONTE-CARLO
+#=============================================================================
+
+def monte_carlo(corps: list, n, utiliser_degres=False, variables=None, session=None) -> tuple:
+    """
+    Estime la moyenne de corps sur n tirages : mc(expr, n).
+
+    Args:
+        corps: Sous-programme RPN de l'expression (argument différé)
+        n: Nombre de tirages (entier de 2 à TIRAGES_MAX)
+        utiliser_degres: Mode angulaire
+        variables: Variables extérieures visibles dans l'expression
+        session: Session (générateur, fonctions de l'utilisateur)
+
+    Returns:
+        tuple: (moyenne, bas, haut), [bas, haut] étant l'intervalle de
+               confiance à 95 % de la moyenne
+
+    Raises:
+        ArgumentFonctionError: n invalide, ou expression non définie ou
+                               non réelle pour certains tirages
+
+    Examples:
+        >>> moyenne, bas, haut = monte_carlo(['rand'], 100000)
+        >>> bas < 0.5 < haut
+        True
+    """
+    n = _entier('mc', n)
+    if n < 2:
+        raise ArgumentFonctionError('mc', "nécessite au moins 2 tirages")
+    if n > TIRAGES_MAX:
+        raise ArgumentFonctionError('mc', f"accepte au plus {TIRAGES_MAX} tirages")
+
+    from src import vectoriel
+    resultat = None
+    # Les tableaux NumPy sont réels : le mode complexe passe par la boucle
+    if vectoriel.NUMPY_DISPONIBLE and not (session is not None and session.mode_complexe):
+        resultat = _par_lots(corps, n, utiliser_degres, variables, session)
+    if resultat is None:
+        resultat = _par_boucle(corps, n, utiliser_degres, variables, session)
+
+    moyenne, m2 = resultat
+    demi_largeur = QUANTILE_95 * (m2 / (n - 1) / n) ** 0.5
+    return moyenne, moyenne - demi_largeur, moyenne + demi_largeur
+
+
+def _par_lots(corps: list, n: int, utiliser_degres, variables, session):
+    """
+    Moyenne et somme des carrés des écarts, par lots NumPy.
+
+    Returns:
+        tuple: (moyenne, m2), ou None si l'expression n'est pas
+               vectorisable (la boucle lèvera l'erreur exacte s'il y en a une)
+    """
+    from src import vectoriel
+
+    variables_locales = dict(variables) if variables else {}
+    moyenne = m2 = 0.0
+    compte = 0
+    while compte < n:
+        taille = min(TAILLE_LOT, n - compte)
+        # Donne sa forme aux tirages de rand() : un par élément du lot
+        variables_locales[vectoriel.TIRAGES] = np.zeros(taille)
+        try:
+            valeurs = vectoriel.evaluer_rpn_vectoriel(corps, variables_locales, utiliser_degres, session)
+        except (ArithmeticError, ValueError, TypeError, CalculatriceError):
+            return None
+        if not np.isfinite(valeurs).all():
+            raise ArgumentFonctionError('mc', "l'expression n'est pas définie pour certains tirages")
+
+        # Fusion des statistiques du lot avec celles des lots précédents (Chan)
+        moyenne_lot = valeurs.mean()
+        m2_lot = ((valeurs - moyenne_lot) ** 2).sum()
+        total = compte + taille
+        delta = moyenne_lot - moyenne
+        moyenne += delta * taille / total
+        m2 += m2_lot + delta * delta * compte * taille / total
+        compte = total
+
+    return float(moyenne), float(m2)
+
+
+def _par_boucle(corps: list, n: int, utiliser_degres, variables, session) -> tuple:
+    """Moyenne et somme des carrés des écarts, tirage par tirage (Welford)."""
+    moyenne = m2 = 0.0
+    for compte in range(1, n + 1):
+        valeur = evaluer_rpn(corps, utiliser_degres, variables, session)
+        if not isinstance(valeur, (int, float)):
+            raise ArgumentFonctionError('mc', "l'expression doit avoir une valeur réelle")
+        delta = valeur - moyenne
+        moyenne += delta / compte
+        m2 += delta * (valeur - moyenne)
+    return moyenne, m2
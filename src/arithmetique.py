@@ -0,0 +1,378 @@
+# src/arithmetique.py
+"""
+================================================================================
+Module d'arithmétique des entiers - VERSION 4.0
+================================================================================
+
+Fonctions de théorie des nombres, calculées sur des entiers exacts (int
+de Python, sans limite de taille) :
+
+    gcd(a, b, ...), lcm(a, b, ...)  PGCD et PPCM
+    powmod(a, b, m)                 a^b modulo m (exponentiation rapide)
+    isprime(n)                      1 si n est premier, 0 sinon
+    factor(n)                       décomposition en facteurs premiers
+    nCr(n, k), nPr(n, k)            combinaisons et arrangements
+    fact(n)                         factorielle
+
+Un argument float entier (12.0) est converti sans perte ; 1.5 lève une
+erreur. Les littéraux décimaux au-delà de 2^53 restent des entiers exacts
+(voir calculateur.valeur_nombre), comme tous les entiers du mode programmeur.
+
+ALGORITHMES :
+-------------
+    - isprime : divisions par les petits premiers, puis Miller-Rabin.
+      Déterministe avec les 12 premières bases jusqu'à 3.3 * 10^24 (donc
+      pour tout entier de 64 bits), probabiliste au-delà (8 bases de plus,
+      erreur < 4^-20, toujours les mêmes pour un n donné)
+    - factor : petits premiers, puis rho de Pollard (variante de Brent,
+      PGCD groupés) : un semi-premier de 20 chiffres en quelques dixièmes
+      de seconde, au lieu de 10^10 divisions
+    - fact : n! = 2^(n - popcount(n)) * produit des parties impaires,
+      chaque produit étant découpé en deux moitiés de tailles égales
+      (multiplications de grands entiers équilibrées) : fact(100000) en
+      une fraction de seconde
+    - nCr, nPr : produits découpés de la même façon, puis une seule
+      division exacte
+
+================================================================================
+"""
+
+import random
+
+from src.exceptions import ArgumentFonctionError, ModuloParZeroError
+from src.fractions import pgcd
+from src.programmeur import _entier
+
+
+# Petits premiers : divisions d'essai avant Miller-Rabin et Pollard
+PETITS_PREMIERS = [p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+
+# Bases de Miller-Rabin déterministes pour n < 3 317 044 064 679 887 385 961 981
+BASES_DETERMINISTES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+LIMITE_DETERMINISTE = 3317044064679887385961981
+
+# Bases aléatoires supplémentaires au-delà de cette limite
+BASES_ALEATOIRES = 8
+
+# Nombre d'itérations de Pollard entre deux calculs de PGCD
+TAILLE_LOT = 128
+
+# En dessous de cette longueur, un produit est calculé par une simple boucle
+SEUIL_PRODUIT = 16
+
+
+#=============================================================================
+# FONCTIONS DE LA CALCULATRICE
+#=============================================================================
+
+def fonction(nom: str, *arguments):
+    """
+    Applique isprime, factor, fact, powmod, ncr ou npr.
+
+    Args:
+        nom: Nom de la fonction (en minuscules, comme après tokenize)
+        *arguments: Arguments (int, ou float entiers)
+
+    Returns:
+        int: Le résultat exact (Factorisation pour factor)
+
+    Raises:
+        ArgumentFonctionError: Argument non entier ou hors du domaine
+
+    Examples:
+        >>> fonction('ncr', 5.0, 2.0)
+        10
+    """
+    entiers = [_entier(nom, argument) for argument in arguments]
+
+    if nom == 'isprime':
+        return 1 if est_premier(entiers[0]) else 0
+    if nom == 'factor':
+        return Factorisation(entiers[0])
+    if nom == 'fact':
+        return factorielle(entiers[0])
+    if nom == 'powmod':
+        return puissance_modulaire(*entiers)
+    if nom == 'ncr':
+        return combinaisons(*entiers)
+    return arrangements(*entiers)
+
+
+def variadique(nom: str, valeurs) -> int:
+    """
+    gcd(a, b, ...) ou lcm(a, b, ...) de tous les arguments.
+
+    Examples:
+        >>> variadique('gcd', [12, 18, 8])
+        2
+        >>> variadique('lcm', [4, 6])
+        12
+    """
+    resultat = 0 if nom == 'gcd' else 1
+    for valeur in valeurs:
+        n = _entier(nom, valeur)
+        if nom == 'gcd':
+            resultat = pgcd(resultat, n)
+        elif resultat == 0 or n == 0:
+            resultat = 0
+        else:
+            resultat = abs(resultat * n) // pgcd(resultat, n)
+    return resultat
+
+
+#=============================================================================
+# PRIMALITÉ ET FACTORISATION
+#=============================================================================
+
+def est_premier(n: int) -> bool:
+    """
+    Test de primalité de Miller-Rabin.
+
+    Examples:
+        >>> est_premier(2 ** 61 - 1)
+        True
+        >>> est_premier(561)
+        False
+    """
+    if n < 2:
+        return False
+    for p in PETITS_PREMIERS:
+        if n % p == 0:
+            return n == p
+
+    # n - 1 = d * 2^s avec d impair
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    bases = list(BASES_DETERMINISTES)
+    if n >= LIMITE_DETERMINISTE:
+        # Toujours les mêmes bases pour un même n : résultat reproductible
+        generateur = random.Random(n)
+        bases += [generateur.randrange(2, n - 1) for _ in range(BASES_ALEATOIRES)]
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def factoriser(n: int) -> dict:
+    """
+    Décompose n en facteurs premiers.
+
+    Args:
+        n: Entier non nul (le signe est ignoré)
+
+    Returns:
+        dict: {premier: exposant}, dans l'ordre croissant des premiers
+
+    Raises:
+        ArgumentFonctionError: Si n = 0
+
+    Examples:
+        >>> factoriser(360)
+        {2: 3, 3: 2, 5: 1}
+    """
+    if n == 0:
+        raise ArgumentFonctionError('factor', "0 n'a pas de décomposition")
+    n = abs(n)
+
+    facteurs = {}
+    for p in PETITS_PREMIERS:
+        if p * p > n:
+            break
+        while n % p == 0:
+            facteurs[p] = facteurs.get(p, 0) + 1
+            n //= p
+
+    # Les facteurs restants sont tous > 1000 : Pollard sur les composés
+    a_decomposer = [n] if n > 1 else []
+    while a_decomposer:
+        m = a_decomposer.pop()
+        if est_premier(m):
+            facteurs[m] = facteurs.get(m, 0) + 1
+        else:
+            diviseur = _pollard_brent(m)
+            a_decomposer += [diviseur, m // diviseur]
+
+    return dict(sorted(facteurs.items()))
+
+
+class Factorisation(int):
+    """
+    Résultat de factor(n) : vaut n dans les calculs, mais s'affiche sous
+    forme factorisée (comme la touche FACT des calculatrices).
+
+    Examples:
+        >>> str(Factorisation(360))
+        '2^3 * 3^2 * 5'
+        >>> Factorisation(360) + 0
+        360
+    """
+
+    def __new__(cls, n: int):
+        factorisation = super().__new__(cls, n)
+        factorisation.facteurs = factoriser(n)
+        return factorisation
+
+    def __str__(self) -> str:
+        termes = [str(p) if k == 1 else f"{p}^{k}" for p, k in self.facteurs.items()]
+        texte = " * ".join(termes) or "1"
+        return "-" + texte if self < 0 else texte
+
+    __repr__ = __str__
+
+
+def _pollard_brent(n: int) -> int:
+    """
+    Trouve un diviseur non trivial d'un n composé (rho de Pollard, Brent).
+
+    Les |x - y| sont multipliés par lots de TAILLE_LOT avant un seul PGCD ;
+    si le lot saute par-dessus le diviseur, on le rejoue pas à pas.
+    """
+    if n % 2 == 0:
+        return 2
+
+    generateur = random.Random(n)
+    while True:
+        y = generateur.randrange(1, n)
+        c = generateur.randrange(1, n)
+        diviseur = produit = longueur = 1
+
+        while diviseur == 1:
+            x = y
+            for _ in range(longueur):
+                y = (y * y + c) % n
+            k = 0
+            while k < longueur and diviseur == 1:
+                sauvegarde = y
+                for _ in range(min(TAILLE_LOT, longueur - k)):
+                    y = (y * y + c) % n
+                    produit = produit * abs(x - y) % n
+                diviseur = pgcd(produit, n)
+                k += TAILLE_LOT
+            longueur *= 2
+
+        if diviseur == n:
+            # Lot trop grand : reprendre depuis sa sauvegarde, un pas à la fois
+            diviseur = 1
+            while diviseur == 1:
+                sauvegarde = (sauvegarde * sauvegarde + c) % n
+                diviseur = pgcd(abs(x - sauvegarde), n)
+
+        if diviseur != n:
+            return diviseur
+        # Cycle sans diviseur : recommencer avec une autre constante
+
+
+#=============================================================================
+# FACTORIELLE, COMBINAISONS, PUISSANCE MODULAIRE
+#=============================================================================
+
+def factorielle(n: int) -> int:
+    """
+    n! par découpage binaire des parties impaires.
+
+    n! = (impairs <= n) * 2^(n//2) * (n//2)!, donc la partie impaire de n!
+    est le produit, pour k = 0, 1, 2..., des impairs <= n >> k.
+
+    Raises:
+        ArgumentFonctionError: Si n < 0
+
+    Examples:
+        >>> factorielle(10)
+        3628800
+    """
+    if n < 0:
+        raise ArgumentFonctionError('fact', "nécessite un entier positif ou nul")
+
+    impairs = 1   # Produit des impairs <= n >> k
+    resultat = 1
+    for k in range(n.bit_length() - 1, -1, -1):
+        haut = n >> k
+        bas = n >> (k + 1)
+        # Impairs de ]bas, haut] : de (bas + 1) | 1 à haut, par pas de 2
+        premier = (bas + 1) | 1
+        if premier <= haut:
+            impairs *= _produit(premier, (haut - premier) // 2 + 1, 2)
+        resultat *= impairs
+
+    return resultat << (n - bin(n).count('1'))
+
+
+def combinaisons(n: int, k: int) -> int:
+    """
+    nCr(n, k) = n! / (k! (n-k)!), 0 si k > n.
+
+    Examples:
+        >>> combinaisons(5, 2)
+        10
+    """
+    if n < 0 or k < 0:
+        raise ArgumentFonctionError('nCr', "nécessite des entiers positifs ou nuls")
+    if k > n:
+        return 0
+    k = min(k, n - k)
+    return arrangements(n, k) // factorielle(k)
+
+
+def arrangements(n: int, k: int) -> int:
+    """
+    nPr(n, k) = n! / (n-k)! = n * (n-1) * ... * (n-k+1), 0 si k > n.
+
+    Examples:
+        >>> arrangements(5, 2)
+        20
+    """
+    if n < 0 or k < 0:
+        raise ArgumentFonctionError('nPr', "nécessite des entiers positifs ou nuls")
+    if k > n:
+        return 0
+    return _produit(n - k + 1, k, 1)
+
+
+def puissance_modulaire(a: int, b: int, m: int) -> int:
+    """
+    a^b modulo m sans calculer a^b (exponentiation rapide de pow).
+
+    Un exposant négatif utilise l'inverse modulaire de a.
+
+    Raises:
+        ModuloParZeroError: Si m = 0
+        ArgumentFonctionError: Exposant négatif et a non inversible modulo m
+
+    Examples:
+        >>> puissance_modulaire(2, 10, 1000)
+        24
+        >>> puissance_modulaire(3, -1, 7)
+        5
+    """
+    if m == 0:
+        raise ModuloParZeroError()
+    try:
+        return pow(a, b, m)
+    except ValueError:
+        raise ArgumentFonctionError('powmod', f"{a} n'est pas inversible modulo {m}")
+
+
+def _produit(debut: int, nombre: int, pas: int) -> int:
+    """
+    debut * (debut + pas) * ... (nombre termes), découpé en deux moitiés.
+    """
+    if nombre <= SEUIL_PRODUIT:
+        resultat = 1
+        for i in range(nombre):
+            resultat *= debut + i * pas
+        return resultat
+    moitie = nombre // 2
+    return _produit(debut, moitie, pas) * _produit(debut + moitie * pas, nombre - moitie, pas)
@@ -0,0 +1,234 @@
+# src/balayage.py
+"""
+================================================================================
+Module de balayage de paramètres (tables de valeurs) - VERSION 4.0
+================================================================================
+
+Évalue une expression sur le PRODUIT CARTÉSIEN de grilles de valeurs,
+sur tous les cœurs du processeur :
+
+    >>> table = balayer("a*sin(x) + x^2", {'x': np.linspace(0, 1, 1000),
+    ...                                    'a': [1, 2, 3]})
+    >>> table.shape        # un axe par grille, dans l'ordre du dictionnaire
+    (1000, 3)
+    >>> table[999, 2]      # x = 1, a = 3
+    3.5244129544236893
+
+FONCTIONNEMENT :
+----------------
+    - L'expression est compilée UNE fois (tokenize, RPN, polynômes) ;
+      chaque processus reçoit la RPN et les grilles une seule fois, à son
+      démarrage.
+    - La table (aplatie) est découpée en morceaux de TAILLE_MORCEAU
+      valeurs. Chaque processus calcule les valeurs des variables de son
+      morceau (np.unravel_index) et l'évalue par blocs (src.blocs)
+      DIRECTEMENT dans la table, un fichier .npy projeté en mémoire
+      (np.memmap) partagé par tous les processus : aucun résultat ne
+      transite par pickle, seul le numéro du morceau revient.
+    - Reprise : avec sortie='table.npy', la liste des morceaux terminés
+      est tenue dans 'table.progression.npy' ; balayer(..., reprendre=True)
+      ne recalcule que les morceaux manquants (après une interruption).
+      Un morceau n'est marqué terminé qu'une fois écrit sur disque.
+      'table.signature' résume le balayage (RPN compilée, grilles, mode
+      angulaire, taille des morceaux) : une reprise d'un autre balayage
+      est refusée, au lieu de compléter une table qui mêlerait les deux.
+    - progression(termines, total) est appelée après chaque morceau.
+
+Sans sortie, la table est écrite dans un .npy temporaire, puis renvoyée
+en mémoire. NumPy est nécessaire.
+
+================================================================================
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from src.calculateur import tokenize, infix_to_rpn
+from src.exceptions import ExpressionInvalideError
+from src.polynomes import compiler
+from src.blocs import evaluer_par_blocs
+
+
+# Valeurs par morceau (8 Mo de résultats) : assez pour amortir l'envoi
+# d'une tâche, assez peu pour équilibrer les processus et reprendre vite
+TAILLE_MORCEAU = 2 ** 20
+
+# Contexte d'un processus de calcul (rempli par _initialiser)
+_contexte = {}
+
+
+#=============================================================================
+# FONCTION PRINCIPALE
+#=============================================================================
+
+def balayer(expression: str, grilles: dict, sortie=None, reprendre=False, processus=None,
+            taille_morceau=TAILLE_MORCEAU, progression=None, utiliser_degres=False, session=None):
+    """
+    Évalue une expression sur le produit cartésien des grilles.
+
+    Args:
+        expression: Expression (ex: "a*sin(x) + x^2")
+        grilles: {nom: valeurs} ; l'ordre du dictionnaire donne les axes
+        sortie: Chemin du fichier .npy de la table (None : table en mémoire)
+        reprendre: Si True et que sortie existe, ne calcule que les morceaux
+                   qui n'ont pas été terminés
+        processus: Nombre de processus (défaut : nombre de cœurs ; 1 :
+                   calcul dans le processus courant)
+        taille_morceau: Nombre de valeurs par morceau
+        progression: Fonction optionnelle appelée avec (termines, total)
+        utiliser_degres: Mode angulaire
+        session: Session optionnelle (fonctions et variables de l'utilisateur)
+
+    Returns:
+        numpy.ndarray: La table (np.memmap ouvert sur sortie si donnée)
+
+    Raises:
+        ExpressionInvalideError: Grille vide ou non à une dimension, table
+                                 existante d'un autre balayage (forme ou
+                                 signature différente)
+        CalculatriceError: Expression invalide (vérifiée sur le premier
+                           point, avant de lancer les processus)
+    """
+    if np is None:
+        raise ImportError("NumPy est nécessaire pour le balayage")
+
+    grilles = {nom: np.asarray(valeurs, dtype=float) for nom, valeurs in grilles.items()}
+    if any(g.ndim != 1 or g.size == 0 for g in grilles.values()):
+        raise ExpressionInvalideError("Chaque grille doit être une liste de valeurs non vide")
+    forme = tuple(g.size for g in grilles.values())
+    total = int(np.prod(forme))
+    nb_morceaux = -(-total // taille_morceau)
+
+    rpn = compiler(infix_to_rpn(tokenize(expression)))
+    # Les erreurs (variable inconnue...) sont levées ici, avec leur type,
+    # plutôt que depuis un processus
+    evaluer_par_blocs(rpn, {nom: g[:1] for nom, g in grilles.items()}, utiliser_degres=utiliser_degres,
+                      session=session)
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = Path(sortie) if sortie is not None else Path(dossier) / 'table.npy'
+        signature = _signature(rpn, grilles, utiliser_degres, taille_morceau)
+        termines = _ouvrir(chemin, forme, nb_morceaux, signature, reprendre and sortie is not None)
+
+        a_calculer = [k for k in range(nb_morceaux) if not termines[k]]
+        contexte = (str(chemin), rpn, grilles, taille_morceau, utiliser_degres, session)
+        fait = nb_morceaux - len(a_calculer)
+        for k in _calculer(a_calculer, contexte, processus):
+            termines[k] = True
+            termines.flush()
+            fait += 1
+            if progression is not None:
+                progression(fait, nb_morceaux)
+        del termines
+
+        table = np.load(chemin, mmap_mode='r+')
+        if sortie is None:
+            table = np.array(table)
+    return table
+
+
+def _ouvrir(chemin: Path, forme: tuple, nb_morceaux: int, signature: str, reprendre: bool):
+    """
+    Crée (ou rouvre pour une reprise) la table et sa liste de morceaux terminés.
+
+    Returns:
+        np.memmap: Un booléen par morceau
+
+    Raises:
+        ExpressionInvalideError: Reprise d'une table d'un autre balayage
+    """
+    suivi = _chemin_progression(chemin)
+    fichier_signature = chemin.with_name(chemin.stem + '.signature')
+    if reprendre and chemin.exists() and suivi.exists():
+        table = np.load(chemin, mmap_mode='r')
+        termines = np.load(suivi, mmap_mode='r+')
+        try:
+            ancienne = fichier_signature.read_text(encoding='ascii').strip()
+        except OSError:
+            ancienne = None
+        if table.shape != forme or termines.shape != (nb_morceaux,) or ancienne != signature:
+            raise ExpressionInvalideError(f"La table {chemin.name} ne correspond pas à ce balayage")
+        return termines
+
+    np.lib.format.open_memmap(chemin, mode='w+', dtype=float, shape=forme).flush()
+    termines = np.lib.format.open_memmap(suivi, mode='w+', dtype=bool, shape=(nb_morceaux,))
+    termines.flush()
+    fichier_signature.write_text(signature, encoding='ascii')
+    return termines
+
+
+def _chemin_progression(chemin: Path) -> Path:
+    """table.npy -> table.progression.npy"""
+    return chemin.with_name(chemin.stem + '.progression.npy')
+
+
+def _signature(rpn: list, grilles: dict, utiliser_degres: bool, taille_morceau: int) -> str:
+    """Empreinte de ce qui détermine les valeurs et le découpage de la table."""
+    empreinte = hashlib.blake2b(digest_size=16)
+    empreinte.update(repr((rpn, bool(utiliser_degres), taille_morceau)).encode('utf-8'))
+    for nom, grille in grilles.items():
+        empreinte.update(nom.encode('utf-8') + b'\0')
+        empreinte.update(np.ascontiguousarray(grille, dtype='<f8').tobytes())
+    return empreinte.hexdigest()
+
+
+#=============================================================================
+# CALCUL DES MORCEAUX
+#=============================================================================
+
+def _calculer(morceaux: list, contexte: tuple, processus):
+    """Génère les numéros des morceaux au fur et à mesure qu'ils sont écrits."""
+    if not morceaux:
+        return
+    processus = min(processus or os.cpu_count() or 1, len(morceaux))
+
+    if processus == 1:
+        _initialiser(*contexte)
+        try:
+            for k in morceaux:
+                yield _calculer_morceau(k)
+        finally:
+            _contexte.clear()
+        return
+
+    with ProcessPoolExecutor(processus, initializer=_initialiser, initargs=contexte) as executeur:
+        taches = [executeur.submit(_calculer_morceau, k) for k in morceaux]
+        try:
+            for tache in as_completed(taches):
+                yield tache.result()
+        finally:
+            for tache in taches:
+                tache.cancel()
+
+
+def _initialiser(chemin: str, rpn: list, grilles: dict, taille_morceau: int, utiliser_degres, session):
+    """Ouvre la table partagée une fois par processus."""
+    table = np.load(chemin, mmap_mode='r+')
+    _contexte.update(
+        table=table, plat=table.reshape(-1), rpn=rpn, grilles=grilles,
+        taille_morceau=taille_morceau, utiliser_degres=utiliser_degres, session=session,
+    )
+
+
+def _calculer_morceau(k: int) -> int:
+    """Évalue le morceau k directement dans la table, puis l'écrit sur disque."""
+    plat = _contexte['plat']
+    debut = k * _contexte['taille_morceau']
+    fin = min(debut + _contexte['taille_morceau'], plat.size)
+
+    grilles = _contexte['grilles']
+    indices = np.unravel_index(np.arange(debut, fin), _contexte['table'].shape)
+    variables = {nom: grille[indice] for (nom, grille), indice in zip(grilles.items(), indices)}
+
+    evaluer_par_blocs(_contexte['rpn'], variables, sortie=plat[debut:fin],
+                      utiliser_degres=_contexte['utiliser_degres'], session=_contexte['session'])
+    _contexte['table'].flush()
+    return k
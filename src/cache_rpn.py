@@ -0,0 +1,325 @@
+# src/cache_rpn.py
+"""
+================================================================================
+Cache disque des expressions compilées (RPN) - VERSION 4.0
+================================================================================
+
+Après un redémarrage, les expressions déjà calculées (historique,
+formules enregistrées) n'ont plus à être re-tokenisées ni recompilées :
+leur RPN compilée (tokenize, infix_to_rpn, polynômes) est relue d'un
+fichier binaire.
+
+    cache = CacheRPN(fichier_utilisateur())   # dossier de cache de l'utilisateur
+    session = Session(cache_rpn=cache)
+    ...
+    cache.sauvegarder()     # à la fermeture
+
+FORMAT DU FICHIER (petit-boutiste) :
+------------------------------------
+    En-tête   'CRPN', version du format (H), signature du moteur (16 o),
+              nombre d'entrées n (I)
+    Index     n x (empreinte de l'expression (16 o), position (Q),
+              longueur (I)), trié par empreinte
+    Données   une entrée JSON par expression : [expression, rpn], de la
+              plus récemment utilisée à la plus ancienne
+
+    Le fichier est projeté en mémoire (mmap) à la première recherche : une
+    recherche est une dichotomie dans l'index, seule l'entrée trouvée est
+    décodée. Rien n'est lu au démarrage.
+
+VALIDITÉ :
+----------
+    La signature résume le moteur : fonctions reconnues, arités,
+    arguments différés, opérateurs, VERSION_RPN. Si une fonction est
+    ajoutée ou change d'arité, le fichier ne correspond plus et il est
+    ignoré (puis remplacé à la sauvegarde). Changer la forme de la RPN
+    sans changer ces tables impose d'augmenter VERSION_RPN.
+
+TAILLE :
+--------
+    Au plus taille_max expressions sont gardées : à la sauvegarde, les
+    nouvelles expressions et celles relues pendant la session passent en
+    premier, puis celles du fichier dans l'ordre de ses données (d'usage
+    le plus récent) : les plus anciennes non utilisées sont oubliées.
+
+Le JSON (et non pickle) garantit qu'un fichier modifié ne peut
+qu'échouer à se décoder, jamais exécuter de code.
+
+================================================================================
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from src import calculateur
+from src.polynomes import Polynome, DEGRE_MAX
+
+
+# À augmenter quand la forme de la RPN compilée change
+VERSION_RPN = 1
+
+# Nombre maximal d'expressions dans le fichier
+TAILLE_MAX = 50000
+
+_MAGIQUE = b'CRPN'
+_FORMAT_FICHIER = 1
+_ENTETE = struct.Struct('<4sH16sI')
+_ENTREE = struct.Struct('<16sQI')
+
+
+def signature_moteur() -> bytes:
+    """
+    Empreinte des tables du moteur qui déterminent la RPN.
+
+    Examples:
+        >>> len(signature_moteur())
+        16
+    """
+    tables = (
+        VERSION_RPN,
+        sorted(calculateur.FONCTIONS_RECONNUES),
+        sorted(calculateur.ARITES_FIXES.items()),
+        sorted((nom, sorted(indices) if isinstance(indices, set) else indices)
+               for nom, indices in calculateur.ARGUMENTS_DIFFERES.items()),
+        sorted(calculateur.OPERATEURS_COMPARAISON | calculateur.OPERATEURS_BITS),
+        calculateur.NEGATION_BITS,
+        calculateur.SEPARATEUR_ARITE,
+        calculateur.LITTERAL_TABLEAU,
+        DEGRE_MAX,
+    )
+    return hashlib.blake2b(repr(tables).encode('utf-8'), digest_size=16).digest()
+
+
+def fichier_utilisateur(nom='cache_rpn.bin') -> str:
+    """
+    Chemin du cache dans le dossier de cache de l'utilisateur
+    (%LOCALAPPDATA%, ~/Library/Caches ou $XDG_CACHE_HOME, ~/.cache par
+    défaut), plutôt que dans le dossier courant.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'calculatrice', nom)
+
+
+def _empreinte(expression: str) -> bytes:
+    return hashlib.blake2b(expression.encode('utf-8'), digest_size=16).digest()
+
+
+class CacheRPN:
+    """
+    Cache disque des RPN compilées, par texte d'expression.
+
+    Examples:
+        >>> cache = CacheRPN('cache_rpn.bin')
+        >>> cache.obtenir("2 + 3")         # absent
+        >>> cache.ajouter("2 + 3", ['2', '3', '+'])
+        >>> cache.obtenir("2 + 3")
+        ['2', '3', '+']
+    """
+
+    def __init__(self, fichier='cache_rpn.bin', taille_max=TAILLE_MAX):
+        """
+        Args:
+            fichier: Chemin du fichier du cache
+            taille_max: Nombre maximal d'expressions gardées
+        """
+        self.fichier = fichier
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        self._nouvelles = {}     # expression -> rpn (à écrire)
+        self._relues = {}        # expression -> rpn (lues du fichier)
+        self._projection = None  # mmap du fichier, ouvert au premier besoin
+        self._nombre = 0
+        self._ouvert = False
+
+    def obtenir(self, expression: str):
+        """
+        RPN compilée de l'expression, ou None si elle n'est pas en cache.
+        """
+        rpn = self._nouvelles.get(expression)
+        if rpn is None:
+            rpn = self._relues.get(expression)
+        if rpn is None:
+            rpn = self._lire(expression)
+            if rpn is not None:
+                self._relues[expression] = rpn
+        if rpn is None:
+            self.echecs += 1
+        else:
+            self.succes += 1
+        return rpn
+
+    def ajouter(self, expression: str, rpn: list):
+        """Mémorise la RPN compilée d'une expression (écrite par sauvegarder())."""
+        if len(self._nouvelles) >= self.taille_max:
+            del self._nouvelles[next(iter(self._nouvelles))]
+        self._nouvelles[expression] = rpn
+
+    def sauvegarder(self):
+        """
+        Réécrit le fichier : nouvelles expressions, puis expressions relues,
+        puis anciennes, dans la limite de taille_max.
+
+        L'écriture passe par un fichier temporaire renommé : un arrêt
+        pendant la sauvegarde laisse l'ancien fichier intact.
+
+        Raises:
+            OSError: Dossier ou fichier impossible à écrire
+        """
+        entrees = {}
+        for source in (self._nouvelles, self._relues):
+            for expression, rpn in reversed(list(source.items())):
+                if len(entrees) >= self.taille_max:
+                    break
+                entrees.setdefault(expression, _encoder(rpn))
+        for expression, donnees in self._anciennes():
+            if len(entrees) >= self.taille_max:
+                break
+            entrees.setdefault(expression, donnees)
+
+        # Données dans l'ordre d'usage (relu par _anciennes), index par empreinte
+        blocs = [json.dumps([expression, rpn], ensure_ascii=False).encode('utf-8')
+                 for expression, rpn in entrees.items()]
+        index = []
+        position = _ENTETE.size + _ENTREE.size * len(blocs)
+        for expression, bloc in zip(entrees, blocs):
+            index.append((_empreinte(expression), position, len(bloc)))
+            position += len(bloc)
+        index.sort()
+
+        dossier = os.path.dirname(self.fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        temporaire = f"{self.fichier}.tmp"
+        with open(temporaire, 'wb') as f:
+            f.write(_ENTETE.pack(_MAGIQUE, _FORMAT_FICHIER, signature_moteur(), len(blocs)))
+            for entree in index:
+                f.write(_ENTREE.pack(*entree))
+            for bloc in blocs:
+                f.write(bloc)
+
+        self.fermer()
+        os.replace(temporaire, self.fichier)
+        self._relues.update(self._nouvelles)
+        self._nouvelles.clear()
+
+    def fermer(self):
+        """Libère la projection du fichier."""
+        if self._projection is not None:
+            self._projection.close()
+        self._projection = None
+        self._nombre = 0
+        self._ouvert = False
+
+    def __getstate__(self):
+        """Copie (pickle, deepcopy) sans la projection : rouverte au besoin."""
+        etat = dict(self.__dict__)
+        etat.update(_projection=None, _nombre=0, _ouvert=False)
+        return etat
+
+    def __len__(self) -> int:
+        self._ouvrir()
+        return self._nombre + len(self._nouvelles)
+
+    #=========================================================================
+    # LECTURE DU FICHIER
+    #=========================================================================
+
+    def _ouvrir(self):
+        """Projette le fichier en mémoire s'il est valide pour ce moteur."""
+        if self._ouvert:
+            return
+        self._ouvert = True
+        try:
+            with open(self.fichier, 'rb') as f:
+                projection = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Absent ou vide
+            return
+        if len(projection) >= _ENTETE.size:
+            magique, format_fichier, signature, nombre = _ENTETE.unpack_from(projection)
+            if (magique, format_fichier, signature) == (_MAGIQUE, _FORMAT_FICHIER, signature_moteur()) \
+                    and len(projection) >= _ENTETE.size + nombre * _ENTREE.size:
+                self._projection = projection
+                self._nombre = nombre
+                return
+        projection.close()  # Autre moteur ou fichier abîmé : ignoré
+
+    def _lire(self, expression: str):
+        """Dichotomie dans l'index, puis décodage de la seule entrée trouvée."""
+        self._ouvrir()
+        if self._projection is None:
+            return None
+        empreinte = _empreinte(expression)
+        bas, haut = 0, self._nombre
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            cle, position, longueur = _ENTREE.unpack_from(self._projection, _ENTETE.size + milieu * _ENTREE.size)
+            if cle < empreinte:
+                bas = milieu + 1
+            elif cle > empreinte:
+                haut = milieu
+            else:
+                try:
+                    texte, rpn = json.loads(self._projection[position:position + longueur])
+                except ValueError:
+                    return None
+                return _decoder(rpn) if texte == expression else None
+        return None
+
+    def _anciennes(self):
+        """Entrées du fichier (expression, rpn encodée), des plus récentes aux plus anciennes."""
+        self._ouvrir()
+        if self._projection is None:
+            return
+        positions = sorted(
+            _ENTREE.unpack_from(self._projection, _ENTETE.size + i * _ENTREE.size)[1:]
+            for i in range(self._nombre)
+        )
+        for position, longueur in positions:
+            try:
+                expression, rpn = json.loads(self._projection[position:position + longueur])
+            except ValueError:
+                continue
+            yield expression, rpn
+
+
+#=============================================================================
+# ENCODAGE JSON DE LA RPN
+#=============================================================================
+# Tokens : chaînes ; sous-programmes (arguments différés) : listes ;
+# Polynome : {"polynome": [variable, coefficients, rpn]}
+
+def _encoder(rpn):
+    """RPN compilée -> structure JSON."""
+    encodee = []
+    for token in rpn:
+        if isinstance(token, Polynome):
+            encodee.append({'polynome': [token.variable, list(token.coefficients), list(token.rpn)]})
+        elif isinstance(token, list):
+            encodee.append(_encoder(token))
+        else:
+            encodee.append(token)
+    return encodee
+
+
+def _decoder(encodee):
+    """Structure JSON -> RPN compilée."""
+    rpn = []
+    for token in encodee:
+        if isinstance(token, dict):
+            variable, coefficients, origine = token['polynome']
+            rpn.append(Polynome(variable, tuple(coefficients), tuple(origine)))
+        elif isinstance(token, list):
+            rpn.append(_decoder(token))
+        else:
+            rpn.append(token)
+    return rpn
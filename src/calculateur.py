@@ -21,17 +21,46 @@ VERSION 3.0 - NOUVELLES FONCTIONNALITÉS :
 - Trigonométrie en degrés :  sind(), cosd(), tand()
 - Support de ANS (dernier résultat)
 
+VERSION 4.0 - NOUVELLES FONCTIONNALITÉS :
+-----------------------------------------
+- Fonctions à nombre variable d'arguments : min(a,b,c,...), max(...)
+- Statistiques en une passe : sum, mean, var, stdev, median
+- Variables : calculer("2*x", variables={'x': 3})
+- Somme et produit indicés : sigma(k^2, k, 1, 10), prod(k, k, 1, 5)
+- Comparaisons (<, >, <=, >=, ==, !=) qui valent 1 (vrai) ou 0 (faux)
+- Conditions paresseuses : if(x>0, ln(x), 0), piecewise(c1, v1, c2, v2, défaut)
+- Fonctions de l'utilisateur appelées depuis la RPN (voir src.session)
+- Mode complexe par session : sqrt(-4) = 2i, ln(-1), i, re, im, arg, conj
+  (voir src.complexes)
+- Vecteurs et matrices : [[1,2],[3,4]], det, inv, transpose, dot, solve
+  (voir src.matrices)
+- Mode programmeur : entiers exacts 0xFF, 0o17, 0b1010 et opérateurs
+  and, or, xor, shl, shr, not (voir src.programmeur)
+- Arithmétique des entiers : gcd, lcm, powmod, isprime, factor, nCr, nPr,
+  fact (voir src.arithmetique)
+- Encadrement garanti par arithmétique d'intervalles : bounds(expr, x, a, b)
+  (voir src.intervalles)
+- Polynômes évalués par le schéma de Horner et racines : roots(x^2 - 1)
+  (voir src.polynomes)
+- Tirages aléatoires rand(), randn(), randint(a, b) et estimation de
+  Monte-Carlo mc(expr, n) (voir src.aleatoire)
+
 ================================================================================
 """
 
+from itertools import islice
+from time import perf_counter
+
 from src.exceptions import (
+    CalculatriceError,
     DivisionParZeroError, 
     ExpressionInvalideError,
     RacineNegativeError,
     ArgumentFonctionError,
     TangenteDomainError,
     ModuloParZeroError,
-    LogarithmeError
+    LogarithmeError,
+    DepassementCapaciteError
 )
 
 
@@ -42,6 +71,139 @@ PI = 3.141592653589793 # Valeur de π
 E = 2.718281828459045 # Valeur de e, nombre d'Euler (base des logarithmes népériens)
 
 
+#=============================================================================
+# FONCTIONS À UN ARGUMENT
+#=============================================================================
+FONCTIONS_UNAIRES = {
+    # Fonctions de base
+    'sqrt', 'abs',
+    # Trigonométrie radians
+    'sin', 'cos', 'tan',
+    # Trigonométrie degrés
+    'sind', 'cosd', 'tand',
+    # Logarithmes
+    'ln', 'log',
+    # Exponentielle
+    'exp',
+    # Autres
+    'inv', 'sqr',
+    # Nombres complexes (voir src.complexes)
+    're', 'im', 'arg', 'conj',
+    # Matrices (voir src.matrices)
+    'det', 'transpose',
+    # Arithmétique des entiers (voir src.arithmetique)
+    'isprime', 'factor', 'fact',
+    # Racines réelles d'un polynôme (voir src.polynomes)
+    'roots',
+}
+
+
+#=============================================================================
+# FONCTIONS À NOMBRE VARIABLE D'ARGUMENTS
+#=============================================================================
+# Dans la RPN, ces fonctions sont suivies de leur nombre d'arguments :
+# min(3,7,1) -> ['3', '7', '1', 'min#3']
+SEPARATEUR_ARITE = '#'
+
+FONCTIONS_VARIADIQUES = {
+    # Min/Max
+    'min', 'max',
+    # Statistiques
+    'sum', 'mean', 'var', 'stdev', 'median',
+    # PGCD et PPCM (entiers exacts, voir src.arithmetique)
+    'gcd', 'lcm',
+}
+
+# Fonctions dont le nombre d'arguments est fixe et différent de 1
+ARITES_FIXES = {
+    'sigma': 4,  # sigma(expr, k, a, b) = Σ expr pour k de a à b
+    'prod': 4,   # prod(expr, k, a, b)  = Π expr pour k de a à b
+    'if': 3,     # if(condition, si_vrai, si_faux)
+    'dot': 2,    # dot(u, v) : produit scalaire
+    'solve': 2,  # solve(A, b) : solution de A*x = b
+    'powmod': 3, # powmod(a, b, m) = a^b modulo m
+    'ncr': 2,    # nCr(n, k) : combinaisons (le tokenizer met les noms en minuscules)
+    'npr': 2,    # nPr(n, k) : arrangements
+    'bounds': 4, # bounds(expr, x, a, b) : encadrement garanti (voir src.intervalles)
+    'rand': 0,   # rand() : uniforme sur [0, 1[ (voir src.aleatoire)
+    'randn': 0,  # randn() : loi normale centrée réduite
+    'randint': 2, # randint(a, b) : entier uniforme de a à b inclus
+    'mc': 2,     # mc(expr, n) : moyenne de n tirages et intervalle de confiance
+}
+
+# Fonctions dont le résultat change à chaque appel : jamais mises en cache
+FONCTIONS_ALEATOIRES = {'rand', 'randn', 'randint', 'mc'}
+
+# Fonctions de src.arithmetique à plusieurs arguments fixes
+FONCTIONS_ARITHMETIQUES = {'powmod', 'ncr', 'npr'}
+
+# Fonctions variadiques dont tous les arguments sont différés
+# piecewise(c1, v1, c2, v2, ..., défaut) : première valeur dont la condition est vraie
+FONCTIONS_PAR_MORCEAUX = {'piecewise'}
+TOUS_LES_ARGUMENTS = 'tous'
+
+# Arguments différés : au lieu d'être évalués, ils sont gardés sous forme
+# de sous-programme RPN (une liste imbriquée dans la RPN), évalué par la
+# fonction elle-même. sigma(k^2, k, 1, 3) -> [['k', '2', '^'], ['k'], '1', '3', 'sigma']
+ARGUMENTS_DIFFERES = {
+    'sigma': {0, 1},
+    'prod': {0, 1},
+    'bounds': {0, 1},
+    'roots': {0},
+    'mc': {0},
+    # Seule la branche choisie est évaluée : if(x>0, ln(x), 0) n'appelle
+    # jamais ln() quand x <= 0
+    'if': {1, 2},
+    'piecewise': TOUS_LES_ARGUMENTS,
+}
+
+# Tous les noms de fonctions prédéfinies (réservés : une fonction ou
+# variable de l'utilisateur ne peut pas porter ces noms)
+FONCTIONS_RECONNUES = (
+    FONCTIONS_UNAIRES | FONCTIONS_VARIADIQUES | FONCTIONS_PAR_MORCEAUX | set(ARITES_FIXES)
+)
+
+#=============================================================================
+# OPÉRATEURS DE COMPARAISON (résultat : 1.0 si vrai, 0.0 si faux)
+#=============================================================================
+OPERATEURS_COMPARAISON = {'<', '>', '<=', '>=', '==', '!='}
+
+#=============================================================================
+# VECTEURS ET MATRICES (voir src.matrices)
+#=============================================================================
+# [1, 2, 3] -> ['1', '2', '3', 'TABLEAU#3'] ; [[1,2],[3,4]] est un tableau
+# de deux tableaux
+LITTERAL_TABLEAU = 'TABLEAU'
+
+# Types des valeurs scalaires sur la pile : toute autre valeur (tableau
+# NumPy) passe par src.matrices
+TYPES_SCALAIRES = (int, float, complex)
+
+#=============================================================================
+# MODE PROGRAMMEUR (voir src.programmeur)
+#=============================================================================
+# Littéraux entiers exacts : 0xFF, 0o17, 0b1010
+PREFIXES_BASES = {'0x': 16, '0o': 8, '0b': 2}
+
+# Opérateurs bit à bit binaires (en mots : 12 and 10, 1 shl 64)
+OPERATEURS_BITS = {'and', 'or', 'xor', 'shl', 'shr'}
+
+# Complément bit à bit, préfixe comme le moins unaire : not 5
+NEGATION_BITS = 'not'
+
+# Au-delà de 2^53, un float ne représente plus tous les entiers : les
+# littéraux décimaux plus grands restent des int exacts (factor, isprime...)
+ENTIER_FLOTTANT_MAX = 2 ** 53
+
+#=============================================================================
+# VERSION DES NOYAUX NUMÉRIQUES
+#=============================================================================
+# À augmenter quand un noyau (sinus, exponentielle, somme...) change de
+# résultat : les résultats mémorisés par les versions précédentes (voir
+# src.memo) sont alors oubliés
+VERSION_NOYAUX = 1
+
+
 #=============================================================================
 # VARIABLE GLOBALE POUR ANS (dernier résultat)
 #=============================================================================
@@ -72,7 +234,7 @@ def definir_dernier_resultat(valeur):
 # FONCTION PRINCIPALE
 #=============================================================================
 
-def calculer(expression:  str, utiliser_degres=False) -> float:
+def calculer(expression:  str, utiliser_degres=False, variables=None) -> float:
     """
     Calcule le résultat d'une expression mathématique.
     
@@ -80,6 +242,7 @@ def calculer(expression:  str, utiliser_degres=False) -> float:
         expression: Expression mathématique (ex: "3 + 5 * 2", "min(3,7)")
         utiliser_degres: Si True, les fonctions trigo utilisent des degrés
                         Si False (défaut), elles utilisent des radians
+        variables: Dictionnaire optionnel {nom: valeur} (ex: {'x': 2.0})
     
     Returns:
         float:  Le résultat du calcul
@@ -88,15 +251,17 @@ def calculer(expression:  str, utiliser_degres=False) -> float:
         resultat = calculer("3 + 5 * 2")
         calculer("ln(E)")  # Retourne 1.0
         calculer("2^3 + sqr(4)")  # Retourne 24.0
+        calculer("x^2 + 1", variables={'x': 3})  # Retourne 10.0
     """
-    # ÉTAPE 1 : Tokenization
-    tokens = tokenize(expression)
+    if _mesures is not None:
+        return _calculer_mesure(expression, utiliser_degres, variables)
     
-    # ÉTAPE 2 :  Conversion en notation polonaise inversée (RPN)
-    rpn = infix_to_rpn(tokens)
+    # ÉTAPES 1 et 2 : Tokenization, puis conversion en notation polonaise
+    # inversée (RPN), dont les polynômes sont évalués par le schéma de Horner
+    rpn = compiler_expression(expression)
     
     # ÉTAPE 3 : Évaluation
-    resultat = evaluer_rpn(rpn, utiliser_degres)
+    resultat = evaluer_rpn(rpn, utiliser_degres, variables)
     
     # Mettre à jour le dernier résultat pour ANS
     definir_dernier_resultat(resultat)
@@ -104,6 +269,183 @@ def calculer(expression:  str, utiliser_degres=False) -> float:
     return resultat
 
 
+#=============================================================================
+# CACHE D'ANALYSE (voir src.canonique)
+#=============================================================================
+# Expressions compilées gardées en mémoire
+TAILLE_CACHE_ANALYSE = 1000
+
+_analyses_par_texte = {}       # texte -> RPN compilée
+_analyses_par_forme = {}       # forme canonique -> RPN compilée
+_statistiques_analyse = {'textes': 0, 'formes': 0, 'analyses': 0}
+
+
+def compiler_expression(expression: str) -> list:
+    """
+    RPN compilée d'une expression, par le cache d'analyse.
+    
+    Un texte déjà vu n'est pas réanalysé. Un texte nouveau est analysé,
+    puis sa forme canonique est cherchée : "3+2" reprend la RPN compilée
+    de "2+3" (sans repasser par src.polynomes).
+    
+    Args:
+        expression: Expression mathématique
+    
+    Returns:
+        list: La RPN compilée (à ne pas modifier : elle est partagée)
+    
+    Examples:
+        >>> compiler_expression("2 + 3") is compiler_expression("3+2")
+        True
+    """
+    rpn = _analyses_par_texte.get(expression)
+    if rpn is not None:
+        _statistiques_analyse['textes'] += 1
+        return rpn
+    
+    return _optimiser(expression, infix_to_rpn(tokenize(expression)))
+
+
+def _optimiser(expression: str, rpn_brute: list) -> list:
+    """RPN compilée d'un texte nouveau : par sa forme canonique, sinon par src.polynomes."""
+    from src import canonique, polynomes
+    try:
+        forme = canonique.canoniser(rpn_brute)
+    except CalculatriceError:
+        forme = None  # L'erreur sera levée par evaluer_rpn, à sa place
+    
+    rpn = _analyses_par_forme.get(forme)
+    if rpn is not None:
+        _statistiques_analyse['formes'] += 1
+    else:
+        rpn = polynomes.compiler(rpn_brute)
+        _statistiques_analyse['analyses'] += 1
+        if forme is not None:
+            _memoriser(_analyses_par_forme, forme, rpn)
+    _memoriser(_analyses_par_texte, expression, rpn)
+    return rpn
+
+
+def _memoriser(cache: dict, cle: str, rpn: list):
+    """Ajoute au cache, en oubliant la plus ancienne entrée s'il est plein."""
+    if len(cache) >= TAILLE_CACHE_ANALYSE:
+        del cache[next(iter(cache))]
+    cache[cle] = rpn
+
+
+def statistiques_analyse() -> dict:
+    """
+    Compteurs du cache d'analyse.
+    
+    Returns:
+        dict: textes (succès par le texte), formes (succès par la forme
+              canonique seulement), analyses (échecs), taux_texte et
+              taux (succès / appels, sans puis avec la forme canonique)
+    """
+    statistiques = dict(_statistiques_analyse)
+    appels = sum(statistiques.values())
+    statistiques['taux_texte'] = statistiques['textes'] / appels if appels else 0.0
+    statistiques['taux'] = (statistiques['textes'] + statistiques['formes']) / appels if appels else 0.0
+    return statistiques
+
+
+def vider_cache_analyse():
+    """Oublie les expressions compilées et remet les compteurs à zéro."""
+    _analyses_par_texte.clear()
+    _analyses_par_forme.clear()
+    for nom in _statistiques_analyse:
+        _statistiques_analyse[nom] = 0
+
+
+#=============================================================================
+# MESURES DES ÉTAPES (voir src.mesures)
+#=============================================================================
+_mesures = None  # Mesures en cours, ou None (désactivées)
+
+
+def activer_mesures():
+    """
+    Active la mesure des étapes de calculer() (durées, tokens, erreurs).
+    
+    Les mesures déjà prises sont gardées ; desactiver_mesures() les oublie.
+    """
+    global _mesures
+    if _mesures is None:
+        from src.mesures import Mesures
+        _mesures = Mesures()
+
+
+def desactiver_mesures():
+    """Désactive les mesures et oublie les mesures prises."""
+    global _mesures
+    _mesures = None
+
+
+def statistiques() -> dict:
+    """
+    Mesures des étapes de calculer().
+    
+    Returns:
+        dict: actif, et si les mesures sont actives : calculs, etapes
+              ({étape: nombre, somme, moyenne, p50, p99 en secondes}),
+              tokens, erreurs ({type: nombre}), cache_analyse
+    
+    Examples:
+        >>> activer_mesures()
+        >>> calculer("1 + 1")
+        2.0
+        >>> statistiques()['calculs']
+        1
+    """
+    if _mesures is None:
+        return {'actif': False}
+    return {'actif': True, **_mesures.statistiques(), 'cache_analyse': statistiques_analyse()}
+
+
+def exposition_prometheus() -> str:
+    """
+    Mesures au format texte d'exposition de Prometheus (vide si inactives).
+    """
+    if _mesures is None:
+        return ''
+    return _mesures.exposition_prometheus(statistiques_analyse())
+
+
+def _calculer_mesure(expression: str, utiliser_degres, variables):
+    """calculer(), étape par étape, avec les mesures."""
+    mesures = _mesures
+    debut = perf_counter()
+    try:
+        rpn = _analyses_par_texte.get(expression)
+        if rpn is not None:
+            _statistiques_analyse['textes'] += 1
+        else:
+            tokens = tokenize(expression)
+            instant = perf_counter()
+            mesures.observer('tokenize', instant - debut)
+            mesures.tokens.observer(len(tokens))
+            
+            rpn_brute = infix_to_rpn(tokens)
+            suivant = perf_counter()
+            mesures.observer('rpn', suivant - instant)
+            instant = suivant
+            
+            rpn = _optimiser(expression, rpn_brute)
+            mesures.observer('optimisation', perf_counter() - instant)
+        
+        instant = perf_counter()
+        resultat = evaluer_rpn(rpn, utiliser_degres, variables)
+        fin = perf_counter()
+        mesures.observer('evaluation', fin - instant)
+    except Exception as e:
+        mesures.erreur(e)
+        raise
+    
+    mesures.observer('total', fin - debut)
+    definir_dernier_resultat(resultat)
+    return resultat
+
+
 #=============================================================================
 # TOKENIZATION
 #=============================================================================
@@ -115,11 +457,16 @@ def tokenize(expression: str) -> list:
     GÈRE : 
     ------
         - Nombres entiers et décimaux
+        - Entiers en base 16, 8 et 2 : 0xFF, 0o17, 0b1010
         - Opérateurs :  +, -, *, /, %, ^
+        - Opérateurs bit à bit : and, or, xor, shl, shr, not
+        - Comparaisons : <, >, <=, >=, ==, !=
         - Parenthèses : (, )
+        - Crochets : [, ] (vecteurs et matrices)
         - Virgule : , (séparateur d'arguments)
         - Fonctions : sqrt, abs, sin, cos, tan, ln, log, exp, inv, sqr, etc.
         - Constantes :  PI, E, ANS
+        - Variables (tout autre nom, ex: x, k)
         - Nombres négatifs (unaires)
     
     Args:
@@ -134,8 +481,8 @@ def tokenize(expression: str) -> list:
         >>> tokenize("ln(E)")
         ['ln', '(', 'E', ')']
     """
-    # Nettoyage :  enlever espaces
-    expression = expression.replace(" ", "")
+    # Les espaces sont ignorés dans la boucle (et non supprimés d'avance)
+    # pour séparer les opérateurs en mots : "0xFF and 0b1010"
     # NE PAS remplacer la virgule par un point !  La virgule sert de séparateur
     # pour les fonctions comme min(a,b) et max(a,b)
     
@@ -145,10 +492,23 @@ def tokenize(expression: str) -> list:
     while i < len(expression):
         char = expression[i]
         
+        if char.isspace():
+            i += 1
+            continue
+        
+        #=====================================================================
+        # CAS 0 : ENTIER EN BASE 16, 8 OU 2 (0xFF, 0o17, 0b1010)
+        #=====================================================================
+        if char == '0' and _longueur_litteral_base(expression, i):
+            longueur = _longueur_litteral_base(expression, i)
+            tokens.append(expression[i:i + longueur].lower())
+            i += longueur
+            continue
+        
         #=====================================================================
         # CAS 1 :  CHIFFRE OU POINT -> NOMBRE
         #=====================================================================
-        if char.isdigit() or char == '.':
+        elif char.isdigit() or char == '.':
             nombre = ""
             while i < len(expression) and (expression[i].isdigit() or expression[i] == '.'):
                 nombre += expression[i]
@@ -170,12 +530,12 @@ def tokenize(expression: str) -> list:
             # Vérifier si c'est une constante reconnue
             if mot_lower == 'pi':
                 tokens.append('PI') # garder en majuscules pour la constante
-            elif mot_lower == 'e' and (i >= len(expression) or not expression[i] != 'x'):
+            elif mot_lower == 'e':
                 tokens.append('E') # garder en majuscules pour la constante
             elif mot_lower == 'ans':
                 tokens.append('ANS') # garder en majuscules pour la constante
             else:
-                # C'est une fonction
+                # C'est une fonction ou une variable
                 tokens.append(mot_lower)
             continue
         
@@ -191,7 +551,10 @@ def tokenize(expression: str) -> list:
             
             est_unaire = (
                 len(tokens) == 0 or
-                tokens[-1] in ['+', '-', '*', '/', '%', '^', '(', ',']
+                tokens[-1] in ['+', '-', '*', '/', '%', '^', '(', ',', '['] or
+                tokens[-1] in OPERATEURS_COMPARAISON or
+                tokens[-1] in OPERATEURS_BITS or
+                tokens[-1] == NEGATION_BITS
             )
             
             if est_unaire:
@@ -208,7 +571,10 @@ def tokenize(expression: str) -> list:
         elif char == '+': 
             est_unaire = (
                 len(tokens) == 0 or
-                tokens[-1] in ['+', '-', '*', '/', '%', '^', '(', ',']
+                tokens[-1] in ['+', '-', '*', '/', '%', '^', '(', ',', '['] or
+                tokens[-1] in OPERATEURS_COMPARAISON or
+                tokens[-1] in OPERATEURS_BITS or
+                tokens[-1] == NEGATION_BITS
             )
             
             if not est_unaire:
@@ -234,12 +600,23 @@ def tokenize(expression: str) -> list:
         #=====================================================================
         # CAS 7 : AUTRES OPÉRATEURS ET PARENTHÈSES
         #=====================================================================
-        elif char in '*/()%':
+        elif char in '*/()%[]':
             tokens.append(char)
             i += 1
         
         #=====================================================================
-        # CAS 8 : CARACTÈRE INCONNU
+        # CAS 8 : COMPARAISONS <, >, <=, >=, ==, !=
+        #=====================================================================
+        elif char in '<>!=' and expression[i:i + 2] in OPERATEURS_COMPARAISON:
+            tokens.append(expression[i:i + 2])
+            i += 2
+        
+        elif char in '<>':
+            tokens.append(char)
+            i += 1
+        
+        #=====================================================================
+        # CAS 9 : CARACTÈRE INCONNU
         #=====================================================================
         else:
             tokens.append(char)
@@ -260,6 +637,13 @@ def infix_to_rpn(tokens: list) -> list:
     - Gestion correcte de la virgule comme séparateur
     - UNARY_MINUS a la plus haute priorité
     
+    VERSION 4.0 :
+    - Comptage des arguments : les fonctions variadiques sont émises
+      avec leur arité (ex: 'min#3'), les autres doivent avoir le bon nombre
+    - Arguments différés (ARGUMENTS_DIFFERES) capturés en sous-listes
+    - Variables : tout nom qui n'est pas une fonction va dans la sortie
+    - Crochets : [a, b, c] est émis comme 'TABLEAU#3'
+    
     Args:
         tokens: Liste de tokens en notation infixe
     
@@ -271,19 +655,29 @@ def infix_to_rpn(tokens: list) -> list:
         ['3', '5', '2', '*', '+']
         >>> infix_to_rpn(['2', '^', '3'])
         ['2', '3', '^']
+        >>> infix_to_rpn(['min', '(', '3', ',', '7', ',', '1', ')'])
+        ['3', '7', '1', 'min#3']
     """
     #=========================================================================
     # TABLE DES PRIORITÉS DES OPÉRATEURS
     #=========================================================================
     # Plus le nombre est élevé, plus l'opérateur est prioritaire
     precedence = {
-        '+': 1,
-        '-': 1,
-        '*': 2,
-        '/':  2,
-        '%': 2,
-        '^': 3,
-        'UNARY_MINUS': 4  # Priorité la plus haute pour le moins unaire
+        # Comparaisons : priorité la plus basse (x + 1 > 2 * y)
+        '<': 0, '>': 0, '<=': 0, '>=': 0, '==': 0, '!=': 0,
+        # Bit à bit, dans l'ordre de Python : | < ^ < & < décalages
+        'or': 1,
+        'xor': 2,
+        'and': 3,
+        'shl': 4, 'shr': 4,
+        '+': 5,
+        '-': 5,
+        '*': 6,
+        '/':  6,
+        '%': 6,
+        '^': 7,
+        'UNARY_MINUS': 8,  # Priorité la plus haute pour le moins unaire
+        'not': 8
     }
     
     #=========================================================================
@@ -296,27 +690,24 @@ def infix_to_rpn(tokens: list) -> list:
     #=========================================================================
     # LISTE DES FONCTIONS RECONNUES
     #=========================================================================
-    fonctions = {
-        # Fonctions de base
-        'sqrt', 'abs',
-        # Trigonométrie radians
-        'sin', 'cos', 'tan',
-        # Trigonométrie degrés
-        'sind', 'cosd', 'tand',
-        # Logarithmes
-        'ln', 'log',
-        # Exponentielle
-        'exp',
-        # Autres
-        'inv', 'sqr',
-        # Min/Max
-        'min', 'max'
-    }
+    fonctions = FONCTIONS_RECONNUES
+    
+    # Noms inconnus suivis de '(' : fonctions définies par l'utilisateur,
+    # émises comme les variadiques ('f#2') et résolues à l'évaluation
+    appels_utilisateur = set()
     
     output = []
     stack = []
     
-    for token in tokens:
+    # Une entrée par parenthèse ouvrante : fonction appelée (ou None),
+    # nombre de virgules rencontrées à ce niveau et début de l'argument
+    # courant dans output (sert à compter et capturer les arguments)
+    niveaux = []
+    precedent = None
+    
+    for position, token in enumerate(tokens):
+        suivant = tokens[position + 1] if position + 1 < len(tokens) else None
+        
         #=====================================================================
         # NOMBRE -> directement dans output
         #=====================================================================
@@ -336,23 +727,30 @@ def infix_to_rpn(tokens: list) -> list:
             stack.append(token)
         
         #=====================================================================
-        # MOINS UNAIRE -> sur la pile (haute priorité)
+        # MOINS UNAIRE (ou not) -> sur la pile (haute priorité)
         #=====================================================================
-        elif token == 'UNARY_MINUS': 
+        elif token == 'UNARY_MINUS' or token == NEGATION_BITS: 
             stack.append(token)
         
         #=====================================================================
         # VIRGULE -> dépiler jusqu'à la parenthèse ouvrante
         #=====================================================================
         elif token == ',': 
-            while stack and stack[-1] != '(':
+            while stack and stack[-1] not in ('(', '['):
                 output.append(stack.pop())
+            if niveaux:
+                _capturer_argument(output, niveaux[-1])
+                niveaux[-1]['virgules'] += 1
+                niveaux[-1]['debut'] = len(output)
         
         #=====================================================================
         # PARENTHÈSE OUVRANTE -> sur la pile
         #=====================================================================
         elif token == '(': 
+            est_appel = stack and (stack[-1] in fonctions or stack[-1] in appels_utilisateur)
+            fonction = stack[-1] if est_appel else None
             stack.append(token)
+            niveaux.append({'fonction': fonction, 'virgules': 0, 'debut': len(output)})
         
         #=====================================================================
         # PARENTHÈSE FERMANTE -> dépiler jusqu'à l'ouvrante
@@ -365,9 +763,45 @@ def infix_to_rpn(tokens: list) -> list:
             if stack: 
                 stack.pop()
             
+            # Nombre d'arguments : virgules + 1, ou 0 pour "f()"
+            niveau = niveaux.pop() if niveaux else {'fonction': None, 'virgules': 0}
+            if precedent == '(':
+                nb_arguments = 0
+            else:
+                nb_arguments = niveau['virgules'] + 1
+                if niveau['fonction'] is not None:
+                    _capturer_argument(output, niveau)
+            
             # Si une fonction précède, la dépiler
-            if stack and stack[-1] in fonctions: 
+            if stack and (stack[-1] in fonctions or stack[-1] in appels_utilisateur): 
+                fonction = stack.pop()
+                if (fonction in FONCTIONS_VARIADIQUES or fonction in FONCTIONS_PAR_MORCEAUX
+                        or fonction in appels_utilisateur):
+                    output.append(f"{fonction}{SEPARATEUR_ARITE}{nb_arguments}")
+                elif nb_arguments != ARITES_FIXES.get(fonction, 1):
+                    attendus = ARITES_FIXES.get(fonction, 1)
+                    raise ArgumentFonctionError(
+                        fonction,
+                        f"attend exactement {attendus} argument{'s' if attendus > 1 else ''}"
+                    )
+                else:
+                    output.append(fonction)
+        
+        #=====================================================================
+        # CROCHETS -> VECTEUR OU MATRICE, émis comme 'TABLEAU#n'
+        #=====================================================================
+        elif token == '[':
+            stack.append(token)
+            niveaux.append({'fonction': None, 'virgules': 0, 'debut': len(output)})
+        
+        elif token == ']':
+            while stack and stack[-1] != '[':
                 output.append(stack.pop())
+            if not stack or precedent == '[':
+                raise ExpressionInvalideError("Crochets de matrice mal formés")
+            stack.pop()
+            niveau = niveaux.pop()
+            output.append(f"{LITTERAL_TABLEAU}{SEPARATEUR_ARITE}{niveau['virgules'] + 1}")
         
         #=====================================================================
         # OPÉRATEUR -> gérer les priorités
@@ -390,6 +824,21 @@ def infix_to_rpn(tokens: list) -> list:
                         break
                     
             stack.append(token)
+        
+        #=====================================================================
+        # NOM SUIVI DE '(' -> FONCTION DE L'UTILISATEUR, sur la pile
+        #=====================================================================
+        elif token.isalpha() and suivant == '(':
+            appels_utilisateur.add(token)
+            stack.append(token)
+        
+        #=====================================================================
+        # NOM -> VARIABLE, directement dans output
+        #=====================================================================
+        elif token.isalpha():
+            output.append(token)
+        
+        precedent = token
     
     # Vider la pile
     while stack: 
@@ -398,17 +847,32 @@ def infix_to_rpn(tokens: list) -> list:
     return output
 
 
+def _capturer_argument(output: list, niveau: dict) -> None:
+    """
+    Si l'argument qui vient de se terminer est différé pour la fonction
+    appelée, remplace sa RPN (à la fin de output) par une sous-liste.
+    """
+    differes = ARGUMENTS_DIFFERES.get(niveau['fonction'])
+    if differes == TOUS_LES_ARGUMENTS or (differes and niveau['virgules'] in differes):
+        sous_programme = output[niveau['debut']:]
+        del output[niveau['debut']:]
+        output.append(sous_programme)
+
+
 #=============================================================================
 # ÉVALUATION RPN
 #=============================================================================
 
-def evaluer_rpn(rpn: list, utiliser_degres=False) -> float:
+def evaluer_rpn(rpn: list, utiliser_degres=False, variables=None, session=None) -> float:
     """
     Évalue une expression en notation polonaise inversée (RPN).
     
     Args:
         rpn: Liste de tokens en notation RPN
         utiliser_degres: Si True, les fonctions trigo utilisent des degrés
+        variables: Dictionnaire optionnel {nom: valeur}
+        session: Session optionnelle (src.session.Session) qui fournit
+                 les fonctions de l'utilisateur et son propre ANS
     
     Returns:
         float:  Résultat du calcul
@@ -419,16 +883,43 @@ def evaluer_rpn(rpn: list, utiliser_degres=False) -> float:
     stack = []
     
     # Listes des différents types de tokens
-    operateurs_binaires = {'+', '-', '*', '/', '%', '^'}
-    fonctions_unaires = {'sqrt', 'abs', 'sin', 'cos', 'tan', 'sind', 'cosd', 'tand', 'ln', 'log', 'exp', 'inv', 'sqr', 'UNARY_MINUS'}
-    fonctions_binaires = {'min', 'max'}
+    operateurs_binaires = {'+', '-', '*', '/', '%', '^'} | OPERATEURS_COMPARAISON | OPERATEURS_BITS
+    fonctions_unaires = FONCTIONS_UNAIRES | {'UNARY_MINUS', NEGATION_BITS}
+    
+    # Mode programmeur : entiers décimaux exacts et division entière
+    mode_entier = session is not None and session.mode_programmeur
+    
+    # Mode complexe : les noyaux complexes ne sont utilisés que si un
+    # opérande est complexe ou sort du domaine réel (ex: sqrt(-4))
+    complexe = session is not None and session.mode_complexe
+    if complexe:
+        from src import complexes
     
     for token in rpn:
+        #=====================================================================
+        # SOUS-PROGRAMME (argument différé) -> empiler tel quel
+        #=====================================================================
+        if isinstance(token, list):
+            stack.append(token)
+        
+        #=====================================================================
+        # POLYNÔME compilé (src.polynomes.Polynome) -> schéma de Horner
+        #=====================================================================
+        elif isinstance(token, tuple):
+            valeur = _valeur_nom(token.variable, utiliser_degres, variables, session)
+            if isinstance(valeur, (int, float)) and not mode_entier:
+                from src import polynomes
+                stack.append(polynomes.horner(token.coefficients, valeur))
+            else:
+                # Matrice (x^2 est un produit matriciel), complexe (i^2 doit
+                # redevenir réel) ou entiers exacts : la RPN d'origine
+                stack.append(evaluer_rpn(list(token.rpn), utiliser_degres, variables, session))
+        
         #=====================================================================
         # NOMBRE -> empiler
         #=====================================================================
-        if est_nombre(token):
-            stack.append(float(token))
+        elif est_nombre(token):
+            stack.append(valeur_nombre(token, mode_entier))
         
         # =====================================================================
         # CONSTANTE PI -> empiler sa valeur
@@ -446,7 +937,10 @@ def evaluer_rpn(rpn: list, utiliser_degres=False) -> float:
         # ANS (dernier résultat) -> empiler sa valeur
         #=====================================================================
         elif token == 'ANS':
-            stack.append(obtenir_dernier_resultat())
+            if session is not None:
+                stack.append(session.dernier_resultat)
+            else:
+                stack.append(obtenir_dernier_resultat())
         
         #=====================================================================
         # OPÉRATEUR BINAIRE
@@ -458,25 +952,68 @@ def evaluer_rpn(rpn: list, utiliser_degres=False) -> float:
             b = stack.pop()
             a = stack.pop()
             
-            if token == '+':
-                resultat = a + b
-            elif token == '-':
-                resultat = a - b
-            elif token == '*':
-                resultat = a * b
-            elif token == '/':
-                if b == 0:
-                    raise DivisionParZeroError()
-                resultat = a / b
-            elif token == '%': 
-                if b == 0:
-                    raise ModuloParZeroError()
-                resultat = modulo(a, b)
-            elif token == '^':
-                resultat = puissance(a, b)
+            try:
+                if not isinstance(a, TYPES_SCALAIRES) or not isinstance(b, TYPES_SCALAIRES):
+                    from src import matrices
+                    resultat = matrices.operation(token, a, b)
+                elif complexe and complexes.besoin_complexe(token, a, b):
+                    resultat = complexes.operation(token, a, b)
+                elif token == '+':
+                    resultat = a + b
+                elif token == '-':
+                    resultat = a - b
+                elif token == '*':
+                    resultat = a * b
+                elif token == '/':
+                    if b == 0:
+                        raise DivisionParZeroError()
+                    if mode_entier and isinstance(a, int) and isinstance(b, int):
+                        resultat = a // b
+                    else:
+                        resultat = a / b
+                elif token == '%': 
+                    if b == 0:
+                        raise ModuloParZeroError()
+                    if isinstance(a, int) and isinstance(b, int):
+                        resultat = a % b
+                    else:
+                        resultat = modulo(a, b)
+                elif token == '^':
+                    if isinstance(a, int) and isinstance(b, int) and b >= 0:
+                        resultat = a ** b  # Entiers : exact, sans passer par float
+                    else:
+                        resultat = puissance(a, b)
+                elif token in OPERATEURS_BITS:
+                    from src import programmeur
+                    resultat = programmeur.operation_bits(token, a, b)
+                else:
+                    resultat = comparer(token, a, b)
+            except OverflowError:
+                # Entier exact trop grand pour un float : fact(200) + 0.5
+                raise DepassementCapaciteError()
             
             stack.append(resultat)
         
+        #=====================================================================
+        # RACINES D'UN POLYNÔME : roots(expr) -> vecteur des racines réelles
+        #=====================================================================
+        elif token == 'roots':
+            if len(stack) < 1:
+                raise ExpressionInvalideError(f"Fonction {token}() sans argument")
+            
+            corps = stack.pop()
+            
+            # Les variables déjà connues sont des coefficients : roots(a*x^2 - 1)
+            def constante(nom):
+                try:
+                    valeur = _valeur_nom(nom, utiliser_degres, variables, session)
+                except ExpressionInvalideError:
+                    return None
+                return valeur if isinstance(valeur, (int, float)) else None
+            
+            from src import polynomes, matrices
+            stack.append(matrices.construire(polynomes.racines_reelles(corps, constante)))
+        
         #=====================================================================
         # FONCTION UNAIRE
         #=====================================================================
@@ -486,67 +1023,304 @@ def evaluer_rpn(rpn: list, utiliser_degres=False) -> float:
             
             arg = stack.pop()
             
-            # Fonctions de base
-            if token == 'sqrt':
-                resultat = racine_carree(arg)
-            elif token == 'abs':
-                resultat = valeur_absolue(arg)
-            
-            # Trigonométrie radians
-            elif token == 'sin':
-                resultat = sinus(arg)
-            elif token == 'cos':
-                resultat = cosinus(arg)
-            elif token == 'tan': 
-                resultat = tangente(arg)
-            
-            # Trigonométrie degrés
-            elif token == 'sind': 
-                resultat = sinus_degres(arg)
-            elif token == 'cosd':
-                resultat = cosinus_degres(arg)
-            elif token == 'tand':
-                resultat = tangente_degres(arg)
-            
-            # Logarithmes
-            elif token == 'ln':
-                resultat = logarithme_neperien(arg)
-            elif token == 'log':
-                resultat = logarithme_base10(arg)
-            
-            # Exponentielle
-            elif token == 'exp': 
-                resultat = exponentielle(arg)
-            
-            # Autres
-            elif token == 'inv':
-                resultat = inverse(arg)
-            elif token == 'sqr': 
-                resultat = carre(arg)
-            
-            # Moins unaire
-            elif token == 'UNARY_MINUS': 
-                resultat = -arg
+            try:
+                if not isinstance(arg, TYPES_SCALAIRES):
+                    from src import matrices
+                    resultat = matrices.fonction(token, arg)
+                elif complexe and complexes.besoin_complexe(token, arg):
+                    resultat = complexes.fonction(token, arg)
+            
+                # Fonctions de base
+                elif token == 'sqrt':
+                    resultat = racine_carree(arg)
+                elif token == 'abs':
+                    resultat = valeur_absolue(arg)
+            
+                # Trigonométrie radians
+                elif token == 'sin':
+                    resultat = sinus(arg)
+                elif token == 'cos':
+                    resultat = cosinus(arg)
+                elif token == 'tan': 
+                    resultat = tangente(arg)
+            
+                # Trigonométrie degrés
+                elif token == 'sind': 
+                    resultat = sinus_degres(arg)
+                elif token == 'cosd':
+                    resultat = cosinus_degres(arg)
+                elif token == 'tand':
+                    resultat = tangente_degres(arg)
+            
+                # Logarithmes
+                elif token == 'ln':
+                    resultat = logarithme_neperien(arg)
+                elif token == 'log':
+                    resultat = logarithme_base10(arg)
+            
+                # Exponentielle
+                elif token == 'exp': 
+                    resultat = exponentielle(arg)
+            
+                # Autres
+                elif token == 'inv':
+                    resultat = inverse(arg)
+                elif token == 'sqr': 
+                    resultat = carre(arg)
+            
+                # Nombres complexes (argument réel)
+                elif token in ('re', 'conj'):
+                    resultat = float(arg)
+                elif token == 'im':
+                    resultat = 0.0
+                elif token == 'arg':
+                    resultat = PI if arg < 0 else 0.0
+            
+                # Matrices (argument scalaire : matrice 1x1)
+                elif token in ('det', 'transpose'):
+                    resultat = arg
+            
+                # Arithmétique des entiers exacts
+                elif token in ('isprime', 'factor', 'fact'):
+                    from src import arithmetique
+                    resultat = arithmetique.fonction(token, arg)
+            
+                # Moins unaire
+                elif token == 'UNARY_MINUS': 
+                    resultat = -arg
+            
+                # Complément bit à bit
+                elif token == NEGATION_BITS:
+                    from src import programmeur
+                    resultat = programmeur.negation_bits(arg)
+            except OverflowError:
+                # Entier exact trop grand pour un float : sqrt(fact(200))
+                raise DepassementCapaciteError()
+            
+            stack.append(resultat)
+        
+        #=====================================================================
+        # CONDITION : if(condition, si_vrai, si_faux) - branches différées
+        #=====================================================================
+        elif token == 'if':
+            if len(stack) < 3:
+                raise ArgumentFonctionError(token, "nécessite 3 arguments (condition, si_vrai, si_faux)")
+            
+            si_faux = stack.pop()
+            si_vrai = stack.pop()
+            condition = stack.pop()
+            
+            # Seule la branche choisie est évaluée
+            branche = si_vrai if condition != 0 else si_faux
+            stack.append(evaluer_rpn(branche, utiliser_degres, variables, session))
+        
+        #=====================================================================
+        # FONCTION PAR MORCEAUX : piecewise(c1, v1, c2, v2, ..., défaut)
+        #=====================================================================
+        elif token.startswith('piecewise' + SEPARATEUR_ARITE):
+            nb_arguments = int(token.split(SEPARATEUR_ARITE)[1])
+            if nb_arguments < 1:
+                raise ArgumentFonctionError('piecewise', "nécessite au moins 1 argument")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            
+            debut = len(stack) - nb_arguments
+            morceaux = stack[debut:]
+            del stack[debut:]
+            stack.append(par_morceaux(morceaux, utiliser_degres, variables, session))
+        
+        #=====================================================================
+        # VECTEUR OU MATRICE : [a, b, ...]
+        #=====================================================================
+        elif token.startswith(LITTERAL_TABLEAU + SEPARATEUR_ARITE):
+            nb_elements = int(token.split(SEPARATEUR_ARITE)[1])
+            if len(stack) < nb_elements:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            
+            from src import matrices
+            debut = len(stack) - nb_elements
+            tableau = matrices.construire(stack[debut:])
+            del stack[debut:]
+            stack.append(tableau)
+        
+        #=====================================================================
+        # PRODUIT SCALAIRE ET SYSTÈME LINÉAIRE : dot(u, v), solve(A, b)
+        #=====================================================================
+        elif token in ('dot', 'solve'):
+            if len(stack) < 2:
+                raise ArgumentFonctionError(token, "nécessite 2 arguments")
+            
+            b = stack.pop()
+            a = stack.pop()
+            
+            if isinstance(a, TYPES_SCALAIRES) and isinstance(b, TYPES_SCALAIRES):
+                # Cas 1x1 : dot(a, b) = a*b, solve(a, b) = b/a
+                if token == 'dot':
+                    resultat = a * b
+                elif a == 0:
+                    raise DivisionParZeroError()
+                else:
+                    resultat = b / a
+            else:
+                from src import matrices
+                if token == 'dot':
+                    resultat = matrices.produit_scalaire(a, b)
+                else:
+                    resultat = matrices.resoudre(a, b)
             
             stack.append(resultat)
         
         #=====================================================================
-        # FONCTION BINAIRE (min, max)
+        # ENCADREMENT GARANTI : bounds(expr, x, a, b) -> vecteur [bas, haut]
+        #=====================================================================
+        elif token == 'bounds':
+            if len(stack) < 4:
+                raise ArgumentFonctionError(token, "nécessite 4 arguments (expr, x, a, b)")
+            
+            fin = stack.pop()
+            debut = stack.pop()
+            indice = stack.pop()
+            corps = stack.pop()
+            
+            nom = nom_variable(token, indice)
+            if not isinstance(debut, (int, float)) or not isinstance(fin, (int, float)):
+                raise ArgumentFonctionError(token, "les bornes doivent être des nombres réels")
+            
+            from src import intervalles, matrices
+            bas, haut = intervalles.bornes(corps, nom, debut, fin, utiliser_degres, variables, session)
+            stack.append(matrices.construire([bas, haut]))
+        
+        #=====================================================================
+        # TIRAGES ALÉATOIRES : rand(), randn(), randint(a, b)
         #=====================================================================
-        elif token in fonctions_binaires:
+        elif token in ('rand', 'randn'):
+            from src import aleatoire
+            stack.append(aleatoire.tirage(token, session))
+        
+        elif token == 'randint':
             if len(stack) < 2:
-                raise ArgumentFonctionError(token, "nécessite 2 arguments séparés par une virgule")
+                raise ArgumentFonctionError(token, "nécessite 2 arguments")
             
             b = stack.pop()
             a = stack.pop()
             
-            if token == 'min': 
-                resultat = minimum(a, b)
-            elif token == 'max':
-                resultat = maximum(a, b)
+            from src import aleatoire
+            stack.append(aleatoire.entier_aleatoire(a, b, session))
+        
+        #=====================================================================
+        # MONTE-CARLO : mc(expr, n) -> vecteur [moyenne, bas, haut]
+        #=====================================================================
+        elif token == 'mc':
+            if len(stack) < 2:
+                raise ArgumentFonctionError(token, "nécessite 2 arguments (expr, n)")
+            
+            n = stack.pop()
+            corps = stack.pop()
+            
+            from src import aleatoire, matrices
+            estimation = aleatoire.monte_carlo(corps, n, utiliser_degres, variables, session)
+            stack.append(matrices.construire(list(estimation)))
+        
+        #=====================================================================
+        # ARITHMÉTIQUE : powmod(a, b, m), nCr(n, k), nPr(n, k)
+        #=====================================================================
+        elif token in FONCTIONS_ARITHMETIQUES:
+            nb_arguments = ARITES_FIXES[token]
+            if len(stack) < nb_arguments:
+                raise ArgumentFonctionError(token, f"nécessite {nb_arguments} arguments")
+            
+            from src import arithmetique
+            debut = len(stack) - nb_arguments
+            resultat = arithmetique.fonction(token, *stack[debut:])
+            del stack[debut:]
+            stack.append(resultat)
+        
+        #=====================================================================
+        # FONCTION DE L'UTILISATEUR : f(x) = ... définie dans la session
+        #=====================================================================
+        elif SEPARATEUR_ARITE in token and token.split(SEPARATEUR_ARITE)[0] not in FONCTIONS_VARIADIQUES:
+            nom, arite = token.split(SEPARATEUR_ARITE)
+            nb_arguments = int(arite)
+            
+            if session is None or nom not in session.fonctions:
+                raise ExpressionInvalideError(f"Fonction inconnue :  '{nom}'")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            
+            debut = len(stack) - nb_arguments
+            arguments = stack[debut:]
+            del stack[debut:]
+            stack.append(appeler_fonction(session.fonctions[nom], arguments, utiliser_degres, variables, session))
+        
+        #=====================================================================
+        # FONCTION VARIADIQUE (min, max, sum, mean, var, stdev, median)
+        #=====================================================================
+        elif SEPARATEUR_ARITE in token:
+            nom, arite = token.split(SEPARATEUR_ARITE)
+            nb_arguments = int(arite)
+            
+            if nb_arguments < 1:
+                raise ArgumentFonctionError(nom, "nécessite au moins 1 argument")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            
+            # Les arguments sont les nb_arguments derniers éléments de la pile :
+            # on les parcourt sur place, sans les copier dans une liste
+            debut = len(stack) - nb_arguments
             
+            if not all(isinstance(v, TYPES_SCALAIRES) for v in islice(stack, debut, None)):
+                from src import matrices
+                resultat = matrices.variadique(nom, stack[debut:])
+            elif complexe and any(isinstance(v, complex) for v in islice(stack, debut, None)):
+                resultat = complexes.variadique(nom, stack[debut:])
+            elif nom == 'median':
+                resultat = _mediane_en_place(stack, debut, len(stack))
+            elif nom in ('gcd', 'lcm'):
+                from src import arithmetique
+                resultat = arithmetique.variadique(nom, islice(stack, debut, None))
+            else:
+                arguments = islice(stack, debut, None)
+                if nom == 'min':
+                    resultat = minimum_liste(arguments)
+                elif nom == 'max':
+                    resultat = maximum_liste(arguments)
+                elif nom == 'sum':
+                    resultat = somme(arguments)
+                elif nom == 'mean':
+                    resultat = moyenne(arguments)
+                elif nom == 'var':
+                    resultat = variance(arguments)
+                elif nom == 'stdev':
+                    resultat = ecart_type(arguments)
+            
+            del stack[debut:]
             stack.append(resultat)
         
+        #=====================================================================
+        # SOMME ET PRODUIT INDICÉS : sigma(expr, k, a, b), prod(expr, k, a, b)
+        #=====================================================================
+        elif token in ('sigma', 'prod'):
+            if len(stack) < 4:
+                raise ArgumentFonctionError(token, "nécessite 4 arguments (expr, k, a, b)")
+            
+            fin = stack.pop()
+            debut = stack.pop()
+            indice = stack.pop()
+            corps = stack.pop()
+            
+            if token == 'sigma':
+                resultat = somme_indicee(corps, indice, debut, fin, utiliser_degres, variables, session)
+            else:
+                resultat = produit_indice(corps, indice, debut, fin, utiliser_degres, variables, session)
+            
+            stack.append(resultat)
+        
+        #=====================================================================
+        # VARIABLE -> empiler sa valeur
+        #=====================================================================
+        elif token.isalpha():
+            stack.append(_valeur_nom(token, utiliser_degres, variables, session))
+        
         else:
             raise ExpressionInvalideError(f"Token inconnu :  '{token}'")
     
@@ -560,13 +1334,88 @@ def evaluer_rpn(rpn: list, utiliser_degres=False) -> float:
 # FONCTIONS UTILITAIRES
 #=============================================================================
 
+def _valeur_nom(nom: str, utiliser_degres, variables, session):
+    """
+    Valeur d'une variable : locale, de la session, ou i en mode complexe.
+    
+    Raises:
+        ExpressionInvalideError: Si le nom n'a pas de valeur
+    """
+    if variables is not None and nom in variables:
+        return variables[nom]
+    
+    # Variable de la session (recalculée seulement si invalidée)
+    if session is not None and nom in session.variables:
+        return session.valeur(nom, utiliser_degres)
+    
+    # Unité imaginaire (mode complexe), masquée par un indice nommé i
+    if session is not None and session.mode_complexe:
+        from src import complexes
+        if nom == complexes.UNITE_IMAGINAIRE:
+            return 1j
+    
+    raise ExpressionInvalideError(f"Variable inconnue :  '{nom}'")
+
+
 def est_nombre(token: str) -> bool:
-    """Vérifie si un token est un nombre."""
+    """Vérifie si un token est un nombre (y compris 0xFF, 0o17, 0b1010)."""
     try:
         float(token)
         return True
-    except ValueError:
-        return False
+    except (ValueError, TypeError):
+        return isinstance(token, str) and _longueur_litteral_base(token, 0) == len(token)
+
+
+def valeur_nombre(token: str, entiers=False):
+    """
+    Convertit un token nombre en valeur.
+    
+    Args:
+        token: Le nombre (ex: "3.5", "0xff")
+        entiers: Mode programmeur : les entiers décimaux restent des int
+    
+    Returns:
+        int pour 0xFF, 0o17, 0b1010, les entiers décimaux au-delà de 2^53
+        (et "42" si entiers), float sinon
+    """
+    if isinstance(token, str):
+        base = PREFIXES_BASES.get(token[:2])
+        if base is not None:
+            return int(token[2:], base)
+        if token.isdigit() and (entiers or len(token) > 15):
+            from src.programmeur import lire_entier
+            n = lire_entier(token)
+            if entiers or n > ENTIER_FLOTTANT_MAX:
+                return n
+    return float(token)
+
+
+def _longueur_litteral_base(texte: str, debut: int) -> int:
+    """
+    Longueur du littéral 0x.., 0o.. ou 0b.. qui commence à debut (0 sinon).
+    """
+    base = PREFIXES_BASES.get(texte[debut:debut + 2].lower())
+    if base is None:
+        return 0
+    
+    chiffres_valides = '0123456789abcdef'[:base]
+    fin = debut + 2
+    while fin < len(texte) and texte[fin].lower() in chiffres_valides:
+        fin += 1
+    return fin - debut if fin > debut + 2 else 0
+
+
+def nom_variable(fonction: str, sous_programme) -> str:
+    """
+    Extrait un nom de variable d'un argument différé (ex: le k de sigma).
+    
+    Raises:
+        ArgumentFonctionError: Si l'argument n'est pas un simple nom
+    """
+    if (isinstance(sous_programme, list) and len(sous_programme) == 1
+            and isinstance(sous_programme[0], str) and sous_programme[0].isalpha()):
+        return sous_programme[0]
+    raise ArgumentFonctionError(fonction, "l'indice doit être un nom de variable")
 
 
 #=============================================================================
@@ -632,6 +1481,49 @@ def maximum(a: float, b: float) -> float:
     return float(b)
 
 
+def minimum_liste(valeurs) -> float:
+    """Retourne le minimum d'une suite de valeurs (au moins une)."""
+    iterateur = iter(valeurs)
+    resultat = next(iterateur)
+    for valeur in iterateur:
+        resultat = minimum(resultat, valeur)
+    return float(resultat)
+
+
+def maximum_liste(valeurs) -> float:
+    """Retourne le maximum d'une suite de valeurs (au moins une)."""
+    iterateur = iter(valeurs)
+    resultat = next(iterateur)
+    for valeur in iterateur:
+        resultat = maximum(resultat, valeur)
+    return float(resultat)
+
+
+def comparer(operateur: str, a: float, b: float) -> float:
+    """
+    Compare a et b.
+    
+    Args:
+        operateur: '<', '>', '<=', '>=', '==' ou '!='
+    
+    Returns:
+        float: 1.0 si la comparaison est vraie, 0.0 sinon
+    """
+    if operateur == '<':
+        vrai = a < b
+    elif operateur == '>':
+        vrai = a > b
+    elif operateur == '<=':
+        vrai = a <= b
+    elif operateur == '>=':
+        vrai = a >= b
+    elif operateur == '==':
+        vrai = a == b
+    else:
+        vrai = a != b
+    return 1.0 if vrai else 0.0
+
+
 def puissance(base: float, exposant: float) -> float:
     """
     Calcule base^exposant.
@@ -907,4 +1799,402 @@ def exponentielle(x:  float) -> float:
         if valeur_absolue(terme) < 1e-15:
             break
     
-    return resultat
\ No newline at end of file
+    return resultat
+
+
+#=============================================================================
+# FONCTIONS STATISTIQUES - UNE SEULE PASSE
+#=============================================================================
+
+def somme(valeurs) -> float:
+    """
+    Calcule la somme d'une suite de valeurs avec compensation des erreurs
+    d'arrondi (algorithme de Kahan-Babuška / Neumaier).
+    
+    Args:
+        valeurs: Suite (ou itérateur) de nombres
+    
+    Returns:
+        float: La somme
+    
+    Examples:
+        >>> somme([0.1] * 10)
+        1.0
+    """
+    total, _ = _somme_compensee(valeurs)
+    return total
+
+
+def moyenne(valeurs) -> float:
+    """
+    Calcule la moyenne d'une suite de valeurs (somme compensée).
+    
+    Args:
+        valeurs: Suite (ou itérateur) d'au moins une valeur
+    
+    Returns:
+        float: La moyenne arithmétique
+    """
+    total, n = _somme_compensee(valeurs)
+    if n == 0:
+        raise ArgumentFonctionError('mean', "nécessite au moins 1 argument")
+    return total / n
+
+
+def _somme_compensee(valeurs) -> tuple:
+    """
+    Somme compensée de Neumaier en une passe.
+    
+    Returns:
+        tuple: (somme, nombre de valeurs)
+    """
+    total = 0.0
+    compensation = 0.0  # Erreur d'arrondi accumulée
+    n = 0
+    
+    for valeur in valeurs:
+        n += 1
+        t = total + valeur
+        # On récupère la partie perdue par l'arrondi de l'addition
+        if valeur_absolue(total) >= valeur_absolue(valeur):
+            compensation += (total - t) + valeur
+        else:
+            compensation += (valeur - t) + total
+        total = t
+    
+    return (total + compensation, n)
+
+
+def variance(valeurs) -> float:
+    """
+    Calcule la variance (d'échantillon, diviseur n - 1) en une seule passe.
+    
+    Utilise l'algorithme de Welford, numériquement stable :
+    on met à jour la moyenne et la somme des carrés des écarts
+    à chaque nouvelle valeur.
+    
+    Args:
+        valeurs: Suite (ou itérateur) d'au moins deux valeurs
+    
+    Returns:
+        float: La variance
+    
+    Raises:
+        ArgumentFonctionError: Si moins de 2 valeurs
+    """
+    n = 0
+    moyenne_courante = 0.0
+    m2 = 0.0  # Somme des carrés des écarts à la moyenne
+    
+    for valeur in valeurs:
+        n += 1
+        delta = valeur - moyenne_courante
+        moyenne_courante += delta / n
+        m2 += delta * (valeur - moyenne_courante)
+    
+    if n < 2:
+        raise ArgumentFonctionError('var', "nécessite au moins 2 arguments")
+    return m2 / (n - 1)
+
+
+def ecart_type(valeurs) -> float:
+    """
+    Calcule l'écart-type (d'échantillon) : racine carrée de la variance.
+    
+    Raises:
+        ArgumentFonctionError: Si moins de 2 valeurs
+    """
+    try:
+        return racine_carree(variance(valeurs))
+    except ArgumentFonctionError:
+        raise ArgumentFonctionError('stdev', "nécessite au moins 2 arguments")
+
+
+def mediane(valeurs) -> float:
+    """
+    Calcule la médiane d'une suite de valeurs en temps linéaire (en moyenne).
+    
+    Args:
+        valeurs: Suite d'au moins une valeur (n'est pas modifiée)
+    
+    Returns:
+        float: La médiane
+    
+    Examples:
+        >>> mediane([3, 1, 2])
+        2.0
+        >>> mediane([4, 1, 3, 2])
+        2.5
+    """
+    copie = list(valeurs)
+    if not copie:
+        raise ArgumentFonctionError('median', "nécessite au moins 1 argument")
+    return _mediane_en_place(copie, 0, len(copie))
+
+
+def _mediane_en_place(tableau: list, debut: int, fin: int) -> float:
+    """
+    Médiane de tableau[debut:fin] par sélection rapide (quickselect).
+    
+    ATTENTION : réordonne les éléments de tableau[debut:fin].
+    Utilisée directement sur la pile de evaluer_rpn pour éviter une copie.
+    """
+    n = fin - debut
+    milieu = debut + n // 2
+    _selectionner(tableau, debut, fin - 1, milieu)
+    valeur_haute = tableau[milieu]
+    
+    if n % 2 == 1:
+        return float(valeur_haute)
+    
+    # n pair : la valeur basse est le maximum de la moitié gauche
+    # (après la sélection, tous ces éléments sont <= valeur_haute)
+    valeur_basse = maximum_liste(islice(tableau, debut, milieu))
+    return (valeur_basse + valeur_haute) / 2.0
+
+
+def _selectionner(tableau: list, gauche: int, droite: int, k: int) -> None:
+    """
+    Place en position k l'élément qui y serait si tableau[gauche:droite+1]
+    était trié (partition de Hoare, pivot médian de trois).
+    """
+    while gauche < droite:
+        milieu = (gauche + droite) // 2
+        # Pivot : médiane de trois (robuste aux données déjà triées)
+        a, b, c = tableau[gauche], tableau[milieu], tableau[droite]
+        if a > b:
+            a, b = b, a
+        if b > c:
+            b = c if a <= c else a
+        pivot = b
+        
+        i, j = gauche, droite
+        while i <= j:
+            while tableau[i] < pivot:
+                i += 1
+            while tableau[j] > pivot:
+                j -= 1
+            if i <= j:
+                tableau[i], tableau[j] = tableau[j], tableau[i]
+                i += 1
+                j -= 1
+        
+        # Continuer seulement dans la partie qui contient k
+        if k <= j:
+            droite = j
+        elif k >= i:
+            gauche = i
+        else:
+            return
+
+
+#=============================================================================
+# FONCTIONS PAR MORCEAUX
+#=============================================================================
+
+def par_morceaux(morceaux: list, utiliser_degres=False, variables=None, session=None) -> float:
+    """
+    Évalue piecewise(c1, v1, c2, v2, ..., défaut).
+    
+    Les conditions sont évaluées dans l'ordre, et seule la valeur de la
+    première condition vraie est calculée. Avec un nombre impair
+    d'arguments, le dernier est la valeur par défaut.
+    
+    Args:
+        morceaux: Sous-programmes RPN [c1, v1, c2, v2, ..., (défaut)]
+        utiliser_degres: Mode angulaire
+        variables: Variables visibles
+        session: Session (fonctions de l'utilisateur, ANS)
+    
+    Returns:
+        float: La valeur retenue
+    
+    Raises:
+        ArgumentFonctionError: Si aucune condition n'est vraie et qu'il
+                               n'y a pas de valeur par défaut
+    
+    Examples:
+        >>> calculer("piecewise(x < 0, -x, x < 1, x^2, 1)", variables={'x': 0.5})
+        0.25
+    """
+    for i in range(0, len(morceaux) - 1, 2):
+        if evaluer_rpn(morceaux[i], utiliser_degres, variables, session) != 0:
+            return evaluer_rpn(morceaux[i + 1], utiliser_degres, variables, session)
+    
+    if len(morceaux) % 2 == 1:
+        return evaluer_rpn(morceaux[-1], utiliser_degres, variables, session)
+    raise ArgumentFonctionError('piecewise', "aucune condition vraie et pas de valeur par défaut")
+
+
+#=============================================================================
+# SOMME ET PRODUIT INDICÉS
+#=============================================================================
+# Termes évalués ensemble par NumPy : la mémoire ne dépend pas du nombre
+# de termes (sigma(k, k, 1, 10^9) n'alloue pas 8 Go d'indices)
+TAILLE_BLOC_INDICE = 65536
+
+
+def somme_indicee(corps: list, indice, debut, fin, utiliser_degres=False, variables=None, session=None) -> float:
+    """
+    Calcule sigma(expr, k, a, b) = expr(a) + expr(a+1) + ... + expr(b).
+    
+    Le corps est déjà compilé en RPN (argument différé) : il n'est jamais
+    re-tokenisé. Si NumPy est disponible, il est évalué par blocs de
+    TAILLE_BLOC_INDICE valeurs de k ; sinon, on boucle sur la RPN.
+    La somme est compensée (Neumaier) pour limiter les erreurs d'arrondi.
+    
+    Args:
+        corps: Sous-programme RPN de l'expression à sommer
+        indice: Sous-programme contenant le nom de l'indice (ex: ['k'])
+        debut, fin: Bornes entières (incluses)
+        utiliser_degres: Mode angulaire transmis au corps
+        variables: Variables extérieures visibles dans le corps
+        session: Session (fonctions de l'utilisateur, ANS)
+    
+    Returns:
+        float: La somme (0 si fin < debut)
+    
+    Examples:
+        >>> calculer("sigma(k^2, k, 1, 10)")
+        385.0
+    """
+    nom = nom_variable('sigma', indice)
+    debut, fin = _bornes_entieres('sigma', debut, fin)
+    
+    from src.vectoriel import somme_compensee_tableau
+    sommes = _blocs_vectorises(corps, nom, debut, fin, utiliser_degres, variables, session,
+                               somme_compensee_tableau)
+    if sommes is not None:
+        # Fusion compensée des sommes (elles-mêmes compensées) des blocs
+        return float(somme(sommes))
+    
+    if session is not None and session.mode_complexe:
+        from src.complexes import somme_complexe
+        return somme_complexe(_termes(corps, nom, debut, fin, utiliser_degres, variables, session))
+    
+    return somme(_termes(corps, nom, debut, fin, utiliser_degres, variables, session))
+
+
+def produit_indice(corps: list, indice, debut, fin, utiliser_degres=False, variables=None, session=None) -> float:
+    """
+    Calcule prod(expr, k, a, b) = expr(a) * expr(a+1) * ... * expr(b).
+    
+    Même fonctionnement que somme_indicee.
+    
+    Returns:
+        float: Le produit (1 si fin < debut)
+    
+    Examples:
+        >>> calculer("prod(k, k, 1, 5)")
+        120.0
+    """
+    nom = nom_variable('prod', indice)
+    debut, fin = _bornes_entieres('prod', debut, fin)
+    
+    produits = _blocs_vectorises(corps, nom, debut, fin, utiliser_degres, variables, session,
+                                 lambda termes: termes.prod())
+    if produits is not None:
+        resultat = 1.0
+        for produit in produits:
+            resultat *= produit
+        return float(resultat)
+    
+    resultat = 1.0
+    for terme in _termes(corps, nom, debut, fin, utiliser_degres, variables, session):
+        resultat *= terme
+    
+    # Mode complexe : i * i = -1 redevient un réel
+    if isinstance(resultat, complex) and resultat.imag == 0:
+        return resultat.real
+    return resultat
+
+
+def _bornes_entieres(fonction: str, debut, fin) -> tuple:
+    """Vérifie que les bornes d'une somme/d'un produit sont entières."""
+    if isinstance(debut, list) or isinstance(fin, list):
+        raise ArgumentFonctionError(fonction, "les bornes doivent être des nombres")
+    if debut != int(debut) or fin != int(fin):
+        raise ArgumentFonctionError(fonction, "les bornes doivent être entières")
+    return int(debut), int(fin)
+
+
+def _termes(corps: list, nom: str, debut: int, fin: int, utiliser_degres, variables, session):
+    """Génère les termes d'une somme/d'un produit en évaluant la RPN du corps."""
+    variables_locales = dict(variables) if variables else {}
+    for k in range(debut, fin + 1):
+        variables_locales[nom] = float(k)
+        yield evaluer_rpn(corps, utiliser_degres, variables_locales, session)
+
+
+def _blocs_vectorises(corps: list, nom: str, debut: int, fin: int, utiliser_degres, variables, session,
+                      reduire) -> list:
+    """
+    Évalue les termes avec NumPy, par blocs de TAILLE_BLOC_INDICE.
+    
+    Args:
+        reduire: Réduit le tableau des termes d'un bloc (somme, produit)
+    
+    Returns:
+        list: La réduction de chaque bloc, ou None si NumPy est absent ou
+              si un terme n'est pas fini (on repasse alors par la boucle
+              pour lever la bonne erreur : division par zéro, logarithme, etc.)
+    """
+    from src import vectoriel
+    if not vectoriel.NUMPY_DISPONIBLE or fin < debut:
+        return None
+    # Les tableaux NumPy sont réels : le mode complexe passe par la boucle
+    if session is not None and session.mode_complexe:
+        return None
+    
+    variables_locales = dict(variables) if variables else {}
+    reductions = []
+    for bloc in range(debut, fin + 1, TAILLE_BLOC_INDICE):
+        k = vectoriel.np.arange(bloc, min(bloc + TAILLE_BLOC_INDICE, fin + 1), dtype=float)
+        variables_locales[nom] = k
+        try:
+            termes = vectoriel.evaluer_rpn_vectoriel(corps, variables_locales, utiliser_degres, session)
+        except (ArithmeticError, ValueError, TypeError, CalculatriceError):
+            # Corps non vectorisable (matrices, ...) : la boucle lèvera
+            # l'erreur exacte s'il y en a une
+            return None
+        
+        if termes.shape != k.shape or not vectoriel.np.isfinite(termes).all():
+            return None
+        reductions.append(reduire(termes))
+    return reductions
+
+
+#=============================================================================
+# FONCTIONS DE L'UTILISATEUR
+#=============================================================================
+
+def appeler_fonction(definition, arguments: list, utiliser_degres=False, variables=None, session=None) -> float:
+    """
+    Appelle une fonction définie par l'utilisateur (ex: f(x) = x^2 + 1).
+    
+    Le corps, déjà compilé en RPN lors de la définition, est évalué avec
+    les paramètres liés aux arguments.
+    
+    Args:
+        definition: Objet avec .nom, .parametres (liste de noms) et .rpn
+        arguments: Valeurs des arguments, dans l'ordre
+        utiliser_degres: Mode angulaire
+        variables: Variables visibles depuis l'appel
+        session: Session qui contient les autres fonctions
+    
+    Returns:
+        float: Le résultat de l'appel
+    
+    Raises:
+        ArgumentFonctionError: Si le nombre d'arguments est incorrect
+    """
+    if len(arguments) != len(definition.parametres):
+        attendus = len(definition.parametres)
+        raise ArgumentFonctionError(
+            definition.nom,
+            f"attend exactement {attendus} argument{'s' if attendus > 1 else ''}"
+        )
+    
+    variables_locales = dict(variables) if variables else {}
+    variables_locales.update(zip(definition.parametres, arguments))
+    return evaluer_rpn(definition.rpn, utiliser_degres, variables_locales, session)
@@ -0,0 +1,314 @@
+# src/canonique.py
+"""
+================================================================================
+Forme canonique des expressions - VERSION 4.0
+================================================================================
+
+"2+3", " 2 + 3 ", "(2)+3" et "3+2" sont quatre textes pour un seul
+calcul. La forme canonique est calculée à partir de la RPN (l'arbre
+analysé), pas du texte :
+
+    >>> forme_canonique(" (2) + 3 ")
+    '2+3'
+    >>> forme_canonique("3+2") == forme_canonique("2+3")
+    True
+    >>> forme_canonique("pi * 2") == forme_canonique("2*PI")
+    True
+
+NORMALISATIONS :
+----------------
+    - espaces et parenthèses superflues (l'arbre n'en garde pas trace) ;
+    - casse des noms et des constantes (pi, Pi -> PI ; fait par tokenize) ;
+    - écriture des nombres : 007 -> 7, 1.50 -> 1.5, .5 -> 0.5 (les
+      littéraux 0xFF, 0o17, 0b1010 sont gardés tels quels ; 2.0 et 2
+      restent distincts : ils diffèrent en mode programmeur) ;
+    - ordre des opérandes des opérateurs commutatifs : +, ==, !=, and,
+      or, xor toujours ; * seulement entre valeurs sûrement scalaires
+      (nombres, PI, E, fonctions scalaires) : A*B n'est pas B*A pour des
+      matrices, et une variable peut en être une ;
+    - a > b s'écrit b < a, a >= b s'écrit b <= a.
+
+Ces transformations donnent exactement le même résultat en virgule
+flottante (l'addition et la multiplication IEEE sont commutatives).
+L'ASSOCIATIVITÉ n'est PAS utilisée : (a+b)+c et a+(b+c) peuvent différer
+d'un arrondi, ils gardent des formes distinctes. Seule différence
+possible : quand les deux opérandes d'un opérateur commutatif échouent,
+le message d'erreur peut être celui de l'autre opérande.
+
+La forme canonique est une expression valide, entièrement parenthésée
+(sauf au niveau le plus haut), qui a elle-même la même forme canonique.
+empreinte() en donne un hachage stable (identique d'un processus et
+d'une machine à l'autre, contrairement à hash()).
+
+Taux de succès d'un cache sur un historique enregistré :
+
+    $ python -m src.canonique historique.json formules.txt
+
+================================================================================
+"""
+
+import hashlib
+
+from src.calculateur import (
+    tokenize, infix_to_rpn, est_nombre,
+    FONCTIONS_UNAIRES, FONCTIONS_VARIADIQUES, ARITES_FIXES,
+    OPERATEURS_COMPARAISON, OPERATEURS_BITS, NEGATION_BITS,
+    SEPARATEUR_ARITE, LITTERAL_TABLEAU, PREFIXES_BASES,
+)
+from src.exceptions import CalculatriceError, ExpressionInvalideError
+from src.polynomes import Polynome
+
+
+OPERATEURS_BINAIRES = {'+', '-', '*', '/', '%', '^'} | OPERATEURS_COMPARAISON | OPERATEURS_BITS
+
+# Opérateurs dont les opérandes sont triés
+OPERATEURS_COMMUTATIFS = {'+', '==', '!=', 'and', 'or', 'xor'}
+
+# a > b -> b < a
+COMPARAISONS_MIROIR = {'>': '<', '>=': '<='}
+
+# Fonctions dont le résultat est scalaire quand leurs arguments le sont
+# (transpose, solve, roots, mc, bounds peuvent rendre autre chose)
+FONCTIONS_SCALAIRES = (
+    (FONCTIONS_UNAIRES - {'transpose', 'roots', 'factor'})
+    | FONCTIONS_VARIADIQUES
+    | (set(ARITES_FIXES) - {'solve', 'mc', 'bounds'})
+)
+
+# Constantes scalaires (ANS peut être une matrice)
+CONSTANTES = {'PI', 'E'}
+
+
+#=============================================================================
+# FORME CANONIQUE
+#=============================================================================
+
+def forme_canonique(expression: str) -> str:
+    """
+    Forme canonique d'une expression.
+
+    Args:
+        expression: Expression mathématique (ex: "3 + 2")
+
+    Returns:
+        str: Forme canonique (ex: "2+3")
+
+    Raises:
+        CalculatriceError: Expression invalide
+
+    Examples:
+        >>> forme_canonique("x*(1+2)")
+        'x*(1+2)'
+        >>> forme_canonique("(3) + 2")
+        '2+3'
+    """
+    return canoniser(infix_to_rpn(tokenize(expression)))
+
+
+def empreinte(expression: str) -> str:
+    """
+    Hachage stable de la forme canonique (32 chiffres hexadécimaux).
+
+    Examples:
+        >>> empreinte("2+3") == empreinte(" 3 + 2 ")
+        True
+    """
+    return hashlib.blake2b(forme_canonique(expression).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def cle(expression: str) -> str:
+    """
+    Clé de cache : la forme canonique, ou le texte sans espaces autour
+    si l'expression ne s'analyse pas (une erreur n'est jamais levée).
+
+    Examples:
+        >>> cle("3+2")
+        '2+3'
+        >>> cle("2 + ")
+        '2 +'
+    """
+    try:
+        return forme_canonique(expression)
+    except CalculatriceError:
+        return expression.strip()
+
+
+def canoniser(rpn: list) -> str:
+    """
+    Forme canonique d'une RPN produite par infix_to_rpn(), compilée ou
+    non par src.polynomes.
+
+    Les arguments différés (listes imbriquées) sont canonisés comme des
+    sous-expressions.
+
+    Raises:
+        ExpressionInvalideError: RPN incomplète ou incohérente
+
+    Examples:
+        >>> canoniser(['3', '2', '+'])
+        '2+3'
+    """
+    return _sans_parentheses(_noeud_racine(rpn)[0])
+
+
+def _noeud_racine(rpn) -> tuple:
+    """(texte, scalaire) de la seule valeur laissée par la RPN."""
+    pile = []
+    for token in rpn:
+        if isinstance(token, list):
+            pile.append(_noeud_racine(token))
+            continue
+        if isinstance(token, Polynome):
+            pile.append(_noeud_racine(token.rpn))  # Forme développée d'origine
+            continue
+
+        arite = _arite(token)
+        if len(pile) < arite:
+            raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+        operandes = pile[len(pile) - arite:]
+        del pile[len(pile) - arite:]
+        pile.append(_noeud(token, operandes))
+
+    if len(pile) != 1:
+        raise ExpressionInvalideError("Expression invalide - vérifiez la syntaxe")
+    return pile[0]
+
+
+def _sans_parentheses(texte: str) -> str:
+    """Retire les parenthèses qui entourent tout le texte."""
+    if texte.startswith('(') and _parenthese_fermante(texte, 0) == len(texte) - 1:
+        return texte[1:-1]
+    return texte
+
+
+def _arite(token: str) -> int:
+    """Nombre d'opérandes que le token prend sur la pile."""
+    if token in OPERATEURS_BINAIRES:
+        return 2
+    if token in ('UNARY_MINUS', NEGATION_BITS) or token in FONCTIONS_UNAIRES:
+        return 1
+    if SEPARATEUR_ARITE in token:
+        return int(token.rsplit(SEPARATEUR_ARITE, 1)[1])
+    return ARITES_FIXES.get(token, 0)
+
+
+def _noeud(token: str, operandes: list) -> tuple:
+    """(texte, scalaire) d'un token appliqué à ses opérandes."""
+    textes = [texte for texte, _ in operandes]
+    scalaire = all(scalaire for _, scalaire in operandes)
+
+    if token in OPERATEURS_BINAIRES:
+        a, b = textes
+        if token in COMPARAISONS_MIROIR:
+            token, a, b = COMPARAISONS_MIROIR[token], b, a
+        if token in OPERATEURS_COMMUTATIFS or (token == '*' and scalaire):
+            a, b = sorted((a, b))
+        separateur = f" {token} " if token.isalpha() else token
+        return f"({a}{separateur}{b})", scalaire
+    if token == 'UNARY_MINUS':
+        return f"(-{textes[0]})", scalaire
+    if token == NEGATION_BITS:
+        return f"({token} {textes[0]})", scalaire
+    if not operandes and est_nombre(token):
+        return _nombre(token), True
+    if not operandes and token not in ARITES_FIXES:
+        return token, token in CONSTANTES  # Constante ou variable
+
+    nom = token.split(SEPARATEUR_ARITE, 1)[0]
+    arguments = ','.join(_sans_parentheses(texte) for texte in textes)
+    if nom == LITTERAL_TABLEAU:
+        return f"[{arguments}]", False
+    return f"{nom}({arguments})", scalaire and nom in FONCTIONS_SCALAIRES
+
+
+def _nombre(token: str) -> str:
+    """Écriture unique d'un littéral : 007 -> 7, 1.50 -> 1.5."""
+    if token[:2] in PREFIXES_BASES:
+        return token
+    if token.isdigit():
+        return str(int(token))
+    texte = repr(float(token))
+    return texte if 'e' not in texte else token  # 1e+16 ne se relirait pas
+
+
+def _parenthese_fermante(texte: str, debut: int) -> int:
+    """Position de la parenthèse qui ferme celle ouverte en debut."""
+    profondeur = 0
+    for i in range(debut, len(texte)):
+        if texte[i] == '(':
+            profondeur += 1
+        elif texte[i] == ')':
+            profondeur -= 1
+            if profondeur == 0:
+                return i
+    return -1
+
+
+#=============================================================================
+# TAUX DE SUCCÈS D'UN CACHE
+#=============================================================================
+
+def taux_de_succes(expressions) -> dict:
+    """
+    Compare un cache indexé par le texte et un cache indexé par la forme
+    canonique (de taille illimitée) sur une suite d'expressions.
+
+    Returns:
+        dict: expressions, textes (distincts), formes (distinctes),
+              taux_texte et taux_canonique (succès / expressions)
+
+    Examples:
+        >>> taux_de_succes(["2+3", "3+2", " 2 + 3"])['taux_canonique']
+        0.6666666666666666
+    """
+    textes, formes = set(), set()
+    nombre = 0
+    for expression in expressions:
+        nombre += 1
+        textes.add(expression)
+        formes.add(cle(expression))
+    return {
+        'expressions': nombre,
+        'textes': len(textes),
+        'formes': len(formes),
+        'taux_texte': (nombre - len(textes)) / nombre if nombre else 0.0,
+        'taux_canonique': (nombre - len(formes)) / nombre if nombre else 0.0,
+    }
+
+
+def _expressions(fichier: str) -> list:
+    """Expressions d'un historique JSON (src.historique) ou d'un fichier texte."""
+    import json
+
+    with open(fichier, encoding='utf-8') as f:
+        contenu = f.read()
+    try:
+        operations = json.loads(contenu)
+    except ValueError:
+        return [ligne for ligne in contenu.splitlines() if ligne.strip()]
+    return [operation['expression'] for operation in operations]
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée de python -m src.canonique."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(
+        prog='python -m src.canonique',
+        description="Taux de succès d'un cache par texte et par forme canonique.",
+    )
+    analyseur.add_argument('fichiers', nargs='+', help="historiques JSON ou fichiers d'expressions")
+    options = analyseur.parse_args(arguments)
+
+    for fichier in options.fichiers:
+        taux = taux_de_succes(_expressions(fichier))
+        print(f"{fichier} : {taux['expressions']} expressions, "
+              f"{taux['textes']} textes, {taux['formes']} formes canoniques")
+        print(f"    succès par texte     : {taux['taux_texte']:.1%}")
+        print(f"    succès par forme     : {taux['taux_canonique']:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,422 @@
+# src/complexes.py
+"""
+================================================================================
+Module des nombres complexes - VERSION 4.0
+================================================================================
+
+Noyaux de calcul du MODE COMPLEXE de la calculatrice (activé par session :
+Session(mode_complexe=True)).
+
+En mode complexe :
+    - sqrt(-4) = 2i, ln(-1) = πi, (-8)^(1/3) = 1 + 1.732i
+    - i est l'unité imaginaire : (1 + 2*i) * (3 - i) = 5 + 5i
+    - re(z), im(z), arg(z), conj(z), abs(z) (module)
+
+BRANCHES PRINCIPALES :
+----------------------
+    - arg(z) dans ]-π, π]
+    - sqrt(z) a une partie réelle >= 0
+    - ln(z) = ln|z| + i*arg(z)
+    - a^b = exp(b * ln(a)) (sauf exposant entier : multiplications)
+
+CHEMIN RAPIDE :
+---------------
+evaluer_rpn n'appelle ces noyaux que si un opérande est complexe ou si
+le noyau réel sortirait de son domaine (racine d'un négatif, etc.).
+Une expression purement réelle est donc calculée exactement comme en
+mode réel. Un résultat dont la partie imaginaire est nulle redevient
+un float.
+
+Comme pour src.calculateur, on n'utilise PAS le module math (ni cmath) :
+tout est construit sur les noyaux réels (séries de Taylor).
+
+================================================================================
+"""
+
+from src.calculateur import (
+    PI,
+    racine_carree,
+    valeur_absolue,
+    logarithme_neperien,
+    exponentielle,
+    sinus,
+    cosinus,
+    _somme_compensee,
+)
+from src.exceptions import (
+    DivisionParZeroError,
+    ExpressionInvalideError,
+    ArgumentFonctionError,
+    LogarithmeError,
+    TangenteDomainError,
+)
+
+
+# Nom de l'unité imaginaire dans les expressions
+UNITE_IMAGINAIRE = 'i'
+
+# Fonctions variadiques définies pour les complexes
+VARIADIQUES_COMPLEXES = {'sum', 'mean'}
+
+LN_10 = 2.302585092994046  # Valeur précalculée de ln(10)
+
+
+#=============================================================================
+# AIGUILLAGE (appelé par evaluer_rpn en mode complexe)
+#=============================================================================
+
+def besoin_complexe(token: str, *arguments) -> bool:
+    """
+    Indique si une opération doit passer par les noyaux complexes.
+
+    Vrai si un opérande est complexe, ou si le noyau réel sortirait de
+    son domaine (sqrt ou ln d'un négatif, négatif à une puissance non entière).
+
+    Examples:
+        >>> besoin_complexe('sqrt', 4.0)
+        False
+        >>> besoin_complexe('sqrt', -4.0)
+        True
+    """
+    for argument in arguments:
+        if isinstance(argument, complex):
+            return True
+
+    x = arguments[0]
+    if token in ('sqrt', 'ln', 'log'):
+        return x < 0
+    if token == '^':
+        exposant = arguments[1]
+        return x < 0 and exposant != int(exposant)
+    return False
+
+
+def fonction(token: str, z):
+    """
+    Applique une fonction à un argument complexe.
+
+    Args:
+        token: Nom de la fonction (sqrt, ln, sin, re, ..., ou UNARY_MINUS)
+        z: Argument (complex ou float)
+
+    Returns:
+        Le résultat, normalisé (float si la partie imaginaire est nulle)
+    """
+    z = complex(z)
+
+    if token == 'UNARY_MINUS':
+        resultat = -z
+    elif token == 'sqr':
+        resultat = z * z
+    elif token == 'inv':
+        resultat = _diviser(1, z)
+    elif token == 'abs':
+        resultat = module(z)
+    elif token == 're':
+        resultat = z.real
+    elif token == 'im':
+        resultat = z.imag
+    elif token == 'conj':
+        resultat = z.conjugate()
+    elif token == 'arg':
+        resultat = argument(z)
+    elif token in ('sind', 'cosd', 'tand'):
+        resultat = _FONCTIONS[token[:-1]](z * PI / 180)
+    elif token in _FONCTIONS:
+        resultat = _FONCTIONS[token](z)
+    else:
+        raise ExpressionInvalideError(f"Fonction {token}() non définie pour les nombres complexes")
+
+    return normaliser(resultat)
+
+
+def operation(token: str, a, b):
+    """
+    Applique un opérateur binaire à des opérandes complexes.
+
+    Raises:
+        DivisionParZeroError: Division par zéro
+        ExpressionInvalideError: Modulo ou comparaison d'ordre (<, >, ...)
+                                 entre nombres complexes
+    """
+    if token == '+':
+        resultat = a + b
+    elif token == '-':
+        resultat = a - b
+    elif token == '*':
+        resultat = a * b
+    elif token == '/':
+        resultat = _diviser(a, b)
+    elif token == '^':
+        resultat = puissance_complexe(complex(a), complex(b))
+    elif token == '==':
+        resultat = 1.0 if a == b else 0.0
+    elif token == '!=':
+        resultat = 1.0 if a != b else 0.0
+    else:
+        raise ExpressionInvalideError(f"Opérateur '{token}' non défini pour les nombres complexes")
+
+    return normaliser(resultat)
+
+
+def variadique(nom: str, valeurs: list):
+    """
+    Fonctions variadiques sur des complexes : seules sum et mean ont un sens.
+
+    Raises:
+        ArgumentFonctionError: Pour min, max, median, var, stdev
+    """
+    if nom not in VARIADIQUES_COMPLEXES:
+        raise ArgumentFonctionError(nom, "non définie pour les nombres complexes")
+
+    total = somme_complexe(valeurs)
+    if nom == 'mean':
+        total = total / len(valeurs)
+    return normaliser(total)
+
+
+def somme_complexe(valeurs):
+    """Somme compensée (Neumaier) des parties réelles et imaginaires."""
+    valeurs = [complex(v) for v in valeurs]
+    reelle, _ = _somme_compensee(v.real for v in valeurs)
+    imaginaire, _ = _somme_compensee(v.imag for v in valeurs)
+    return normaliser(complex(reelle, imaginaire))
+
+
+def normaliser(z):
+    """Retourne un float si la partie imaginaire est nulle."""
+    if isinstance(z, complex) and z.imag == 0:
+        return z.real
+    return z
+
+
+def formater(z, decimales=10) -> str:
+    """
+    Affiche un complexe sous la forme a + bi.
+
+    Examples:
+        >>> formater(complex(3, -2))
+        '3 - 2i'
+        >>> formater(2j)
+        '2i'
+    """
+    def nombre(x):
+        x = round(x, decimales)
+        return str(int(x)) if x == int(x) else str(x)
+
+    if not isinstance(z, complex):
+        return nombre(z)
+
+    reelle, imaginaire = z.real, z.imag
+    partie_imaginaire = "i" if valeur_absolue(imaginaire) == 1 else nombre(valeur_absolue(imaginaire)) + "i"
+    if round(reelle, decimales) == 0:
+        return ("-" if imaginaire < 0 else "") + partie_imaginaire
+    signe = "-" if imaginaire < 0 else "+"
+    return f"{nombre(reelle)} {signe} {partie_imaginaire}"
+
+
+#=============================================================================
+# MODULE ET ARGUMENT
+#=============================================================================
+
+def module(z: complex) -> float:
+    """
+    Calcule |z| = sqrt(a² + b²) sans dépassement pour les grandes valeurs.
+    """
+    a = valeur_absolue(z.real)
+    b = valeur_absolue(z.imag)
+    plus_grand = a if a > b else b
+    if plus_grand == 0:
+        return 0.0
+    # On divise par le plus grand pour que les carrés restent <= 1
+    a /= plus_grand
+    b /= plus_grand
+    return plus_grand * racine_carree(a * a + b * b)
+
+
+def argument(z: complex) -> float:
+    """
+    Calcule arg(z) dans ]-π, π] (équivalent de atan2(b, a)).
+    """
+    a, b = z.real, z.imag
+    if a > 0:
+        return arc_tangente(b / a)
+    if a < 0:
+        if b >= 0:
+            return arc_tangente(b / a) + PI
+        return arc_tangente(b / a) - PI
+    if b > 0:
+        return PI / 2
+    if b < 0:
+        return -PI / 2
+    return 0.0
+
+
+def arc_tangente(x: float) -> float:
+    """
+    Calcule arctan(x) par la série de Taylor.
+
+    Réduction de l'argument :
+        - |x| > 1 : arctan(x) = ±π/2 - arctan(1/x)
+        - arctan(x) = 2 * arctan(x / (1 + sqrt(1 + x²))), appliquée deux
+          fois : |x| <= tan(π/16) ≈ 0.2, la série converge vite
+
+    Formule:
+        arctan(x) = x - x³/3 + x⁵/5 - ...
+    """
+    if x < 0:
+        return -arc_tangente(-x)
+    if x > 1:
+        return PI / 2 - arc_tangente(1 / x)
+
+    for _ in range(2):
+        x = x / (1 + racine_carree(1 + x * x))
+
+    x_carre = x * x
+    resultat = 0.0
+    terme = x
+    n = 0
+    while valeur_absolue(terme) > 1e-17:
+        resultat += terme / (2 * n + 1)
+        terme *= -x_carre
+        n += 1
+
+    return 4 * resultat
+
+
+#=============================================================================
+# NOYAUX COMPLEXES
+#=============================================================================
+
+def racine_complexe(z: complex):
+    """
+    Racine carrée principale (partie réelle >= 0).
+
+    Examples:
+        >>> racine_complexe(complex(-4, 0))
+        2j
+    """
+    m = module(z)
+    if m == 0:
+        return 0.0
+    a, b = z.real, z.imag
+    # On calcule la plus grande des deux parties en premier
+    # (pas de soustraction de nombres proches)
+    if a >= 0:
+        r = racine_carree((m + a) / 2)
+        return complex(r, b / (2 * r))
+    s = racine_carree((m - a) / 2)
+    if b < 0:
+        s = -s
+    return complex(b / (2 * s), s)
+
+
+def logarithme_complexe(z: complex):
+    """
+    Logarithme principal : ln(z) = ln|z| + i*arg(z).
+
+    Raises:
+        LogarithmeError: Si z = 0
+    """
+    m = module(z)
+    if m == 0:
+        raise LogarithmeError(0)
+    return complex(logarithme_neperien(m), argument(z))
+
+
+def logarithme_base10_complexe(z: complex):
+    """log₁₀(z) = ln(z) / ln(10)."""
+    return logarithme_complexe(z) / LN_10
+
+
+def exponentielle_complexe(z: complex):
+    """exp(a + bi) = e^a * (cos(b) + i*sin(b))."""
+    module_resultat = exponentielle(z.real)
+    return complex(module_resultat * cosinus(z.imag), module_resultat * sinus(z.imag))
+
+
+def sinus_complexe(z: complex):
+    """sin(a + bi) = sin(a)*cosh(b) + i*cos(a)*sinh(b)."""
+    ch, sh = _cosh_sinh(z.imag)
+    return complex(sinus(z.real) * ch, cosinus(z.real) * sh)
+
+
+def cosinus_complexe(z: complex):
+    """cos(a + bi) = cos(a)*cosh(b) - i*sin(a)*sinh(b)."""
+    ch, sh = _cosh_sinh(z.imag)
+    return complex(cosinus(z.real) * ch, -sinus(z.real) * sh)
+
+
+def tangente_complexe(z: complex):
+    """
+    tan(z) = sin(z) / cos(z).
+
+    Raises:
+        TangenteDomainError: Si cos(z) = 0
+    """
+    c = cosinus_complexe(z)
+    if valeur_absolue(c.real) < 1e-10 and valeur_absolue(c.imag) < 1e-10:
+        raise TangenteDomainError(formater(z))
+    return sinus_complexe(z) / c
+
+
+def puissance_complexe(base: complex, exposant: complex):
+    """
+    Calcule base^exposant (branche principale).
+
+    Exposant entier : multiplications successives (exactes pour i^2 = -1).
+    Sinon : exp(exposant * ln(base)).
+
+    Raises:
+        DivisionParZeroError: 0 à une puissance de partie réelle <= 0
+    """
+    if exposant == 0:
+        return 1.0
+    if base == 0:
+        if exposant.real > 0:
+            return 0.0
+        raise DivisionParZeroError()
+
+    if exposant.imag == 0 and exposant.real == int(exposant.real):
+        n = int(exposant.real)
+        if n < 0:
+            return _diviser(1, puissance_complexe(base, complex(-n)))
+        # Exponentiation rapide
+        resultat = complex(1)
+        while n:
+            if n & 1:
+                resultat *= base
+            base *= base
+            n >>= 1
+        return resultat
+
+    return exponentielle_complexe(exposant * logarithme_complexe(base))
+
+
+#=============================================================================
+# FONCTIONS UTILITAIRES
+#=============================================================================
+
+def _diviser(a, b):
+    """Division qui lève DivisionParZeroError (comme le mode réel)."""
+    if b == 0:
+        raise DivisionParZeroError()
+    return a / b
+
+
+def _cosh_sinh(x: float) -> tuple:
+    """Retourne (cosh(x), sinh(x)) avec une seule exponentielle."""
+    ex = exponentielle(x)
+    inverse_ex = 1 / ex
+    return (ex + inverse_ex) / 2, (ex - inverse_ex) / 2
+
+
+_FONCTIONS = {
+    'sqrt': racine_complexe,
+    'ln': logarithme_complexe,
+    'log': logarithme_base10_complexe,
+    'exp': exponentielle_complexe,
+    'sin': sinus_complexe,
+    'cos': cosinus_complexe,
+    'tan': tangente_complexe,
+}
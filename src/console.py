@@ -0,0 +1,250 @@
+# src/console.py
+"""
+================================================================================
+Mode console : calcul en flux, sans interface graphique - VERSION 4.0
+================================================================================
+
+Lit des expressions ligne par ligne (entrée standard ou fichiers) et écrit
+un résultat par ligne, aussitôt calculé :
+
+    $ printf '2 + 3\\na = 4\\nsqrt(a) * 10\\n1/0\\n' | python -m src
+    5.0
+    4.0
+    20.0
+    Erreur :  Division par zéro impossible
+
+    $ python -m src --format csv formules.txt > resultats.csv
+    $ python -m src --format json < formules.txt | jq .resultat
+
+FORMATS :
+---------
+    texte   Le résultat (ou le message d'erreur) seul, une ligne par ligne
+            lue : les lignes vides restent vides, l'alignement est gardé
+    csv     ligne,expression,resultat,erreur (en-tête compris)
+    json    Un objet JSON par ligne : {"ligne", "expression", "resultat",
+            "erreur"} ; un résultat réel fini ou entier est un nombre JSON
+
+Les lignes sont calculées dans une même Session : les définitions
+(a = 4, f(x) = x^2) servent aux lignes suivantes. Chaque texte distinct
+n'est analysé qu'une fois, et la mémoire reste bornée quel que soit le
+nombre de lignes (taille_cache expressions compilées au plus). Chaque
+ligne écrite est vidée (flush) : le mode console se place dans un tube
+Unix (| head, | tee...) sans attendre la fin de l'entrée.
+
+Une erreur sur une ligne (CalculatriceError) est écrite à sa place et
+n'arrête pas le flux ; le code de sortie est alors 1.
+
+Avec --processus N, les lignes sont des expressions indépendantes,
+calculées sur N processus (src.lot) ; les résultats restent dans l'ordre.
+
+================================================================================
+"""
+
+import csv
+import json
+import sys
+
+from src.calculateur import TYPES_SCALAIRES
+from src.complexes import formater as formater_complexe
+from src.lot import calculer_lot, calculer_un
+from src.session import Session
+
+
+FORMATS = ('texte', 'csv', 'json')
+
+# Expressions compilées gardées par la session du mode console
+TAILLE_CACHE = 10000
+
+
+#=============================================================================
+# CALCUL EN FLUX
+#=============================================================================
+
+def calculer_lignes(lignes, session=None, utiliser_degres=False, processus=None):
+    """
+    Calcule un flux d'expressions, une par ligne.
+
+    Args:
+        lignes: Itérable de lignes (fichier, sys.stdin, liste...)
+        session: Session de calcul (défaut : une nouvelle session)
+        utiliser_degres: Mode angulaire
+        processus: Si donné, les lignes sont calculées comme des expressions
+                   indépendantes sur ce nombre de processus (voir src.lot)
+
+    Yields:
+        tuple: (numéro de ligne, expression, résultat, erreur) ; résultat
+               et erreur valent None pour une ligne vide, erreur est le
+               message de la CalculatriceError levée par la ligne
+
+    Examples:
+        >>> list(calculer_lignes(["2 + 3\\n", "1/0\\n"]))[0]
+        (1, '2 + 3', 5.0, None)
+    """
+    if session is None:
+        session = Session(taille_cache=TAILLE_CACHE)
+
+    if processus:
+        calculs = calculer_lot(lignes, processus, utiliser_degres=utiliser_degres, session=session)
+        for numero, calcul in enumerate(calculs, 1):
+            yield (numero,) + calcul
+        return
+
+    for numero, ligne in enumerate(lignes, 1):
+        expression = ligne.strip()
+        yield (numero, expression) + calculer_un(expression, session, utiliser_degres)
+
+
+def formater_resultat(resultat, session: Session) -> str:
+    """
+    Texte d'un résultat sur une seule ligne.
+
+    Examples:
+        >>> formater_resultat(0.1 + 0.2, Session())
+        '0.30000000000000004'
+    """
+    if resultat is None:
+        return ''  # Définition de fonction
+    if not isinstance(resultat, TYPES_SCALAIRES):
+        if hasattr(resultat, 'shape'):
+            from src.matrices import formater as formater_matrice
+            return formater_matrice(resultat).replace('\n', '')
+        return session.formater(resultat)  # factor(n)
+    if isinstance(resultat, complex):
+        return formater_complexe(resultat)
+    if isinstance(resultat, int):
+        return session.formater(resultat)
+    return repr(resultat)
+
+
+#=============================================================================
+# ÉCRITURE
+#=============================================================================
+
+def ecrire(calculs, sortie, format='texte', session=None) -> int:
+    """
+    Écrit les calculs au fil de l'eau, une ligne vidée par calcul.
+
+    Args:
+        calculs: Flux de calculer_lignes()
+        sortie: Fichier texte de sortie (ex: sys.stdout)
+        format: 'texte', 'csv' ou 'json'
+        session: Session des calculs (base d'affichage des entiers)
+
+    Returns:
+        int: Nombre de lignes en erreur
+    """
+    session = session or Session()
+    erreurs = 0
+    ecrivain_csv = None
+    if format == 'csv':
+        ecrivain_csv = csv.writer(sortie, lineterminator='\n')
+        ecrivain_csv.writerow(['ligne', 'expression', 'resultat', 'erreur'])
+
+    for numero, expression, resultat, erreur in calculs:
+        if erreur is not None:
+            erreurs += 1
+        elif format != 'texte' and not expression:
+            continue  # Ligne vide : rien à écrire hors du format texte
+
+        if format == 'texte':
+            sortie.write((erreur if erreur is not None else formater_resultat(resultat, session)) + '\n')
+        elif format == 'csv':
+            ecrivain_csv.writerow([numero, expression, formater_resultat(resultat, session) if erreur is None else '',
+                                   erreur or ''])
+        else:
+            sortie.write(json.dumps({
+                'ligne': numero,
+                'expression': expression,
+                'resultat': valeur_json(resultat, session) if erreur is None else None,
+                'erreur': erreur,
+            }, ensure_ascii=False) + '\n')
+        sortie.flush()
+
+    return erreurs
+
+
+def valeur_json(resultat, session):
+    """Un réel fini (ou un entier en base 10) reste un nombre JSON ; le reste est écrit en texte."""
+    if isinstance(resultat, float) and resultat - resultat == 0:
+        return resultat
+    if type(resultat) is int and session.base_affichage == 10:  # factor(n) : en texte
+        return resultat
+    if resultat is None:
+        return None
+    return formater_resultat(resultat, session)
+
+
+#=============================================================================
+# LIGNE DE COMMANDE
+#=============================================================================
+
+def analyser_arguments(arguments=None):
+    """Options de python -m src."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(
+        prog='python -m src',
+        description="Calcule des expressions ligne par ligne (entrée standard ou fichiers).",
+    )
+    analyseur.add_argument('fichiers', nargs='*', help="fichiers d'expressions ('-' : entrée standard)")
+    analyseur.add_argument('-f', '--format', choices=FORMATS, default='texte', help="format de sortie")
+    analyseur.add_argument('--degres', action='store_true', help="angles en degrés")
+    analyseur.add_argument('--complexe', action='store_true', help="mode complexe (sqrt(-4) = 2i)")
+    analyseur.add_argument('--programmeur', action='store_true', help="mode programmeur (entiers exacts)")
+    analyseur.add_argument('--graine', type=int, help="graine de rand(), randn(), randint()")
+    analyseur.add_argument('--cache', type=int, default=TAILLE_CACHE,
+                           help="expressions compilées gardées en mémoire")
+    analyseur.add_argument('--processus', type=int,
+                           help="calcule les lignes, indépendantes, sur ce nombre de processus")
+    analyseur.add_argument('--profil', metavar='PREFIXE',
+                           help="profile le calcul : écrit PREFIXE.folded et PREFIXE.pstats (src.profileur)")
+    analyseur.add_argument('--interface', action='store_true', help="lance l'interface graphique")
+    return analyseur.parse_args(arguments)
+
+
+def main(arguments=None, entree=None, sortie=None) -> int:
+    """
+    Point d'entrée de python -m src.
+
+    Returns:
+        int: Code de sortie (0, ou 1 si une ligne est en erreur)
+    """
+    options = analyser_arguments(arguments)
+    if options.interface:
+        from src.main import main as lancer_interface
+        lancer_interface()
+        return 0
+
+    entree = entree or sys.stdin
+    sortie = sortie or sys.stdout
+    session = Session(options.complexe, options.programmeur, options.graine, taille_cache=options.cache)
+    calculs = calculer_lignes(_lignes(options.fichiers, entree), session, options.degres, options.processus)
+    profileur = None
+    if options.profil:
+        from src.profileur import Profileur
+        profileur = Profileur()
+        profileur.demarrer()
+    try:
+        erreurs = ecrire(calculs, sortie, options.format, session)
+    except BrokenPipeError:
+        # Lecteur fermé (| head) : arrêt silencieux
+        sys.stderr.close()
+        return 0
+    finally:
+        if profileur is not None:
+            profileur.arreter()
+            profileur.ecrire(options.profil)
+    return 1 if erreurs else 0
+
+
+def _lignes(fichiers: list, entree):
+    """Lignes des fichiers à la suite (l'entrée standard si aucun)."""
+    if not fichiers:
+        yield from entree
+        return
+    for fichier in fichiers:
+        if fichier == '-':
+            yield from entree
+        else:
+            with open(fichier, encoding='utf-8') as f:
+                yield from f
@@ -166,4 +166,15 @@ class TangenteDomainError(CalculatriceError):
     x = π/2 + n*π (90°, 270°, etc.)
     """
     def __init__(self, angle):
-        super().__init__(f"Erreur :  Tangente non définie pour l'angle {angle} (cos = 0)")
\ No newline at end of file
+        super().__init__(f"Erreur :  Tangente non définie pour l'angle {angle} (cos = 0)")
+
+
+class DepassementCapaciteError(CalculatriceError):
+    """
+    Levée quand un nombre dépasse la capacité d'un flottant.
+
+    Exemple : fact(200) + 0.5 (un entier exact de 375 chiffres ne peut
+    pas être converti en float pour être ajouté à 0.5).
+    """
+    def __init__(self):
+        super().__init__("Erreur : Dépassement de capacité (nombre trop grand pour un flottant)")
@@ -16,12 +16,26 @@ FONCTIONNALITÉS :
 
 SANS utiliser matplotlib (on dessine directement sur un Canvas tkinter).
 
+VERSION 4.0 :
+-------------
+    - La fonction est compilée UNE fois puis évaluée pour tous les x
+      (vectorisé avec NumPy si disponible), au lieu de remplacer 'x'
+      dans le texte et de tout recalculer pour chaque point
+    - Fonctions par morceaux : if(x>0, ln(x), 0), piecewise(...)
+    - Fonctions et variables de l'utilisateur (session de la calculatrice)
+    - Échantillonnage adaptatif par arithmétique d'intervalles : les zones
+      prouvées hors de l'écran ne sont pas calculées, et seules celles où
+      la courbe traverse plusieurs lignes de pixels sont raffinées
+
 ================================================================================
 """
 
 import customtkinter as ctk
 from tkinter import Canvas, messagebox
-from src.calculateur import calculer
+from src.calculateur import tokenize, infix_to_rpn
+from src.vectoriel import evaluer_points
+from src.intervalles import abscisses_adaptatives
+from src.polynomes import compiler
 from src.exceptions import CalculatriceError
 
 
@@ -33,13 +47,17 @@ class FenetreGraphique:
     et le graphique est dessiné sur un Canvas.
     """
     
-    def __init__(self, parent):
+    def __init__(self, parent, session=None):
         """
         Initialise la fenêtre de graphique. 
         
         Args:
             parent: La fenêtre parent (pour la rendre modale)
+            session: Session de la calculatrice (variables et fonctions
+                     de l'utilisateur, ex: tracer f(x) après f(x) = x^2)
         """
+        self.session = session
+        
         # =====================================================================
         # CRÉER LA FENÊTRE TOPLEVEL
         # =====================================================================
@@ -80,7 +98,7 @@ class FenetreGraphique:
         
         label_info = ctk.CTkLabel(
             frame_haut,
-            text="Entrez une fonction de x (ex: sin(x), x^2, ln(x), 2*x+3)",
+            text="Entrez une fonction de x (ex: sin(x), x^2, ln(x), 2*x+3, if(x>0, ln(x), 0))",
             font=("Arial", 12)
         )
         label_info.pack(pady=5)
@@ -344,43 +362,64 @@ class FenetreGraphique:
         # Redessiner la grille
         self.dessiner_grille()
         
+        # =====================================================================
+        # COMPILER LA FONCTION (une seule fois)
+        # =====================================================================
+        try:
+            rpn = compiler(infix_to_rpn(tokenize(fonction_str)))
+        except CalculatriceError as e:
+            messagebox.showerror("Erreur", str(e))
+            self.label_info_bas.configure(text="Erreur de syntaxe")
+            return
+        
         # =====================================================================
         # CALCULER LES POINTS DE LA COURBE
         # =====================================================================
         points = []
-        nb_points = 1000  # Nombre de points à calculer (plus = plus lisse)
         
-        pas = (self.x_max - self.x_min) / nb_points
+        try:
+            # Abscisses choisies au pixel près (NaN : zone hors de l'écran)
+            xs = abscisses_adaptatives(
+                rpn, 'x',
+                self.x_min, self.x_max, self.y_min, self.y_max,
+                self.largeur_canvas, self.hauteur_canvas,
+                session=self.session
+            )
+        except CalculatriceError:
+            # Fonction sans règle d'intervalle : échantillonnage régulier
+            nb_points = 1000  # Nombre de points à calculer (plus = plus lisse)
+            pas = (self.x_max - self.x_min) / nb_points
+            xs = [self.x_min + i * pas for i in range(nb_points + 1)]
+        
+        if not any(x == x for x in xs):
+            self.label_info_bas.configure(text=f"✓ f(x) = {fonction_str} : rien dans la zone affichée")
+            return
+        
+        try:
+            # Calculer y = f(x) pour tous les x d'un coup
+            # (NaN là où le calcul est impossible, ex: ln(-5), division par 0)
+            ys = evaluer_points(rpn, 'x', xs, session=self.session)
+        except CalculatriceError:
+            # Expression mal formée (ex: variable autre que x)
+            ys = [float('nan')] * len(xs)
         
         erreurs = 0  # Compter les erreurs
         
-        for i in range(nb_points + 1):
-            x_math = self.x_min + i * pas
-            
-            # Remplacer 'x' par la valeur actuelle dans la fonction
-            expression = fonction_str.replace('x', f'({x_math})')
-            
-            try: 
-                # Calculer y = f(x)
-                y_math = calculer(expression)
-                
-                # Vérifier que y est dans les limites (éviter les infinis)
-                if abs(y_math) < 1e6: 
-                    x_pixel = self._math_vers_pixel_x(x_math)
-                    y_pixel = self._math_vers_pixel_y(y_math)
-                    points.append((x_pixel, y_pixel))
-                else: 
-                    # Valeur trop grande, on ignore ce point
-                    points.append(None)
+        for x_math, y_math in zip(xs, ys):
+            if x_math != x_math:  # Zone hors de l'écran : interrompre la courbe
+                points.append(None)
             
-            except CalculatriceError: 
-                # Erreur de calcul (ex: ln(-5), division par 0)
+            elif y_math != y_math:  # NaN : point non calculable
                 erreurs += 1
                 points.append(None)
             
-            except Exception: 
-                # Autre erreur
-                erreurs += 1
+            # Vérifier que y est dans les limites (éviter les infinis)
+            elif abs(y_math) < 1e6: 
+                x_pixel = self._math_vers_pixel_x(x_math)
+                y_pixel = self._math_vers_pixel_y(y_math)
+                points.append((x_pixel, y_pixel))
+            else: 
+                # Valeur trop grande, on ignore ce point
                 points.append(None)
         
         # =====================================================================
@@ -9,6 +9,10 @@ VERSION 3.0 - NOUVEAUTÉS :
     - Export en CSV
     - Export en format texte
     - Filtrage par date
+
+Les expressions sont indexées par leur forme canonique (src.canonique) :
+"3+2" retrouve "2 + 3", et un calcul identique au précédent n'ajoute
+pas de doublon.
 """
 
 import json
@@ -17,6 +21,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple
 
+from src.canonique import cle as cle_canonique
+
 
 class Historique:
     """
@@ -39,28 +45,64 @@ class Historique:
         """
         self.fichier = fichier
         self.operations = []
+        self._index = {}  # forme canonique -> dernière opération
         self.charger()
     
-    def ajouter(self, expression: str, resultat: float):
+    def ajouter(self, expression: str, resultat: float, contexte: dict = None):
         """
         Ajoute une opération à l'historique.
         
+        Si la dernière opération est le même calcul (même forme canonique,
+        même résultat), elle n'est pas dupliquée : seule sa date change.
+        
         Args:
             expression: L'expression calculée (ex: "2 + 3")
             resultat: Le résultat du calcul (ex: 5.0)
+            contexte: Contexte optionnel du calcul (src.memo.contexte) :
+                      permet de reprendre le résultat au démarrage suivant
         
         Example:
             >>> hist = Historique()
             >>> hist.ajouter("2 + 3", 5.0)
+            >>> hist.ajouter("3+2", 5.0)
+            >>> hist.compter()
+            1
         """
-        operation = {
-            'expression': expression,
-            'resultat': resultat,
-            'timestamp': datetime.now().isoformat()
-        }
-        self.operations.append(operation)
+        forme = cle_canonique(expression)
+        dernier = self.obtenir_dernier()
+        if dernier is not None and self._index.get(forme) is dernier and dernier['resultat'] == resultat:
+            dernier['timestamp'] = datetime.now().isoformat()
+        else:
+            operation = {
+                'expression': expression,
+                'resultat': resultat,
+                'timestamp': datetime.now().isoformat()
+            }
+            if contexte is not None:
+                operation['contexte'] = contexte
+            self.operations.append(operation)
+            self._index[forme] = operation
         self.sauvegarder()
     
+    def trouver(self, expression: str):
+        """
+        Retourne la dernière opération du même calcul (même forme
+        canonique), quelle que soit son écriture.
+        
+        Args:
+            expression: L'expression cherchée (ex: "3+2")
+        
+        Returns:
+            dict ou None: L'opération trouvée, ou None
+        
+        Example:
+            >>> hist = Historique()
+            >>> hist.ajouter("2 + 3", 5.0)
+            >>> hist.trouver("(3)+2")['resultat']
+            5.0
+        """
+        return self._index.get(cle_canonique(expression))
+    
     def afficher(self) -> list:
         """
         Retourne toutes les opérations de l'historique.
@@ -88,6 +130,7 @@ class Historique:
             0
         """
         self.operations.clear()
+        self._index.clear()
         self.sauvegarder()
     
     def sauvegarder(self):
@@ -145,6 +188,14 @@ class Historique:
                 self.operations = []
         else:
             self.operations = []
+        self._indexer()
+    
+    def _indexer(self):
+        """Reconstruit l'index des formes canoniques."""
+        self._index = {}
+        for op in self.operations:
+            if isinstance(op, dict) and 'expression' in op:
+                self._index[cle_canonique(op['expression'])] = op
     
     def _creer_backup(self):
         """Crée un backup du fichier corrompu"""
@@ -39,11 +39,16 @@ from tkinter import messagebox
 from datetime import datetime
 import sys
 
-from src.calculateur import calculer, obtenir_dernier_resultat
+from src.session import Session
+from src.cache_rpn import CacheRPN, fichier_utilisateur
+from src.memo import MemoResultats, contexte
 from src.validateur import Validateur
 from src.historique import Historique
 from src.exceptions import CalculatriceError
 from src.fractions import decimal_vers_fraction_str
+from src.complexes import formater as formater_complexe
+from src.matrices import formater as formater_matrice
+from src.calculateur import TYPES_SCALAIRES
 
 class CalculatriceGUI:  
     """
@@ -76,8 +81,15 @@ class CalculatriceGUI:
         # Modules
         self.validateur = Validateur()
         self.historique = Historique()
+        # Expressions compilées conservées d'une exécution à l'autre
+        self.cache_rpn = CacheRPN(fichier_utilisateur())
+        # Résultats des expressions pures, repris de l'historique
+        self.memo = MemoResultats()
+        self.memo.prechauffer(self.historique.operations)
+        self.session = Session(cache_rpn=self.cache_rpn, memo=self.memo)  # Variables et fonctions de l'utilisateur
         
         # Variables
+        self.profileur = None  # Profileur par échantillonnage (Ctrl+Alt+P)
         self.expression_courante = ""
         self.mode_degres = False  # False = radians, True = degrés
         self.afficher_fractions = False  # False = décimal, True = fractions
@@ -144,6 +156,13 @@ class CalculatriceGUI:
         self.fenetre.bind('(', lambda e: self.ajouter_caractere('('))
         self.fenetre.bind(')', lambda e: self.ajouter_caractere(')'))
         
+        # =====================================================================
+        # DIAGNOSTIC (raccourci caché)
+        # =====================================================================
+        # Ctrl+Alt+P = démarrer / arrêter le profileur (voir src.profileur)
+        self.fenetre.bind('<Control-Alt-p>', lambda e: self.basculer_profileur())
+        self.fenetre.bind('<Control-Alt-P>', lambda e: self.basculer_profileur())
+        
     def creer_interface(self):
         """Crée tous les éléments de l'interface"""
         
@@ -189,6 +208,45 @@ class CalculatriceGUI:
         )
         self.btn_mode_fraction.pack(side="left", padx=5)
         
+        # Bouton mode Réel/Complexe
+        self.btn_mode_complexe = ctk.CTkButton(
+            frame_menu,
+            text="ℝ",
+            width=40,
+            height=30,
+            font=("Arial", 12, "bold"),
+            fg_color="#6A4C93",
+            hover_color="#52397A",
+            command=self.basculer_mode_complexe
+        )
+        self.btn_mode_complexe.pack(side="left", padx=5)
+        
+        # Bouton mode programmeur (entiers exacts, opérations bit à bit)
+        self.btn_mode_programmeur = ctk.CTkButton(
+            frame_menu,
+            text="PROG",
+            width=50,
+            height=30,
+            font=("Arial", 12, "bold"),
+            fg_color="#607D8B",
+            hover_color="#455A64",
+            command=self.basculer_mode_programmeur
+        )
+        self.btn_mode_programmeur.pack(side="left", padx=5)
+        
+        # Bouton base d'affichage des entiers (10 → 16 → 2 → 8)
+        self.btn_base = ctk.CTkButton(
+            frame_menu,
+            text="BASE 10",
+            width=70,
+            height=30,
+            font=("Arial", 12, "bold"),
+            fg_color="#607D8B",
+            hover_color="#455A64",
+            command=self.changer_base
+        )
+        self.btn_base.pack(side="left", padx=5)
+        
         # Bouton Graphique
         btn_graphique = ctk.CTkButton(
             frame_menu,
@@ -537,10 +595,28 @@ class CalculatriceGUI:
         # =====================================================================
         try:
             # Calculer avec le bon mode (degrés ou radians)
-            resultat = calculer(expression, utiliser_degres=self.mode_degres)
+            resultat = self.session.calculer(expression, utiliser_degres=self.mode_degres)
+            
+            # Définition de fonction (ex: f(x) = x^2) : rien à afficher
+            if resultat is None:
+                self.label_resultat.configure(text="✓ Fonction définie")
+                return
             
             # Formater le résultat
-            if self.afficher_fractions:
+            if not isinstance(resultat, TYPES_SCALAIRES):
+                # Vecteur ou matrice, texte dans l'historique
+                resultat = formater_matrice(resultat)
+                self.label_resultat.configure(text=f"= {resultat}")
+            elif isinstance(resultat, complex):
+                # Mode complexe : a + bi (pas de fraction), texte dans l'historique
+                resultat = formater_complexe(resultat)
+                self.label_resultat.configure(text=f"= {resultat}")
+            elif isinstance(resultat, int):
+                # Entier exact (0xFF, mode programmeur) dans la base choisie,
+                # texte dans l'historique (pas de limite de taille)
+                resultat = self.session.formater(resultat)
+                self.label_resultat.configure(text=f"= {resultat}")
+            elif self.afficher_fractions:
                 # Mode fraction
                 resultat_affiche = decimal_vers_fraction_str(resultat)
                 self.label_resultat.configure(text=f"= {resultat_affiche}")
@@ -553,7 +629,7 @@ class CalculatriceGUI:
                 self.label_resultat.configure(text=f"= {resultat_affiche}")
             
             # Ajouter à l'historique
-            self.historique.ajouter(expression, resultat)
+            self.historique.ajouter(expression, resultat, contexte(self.session, self.mode_degres))
             
         except CalculatriceError as e: 
             self.label_erreur.configure(text=str(e))
@@ -635,6 +711,43 @@ class CalculatriceGUI:
         else:
             self.btn_mode_fraction.configure(text="DEC", fg_color="#4ECDC4")
     
+    def basculer_mode_complexe(self):
+        """
+        Bascule entre calcul réel et complexe (sqrt(-4) = 2i).
+        
+        ℝ → ℂ → ℝ ...
+        """
+        self.session.mode_complexe = not self.session.mode_complexe
+        
+        if self.session.mode_complexe:
+            self.btn_mode_complexe.configure(text="ℂ", fg_color="#9C27B0")
+        else:
+            self.btn_mode_complexe.configure(text="ℝ", fg_color="#6A4C93")
+    
+    def basculer_mode_programmeur(self):
+        """
+        Bascule le mode programmeur : entiers exacts et '/' entier (7/2 = 3).
+        
+        PROG (éteint) → PROG (allumé) → ...
+        """
+        self.session.mode_programmeur = not self.session.mode_programmeur
+        
+        if self.session.mode_programmeur:
+            self.btn_mode_programmeur.configure(fg_color="#E91E63")
+        else:
+            self.btn_mode_programmeur.configure(fg_color="#607D8B")
+    
+    def changer_base(self):
+        """
+        Change la base d'affichage des résultats entiers.
+        
+        10 → 16 → 2 → 8 → 10 ...
+        """
+        bases = [10, 16, 2, 8]
+        base = bases[(bases.index(self.session.base_affichage) + 1) % len(bases)]
+        self.session.base_affichage = base
+        self.btn_base.configure(text=f"BASE {base}")
+    
     # =========================================================================
     # MÉTHODES POUR COPIER/COLLER
     # =========================================================================
@@ -645,7 +758,13 @@ class CalculatriceGUI:
         
         Utilise le module tkinter pour accéder au clipboard.
         """
-        dernier = obtenir_dernier_resultat()
+        dernier = self.session.dernier_resultat
+        if isinstance(dernier, complex):
+            dernier = formater_complexe(dernier)
+        elif isinstance(dernier, int):
+            dernier = self.session.formater(dernier)
+        elif not isinstance(dernier, TYPES_SCALAIRES):
+            dernier = formater_matrice(dernier)
         
         if dernier is not None:
             # Copier dans le presse-papier
@@ -885,7 +1004,7 @@ class CalculatriceGUI:
         """Ouvre la fenêtre de graphique de fonctions."""
         try:
             from src.graphique import FenetreGraphique
-            FenetreGraphique(self.fenetre)
+            FenetreGraphique(self.fenetre, session=self.session)
         except ImportError: 
             messagebox.showerror(
                 "Erreur",
@@ -947,11 +1066,63 @@ class CalculatriceGUI:
 
 💡 FONCTIONS SPÉCIALES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• min(a,b) : Minimum
-• max(a,b) : Maximum
+• min(a,b,...) : Minimum
+• max(a,b,...) : Maximum
+• sum, mean, median(a,b,...) : Somme, moyenne, médiane
+• var, stdev(a,b,...) : Variance, écart-type
+• sigma(k^2, k, 1, 10) : Somme de k² pour k de 1 à 10
+• prod(k, k, 1, 5) : Produit (ici 5! = 120)
+• if(x>0, ln(x), 0) : Condition (< > <= >= == !=)
+• piecewise(c1, v1, c2, v2, défaut) : Par morceaux
+• bounds(x^2 - x, x, 0, 2) : Encadrement garanti [min, max]
+• roots(x^3 - 2*x + 1) : Racines réelles d'un polynôme
+• rand(), randn(), randint(1, 6) : Tirages aléatoires
+• mc(rand()^2, 100000) : Monte-Carlo [moyenne, bas, haut] (IC 95 %)
 • a^b : Puissance
 • a%b : Modulo
 
+✏️ VARIABLES ET FONCTIONS
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• a = 3 : Définir une variable
+• f(x) = x^2 + a : Définir une fonction
+• f(2) + a : Utiliser les définitions
+• Redéfinir a met à jour f(2) automatiquement
+
+🌀 NOMBRES COMPLEXES (bouton ℝ/ℂ)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• i : Unité imaginaire (2*i, pas 2i)
+• sqrt(-4) = 2i, ln(-1) = 3.14159...i
+• re(z), im(z) : Parties réelle et imaginaire
+• arg(z), abs(z) : Argument et module
+• conj(z) : Conjugué
+
+🔢 ARITHMÉTIQUE (entiers exacts)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• gcd(a, b, ...), lcm(a, b, ...) : PGCD et PPCM
+• powmod(a, b, m) : a^b modulo m
+• isprime(n) : 1 si n est premier, 0 sinon
+• factor(360) = 2^3 * 3^2 * 5
+• nCr(n, k), nPr(n, k), fact(n)
+• Produits de grands entiers : utiliser le mode PROG
+
+💻 PROGRAMMEUR (bouton PROG)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• 0xFF, 0o17, 0b1010 : Entiers en base 16, 8, 2
+• a and b, a or b, a xor b : Opérations bit à bit
+• a shl n, a shr n, not a : Décalages et complément
+• 7 / 2 = 3 : Division entière en mode PROG
+• BASE : Affichage en base 10, 16, 2 ou 8
+
+🔲 VECTEURS ET MATRICES
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• [1, 2, 3] : Vecteur
+• [[1, 2], [3, 4]] : Matrice (ligne par ligne)
+• A * B : Produit matriciel, A^n : Puissance
+• det(A), inv(A), transpose(A)
+• dot(u, v) : Produit scalaire
+• solve(A, b) : Résout A*x = b
+• sqrt([1, 4, 9]) : Fonction élément par élément
+
 💰 CALCUL DE POURCENTAGE
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 • 100 + 20% → 120 (TVA)
@@ -961,6 +1132,8 @@ class CalculatriceGUI:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 • DEC/FRAC : Affichage décimal ou fraction
 • RAD/DEG : Trigonométrie en radians ou degrés
+• ℝ/ℂ : Calcul réel ou complexe
+• PROG : Entiers exacts et opérations bit à bit
 
 📚 HISTORIQUE
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1016,6 +1189,33 @@ class CalculatriceGUI:
         # Reconvertir en hex
         return f"#{r:02x}{g:02x}{b:02x}"
     
+    def basculer_profileur(self):
+        """
+        Démarre le profileur par échantillonnage, ou l'arrête et écrit le
+        profil (profil_<date>.folded et .pstats) dans le dossier courant.
+        """
+        from src.profileur import Profileur
+        
+        if self.profileur is None or not self.profileur.actif:
+            self.profileur = Profileur()
+            self.profileur.demarrer()
+            self.label_erreur.configure(text="Profileur démarré (Ctrl+Alt+P pour l'arrêter)")
+            return
+        
+        self.profileur.arreter()
+        prefixe = f"profil_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        try:
+            repliees, profil = self.profileur.ecrire(prefixe)
+        except OSError as e:
+            messagebox.showerror("Erreur", f"Impossible d'écrire le profil : {e}")
+            return
+        self.label_erreur.configure(text="")
+        messagebox.showinfo("Profileur", f"{self.profileur.echantillons} échantillons\n{repliees}\n{profil}")
+    
     def run(self):
         """Lance l'application et démarre la boucle principale."""
-        self.fenetre.mainloop()
\ No newline at end of file
+        self.fenetre.mainloop()
+        try:
+            self.cache_rpn.sauvegarder()
+        except OSError:
+            pass  # Cache facultatif : sans lui, le prochain démarrage recompile
\ No newline at end of file
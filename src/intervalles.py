@@ -0,0 +1,974 @@
+# src/intervalles.py
+"""
+================================================================================
+Module d'arithmétique d'intervalles - VERSION 4.0
+================================================================================
+
+Évalue une expression déjà compilée en RPN sur des INTERVALLES : chaque
+variable reçoit une boîte [bas, haut] et le résultat est un intervalle qui
+contient à coup sûr toutes les valeurs de l'expression sur cette boîte.
+
+    >>> rpn = infix_to_rpn(tokenize("x^2 - 2*x"))
+    >>> evaluer_intervalle(rpn, {'x': (0, 3)})
+    [-6.000000000000002, 9.000000000000005]
+
+Deux utilisations :
+    - bounds(expr, x, a, b) : encadrement garanti de expr pour x dans
+      [a, b], resserré par découpage (séparation et évaluation)
+    - FenetreGraphique : abscisses_adaptatives() saute les zones dont
+      l'encadrement est hors de l'écran et ne raffine que là où la courbe
+      traverse plusieurs lignes de pixels
+
+GARANTIES :
+-----------
+    - Arrondi vers l'extérieur : chaque borne calculée en flottant est
+      décalée d'un flottant (bas vers -inf, haut vers +inf), de sorte que
+      l'erreur d'arrondi ne fait jamais sortir la valeur exacte
+    - Les littéraux non représentables (0.1) et les constantes PI, E
+      deviennent de petits intervalles qui contiennent leur valeur exacte
+    - sin, cos, tan sont découpés en segments monotones : un extremum
+      (±1) n'est ajouté que si l'intervalle contient π/2 + kπ
+    - Les noyaux (exp, ln, sin, cos) sont ceux de ce module, avec une
+      erreur bornée et compensée par la marge : les séries de Taylor de
+      src.calculateur privilégient la simplicité à la précision
+    - Sur une boîte où l'expression n'est définie qu'en partie (ln de
+      [-1, 2]), le résultat encadre la partie définie ; elle lève l'erreur
+      du calcul scalaire si elle n'est définie nulle part (sqrt de [-3, -1])
+
+Les encadrements sont garantis mais pas toujours serrés : x - x sur [0, 1]
+donne [-1, 1] (chaque occurrence de x est traitée indépendamment). bounds()
+réduit cette surestimation en découpant [a, b].
+
+================================================================================
+"""
+
+import heapq
+import struct
+from decimal import Decimal
+
+from src.calculateur import (
+    PI, E, SEPARATEUR_ARITE, FONCTIONS_VARIADIQUES, OPERATEURS_COMPARAISON,
+    est_nombre, valeur_nombre, nom_variable, obtenir_dernier_resultat,
+    _bornes_entieres, _mediane_en_place
+)
+from src.polynomes import Polynome
+from src.exceptions import (
+    DivisionParZeroError,
+    ExpressionInvalideError,
+    RacineNegativeError,
+    ArgumentFonctionError,
+    TangenteDomainError,
+    ModuloParZeroError,
+    LogarithmeError
+)
+
+
+INFINI = float('inf')
+
+# Erreurs qui signifient « non défini sur toute la boîte » (et non une
+# expression mal formée)
+ERREURS_DE_DOMAINE = (
+    DivisionParZeroError, ModuloParZeroError, RacineNegativeError,
+    LogarithmeError, TangenteDomainError, ArgumentFonctionError
+)
+
+# Au-delà, sin et cos sont encadrés par [-1, 1] (la réduction de l'argument
+# modulo π/2 ne serait plus assez précise)
+LIMITE_REDUCTION = 1e6
+
+# π/2 en deux parties (fdlibm) : k * PI_SUR_2_HAUT est exact pour k < 2^20
+PI_SUR_2_HAUT = 1.57079632673412561417e+00
+PI_SUR_2_BAS = 6.07710050650619224932e-11
+
+# Marge relative des noyaux exp, ln, sin, cos (erreur réelle : quelques ULP)
+MARGE_NOYAU = 2.0 ** -50
+
+# Tolérance sur la position des extremums de sin/cos : en cas de doute,
+# l'extremum est inclus (l'encadrement reste valide, un peu plus large)
+TOLERANCE_EXTREMUM = 1e-9
+
+
+#=============================================================================
+# TYPE INTERVALLE
+#=============================================================================
+
+class Intervalle:
+    """
+    Intervalle fermé [bas, haut] de flottants (bornes infinies permises).
+
+    Examples:
+        >>> x = Intervalle(1, 2)
+        >>> bas, haut = x
+        >>> 1.5 in x
+        True
+    """
+
+    __slots__ = ('bas', 'haut')
+
+    def __init__(self, bas, haut=None):
+        """
+        Args:
+            bas: Borne inférieure
+            haut: Borne supérieure (par défaut bas : intervalle ponctuel)
+
+        Raises:
+            ExpressionInvalideError: Si bas > haut
+        """
+        if haut is None:
+            haut = bas
+        if not bas <= haut:
+            raise ExpressionInvalideError(f"Intervalle vide : [{bas}, {haut}]")
+        self.bas = float(bas)
+        self.haut = float(haut)
+
+    def __iter__(self):
+        yield self.bas
+        yield self.haut
+
+    def __contains__(self, x) -> bool:
+        return self.bas <= x <= self.haut
+
+    def __eq__(self, autre) -> bool:
+        return isinstance(autre, Intervalle) and tuple(self) == tuple(autre)
+
+    def __repr__(self) -> str:
+        return f"[{self.bas!r}, {self.haut!r}]"
+
+    @property
+    def largeur(self) -> float:
+        """Largeur haut - bas."""
+        return self.haut - self.bas
+
+    def est_ponctuel(self) -> bool:
+        """Vrai pour [a, a]."""
+        return self.bas == self.haut
+
+
+#=============================================================================
+# FONCTIONS PRINCIPALES
+#=============================================================================
+
+def evaluer_intervalle(rpn: list, variables=None, utiliser_degres=False, session=None) -> Intervalle:
+    """
+    Évalue une RPN avec des intervalles comme valeurs des variables.
+
+    Args:
+        rpn: Expression compilée (infix_to_rpn)
+        variables: {nom: Intervalle, (bas, haut) ou nombre}
+        utiliser_degres: Mode angulaire
+        session: Session optionnelle (fonctions et variables de l'utilisateur)
+
+    Returns:
+        Intervalle: Encadrement garanti du résultat
+
+    Raises:
+        ExpressionInvalideError: Expression mal formée, ou fonction sans
+                                 règle d'intervalle (isprime, matrices, and...)
+        Les erreurs de domaine du calcul scalaire si l'expression n'est
+        définie nulle part sur la boîte
+    """
+    variables = {nom: _intervalle(valeur) for nom, valeur in (variables or {}).items()}
+    return _evaluer(rpn, variables, utiliser_degres, session)
+
+
+def bornes(corps: list, variable: str, debut, fin, utiliser_degres=False, variables=None,
+           session=None, tolerance=1e-9, evaluations_max=2000) -> tuple:
+    """
+    Encadrement garanti de corps pour variable dans [debut, fin].
+
+    Séparation et évaluation : on découpe en priorité le morceau dont la
+    borne est la plus grande (resp. la plus petite), jusqu'à ce qu'elle
+    soit à moins de `tolerance` d'une valeur effectivement atteinte, ou
+    que le budget d'évaluations soit épuisé : la borne reste garantie,
+    mais moins serrée quand la même variable apparaît plusieurs fois.
+
+    Args:
+        corps: Sous-programme RPN de l'expression
+        variable: Nom de la variable (ex: 'x')
+        debut, fin: Bornes de la variable
+        tolerance: Écart relatif visé entre borne garantie et valeur atteinte
+        evaluations_max: Nombre maximal d'évaluations par borne
+
+    Returns:
+        tuple: (bas, haut)
+
+    Examples:
+        >>> bornes(infix_to_rpn(tokenize("x - x^2")), 'x', 0, 1)
+        (-9.313230187046886e-10, 0.25004762411117565)
+    """
+    if not debut <= fin:
+        raise ArgumentFonctionError('bounds', "nécessite debut <= fin")
+
+    variables = {nom: _intervalle(valeur) for nom, valeur in (variables or {}).items()}
+
+    # Non défini sur tout [debut, fin] : lever l'erreur du calcul scalaire
+    variables[variable] = Intervalle(debut, fin)
+    _evaluer(corps, variables, utiliser_degres, session)
+
+    def encadrer(bas, haut):
+        variables[variable] = Intervalle(bas, haut)
+        try:
+            return _evaluer(corps, variables, utiliser_degres, session)
+        except ERREURS_DE_DOMAINE:
+            return None  # Non défini sur ce morceau
+
+    haut = _borne_extreme(encadrer, float(debut), float(fin), 1, tolerance, evaluations_max)
+    bas = -_borne_extreme(encadrer, float(debut), float(fin), -1, tolerance, evaluations_max)
+    return bas, haut
+
+
+def abscisses_adaptatives(rpn: list, variable: str, x_min, x_max, y_min, y_max,
+                          colonnes: int, lignes: int, utiliser_degres=False, session=None) -> list:
+    """
+    Abscisses où évaluer une courbe pour la tracer au pixel près.
+
+    [x_min, x_max] est découpé tant que l'encadrement de la courbe couvre
+    plus d'une ligne de pixels et que le morceau est plus large qu'une
+    colonne. Un morceau dont l'encadrement est hors de l'écran (ou où
+    la fonction n'est définie nulle part) n'est pas échantillonné.
+
+    Args:
+        rpn: Expression compilée
+        variable: Nom de la variable (ex: 'x')
+        x_min, x_max, y_min, y_max: Fenêtre affichée
+        colonnes, lignes: Taille de la zone de dessin en pixels
+
+    Returns:
+        list: Abscisses croissantes ; NaN marque une interruption de la courbe
+
+    Raises:
+        ExpressionInvalideError: Fonction sans règle d'intervalle (l'appelant
+                                 revient alors à un échantillonnage régulier)
+    """
+    pas_x = (x_max - x_min) / colonnes
+    pas_y = (y_max - y_min) / lignes
+
+    abscisses = []
+    morceaux = [(x_min, x_max)]
+    while morceaux:
+        a, b = morceaux.pop()
+        try:
+            y = _evaluer(rpn, {variable: Intervalle(a, b)}, utiliser_degres, session)
+        except ERREURS_DE_DOMAINE:
+            y = None
+
+        if y is None or y.haut < y_min or y.bas > y_max:
+            # Rien à dessiner : interrompre la courbe
+            if abscisses and abscisses[-1] == abscisses[-1]:
+                abscisses.append(float('nan'))
+        elif b - a <= pas_x or y.largeur <= pas_y:
+            # Un segment de a à b reste à moins d'un pixel de la courbe
+            if not abscisses or abscisses[-1] != a:
+                abscisses.append(a)
+            abscisses.append(b)
+        else:
+            milieu = (a + b) / 2
+            morceaux.append((milieu, b))
+            morceaux.append((a, milieu))
+
+    return abscisses
+
+
+#=============================================================================
+# BOUCLE D'ÉVALUATION
+#=============================================================================
+
+def _evaluer(rpn: list, variables: dict, utiliser_degres: bool, session) -> Intervalle:
+    """Boucle d'évaluation (même structure que vectoriel._evaluer)."""
+    stack = []
+
+    for token in rpn:
+        # Sous-programme (argument différé)
+        if isinstance(token, list):
+            stack.append(token)
+
+        # Polynôme compilé : sa RPN d'origine (x^2 encadré par une puissance
+        # paire est plus serré que le schéma de Horner)
+        elif isinstance(token, Polynome):
+            stack.append(_evaluer(list(token.rpn), variables, utiliser_degres, session))
+
+        # Nombre : intervalle qui contient la valeur décimale exacte
+        elif est_nombre(token):
+            stack.append(_litteral(token))
+
+        # Constantes
+        elif token == 'PI':
+            stack.append(_PI)
+        elif token == 'E':
+            stack.append(_E)
+        elif token == 'ANS':
+            if session is not None:
+                stack.append(_intervalle(session.dernier_resultat))
+            else:
+                stack.append(_intervalle(obtenir_dernier_resultat()))
+
+        # Opérateurs binaires
+        elif token in _BINAIRES:
+            if len(stack) < 2:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(_BINAIRES[token](_operande(a), _operande(b)))
+
+        # Fonctions unaires
+        elif token in _UNAIRES:
+            if len(stack) < 1:
+                raise ExpressionInvalideError(f"Fonction {token}() sans argument")
+            stack.append(_UNAIRES[token](_operande(stack.pop())))
+
+        # Condition : réunion des branches possibles
+        elif token == 'if':
+            if len(stack) < 3:
+                raise ArgumentFonctionError(token, "nécessite 3 arguments (condition, si_vrai, si_faux)")
+            si_faux = stack.pop()
+            si_vrai = stack.pop()
+            condition = _operande(stack.pop())
+            stack.append(_par_morceaux([condition, si_vrai, si_faux], variables, utiliser_degres, session))
+
+        # Fonction par morceaux
+        elif isinstance(token, str) and token.startswith('piecewise' + SEPARATEUR_ARITE):
+            nb_arguments = int(token.split(SEPARATEUR_ARITE)[1])
+            if nb_arguments < 1:
+                raise ArgumentFonctionError('piecewise', "nécessite au moins 1 argument")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            debut = len(stack) - nb_arguments
+            morceaux = stack[debut:]
+            del stack[debut:]
+            stack.append(_par_morceaux(morceaux, variables, utiliser_degres, session))
+
+        # Fonction de l'utilisateur
+        elif (isinstance(token, str) and SEPARATEUR_ARITE in token
+                and token.split(SEPARATEUR_ARITE)[0] not in FONCTIONS_VARIADIQUES):
+            nom, arite = token.split(SEPARATEUR_ARITE)
+            nb_arguments = int(arite)
+            if session is None or nom not in session.fonctions:
+                raise ExpressionInvalideError(f"Fonction inconnue :  '{nom}'")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            definition = session.fonctions[nom]
+            if nb_arguments != len(definition.parametres):
+                attendus = len(definition.parametres)
+                raise ArgumentFonctionError(
+                    nom, f"attend exactement {attendus} argument{'s' if attendus > 1 else ''}"
+                )
+            debut = len(stack) - nb_arguments
+            variables_locales = dict(variables)
+            variables_locales.update(zip(definition.parametres, map(_operande, stack[debut:])))
+            del stack[debut:]
+            stack.append(_evaluer(definition.rpn, variables_locales, utiliser_degres, session))
+
+        # Fonctions variadiques
+        elif isinstance(token, str) and SEPARATEUR_ARITE in token:
+            nom, arite = token.split(SEPARATEUR_ARITE)
+            nb_arguments = int(arite)
+            if nom not in _VARIADIQUES:
+                raise ExpressionInvalideError(f"Fonction {nom}() non supportée pour les intervalles")
+            if nb_arguments < 1:
+                raise ArgumentFonctionError(nom, "nécessite au moins 1 argument")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            debut = len(stack) - nb_arguments
+            arguments = [_operande(valeur) for valeur in stack[debut:]]
+            del stack[debut:]
+            stack.append(_VARIADIQUES[nom](arguments))
+
+        # Somme et produit indicés : un terme par valeur de k
+        elif token in ('sigma', 'prod'):
+            if len(stack) < 4:
+                raise ArgumentFonctionError(token, "nécessite 4 arguments (expr, k, a, b)")
+            fin = _operande(stack.pop())
+            debut = _operande(stack.pop())
+            indice = stack.pop()
+            corps = stack.pop()
+            stack.append(_indice(token, corps, indice, debut, fin, variables, utiliser_degres, session))
+
+        # Variables
+        elif token in variables:
+            stack.append(variables[token])
+        elif session is not None and token in session.variables:
+            stack.append(_intervalle(session.valeur(token, utiliser_degres)))
+
+        elif isinstance(token, str) and token.isalpha():
+            if token.split(SEPARATEUR_ARITE)[0] in _NON_SUPPORTEES:
+                raise ExpressionInvalideError(f"Fonction {token}() non supportée pour les intervalles")
+            raise ExpressionInvalideError(f"Variable inconnue :  '{token}'")
+
+        else:
+            raise ExpressionInvalideError(f"Fonction {token} non supportée pour les intervalles")
+
+    if len(stack) != 1 or isinstance(stack[0], list):
+        raise ExpressionInvalideError("Expression invalide - vérifiez la syntaxe")
+
+    return stack[0]
+
+
+def _par_morceaux(morceaux: list, variables: dict, utiliser_degres: bool, session) -> Intervalle:
+    """
+    if / piecewise : réunion des valeurs des morceaux qui peuvent être
+    choisis. Un morceau non défini sur la boîte est ignoré ; si aucun
+    morceau possible n'est défini, son erreur est levée.
+    """
+    def evaluer(morceau):
+        if isinstance(morceau, list):
+            return _evaluer(morceau, variables, utiliser_degres, session)
+        return _operande(morceau)
+
+    possibles = []
+    erreur = None
+    for i in range(0, len(morceaux) - 1, 2):
+        condition = evaluer(morceaux[i])
+        if condition.bas == 0 and condition.haut == 0:
+            continue  # Toujours fausse
+        try:
+            possibles.append(evaluer(morceaux[i + 1]))
+        except ERREURS_DE_DOMAINE as e:
+            erreur = e
+        if 0 not in condition:
+            break  # Toujours vraie : les morceaux suivants ne sont jamais choisis
+    else:
+        if len(morceaux) % 2 == 1:
+            try:
+                possibles.append(evaluer(morceaux[-1]))
+            except ERREURS_DE_DOMAINE as e:
+                erreur = e
+        elif not possibles and erreur is None:
+            raise ArgumentFonctionError('piecewise', "aucune condition vraie et pas de valeur par défaut")
+
+    if not possibles:
+        raise erreur
+    return Intervalle(min(x.bas for x in possibles), max(x.haut for x in possibles))
+
+
+def _indice(fonction, corps, indice, debut, fin, variables, utiliser_degres, session) -> Intervalle:
+    """sigma/prod : somme (ou produit) des encadrements de chaque terme."""
+    nom = nom_variable(fonction, indice)
+    if not debut.est_ponctuel() or not fin.est_ponctuel():
+        raise ArgumentFonctionError(fonction, "les bornes doivent être constantes")
+    debut, fin = _bornes_entieres(fonction, debut.bas, fin.bas)
+
+    resultat = Intervalle(0.0) if fonction == 'sigma' else Intervalle(1.0)
+    operation = _addition if fonction == 'sigma' else _multiplication
+    variables_locales = dict(variables)
+    for k in range(debut, fin + 1):
+        variables_locales[nom] = _intervalle(k)
+        resultat = operation(resultat, _evaluer(corps, variables_locales, utiliser_degres, session))
+    return resultat
+
+
+def _borne_extreme(encadrer, debut: float, fin: float, signe: int, tolerance: float,
+                   evaluations_max: int) -> float:
+    """
+    Majorant garanti de signe * f sur [debut, fin] (séparation et évaluation).
+
+    Le tas contient les morceaux triés par majorant décroissant ; `atteint`
+    est la meilleure valeur garantie atteinte (en un point milieu).
+    """
+    def majorant(bas, haut):
+        y = encadrer(bas, haut)
+        if y is None:
+            return None
+        return y.haut if signe > 0 else -y.bas
+
+    def atteinte(x):
+        y = encadrer(x, x)
+        if y is None:
+            return -INFINI
+        return y.bas if signe > 0 else -y.haut
+
+    tas = [(-majorant(debut, fin), debut, fin)]
+    atteint = max(atteinte(debut), atteinte(fin))
+
+    evaluations = 0
+    while tas and evaluations < evaluations_max:
+        borne = -tas[0][0]
+        if borne - atteint <= tolerance * max(1.0, abs(atteint)):
+            break
+        _, a, b = heapq.heappop(tas)
+        milieu = (a + b) / 2
+        if not a < milieu < b:
+            heapq.heappush(tas, (-borne, a, b))  # Plus divisible
+            break
+        atteint = max(atteint, atteinte(milieu))
+        for morceau in ((a, milieu), (milieu, b)):
+            valeur = majorant(*morceau)
+            if valeur is not None:
+                heapq.heappush(tas, (-valeur, *morceau))
+        evaluations += 3
+
+    if not tas:
+        return atteint
+    return -tas[0][0]
+
+
+#=============================================================================
+# ARRONDI VERS L'EXTÉRIEUR
+#=============================================================================
+
+def _suivant(x: float) -> float:
+    """Plus petit flottant strictement supérieur à x (sans le module math)."""
+    if x != x or x == INFINI:
+        return x
+    if x == 0:
+        return 5e-324
+    n = struct.unpack('<q', struct.pack('<d', x))[0]
+    n += 1 if x > 0 else -1
+    return struct.unpack('<d', struct.pack('<q', n))[0]
+
+
+def _precedent(x: float) -> float:
+    """Plus grand flottant strictement inférieur à x."""
+    return -_suivant(-x)
+
+
+def _arrondi(bas: float, haut: float) -> Intervalle:
+    """Intervalle [bas, haut] élargi d'un flottant de chaque côté."""
+    return Intervalle(_precedent(bas), _suivant(haut))
+
+
+def _constante(valeur: float) -> Intervalle:
+    """Encadrement d'une constante arrondie (à 2 flottants près)."""
+    return Intervalle(_precedent(_precedent(valeur)), _suivant(_suivant(valeur)))
+
+
+_PI = _constante(PI)
+_E = _constante(E)
+_DEGRE = _constante(PI / 180)
+_LN2 = _constante(0.6931471805599453)
+_LN10 = _constante(2.302585092994046)
+
+
+def _intervalle(valeur) -> Intervalle:
+    """Convertit une valeur de variable (Intervalle, (bas, haut), nombre)."""
+    if isinstance(valeur, Intervalle):
+        return valeur
+    if isinstance(valeur, (tuple, list)):
+        return Intervalle(*valeur)
+    if isinstance(valeur, complex):
+        raise ExpressionInvalideError("Les intervalles complexes ne sont pas supportés")
+    if isinstance(valeur, int) and not isinstance(valeur, bool):
+        return _entier(valeur)
+    try:
+        return Intervalle(float(valeur))
+    except TypeError:
+        raise ExpressionInvalideError("Les intervalles de matrices ne sont pas supportés")
+
+
+def _entier(n: int) -> Intervalle:
+    """Un grand entier non représentable est encadré par ses flottants voisins."""
+    try:
+        approche = float(n)
+    except OverflowError:
+        return Intervalle(INFINI) if n > 0 else Intervalle(-INFINI)
+    if approche == n:
+        return Intervalle(approche)
+    return _arrondi(approche, approche)
+
+
+def _litteral(token: str) -> Intervalle:
+    """0.1 n'est pas un flottant : on l'encadre par ses deux voisins."""
+    valeur = valeur_nombre(token)
+    if isinstance(valeur, int):
+        return _entier(valeur)
+    if Decimal(token) == Decimal(valeur):
+        return Intervalle(valeur)
+    return _arrondi(valeur, valeur)
+
+
+def _operande(valeur) -> Intervalle:
+    """Un sous-programme n'est pas un opérande."""
+    if isinstance(valeur, list):
+        raise ExpressionInvalideError("Expression invalide - vérifiez la syntaxe")
+    return valeur
+
+
+#=============================================================================
+# OPÉRATIONS
+#=============================================================================
+
+def _addition(a: Intervalle, b: Intervalle) -> Intervalle:
+    return _arrondi(a.bas + b.bas, a.haut + b.haut)
+
+
+def _soustraction(a: Intervalle, b: Intervalle) -> Intervalle:
+    return _arrondi(a.bas - b.haut, a.haut - b.bas)
+
+
+def _produit(x: float, y: float) -> float:
+    """x * y avec 0 * inf = 0 (convention des intervalles)."""
+    p = x * y
+    return 0.0 if p != p else p
+
+
+def _multiplication(a: Intervalle, b: Intervalle) -> Intervalle:
+    produits = (_produit(a.bas, b.bas), _produit(a.bas, b.haut),
+                _produit(a.haut, b.bas), _produit(a.haut, b.haut))
+    return _arrondi(min(produits), max(produits))
+
+
+def _division(a: Intervalle, b: Intervalle) -> Intervalle:
+    if b.bas == 0 and b.haut == 0:
+        raise DivisionParZeroError()
+    if 0 in b:
+        return Intervalle(-INFINI, INFINI)
+    return _multiplication(a, _arrondi(1 / b.haut, 1 / b.bas))
+
+
+def _modulo(a: Intervalle, b: Intervalle) -> Intervalle:
+    """a % b (signe de b). Exact si a reste dans une seule période de b."""
+    if b.bas == 0 and b.haut == 0:
+        raise ModuloParZeroError()
+    if b.est_ponctuel():
+        periode = b.bas
+        premier = a.bas // periode
+        if premier == a.haut // periode and premier == premier:
+            reste = _soustraction(a, _multiplication(Intervalle(premier), b))
+            # Le reste est toujours entre 0 et b : recouper l'arrondi
+            return Intervalle(max(reste.bas, min(0.0, periode)), min(reste.haut, max(0.0, periode)))
+    return Intervalle(min(0.0, b.bas), max(0.0, b.haut))
+
+
+def _puissance(base: Intervalle, exposant: Intervalle) -> Intervalle:
+    """base^exposant : exposant entier exact, sinon exp(exposant * ln(base))."""
+    if exposant.est_ponctuel() and exposant.bas == int(exposant.bas):
+        n = int(exposant.bas)
+        if n == 0:
+            return Intervalle(1.0)  # Comme puissance() : x^0 = 1, même 0^0
+        if n < 0:
+            return _division(Intervalle(1.0), _puissance_entiere(base, -n))
+        return _puissance_entiere(base, n)
+
+    if base.haut < 0:
+        raise ArgumentFonctionError('^', "base négative et exposant non entier")
+    base = Intervalle(max(base.bas, 0.0), base.haut)
+    return _exp(_multiplication(exposant, _ln(base)))
+
+
+def _puissance_entiere(base: Intervalle, n: int) -> Intervalle:
+    """x^n pour n > 0 : monotone par morceaux selon la parité de n."""
+    if n % 2 == 0:
+        if base.bas >= 0:
+            bas, haut = base.bas, base.haut
+        elif base.haut <= 0:
+            bas, haut = -base.haut, -base.bas
+        else:
+            bas, haut = 0.0, max(-base.bas, base.haut)
+        return Intervalle(max(0.0, _puissance_bas(bas, n)), _puissance_haut(haut, n))
+    return Intervalle(_puissance_bas(base.bas, n), _puissance_haut(base.haut, n))
+
+
+def _puissance_bas(x: float, n: int) -> float:
+    """Minorant de x^n (** de Python : erreur d'au plus un flottant)."""
+    try:
+        return _precedent(_precedent(x ** n))
+    except OverflowError:
+        return INFINI if x > 0 else -INFINI
+
+
+def _puissance_haut(x: float, n: int) -> float:
+    """Majorant de x^n."""
+    try:
+        return _suivant(_suivant(x ** n))
+    except OverflowError:
+        return INFINI if x > 0 else -INFINI
+
+
+def _comparaison(operateur: str):
+    """<, >, ... : [1, 1] si toujours vrai, [0, 0] si jamais, [0, 1] sinon."""
+    def comparer(a: Intervalle, b: Intervalle) -> Intervalle:
+        if operateur in ('<', '<='):
+            a, b = b, a  # a > b ou a >= b
+        if operateur in ('==', '!='):
+            toujours = a.est_ponctuel() and b.est_ponctuel() and a.bas == b.bas
+            jamais = a.haut < b.bas or b.haut < a.bas
+            if operateur == '!=':
+                toujours, jamais = jamais, toujours
+        elif operateur in ('>', '<'):
+            toujours = a.bas > b.haut
+            jamais = a.haut <= b.bas
+        else:
+            toujours = a.bas >= b.haut
+            jamais = a.haut < b.bas
+        if toujours:
+            return Intervalle(1.0)
+        if jamais:
+            return Intervalle(0.0)
+        return Intervalle(0.0, 1.0)
+    return comparer
+
+
+#=============================================================================
+# FONCTIONS
+#=============================================================================
+
+def _racine(x: Intervalle) -> Intervalle:
+    if x.haut < 0:
+        raise RacineNegativeError(x.haut)
+    bas = max(x.bas, 0.0)
+    return Intervalle(max(0.0, _precedent(bas ** 0.5)), _suivant(x.haut ** 0.5))
+
+
+def _valeur_absolue(x: Intervalle) -> Intervalle:
+    if x.bas >= 0:
+        return x
+    if x.haut <= 0:
+        return Intervalle(-x.haut, -x.bas)
+    return Intervalle(0.0, max(-x.bas, x.haut))
+
+
+def _exp(x: Intervalle) -> Intervalle:
+    return Intervalle(_exp_point(x.bas)[0], _exp_point(x.haut)[1])
+
+
+def _ln(x: Intervalle) -> Intervalle:
+    if x.haut <= 0:
+        raise LogarithmeError(x.haut)
+    bas = _ln_point(x.bas)[0] if x.bas > 0 else -INFINI
+    return Intervalle(bas, _ln_point(x.haut)[1])
+
+
+def _log(x: Intervalle) -> Intervalle:
+    return _division(_ln(x), _LN10)
+
+
+def _sinus(x: Intervalle) -> Intervalle:
+    return _trigonometrique(x, 0)
+
+
+def _cosinus(x: Intervalle) -> Intervalle:
+    return _trigonometrique(x, 1)
+
+
+def _trigonometrique(x: Intervalle, decalage: int) -> Intervalle:
+    """
+    sin (decalage 0) ou cos (decalage 1) sur [bas, haut] : valeurs aux
+    bornes, plus 1 (resp. -1) si un maximum (resp. minimum) est dedans.
+    Les maximums de sin sont en π/2 + 2kπ, ceux de cos en 2kπ.
+    """
+    if x.largeur >= 2 * PI or max(-x.bas, x.haut) > LIMITE_REDUCTION:
+        return Intervalle(-1.0, 1.0)
+
+    gauche = _sinus_point(x.bas, decalage)
+    droite = _sinus_point(x.haut, decalage)
+    bas = min(gauche[0], droite[0])
+    haut = max(gauche[1], droite[1])
+
+    phase = PI / 2 if decalage == 0 else 0.0
+    if _contient_periode(x, phase):
+        haut = 1.0
+    if _contient_periode(x, phase + PI):
+        bas = -1.0
+    return Intervalle(bas, haut)
+
+
+def _tangente(x: Intervalle) -> Intervalle:
+    """tan est croissante entre deux pôles π/2 + kπ."""
+    if x.largeur >= PI or max(-x.bas, x.haut) > LIMITE_REDUCTION:
+        return Intervalle(-INFINI, INFINI)
+    if _contient_periode(x, PI / 2, PI):
+        return Intervalle(-INFINI, INFINI)
+
+    gauche = _division(Intervalle(*_sinus_point(x.bas, 0)), Intervalle(*_sinus_point(x.bas, 1)))
+    droite = _division(Intervalle(*_sinus_point(x.haut, 0)), Intervalle(*_sinus_point(x.haut, 1)))
+    return Intervalle(gauche.bas, droite.haut)
+
+
+def _contient_periode(x: Intervalle, phase: float, periode=2 * PI) -> bool:
+    """Vrai si [bas, haut] contient (ou frôle) phase + k * periode."""
+    t_bas = (x.bas - phase) / periode - TOLERANCE_EXTREMUM
+    t_haut = (x.haut - phase) / periode + TOLERANCE_EXTREMUM
+    return t_haut // 1 >= -((-t_bas) // 1)
+
+
+def _argument(x: Intervalle) -> Intervalle:
+    """arg d'un réel : 0 si positif, π si négatif."""
+    if x.bas >= 0:
+        return Intervalle(0.0)
+    if x.haut < 0:
+        return _PI
+    return Intervalle(0.0, _PI.haut)
+
+
+#=============================================================================
+# NOYAUX PONCTUELS (encadrement de f(x) pour un flottant x)
+#=============================================================================
+
+def _exp_point(x: float) -> tuple:
+    """
+    Encadrement de e^x par les puissances de deux flottants qui
+    encadrent e (** de Python : erreur d'au plus un flottant).
+    """
+    if x == 0:
+        return 1.0, 1.0
+    petit, grand = (_E.bas, _E.haut) if x > 0 else (_E.haut, _E.bas)
+    try:
+        bas = _precedent(petit ** x)
+    except OverflowError:
+        bas = INFINI
+    try:
+        haut = _suivant(grand ** x)
+    except OverflowError:
+        haut = INFINI
+    return max(bas, 0.0), haut
+
+
+def _ln_point(x: float) -> tuple:
+    """
+    Encadrement de ln(x), x > 0 : x = m * 2^e avec m dans [√2/2, √2],
+    ln(x) = e*ln(2) + 2*artanh((m-1)/(m+1)), série rapide car |u| < 0.18.
+    """
+    if x == INFINI:
+        return INFINI, INFINI
+
+    # Exposant binaire exact, sans frexp (module math)
+    numerateur, denominateur = x.as_integer_ratio()
+    e = numerateur.bit_length() - denominateur.bit_length()
+    m = x * 2.0 ** (-e // 2) * 2.0 ** (-e - (-e // 2))
+    if m > 1.4142135623730951:
+        m /= 2
+        e += 1
+    elif m < 0.7071067811865476:
+        m *= 2
+        e -= 1
+
+    u = (m - 1) / (m + 1)
+    u_carre = u * u
+    serie = 0.0
+    terme = u
+    n = 1
+    while abs(terme) > 1e-20 * abs(u):
+        serie += terme / n
+        terme *= u_carre
+        n += 2
+
+    partie_m = 2 * serie
+    partie_e = e * 0.6931471805599453
+    centre = partie_e + partie_m
+    marge = MARGE_NOYAU * (abs(partie_e) + abs(partie_m)) + 5e-324
+    return _precedent(centre - marge), _suivant(centre + marge)
+
+
+def _sinus_point(x: float, decalage: int) -> tuple:
+    """
+    Encadrement de sin(x) (decalage 0) ou cos(x) (decalage 1).
+
+    Réduction : x = k*π/2 + r avec |r| <= π/4, π/2 en deux parties pour
+    que x - k*PI_SUR_2_HAUT soit exact ; puis séries de Taylor de sin r
+    et cos r.
+    """
+    k = int(round(x / (PI / 2)))
+    r = (x - k * PI_SUR_2_HAUT) - k * PI_SUR_2_BAS
+    quart = (k + decalage) % 4
+
+    r_carre = r * r
+    if quart % 2 == 0:
+        valeur, terme, n = 0.0, r, 1        # sin r = r - r³/3! + ...
+    else:
+        valeur, terme, n = 0.0, 1.0, 0      # cos r = 1 - r²/2! + ...
+    while terme != 0 and abs(terme) > 1e-20 * max(abs(valeur), 1e-300):
+        valeur += terme
+        terme = -terme * r_carre / ((n + 1) * (n + 2))
+        n += 2
+    if quart >= 2:
+        valeur = -valeur
+
+    marge = MARGE_NOYAU * (abs(valeur) + abs(r)) + 1e-19 * (k != 0) + 5e-324
+    return max(-1.0, _precedent(valeur - marge)), min(1.0, _suivant(valeur + marge))
+
+
+#=============================================================================
+# FONCTIONS VARIADIQUES
+#=============================================================================
+
+def _minimum(arguments: list) -> Intervalle:
+    return Intervalle(min(x.bas for x in arguments), min(x.haut for x in arguments))
+
+
+def _maximum(arguments: list) -> Intervalle:
+    return Intervalle(max(x.bas for x in arguments), max(x.haut for x in arguments))
+
+
+def _somme(arguments: list) -> Intervalle:
+    total = Intervalle(0.0)
+    for x in arguments:
+        total = _addition(total, x)
+    return total
+
+
+def _moyenne(arguments: list) -> Intervalle:
+    return _division(_somme(arguments), Intervalle(float(len(arguments))))
+
+
+def _mediane(arguments: list) -> Intervalle:
+    """La médiane est croissante en chaque argument."""
+    bas = [x.bas for x in arguments]
+    haut = [x.haut for x in arguments]
+    return _arrondi(_mediane_en_place(bas, 0, len(bas)), _mediane_en_place(haut, 0, len(haut)))
+
+
+def _variance(arguments: list) -> Intervalle:
+    """
+    Inégalité de Popoviciu : la variance de valeurs comprises dans [m, M]
+    est au plus (M - m)² / 4 (* n / (n - 1) pour la variance d'échantillon).
+    """
+    n = len(arguments)
+    if n < 2:
+        raise ArgumentFonctionError('var', "nécessite au moins 2 arguments")
+    etendue = _soustraction(_maximum(arguments), _minimum(arguments)).haut
+    return Intervalle(0.0, _suivant(_suivant(etendue * etendue * n / (4 * (n - 1)))))
+
+
+def _ecart_type(arguments: list) -> Intervalle:
+    if len(arguments) < 2:
+        raise ArgumentFonctionError('stdev', "nécessite au moins 2 arguments")
+    return _racine(_variance(arguments))
+
+
+_BINAIRES = {
+    '+': _addition,
+    '-': _soustraction,
+    '*': _multiplication,
+    '/': _division,
+    '%': _modulo,
+    '^': _puissance,
+}
+_BINAIRES.update({operateur: _comparaison(operateur) for operateur in OPERATEURS_COMPARAISON})
+
+_UNAIRES = {
+    're': lambda x: x,
+    'im': lambda x: Intervalle(0.0),
+    'arg': _argument,
+    'conj': lambda x: x,
+    'sqrt': _racine,
+    'abs': _valeur_absolue,
+    'sin': _sinus,
+    'cos': _cosinus,
+    'tan': _tangente,
+    'sind': lambda x: _sinus(_multiplication(x, _DEGRE)),
+    'cosd': lambda x: _cosinus(_multiplication(x, _DEGRE)),
+    'tand': lambda x: _tangente(_multiplication(x, _DEGRE)),
+    'ln': _ln,
+    'log': _log,
+    'exp': _exp,
+    'inv': lambda x: _division(Intervalle(1.0), x),
+    'sqr': lambda x: _puissance_entiere(x, 2),
+    'UNARY_MINUS': lambda x: Intervalle(-x.haut, -x.bas),
+}
+
+_VARIADIQUES = {
+    'min': _minimum,
+    'max': _maximum,
+    'sum': _somme,
+    'mean': _moyenne,
+    'var': _variance,
+    'stdev': _ecart_type,
+    'median': _mediane,
+}
+
+# Fonctions sans règle d'intervalle (entiers exacts, matrices, bits, bounds)
+_NON_SUPPORTEES = {
+    'isprime', 'factor', 'fact', 'powmod', 'ncr', 'npr', 'gcd', 'lcm',
+    'det', 'transpose', 'dot', 'solve', 'bounds', 'roots',
+    'rand', 'randn', 'randint', 'mc',
+    'and', 'or', 'xor', 'shl', 'shr', 'not',
+}
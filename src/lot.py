@@ -0,0 +1,183 @@
+# src/lot.py
+"""
+================================================================================
+Module de calcul par lots sur plusieurs processus - VERSION 4.0
+================================================================================
+
+Calcule un grand nombre d'expressions indépendantes (formules stockées,
+travaux de nuit...) sur tous les cœurs du processeur :
+
+    >>> for expression, resultat, erreur in calculer_lot(["2 + 3", "1/0"]):
+    ...     print(expression, resultat, erreur)
+    2 + 3 5.0 None
+    1/0 None Erreur :  Division par zéro impossible
+
+FONCTIONNEMENT :
+----------------
+    - Les expressions sont lues au fil de l'eau et regroupées en morceaux
+      de TAILLE_MORCEAU ; un morceau est envoyé à un processus en une
+      seule fois (une sérialisation par morceau, pas par expression).
+    - Chaque processus garde SA Session d'un morceau à l'autre : une
+      formule déjà vue n'est ni réanalysée ni recalculée (caches chauds).
+      La session donnée (définitions, modes, caches) est copiée dans
+      chaque processus à son démarrage.
+    - Les résultats sont rendus dans l'ordre des expressions, au fur et à
+      mesure ; au plus 2 morceaux par processus sont en cours : la mémoire
+      reste bornée, même pour des millions d'expressions.
+    - Une erreur (CalculatriceError) est rendue avec son expression, sous
+      forme de message : elle n'arrête pas le lot.
+    - Tirages (rand...) : si la session donnée a une graine, chaque
+      morceau tire avec la graine « graine:numéro du morceau » ; le lot
+      est reproductible, quels que soient le nombre de processus et celui
+      qui calcule chaque morceau. Sans graine, chaque processus a ses
+      propres tirages.
+
+Les expressions d'un lot sont INDÉPENDANTES : une définition (a = 3) ou
+ANS ne valent que dans le processus qui les calcule. Les définitions
+communes se font dans la session donnée, avant le lot.
+
+En ligne de commande : python -m src --processus 4 formules.txt
+
+================================================================================
+"""
+
+import copy
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.exceptions import CalculatriceError
+from src.session import Session
+
+
+# Expressions envoyées ensemble à un processus
+TAILLE_MORCEAU = 1000
+
+# Expressions compilées gardées par chaque processus
+TAILLE_CACHE = 10000
+
+# Session et mode angulaire d'un processus de calcul (remplis par _initialiser)
+_contexte = {}
+
+
+#=============================================================================
+# FONCTION PRINCIPALE
+#=============================================================================
+
+def calculer_lot(expressions, processus=None, taille_morceau=TAILLE_MORCEAU, utiliser_degres=False,
+                 session=None):
+    """
+    Calcule des expressions indépendantes, en parallèle.
+
+    Args:
+        expressions: Itérable d'expressions (liste, fichier, générateur...)
+        processus: Nombre de processus (défaut : nombre de cœurs ; 1 :
+                   calcul dans le processus courant)
+        taille_morceau: Nombre d'expressions par morceau
+        utiliser_degres: Mode angulaire
+        session: Session modèle (définitions, modes), copiée dans chaque
+                 processus et jamais modifiée
+
+    Yields:
+        tuple: (expression, résultat, erreur) dans l'ordre des expressions ;
+               erreur est le message de l'erreur levée (sinon None), le
+               résultat est None pour une erreur ou une ligne vide
+
+    Examples:
+        >>> [resultat for _, resultat, _ in calculer_lot(["1+1", "2*3"], processus=1)]
+        [2.0, 6.0]
+    """
+    session = copy.deepcopy(session) if session is not None else Session()
+    if session.taille_cache is None:
+        session.taille_cache = TAILLE_CACHE
+    morceaux = _morceaux(expressions, taille_morceau)
+    processus = processus or os.cpu_count() or 1
+
+    if processus == 1:
+        _initialiser(session, utiliser_degres)
+        try:
+            for numero, morceau in enumerate(morceaux):
+                yield from _associer(morceau, _calculer_morceau(morceau, numero))
+        finally:
+            _contexte.clear()
+        return
+
+    executeur = ProcessPoolExecutor(processus, initializer=_initialiser_processus,
+                                    initargs=(session, utiliser_degres))
+    try:
+        en_cours = deque()
+        for numero, morceau in enumerate(morceaux):
+            en_cours.append((morceau, executeur.submit(_calculer_morceau, morceau, numero)))
+            if len(en_cours) >= 2 * processus:
+                morceau, tache = en_cours.popleft()
+                yield from _associer(morceau, tache.result())
+        while en_cours:
+            morceau, tache = en_cours.popleft()
+            yield from _associer(morceau, tache.result())
+    finally:
+        executeur.shutdown(cancel_futures=True)
+
+
+def _morceaux(expressions, taille_morceau: int):
+    """Regroupe les expressions (sans espaces autour) par morceaux."""
+    morceau = []
+    for expression in expressions:
+        morceau.append(expression.strip())
+        if len(morceau) == taille_morceau:
+            yield morceau
+            morceau = []
+    if morceau:
+        yield morceau
+
+
+def _associer(morceau: list, calculs: list):
+    """(expression, résultat, erreur) pour chaque expression d'un morceau."""
+    for expression, (resultat, erreur) in zip(morceau, calculs):
+        yield expression, resultat, erreur
+
+
+#=============================================================================
+# CALCUL DANS UN PROCESSUS
+#=============================================================================
+
+def _initialiser(session: Session, utiliser_degres: bool):
+    """Installe la session du processus, gardée d'un morceau à l'autre."""
+    _contexte.update(session=session, utiliser_degres=utiliser_degres, graine=session.graine)
+
+
+def _initialiser_processus(session: Session, utiliser_degres: bool):
+    """Comme _initialiser ; sans graine, des tirages propres au processus."""
+    if session.graine is None:
+        session.graine = None  # Nouveau générateur : sinon tous les processus tireraient la même suite
+    _initialiser(session, utiliser_degres)
+
+
+def _calculer_morceau(morceau: list, numero: int) -> list:
+    """Calcule le morceau numero : une paire (résultat, erreur) par expression."""
+    session = _contexte['session']
+    utiliser_degres = _contexte['utiliser_degres']
+    if _contexte['graine'] is not None:
+        session.graine = f"{_contexte['graine']}:{numero}"  # Tirages du morceau
+    return [calculer_un(expression, session, utiliser_degres) for expression in morceau]
+
+
+def calculer_un(expression: str, session: Session, utiliser_degres=False, variables=None) -> tuple:
+    """
+    Calcule une expression sans lever d'erreur.
+
+    Returns:
+        tuple: (résultat, None), (None, message d'erreur), ou (None, None)
+               pour une expression vide
+
+    Examples:
+        >>> calculer_un("1/0", Session())
+        (None, 'Erreur :  Division par zéro impossible')
+    """
+    if not expression:
+        return None, None
+    try:
+        return session.calculer(expression, utiliser_degres, variables), None
+    except CalculatriceError as e:
+        return None, str(e)
+    except (ArithmeticError, ValueError, TypeError) as e:
+        return None, f"Erreur inattendue :  {str(e)}"
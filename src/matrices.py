@@ -0,0 +1,276 @@
+# src/matrices.py
+"""
+================================================================================
+Module des vecteurs et matrices - VERSION 4.0
+================================================================================
+
+Valeurs matricielles dans les expressions, stockées en tableaux NumPy :
+
+    [1, 2, 3]                       vecteur
+    [[1, 2], [3, 4]]                matrice 2x2
+    [[1, 2], [3, 4]] * [5, 6]       produit matriciel
+    det(A), inv(A), transpose(A)    déterminant, inverse, transposée
+    dot(u, v)                       produit scalaire
+    solve(A, b)                     solution de A*x = b
+    sqrt([1, 4, 9])                 fonctions scalaires élément par élément
+
+La pile de evaluer_rpn contient alors des valeurs de types différents
+(float, complex, numpy.ndarray) : evaluer_rpn ne passe par ce module que
+si un opérande n'est pas un scalaire.
+
+ALGORITHMES :
+-------------
+    - det, inv et solve passent par une factorisation LU (LAPACK via
+      numpy.linalg) : O(n³), quelques millisecondes pour 500x500, au lieu
+      du développement par cofacteurs en O(n!)
+    - solve(A, b) ne calcule jamais inv(A) (plus rapide et plus précis)
+    - Les fonctions élément par élément réutilisent src.vectoriel ; une
+      erreur de domaine (sqrt([-1]), [1, 2] / 0) lève la même exception
+      qu'en scalaire
+
+NumPy est OPTIONNEL : sans lui, les matrices lèvent une erreur explicite
+et le reste de la calculatrice fonctionne normalement.
+
+================================================================================
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.calculateur import evaluer_rpn
+from src.exceptions import ExpressionInvalideError, ArgumentFonctionError
+from src import vectoriel
+
+
+NUMPY_DISPONIBLE = np is not None
+
+
+#=============================================================================
+# CONSTRUCTION ET AFFICHAGE
+#=============================================================================
+
+def construire(elements: list):
+    """
+    Construit un vecteur (éléments scalaires) ou une matrice (éléments vecteurs).
+
+    Args:
+        elements: Valeurs entre crochets, dans l'ordre
+
+    Returns:
+        numpy.ndarray: Le tableau
+
+    Raises:
+        ExpressionInvalideError: NumPy absent, lignes de longueurs
+                                 différentes ou élément non réel
+
+    Examples:
+        >>> construire([1.0, 2.0])
+        array([1., 2.])
+    """
+    if not NUMPY_DISPONIBLE:
+        raise ExpressionInvalideError("Les matrices nécessitent NumPy (pip install numpy)")
+
+    for element in elements:
+        if isinstance(element, (list, complex)):
+            raise ExpressionInvalideError("Les éléments d'une matrice doivent être des nombres réels")
+
+    try:
+        return np.array(elements, dtype=float)
+    except ValueError:
+        raise ExpressionInvalideError("Les lignes d'une matrice doivent avoir la même longueur")
+
+
+def formater(tableau, decimales=10) -> str:
+    """
+    Affiche un tableau sur plusieurs lignes.
+
+    Examples:
+        >>> formater(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        '[[1, 2],\\n [3, 4]]'
+    """
+    arrondi = np.round(tableau, decimales) + 0.0  # + 0.0 : pas de "-0"
+    return np.array2string(
+        arrondi,
+        separator=', ',
+        formatter={'float_kind': lambda x: f"{x:.{decimales}g}"}
+    )
+
+
+#=============================================================================
+# OPÉRATIONS (appelées par evaluer_rpn si un opérande est un tableau)
+#=============================================================================
+
+def operation(token: str, a, b):
+    """
+    Applique un opérateur binaire quand a ou b est un tableau.
+
+    '*' entre deux tableaux est le produit matriciel ; A^n (n entier)
+    est la puissance matricielle. Les autres cas sont élément par élément.
+
+    Raises:
+        ExpressionInvalideError: Dimensions incompatibles
+    """
+    _verifier_operande(a)
+    _verifier_operande(b)
+
+    a_tableau = isinstance(a, np.ndarray) and a.ndim > 0
+    b_tableau = isinstance(b, np.ndarray) and b.ndim > 0
+
+    if token == '*' and a_tableau and b_tableau:
+        try:
+            return _valeur(a @ b)
+        except ValueError:
+            raise ExpressionInvalideError(
+                f"Dimensions incompatibles pour le produit : {_dimensions(a)} * {_dimensions(b)}"
+            )
+
+    if token == '^' and a_tableau and a.ndim == 2 and not b_tableau:
+        _verifier_carree('^', a)
+        if b != int(b):
+            raise ArgumentFonctionError('^', "une matrice n'a que des puissances entières")
+        try:
+            return np.linalg.matrix_power(a, int(b))
+        except np.linalg.LinAlgError:
+            raise ExpressionInvalideError("Matrice singulière (non inversible)")
+
+    return _element_par_element(['a', 'b', token], a=a, b=b)
+
+
+def fonction(token: str, x):
+    """
+    Applique une fonction à un argument tableau.
+
+    det, inv (matrice carrée) et transpose sont matricielles ; les autres
+    fonctions (sqrt, sin, ...) s'appliquent élément par élément.
+    """
+    _verifier_operande(x)
+
+    if token == 'det':
+        _verifier_carree(token, x)
+        with np.errstate(over='ignore'):
+            return float(np.linalg.det(x))
+
+    if token == 'transpose':
+        return x.T
+
+    if token == 'inv' and x.ndim == 2:
+        _verifier_carree(token, x)
+        try:
+            return np.linalg.inv(x)
+        except np.linalg.LinAlgError:
+            raise ExpressionInvalideError("Matrice singulière (non inversible)")
+
+    return _element_par_element(['x', token], x=x)
+
+
+def produit_scalaire(u, v):
+    """
+    dot(u, v) : produit scalaire de deux vecteurs de même longueur.
+
+    Raises:
+        ExpressionInvalideError: Longueurs différentes
+    """
+    _verifier_operande(u)
+    _verifier_operande(v)
+    try:
+        return _valeur(np.dot(u, v))
+    except ValueError:
+        raise ExpressionInvalideError(
+            f"Dimensions incompatibles pour dot : {_dimensions(u)} et {_dimensions(v)}"
+        )
+
+
+def resoudre(a, b):
+    """
+    solve(A, b) : solution x de A*x = b, par factorisation LU avec pivot.
+
+    Raises:
+        ExpressionInvalideError: Matrice singulière ou dimensions incompatibles
+    """
+    _verifier_operande(a)
+    _verifier_operande(b)
+    _verifier_carree('solve', a)
+    b = np.asarray(b, dtype=float)
+    if b.ndim == 0 or b.shape[0] != a.shape[0]:
+        raise ExpressionInvalideError(
+            f"Dimensions incompatibles pour solve : {_dimensions(a)} et {_dimensions(b)}"
+        )
+    try:
+        return np.linalg.solve(a, b)
+    except np.linalg.LinAlgError:
+        raise ExpressionInvalideError("Matrice singulière : le système n'a pas de solution unique")
+
+
+def variadique(nom: str, valeurs: list):
+    """
+    min, max, sum, ... sur des tableaux : tous les éléments de tous les
+    arguments (sum([1, 2], 3) = 6).
+    """
+    for valeur in valeurs:
+        _verifier_operande(valeur)
+    elements = np.concatenate([np.ravel(valeur) for valeur in valeurs])
+    return _valeur(vectoriel._VARIADIQUES[nom](elements))
+
+
+#=============================================================================
+# FONCTIONS UTILITAIRES
+#=============================================================================
+
+def _element_par_element(rpn: list, **operandes):
+    """
+    Évalue une opération élément par élément avec src.vectoriel.
+
+    Si un élément donne NaN ou l'infini à partir d'opérandes finis, on le
+    recalcule en scalaire pour lever l'erreur exacte (division par zéro, etc.).
+    """
+    try:
+        resultat = vectoriel.evaluer_rpn_vectoriel(rpn, operandes)
+    except ValueError:
+        raise ExpressionInvalideError(
+            "Dimensions incompatibles : "
+            + " et ".join(_dimensions(valeur) for valeur in operandes.values())
+        )
+
+    if not np.isfinite(resultat).all():
+        noms = list(operandes)
+        tableaux = np.broadcast_arrays(*(np.asarray(operandes[nom], dtype=float) for nom in noms), resultat)
+        fautifs = ~np.isfinite(tableaux[-1])
+        for tableau in tableaux[:-1]:
+            fautifs &= np.isfinite(tableau)
+        if fautifs.any():
+            index = tuple(np.argwhere(fautifs)[0])
+            variables = {nom: float(tableau[index]) for nom, tableau in zip(noms, tableaux)}
+            evaluer_rpn(rpn, variables=variables)
+
+    return _valeur(resultat)
+
+
+def _valeur(resultat):
+    """Un tableau à 0 dimension redevient un float."""
+    if isinstance(resultat, np.ndarray) and resultat.ndim == 0:
+        return float(resultat)
+    if isinstance(resultat, np.floating):
+        return float(resultat)
+    return resultat
+
+
+def _verifier_operande(valeur):
+    """Un sous-programme (liste) ou un complexe n'a pas sa place ici."""
+    if isinstance(valeur, list):
+        raise ExpressionInvalideError("Expression invalide - vérifiez la syntaxe")
+    if isinstance(valeur, complex):
+        raise ExpressionInvalideError("Les matrices complexes ne sont pas supportées")
+
+
+def _verifier_carree(fonction: str, matrice):
+    """Vérifie qu'un argument est une matrice carrée."""
+    if not isinstance(matrice, np.ndarray) or matrice.ndim != 2 or matrice.shape[0] != matrice.shape[1]:
+        raise ArgumentFonctionError(fonction, "nécessite une matrice carrée")
+
+
+def _dimensions(valeur) -> str:
+    """Dimensions lisibles : 2x3, 3 (vecteur), 1 (scalaire)."""
+    forme = np.shape(valeur)
+    return "x".join(str(n) for n in forme) if forme else "1"
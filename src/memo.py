@@ -0,0 +1,198 @@
+# src/memo.py
+"""
+================================================================================
+Mémoire des résultats des expressions pures - VERSION 4.0
+================================================================================
+
+Une expression PURE (sans ANS, sans tirage aléatoire, sans aucun nom :
+ni variable, ni fonction de l'utilisateur) donne toujours le même
+résultat. Ce résultat est gardé, d'une session à l'autre et d'une
+exécution à l'autre (via l'historique). L'indice d'une somme
+sigma(k^2, k, 1, n) compte comme un nom : une telle somme n'est pas
+mémorisée.
+
+    memo = MemoResultats()
+    memo.prechauffer(historique.operations)     # au démarrage
+    session = Session(memo=memo)
+    session.calculer("powmod(3, 10^6, 97) * 2")  # calculé une fois...
+    autre = Session(memo=memo)
+    autre.calculer("2*powmod(3,10^6,97)")       # ... puis relu
+
+CLÉ :
+-----
+    (forme canonique, mode degrés, moteur) : la forme canonique
+    (src.canonique) réunit "2+3", " 3 + 2 " et "(2)+3" ; le moteur est le
+    mode de calcul de la session (réel, complexe, programmeur), qui change
+    le résultat de sqrt(-4) ou de 7/2.
+
+TAILLE ET VALIDITÉ :
+--------------------
+    - Au plus taille_max résultats ; le moins récemment utilisé est
+      oublié le premier (LRU).
+    - Chaque résultat est lié à VERSION_NOYAUX (src.calculateur) : si un
+      noyau numérique change de version, la mémoire est vidée, et les
+      opérations d'un historique enregistrées avec une autre version ne
+      sont pas reprises.
+
+PRÉCHAUFFAGE :
+--------------
+    Historique.ajouter() enregistre le contexte d'un calcul (contexte()) ;
+    seules les opérations dont le contexte est connu, l'expression pure
+    et le résultat un réel (non mis en forme pour l'affichage) sont
+    reprises.
+
+================================================================================
+"""
+
+from collections import OrderedDict
+
+from src import calculateur
+from src.canonique import canoniser
+from src.exceptions import CalculatriceError
+
+
+# Nombre maximal de résultats gardés
+TAILLE_MAX = 10000
+
+
+def moteur(mode_complexe=False, mode_programmeur=False) -> str:
+    """
+    Nom du mode de calcul d'une session.
+
+    Examples:
+        >>> moteur(mode_complexe=True)
+        'complexe'
+    """
+    nom = 'complexe' if mode_complexe else 'reel'
+    return f"{nom}-programmeur" if mode_programmeur else nom
+
+
+def contexte(session, utiliser_degres=False) -> dict:
+    """
+    Contexte d'un calcul, à enregistrer avec lui dans l'historique.
+
+    Examples:
+        >>> from src.session import Session
+        >>> contexte(Session(), utiliser_degres=True)
+        {'degres': True, 'moteur': 'reel', 'noyaux': 1}
+    """
+    return {
+        'degres': bool(utiliser_degres),
+        'moteur': moteur(session.mode_complexe, session.mode_programmeur),
+        'noyaux': calculateur.VERSION_NOYAUX,
+    }
+
+
+class MemoResultats:
+    """
+    Résultats des expressions pures, par forme canonique (LRU borné).
+
+    Examples:
+        >>> memo = MemoResultats()
+        >>> cle = memo.cle(['2', '3', '+'])
+        >>> memo.ajouter(cle, 5.0)
+        >>> memo.obtenir(memo.cle(['3', '2', '+']))
+        5.0
+    """
+
+    def __init__(self, taille_max=TAILLE_MAX):
+        """
+        Args:
+            taille_max: Nombre maximal de résultats gardés
+        """
+        self.taille_max = taille_max
+        self.version = calculateur.VERSION_NOYAUX
+        self.succes = 0
+        self.echecs = 0
+        self._resultats = OrderedDict()  # clé -> résultat, du plus ancien au plus récent
+
+    def cle(self, rpn: list, utiliser_degres=False, moteur='reel'):
+        """
+        Clé d'une RPN (compilée ou non), ou None si elle ne se canonise pas.
+        L'appelant vérifie que l'expression est pure.
+        """
+        try:
+            return canoniser(rpn), bool(utiliser_degres), moteur
+        except CalculatriceError:
+            return None
+
+    def obtenir(self, cle):
+        """Résultat mémorisé pour cette clé, ou None."""
+        self._verifier_version()
+        resultat = self._resultats.get(cle)
+        if resultat is None:
+            self.echecs += 1
+        else:
+            self.succes += 1
+            self._resultats.move_to_end(cle)
+        return resultat
+
+    def ajouter(self, cle, resultat):
+        """Mémorise un résultat, en oubliant le moins récemment utilisé si besoin."""
+        self._verifier_version()
+        self._resultats[cle] = resultat
+        self._resultats.move_to_end(cle)
+        if len(self._resultats) > self.taille_max:
+            self._resultats.popitem(last=False)
+
+    def prechauffer(self, operations) -> int:
+        """
+        Reprend les résultats d'un historique (Historique.operations).
+
+        Args:
+            operations: Opérations {'expression', 'resultat', 'contexte'}
+
+        Returns:
+            int: Nombre d'opérations reprises
+        """
+        from src.session import _noms_libres
+
+        reprises = 0
+        for operation in operations:
+            contexte_calcul = operation.get('contexte')
+            resultat = operation.get('resultat')
+            if (not isinstance(contexte_calcul, dict) or type(resultat) is not float
+                    or contexte_calcul.get('noyaux') != calculateur.VERSION_NOYAUX):
+                continue
+            try:
+                tokens = calculateur.tokenize(operation['expression'])
+                if '=' in tokens:
+                    continue  # Définition
+                rpn = calculateur.infix_to_rpn(tokens)
+            except CalculatriceError:
+                continue
+            if _noms_libres(rpn):
+                continue  # Variable, fonction, ANS ou tirage
+            cle = self.cle(rpn, contexte_calcul.get('degres', False), contexte_calcul.get('moteur'))
+            if cle is not None:
+                self.ajouter(cle, resultat)
+                reprises += 1
+        return reprises
+
+    def vider(self):
+        """Oublie tous les résultats."""
+        self._resultats.clear()
+
+    def statistiques(self) -> dict:
+        """
+        Compteurs de la mémoire.
+
+        Returns:
+            dict: resultats (gardés), succes, echecs, taux (succès / recherches)
+        """
+        recherches = self.succes + self.echecs
+        return {
+            'resultats': len(self._resultats),
+            'succes': self.succes,
+            'echecs': self.echecs,
+            'taux': self.succes / recherches if recherches else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._resultats)
+
+    def _verifier_version(self):
+        """Vide la mémoire si les noyaux numériques ont changé de version."""
+        if self.version != calculateur.VERSION_NOYAUX:
+            self._resultats.clear()
+            self.version = calculateur.VERSION_NOYAUX
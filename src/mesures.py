@@ -0,0 +1,206 @@
+# src/mesures.py
+"""
+================================================================================
+Mesures des étapes de calcul : histogrammes et export Prometheus - VERSION 4.0
+================================================================================
+
+Instrumentation facultative de calculer() (src.calculateur) :
+
+    >>> from src import calculateur
+    >>> calculateur.activer_mesures()
+    >>> calculateur.calculer("sqrt(2) * 3")
+    4.242640687119286
+    >>> calculateur.statistiques()['etapes']['evaluation']['nombre']
+    1
+    >>> print(calculateur.exposition_prometheus())    # doctest: +SKIP
+    # HELP calculatrice_etape_secondes Durée des étapes de calculer()
+    ...
+
+ÉTAPES MESURÉES :
+-----------------
+    tokenize      Découpage du texte en tokens
+    rpn           Conversion en notation polonaise inversée
+    optimisation  Forme canonique, cache d'analyse et polynômes (Horner)
+    evaluation    Évaluation de la RPN
+    total         Appel complet de calculer()
+
+    Un texte déjà analysé (cache d'analyse) ne passe que par evaluation :
+    ses trois premières étapes ne sont pas mesurées. Sont aussi comptés :
+    le nombre de tokens des expressions analysées, et les erreurs par type
+    d'exception.
+
+COÛT :
+------
+    Désactivées (par défaut), les mesures coûtent un seul test par appel
+    de calculer(). Activées : quelques appels à perf_counter() et une
+    recherche dichotomique par étape ; les histogrammes ont des classes
+    fixes (pas de liste de valeurs), leur taille ne dépend pas du nombre
+    d'appels. Les compteurs ne sont pas protégés par un verrou : entre
+    threads, une observation peut exceptionnellement être perdue.
+
+Les quantiles (p50, p99) sont estimés par la borne supérieure de la
+classe qui les contient : leur précision est celle des classes (un
+facteur 2 au plus).
+
+================================================================================
+"""
+
+from bisect import bisect_left
+
+
+# Étapes de calculer(), dans l'ordre
+ETAPES = ('tokenize', 'rpn', 'optimisation', 'evaluation', 'total')
+
+# Bornes des classes de durée, en secondes : de 250 ns à ~16 s, facteur 2
+BORNES_DUREES = tuple(2.5e-7 * 2 ** i for i in range(27))
+
+# Bornes des classes du nombre de tokens
+BORNES_TOKENS = tuple(2 ** i for i in range(13))
+
+PREFIXE = 'calculatrice'
+
+
+class Histogramme:
+    """
+    Histogramme à classes fixes (cumulable au format Prometheus).
+
+    Examples:
+        >>> h = Histogramme((1, 2, 4))
+        >>> for valeur in (0.5, 1.5, 3, 10):
+        ...     h.observer(valeur)
+        >>> h.comptes
+        [1, 1, 1, 1]
+        >>> h.quantile(0.5)
+        2
+    """
+
+    def __init__(self, bornes):
+        """
+        Args:
+            bornes: Bornes supérieures croissantes des classes (une classe
+                    +Inf est ajoutée)
+        """
+        self.bornes = tuple(bornes)
+        self.comptes = [0] * (len(self.bornes) + 1)
+        self.somme = 0
+        self.nombre = 0
+
+    def observer(self, valeur):
+        """Ajoute une valeur (comptée dans la première classe de borne >= valeur)."""
+        self.comptes[bisect_left(self.bornes, valeur)] += 1
+        self.somme += valeur
+        self.nombre += 1
+
+    def quantile(self, q: float):
+        """
+        Borne supérieure de la classe du quantile q (0 < q <= 1), ou None
+        si l'histogramme est vide ; float('inf') pour la dernière classe.
+        """
+        if not self.nombre:
+            return None
+        rang = q * self.nombre
+        cumul = 0
+        for i, compte in enumerate(self.comptes):
+            cumul += compte
+            if cumul >= rang and compte:
+                return self.bornes[i] if i < len(self.bornes) else float('inf')
+        return float('inf')
+
+    def resume(self) -> dict:
+        """nombre, somme, moyenne, p50, p99."""
+        return {
+            'nombre': self.nombre,
+            'somme': self.somme,
+            'moyenne': self.somme / self.nombre if self.nombre else 0.0,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+        }
+
+
+class Mesures:
+    """
+    Histogrammes des étapes, des nombres de tokens, et compteurs d'erreurs.
+    """
+
+    def __init__(self):
+        self.etapes = {etape: Histogramme(BORNES_DUREES) for etape in ETAPES}
+        self.tokens = Histogramme(BORNES_TOKENS)
+        self.erreurs = {}  # nom du type d'exception -> nombre
+
+    def observer(self, etape: str, duree: float):
+        """Ajoute la durée d'une étape, en secondes."""
+        self.etapes[etape].observer(duree)
+
+    def erreur(self, exception: BaseException):
+        """Compte une erreur par le nom de son type."""
+        nom = type(exception).__name__
+        self.erreurs[nom] = self.erreurs.get(nom, 0) + 1
+
+    def statistiques(self) -> dict:
+        """
+        Résumé des mesures.
+
+        Returns:
+            dict: calculs (appels terminés ou en erreur), etapes ({étape:
+                  résumé de l'histogramme}), tokens (résumé), erreurs
+                  ({type: nombre})
+        """
+        return {
+            'calculs': self.etapes['total'].nombre + sum(self.erreurs.values()),
+            'etapes': {etape: histogramme.resume() for etape, histogramme in self.etapes.items()},
+            'tokens': self.tokens.resume(),
+            'erreurs': dict(self.erreurs),
+        }
+
+    def exposition_prometheus(self, cache_analyse=None) -> str:
+        """
+        Mesures au format texte d'exposition de Prometheus.
+
+        Args:
+            cache_analyse: Compteurs optionnels du cache d'analyse
+                           (statistiques_analyse() de src.calculateur)
+
+        Returns:
+            str: Le texte, terminé par un saut de ligne
+        """
+        lignes = []
+        nom = f"{PREFIXE}_etape_secondes"
+        lignes.append(f"# HELP {nom} Durée des étapes de calculer()")
+        lignes.append(f"# TYPE {nom} histogram")
+        for etape, histogramme in self.etapes.items():
+            lignes.extend(_lignes_histogramme(nom, f'etape="{etape}"', histogramme))
+
+        nom = f"{PREFIXE}_tokens"
+        lignes.append(f"# HELP {nom} Nombre de tokens des expressions analysées")
+        lignes.append(f"# TYPE {nom} histogram")
+        lignes.extend(_lignes_histogramme(nom, '', self.tokens))
+
+        nom = f"{PREFIXE}_erreurs_total"
+        lignes.append(f"# HELP {nom} Erreurs de calculer() par type d'exception")
+        lignes.append(f"# TYPE {nom} counter")
+        for type_erreur, nombre in sorted(self.erreurs.items()):
+            lignes.append(f'{nom}{{type="{type_erreur}"}} {nombre}')
+
+        if cache_analyse is not None:
+            nom = f"{PREFIXE}_cache_analyse_total"
+            lignes.append(f"# HELP {nom} Recherches dans le cache d'analyse par issue")
+            lignes.append(f"# TYPE {nom} counter")
+            for issue in ('textes', 'formes', 'analyses'):
+                lignes.append(f'{nom}{{issue="{issue}"}} {cache_analyse[issue]}')
+
+        return '\n'.join(lignes) + '\n'
+
+
+def _lignes_histogramme(nom: str, etiquettes: str, histogramme: Histogramme) -> list:
+    """Lignes _bucket (cumulées), _sum et _count d'un histogramme."""
+    separateur = ',' if etiquettes else ''
+    lignes = []
+    cumul = 0
+    for borne, compte in zip(histogramme.bornes + ('+Inf',), histogramme.comptes):
+        cumul += compte
+        le = borne if isinstance(borne, str) else repr(float(borne))
+        lignes.append(f'{nom}_bucket{{{etiquettes}{separateur}le="{le}"}} {cumul}')
+    suffixe = f"{{{etiquettes}}}" if etiquettes else ''
+    lignes.append(f"{nom}_sum{suffixe} {histogramme.somme!r}")
+    lignes.append(f"{nom}_count{suffixe} {histogramme.nombre}")
+    return lignes
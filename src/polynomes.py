@@ -0,0 +1,398 @@
+# src/polynomes.py
+"""
+================================================================================
+Module des polynômes - VERSION 4.0
+================================================================================
+
+Reconnaît les polynômes en une variable dans une RPN déjà compilée, pour
+les évaluer par le schéma de Horner et calculer leurs racines.
+
+    x^3 - 2*x + 1  ->  coefficients [1, -2, 0, 1] (degré croissant)
+                   ->  ((1*x + 0)*x - 2)*x + 1   (3 multiplications)
+
+au lieu de « x, 3, ^ » (boucle de puissance()), puis « 2, x, * », etc.
+
+COMPILATION :
+-------------
+    compiler(rpn) remplace chaque sous-expression polynomiale de degré >= 2
+    par un seul token Polynome(variable, coefficients, rpn d'origine) :
+
+        sin(x^2 + 1) -> [Polynome('x', (1.0, 0.0, 1.0), ('x', '2', '^', '1', '+')), 'sin']
+
+    evaluer_rpn, vectoriel et intervalles l'évaluent ; la RPN d'origine
+    sert quand la variable n'est pas un réel (matrice, complexe) ou en mode
+    programmeur (entiers exacts), et pour les encadrements d'intervalles.
+
+    Seules les formes DÉVELOPPÉES sont compilées (sommes de c * x^k) : un
+    produit de deux polynômes non monômes, comme (x - 1)^10, garde sa
+    forme factorisée, bien plus précise près des racines que sa forme
+    développée.
+
+RACINES :
+---------
+    roots(expr) : racines réelles d'un polynôme, valeurs propres de sa
+    matrice compagnon (NumPy), affinées par un pas de Newton. Ici la
+    forme factorisée est acceptée : roots((x - 1)*(x + 2)) = [-2, 1].
+
+================================================================================
+"""
+
+from collections import namedtuple
+
+from src.calculateur import (
+    PI, E, SEPARATEUR_ARITE, FONCTIONS_UNAIRES, ARITES_FIXES, OPERATEURS_COMPARAISON,
+    OPERATEURS_BITS, NEGATION_BITS, FONCTIONS_RECONNUES, est_nombre, valeur_nombre
+)
+from src.exceptions import ArgumentFonctionError, ExpressionInvalideError
+
+
+# Degré maximal reconnu (au-delà, ^ de NumPy ou puissance() restent plus rapides)
+DEGRE_MAX = 32
+
+# Une valeur propre est réelle si sa partie imaginaire est sous ce seuil
+# (relatif) : une racine double est perturbée d'environ 1e-8, une racine
+# triple d'environ 1e-5 par le calcul des valeurs propres
+TOLERANCE_REELLE = 1e-5
+
+OPERATEURS_BINAIRES = {'+', '-', '*', '/', '%', '^'} | OPERATEURS_COMPARAISON | OPERATEURS_BITS
+
+
+class _DegreTropGrand(Exception):
+    """Polynôme de degré supérieur à DEGRE_MAX (voir coefficients)."""
+
+
+class Polynome(namedtuple('Polynome', 'variable coefficients rpn')):
+    """
+    Token RPN d'un polynôme compilé.
+
+    Attributes:
+        variable: Nom de la variable (ex: 'x')
+        coefficients: Tuple des coefficients, du degré 0 au degré n
+        rpn: Tuple des tokens d'origine (sans sous-programme)
+    """
+    __slots__ = ()
+
+
+#=============================================================================
+# RECONNAISSANCE DES POLYNÔMES
+#=============================================================================
+
+def coefficients(rpn: list, developper=True, constante=None, signaler_degre=False):
+    """
+    Coefficients d'une RPN polynomiale en une variable.
+
+    Args:
+        rpn: Expression compilée
+        developper: Si False, refuse les produits de deux polynômes qui ne
+                    sont pas des monômes (formes factorisées)
+        constante: Fonction optionnelle nom -> valeur (ou None) : les noms
+                   qui ont une valeur sont des constantes
+        signaler_degre: Si True, un degré supérieur à DEGRE_MAX lève
+                        _DegreTropGrand au lieu de rendre None
+
+    Returns:
+        tuple: (variable, [c0, c1, ..., cn]), variable étant None pour une
+               constante ; None si la RPN n'est pas un polynôme
+
+    Examples:
+        >>> coefficients(['x', '3', '^', '2', 'x', '*', '-', '1', '+'])
+        ('x', [1.0, -2.0, 0.0, 1.0])
+    """
+    pile = []
+    for token in _deplier(rpn):
+        if not isinstance(token, str):
+            return None
+        arite = _arite(token)
+        if arite > len(pile):
+            return None
+        operandes = pile[len(pile) - arite:]
+        del pile[len(pile) - arite:]
+        terme = _terme(token, operandes, developper, constante, signaler_degre)
+        if terme is None:
+            return None
+        pile.append(terme)
+
+    if len(pile) != 1:
+        return None
+    return pile[0]
+
+
+def compiler(rpn: list) -> list:
+    """
+    Remplace les sous-expressions polynomiales (forme développée, degré
+    >= 2) par des tokens Polynome, y compris dans les sous-programmes.
+
+    Une RPN mal formée est rendue telle quelle : evaluer_rpn lèvera
+    l'erreur habituelle.
+
+    Examples:
+        >>> compiler(['x', '2', '^', '1', '+', 'sin'])
+        [Polynome(variable='x', coefficients=(1.0, 0.0, 1.0), rpn=('x', '2', '^', '1', '+')), 'sin']
+    """
+    sortie = []
+    pile = []   # Une entrée par valeur : (début de sa RPN dans sortie, terme ou None)
+
+    for token in rpn:
+        if isinstance(token, list):
+            pile.append((len(sortie), None))
+            sortie.append(compiler(token))
+            continue
+        if not isinstance(token, str):
+            return rpn
+
+        arite = _arite(token)
+        if arite > len(pile):
+            return rpn
+        operandes = pile[len(pile) - arite:]
+        del pile[len(pile) - arite:]
+
+        terme = _terme(token, [t for _, t in operandes], False, None)
+        if terme is None:
+            _remplacer(sortie, operandes)
+        debut = operandes[0][0] if operandes else len(sortie)
+        sortie.append(token)
+        pile.append((debut, terme))
+
+    _remplacer(sortie, pile)
+    return sortie
+
+
+def _deplier(rpn: list):
+    """Tokens d'une RPN, ceux des Polynome déjà compilés remis à plat."""
+    for token in rpn:
+        if isinstance(token, Polynome):
+            yield from token.rpn
+        else:
+            yield token
+
+
+def _remplacer(sortie: list, entrees: list) -> None:
+    """
+    Remplace par un Polynome la RPN de chaque entrée polynomiale de degré >= 2.
+
+    Les entrées sont les dernières valeurs de la pile : leurs RPN se
+    suivent jusqu'à la fin de sortie. On part de la dernière pour que les
+    débuts des précédentes restent valables.
+    """
+    fin = len(sortie)
+    for debut, terme in reversed(entrees):
+        if terme is not None and terme[0] is not None and len(terme[1]) > 2:
+            sortie[debut:fin] = [Polynome(terme[0], tuple(terme[1]), tuple(sortie[debut:fin]))]
+        fin = debut
+
+
+def _arite(token: str) -> int:
+    """Nombre de valeurs dépilées par un token."""
+    if SEPARATEUR_ARITE in token:
+        return int(token.split(SEPARATEUR_ARITE)[1])
+    if token in OPERATEURS_BINAIRES:
+        return 2
+    if token in FONCTIONS_UNAIRES or token in ('UNARY_MINUS', NEGATION_BITS):
+        return 1
+    return ARITES_FIXES.get(token, 0)
+
+
+def _terme(token: str, operandes: list, developper: bool, constante, signaler_degre=False):
+    """
+    Polynôme (variable, coefficients) calculé par un token, ou None.
+    """
+    if not operandes:
+        if token == 'PI':
+            return (None, [PI])
+        if token == 'E':
+            return (None, [E])
+        if est_nombre(token):
+            valeur = valeur_nombre(token)
+            # Les entiers exacts (0xFF, au-delà de 2^53) ne passent pas par float
+            return (None, [valeur]) if isinstance(valeur, float) else None
+        if token.isalpha() and token != 'ANS' and token not in FONCTIONS_RECONNUES:
+            valeur = constante(token) if constante is not None else None
+            if valeur is not None:
+                return (None, [valeur])
+            return (token, [0.0, 1.0])
+        return None
+
+    if None in operandes:
+        return None
+
+    if token == 'UNARY_MINUS':
+        variable, p = operandes[0]
+        return (variable, [-c for c in p])
+    if token == 'sqr':
+        token, operandes = '*', operandes * 2
+    elif token not in ('+', '-', '*', '/', '^'):
+        return None
+
+    (variable_a, a), (variable_b, b) = operandes
+    if variable_a is not None and variable_b is not None and variable_a != variable_b:
+        return None
+    variable = variable_a if variable_a is not None else variable_b
+
+    if token == '+':
+        resultat = _somme(a, b, 1.0)
+    elif token == '-':
+        resultat = _somme(a, b, -1.0)
+    elif token == '*':
+        if not developper and not (_est_monome(a) or _est_monome(b)):
+            return None
+        resultat = _produit(a, b)
+    elif token == '/':
+        if len(b) != 1 or b[0] == 0:
+            return None
+        resultat = [c / b[0] for c in a]
+    else:
+        # ^ : exposant entier constant, base monôme (sauf si developper)
+        if len(b) != 1 or b[0] != int(b[0]) or b[0] < 0:
+            return None
+        if b[0] > DEGRE_MAX:
+            if signaler_degre and len(a) > 1:
+                raise _DegreTropGrand()
+            return None
+        if len(a) > 1 and not developper and not _est_monome(a):
+            return None
+        resultat = [1.0]
+        for _ in range(int(b[0])):
+            resultat = _produit(resultat, a)
+
+    if len(resultat) - 1 > DEGRE_MAX:
+        if signaler_degre:
+            raise _DegreTropGrand()
+        return None
+    return (variable if len(resultat) > 1 else None, resultat)
+
+
+def _somme(a: list, b: list, signe: float) -> list:
+    """a + signe * b, sans coefficient de tête nul."""
+    resultat = [0.0] * max(len(a), len(b))
+    for i, c in enumerate(a):
+        resultat[i] += c
+    for i, c in enumerate(b):
+        resultat[i] += signe * c
+    return _normaliser(resultat)
+
+
+def _produit(a: list, b: list) -> list:
+    """Produit de deux polynômes."""
+    resultat = [0.0] * (len(a) + len(b) - 1)
+    for i, ca in enumerate(a):
+        if ca:
+            for j, cb in enumerate(b):
+                resultat[i + j] += ca * cb
+    return _normaliser(resultat)
+
+
+def _normaliser(p: list) -> list:
+    """Retire les coefficients de tête nuls (x - x devient la constante 0)."""
+    while len(p) > 1 and p[-1] == 0:
+        p.pop()
+    return p
+
+
+def _est_monome(p: list) -> bool:
+    """Au plus un coefficient non nul : c * x^k."""
+    return sum(1 for c in p if c) <= 1
+
+
+#=============================================================================
+# ÉVALUATION ET RACINES
+#=============================================================================
+
+def horner(coefficients, x):
+    """
+    Évalue c0 + c1*x + ... + cn*x^n par le schéma de Horner.
+
+    x peut être un nombre (réel ou complexe) ou un tableau NumPy.
+
+    Examples:
+        >>> horner([1.0, -2.0, 0.0, 1.0], 2.0)
+        5.0
+    """
+    resultat = coefficients[-1] * x
+    for c in reversed(coefficients[1:-1]):
+        if c:
+            resultat = resultat + c
+        resultat = resultat * x
+    if coefficients[0]:
+        resultat = resultat + coefficients[0]
+    return resultat
+
+
+def racines(coefficients) -> list:
+    """
+    Toutes les racines (complexes) d'un polynôme.
+
+    Valeurs propres de la matrice compagnon, affinées par un pas de
+    Newton quand il réduit |p(z)|.
+
+    Args:
+        coefficients: [c0, c1, ..., cn], cn non nul, n >= 1
+
+    Returns:
+        list: Les n racines (complex)
+
+    Raises:
+        ExpressionInvalideError: Si NumPy est absent
+
+    Examples:
+        >>> sorted(z.real for z in racines([-1.0, 0.0, 1.0]))
+        [-1.0, 1.0]
+    """
+    from src.matrices import NUMPY_DISPONIBLE, np
+    if not NUMPY_DISPONIBLE:
+        raise ExpressionInvalideError("roots() nécessite NumPy (pip install numpy)")
+
+    n = len(coefficients) - 1
+    # Polynôme unitaire x^n + a(n-1) x^(n-1) + ... + a0 : la matrice
+    # compagnon a des 1 sous la diagonale et -a0, ..., -a(n-1) en dernière colonne
+    compagnon = np.zeros((n, n))
+    compagnon[1:, :-1] = np.eye(n - 1)
+    compagnon[:, -1] = [-c / coefficients[-1] for c in coefficients[:-1]]
+
+    derivee = [i * c for i, c in enumerate(coefficients)][1:]
+    resultat = []
+    for z in np.linalg.eigvals(compagnon).tolist():
+        z = complex(z)
+        pente = horner(derivee, z) if len(derivee) > 1 else derivee[0]
+        if pente:
+            affinee = z - horner(coefficients, z) / pente
+            if abs(horner(coefficients, affinee)) < abs(horner(coefficients, z)):
+                z = affinee
+        resultat.append(z)
+    return resultat
+
+
+def racines_reelles(corps: list, constante=None) -> list:
+    """
+    Racines réelles d'une expression polynomiale (roots), croissantes.
+
+    Args:
+        corps: RPN de l'expression (argument différé de roots)
+        constante: Valeurs des noms connus (voir coefficients)
+
+    Returns:
+        list: Les racines réelles, répétées selon leur multiplicité
+
+    Raises:
+        ArgumentFonctionError: Si corps n'est pas un polynôme de degré >= 1
+                               en une seule variable, ou s'il est de degré
+                               supérieur à DEGRE_MAX
+
+    Examples:
+        >>> racines_reelles(['x', '2', '^', '1', '-'])
+        [-1.0, 1.0]
+    """
+    try:
+        polynome = (coefficients(corps, developper=True, constante=constante, signaler_degre=True)
+                    if isinstance(corps, list) else None)
+    except _DegreTropGrand:
+        raise ArgumentFonctionError('roots', f"polynôme de degré supérieur au maximum ({DEGRE_MAX})") from None
+    if polynome is None:
+        raise ArgumentFonctionError('roots', "l'argument doit être un polynôme en une seule variable")
+    if polynome[0] is None:
+        raise ArgumentFonctionError('roots', "nécessite un polynôme de degré >= 1")
+
+    return sorted(
+        z.real + 0.0  # -0.0 devient 0.0 : roots(x) = [0]
+        for z in racines(polynome[1])
+        if abs(z.imag) <= TOLERANCE_REELLE * max(1.0, abs(z))
+    )
@@ -0,0 +1,249 @@
+# src/profileur.py
+"""
+================================================================================
+Profileur par échantillonnage de la pile du thread principal - VERSION 4.0
+================================================================================
+
+Quand l'interface ou un calcul semble lent, le profileur montre où le
+temps passe, sans modifier le code mesuré :
+
+    profileur = Profileur()
+    profileur.demarrer()
+    ...                                   # l'application travaille
+    profileur.arreter()
+    profileur.ecrire('profil')            # profil.folded, profil.pstats
+
+    - Interface : Ctrl+Alt+P démarre le profileur, le même raccourci
+      l'arrête et écrit les fichiers dans le dossier courant.
+    - Console : python -m src --profil profil formules.txt
+    - Résumé d'un profil : python -m src.profileur profil.pstats
+
+FONCTIONNEMENT :
+----------------
+    Un thread lit la pile du thread principal (sys._current_frames())
+    toutes les INTERVALLE secondes et compte chaque pile rencontrée.
+    Le programme mesuré n'est ni ralenti par des appels de traçage, ni
+    modifié : seul le thread d'échantillonnage travaille. Arrêté (par
+    défaut), le profileur ne coûte rien : aucun thread, aucun crochet.
+
+FICHIERS ÉCRITS :
+-----------------
+    .folded   Piles « repliées », une par ligne, de la racine à la feuille,
+              suivies du nombre d'échantillons :
+                  main (main.py:10);calculer (calculateur.py:227) 42
+              Format d'entrée de flamegraph.pl, speedscope, inferno...
+    .pstats   Le même profil au format de pstats : temps propre (tt) et
+              cumulé (ct) estimés par nombre d'échantillons x intervalle ;
+              les colonnes d'appels comptent des échantillons, pas des
+              appels.
+
+LIMITES :
+---------
+    Au plus taille_max piles distinctes sont gardées (les suivantes sont
+    comptées à part, sans leur détail), chacune tronquée à PROFONDEUR_MAX
+    cadres côté racine : la mémoire reste bornée quelle que soit la durée.
+    Tout reste local : rien n'est envoyé, les fichiers sont écrits là où
+    on le demande.
+
+================================================================================
+"""
+
+import marshal
+import sys
+import threading
+from pathlib import Path
+
+
+# Durée entre deux échantillons, en secondes
+INTERVALLE = 0.005
+
+# Nombre maximal de piles distinctes gardées
+TAILLE_MAX = 20000
+
+# Nombre maximal de cadres gardés par pile (les plus proches de la feuille)
+PROFONDEUR_MAX = 200
+
+# Pile des échantillons dont la pile n'a pas pu être gardée
+PILE_PERDUE = (('~', 0, '[piles non gardées]'),)
+
+
+class Profileur:
+    """
+    Échantillonne la pile d'un thread à intervalle fixe.
+
+    Examples:
+        >>> with Profileur(intervalle=0.001) as profileur:
+        ...     sum(i * i for i in range(10 ** 6))
+        333332833333500000
+        >>> profileur.echantillons > 0
+        True
+    """
+
+    def __init__(self, intervalle=INTERVALLE, taille_max=TAILLE_MAX, thread=None):
+        """
+        Args:
+            intervalle: Durée entre deux échantillons, en secondes
+            taille_max: Nombre maximal de piles distinctes gardées
+            thread: Thread échantillonné (défaut : le thread principal)
+        """
+        self.intervalle = intervalle
+        self.taille_max = taille_max
+        self.thread = thread or threading.main_thread()
+        self.echantillons = 0
+        self._piles = {}  # pile (racine -> feuille) -> nombre d'échantillons
+        self._verrou = threading.Lock()
+        self._arret = threading.Event()
+        self._echantillonneur = None
+
+    @property
+    def actif(self) -> bool:
+        """Vrai entre demarrer() et arreter()."""
+        return self._echantillonneur is not None
+
+    def demarrer(self):
+        """Démarre l'échantillonnage (les échantillons déjà pris sont gardés)."""
+        if self.actif:
+            return
+        self._arret.clear()
+        self._echantillonneur = threading.Thread(target=self._echantillonner, name='profileur', daemon=True)
+        self._echantillonneur.start()
+
+    def arreter(self):
+        """Arrête l'échantillonnage et attend la fin du thread."""
+        if not self.actif:
+            return
+        self._arret.set()
+        self._echantillonneur.join()
+        self._echantillonneur = None
+
+    def __enter__(self):
+        self.demarrer()
+        return self
+
+    def __exit__(self, *exception):
+        self.arreter()
+
+    #=========================================================================
+    # ÉCHANTILLONNAGE
+    #=========================================================================
+
+    def _echantillonner(self):
+        """Boucle du thread d'échantillonnage."""
+        identifiant = self.thread.ident
+        while not self._arret.wait(self.intervalle):
+            cadre = sys._current_frames().get(identifiant)
+            if cadre is None:
+                if not self.thread.is_alive():
+                    return
+                continue
+            self._ajouter(_pile(cadre))
+            del cadre  # Ne pas retenir les cadres du thread mesuré
+
+    def _ajouter(self, pile: tuple):
+        with self._verrou:
+            self.echantillons += 1
+            if pile not in self._piles and len(self._piles) >= self.taille_max:
+                pile = PILE_PERDUE
+            self._piles[pile] = self._piles.get(pile, 0) + 1
+
+    #=========================================================================
+    # EXPORT
+    #=========================================================================
+
+    def piles_repliees(self) -> list:
+        """
+        Lignes du format « piles repliées » (flame graphs), les plus
+        fréquentes d'abord.
+        """
+        with self._verrou:
+            piles = sorted(self._piles.items(), key=lambda element: -element[1])
+        return [f"{';'.join(_nom_cadre(cadre) for cadre in pile)} {nombre}" for pile, nombre in piles]
+
+    def create_stats(self):
+        """
+        Calcule self.stats au format de cProfile : pstats.Stats(profileur)
+        lit directement le profil.
+        """
+        stats = {}
+        with self._verrou:
+            piles = list(self._piles.items())
+        for pile, nombre in piles:
+            duree = nombre * self.intervalle
+            vus = set()
+            for i, cadre in enumerate(pile):
+                entree = stats.setdefault(cadre, [0, 0, 0.0, 0.0, {}])
+                feuille = i == len(pile) - 1
+                if feuille:
+                    entree[2] += duree
+                if cadre in vus:
+                    continue  # Récursion : cumulé une seule fois
+                vus.add(cadre)
+                entree[0] += nombre
+                entree[1] += nombre
+                entree[3] += duree
+                if i:
+                    appelant = entree[4].get(pile[i - 1], (0, 0, 0.0, 0.0))
+                    entree[4][pile[i - 1]] = (appelant[0] + nombre, appelant[1] + nombre,
+                                              appelant[2] + (duree if feuille else 0.0), appelant[3] + duree)
+        self.stats = {cadre: tuple(entree) for cadre, entree in stats.items()}
+
+    def ecrire(self, prefixe) -> tuple:
+        """
+        Écrit <prefixe>.folded et <prefixe>.pstats.
+
+        Returns:
+            tuple: Les chemins des deux fichiers écrits
+        """
+        repliees = Path(f"{prefixe}.folded")
+        repliees.write_text(''.join(ligne + '\n' for ligne in self.piles_repliees()), encoding='utf-8')
+        self.create_stats()
+        profil = Path(f"{prefixe}.pstats")
+        with open(profil, 'wb') as f:
+            marshal.dump(self.stats, f)
+        return str(repliees), str(profil)
+
+
+def _pile(cadre) -> tuple:
+    """Pile d'un cadre, de la racine à la feuille : (fichier, ligne, fonction) par cadre."""
+    pile = []
+    while cadre is not None and len(pile) < PROFONDEUR_MAX:
+        code = cadre.f_code
+        pile.append((code.co_filename, code.co_firstlineno, code.co_name))
+        cadre = cadre.f_back
+    pile.reverse()
+    return tuple(pile)
+
+
+def _nom_cadre(cadre: tuple) -> str:
+    """main (main.py:10)"""
+    fichier, ligne, fonction = cadre
+    return f"{fonction} ({Path(fichier).name}:{ligne})".replace(';', ',')
+
+
+def resume(fichier: str, lignes=25, tri='cumulative') -> str:
+    """
+    Résumé pstats d'un profil écrit par Profileur.ecrire().
+
+    Args:
+        fichier: Fichier .pstats
+        lignes: Nombre de fonctions affichées
+        tri: Clé de tri de pstats ('cumulative', 'tottime'...)
+    """
+    import io
+    import pstats
+
+    sortie = io.StringIO()
+    pstats.Stats(fichier, stream=sortie).sort_stats(tri).print_stats(lignes)
+    return sortie.getvalue()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    analyseur = argparse.ArgumentParser(prog='python -m src.profileur',
+                                        description="Résumé d'un profil .pstats.")
+    analyseur.add_argument('fichier', help="profil écrit par Profileur.ecrire()")
+    analyseur.add_argument('-n', '--lignes', type=int, default=25, help="fonctions affichées")
+    analyseur.add_argument('--tri', default='cumulative', help="clé de tri (cumulative, tottime...)")
+    options = analyseur.parse_args()
+    print(resume(options.fichier, options.lignes, options.tri))
@@ -0,0 +1,211 @@
+# src/programmeur.py
+"""
+================================================================================
+Module du mode programmeur - VERSION 4.0
+================================================================================
+
+Entiers exacts de taille illimitée (int de Python), bases et opérations
+bit à bit :
+
+    0xFF, 0o17, 0b1010          littéraux en base 16, 8 et 2
+    a and b, a or b, a xor b    ET, OU, OU exclusif bit à bit
+    a shl n, a shr n            décalages à gauche et à droite
+    not a                       complément (not 0 = -1, comme ~ en Python)
+
+Les littéraux 0x/0o/0b sont toujours des entiers exacts. En mode
+programmeur (Session(mode_programmeur=True)), les entiers décimaux le sont
+aussi et '/' est la division entière : 7 / 2 = 3.
+
+CONVERSIONS RAPIDES :
+---------------------
+Aucun passage par float : 2^10000 reste exact.
+    - Bases 2, 8, 16 (puissances de 2) : int() et format() de Python,
+      en temps linéaire
+    - Autres bases (10, 3, 36...) : découpage récursif par base^(2^k)
+      (diviser pour régner) au lieu de divisions chiffre par chiffre en
+      temps quadratique. Cela évite aussi la limite de 4300 chiffres de
+      int()/str() de Python.
+
+================================================================================
+"""
+
+from src.exceptions import ArgumentFonctionError
+
+
+# Chiffres des bases 2 à 36
+CHIFFRES = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+# Préfixes affichés pour les bases usuelles
+PREFIXES = {16: '0x', 8: '0o', 2: '0b'}
+
+# En dessous de ce nombre de chiffres, on convertit directement
+SEUIL_CONVERSION = 64
+
+# Au-delà, un float n'est plus un entier exact (2^53 + 1 == 2^53 en float)
+ENTIER_EXACT_MAX = 2 ** 53
+
+
+#=============================================================================
+# OPÉRATIONS BIT À BIT
+#=============================================================================
+
+def operation_bits(operateur: str, a, b) -> int:
+    """
+    Applique and, or, xor, shl ou shr à deux entiers.
+
+    Args:
+        operateur: 'and', 'or', 'xor', 'shl' ou 'shr'
+        a, b: Entiers (un float entier comme 12.0 est accepté)
+
+    Returns:
+        int: Le résultat exact
+
+    Raises:
+        ArgumentFonctionError: Opérande non entier ou décalage négatif
+
+    Examples:
+        >>> operation_bits('xor', 0b1100, 0b1010)
+        6
+        >>> operation_bits('shl', 1, 100)
+        1267650600228229401496703205376
+    """
+    a = _entier(operateur, a)
+    b = _entier(operateur, b)
+
+    if operateur == 'and':
+        return a & b
+    if operateur == 'or':
+        return a | b
+    if operateur == 'xor':
+        return a ^ b
+
+    if b < 0:
+        raise ArgumentFonctionError(operateur, "le décalage doit être positif")
+    if operateur == 'shl':
+        return a << b
+    return a >> b
+
+
+def negation_bits(a) -> int:
+    """
+    Complément bit à bit : not a = -a - 1 (entiers signés illimités).
+
+    Examples:
+        >>> negation_bits(0)
+        -1
+    """
+    return ~_entier('not', a)
+
+
+#=============================================================================
+# CONVERSIONS DE BASE
+#=============================================================================
+
+def formater_entier(n: int, base=10, prefixe=True) -> str:
+    """
+    Écrit un entier dans une base de 2 à 36.
+
+    Args:
+        n: L'entier (de taille quelconque)
+        base: Base d'affichage
+        prefixe: Ajouter 0x, 0o ou 0b pour les bases 16, 8 et 2
+
+    Returns:
+        str: L'écriture de n
+
+    Raises:
+        ArgumentFonctionError: Si la base n'est pas entre 2 et 36
+
+    Examples:
+        >>> formater_entier(255, 16)
+        '0xff'
+        >>> formater_entier(-10, 2)
+        '-0b1010'
+        >>> formater_entier(35, 36)
+        'z'
+    """
+    if not 2 <= base <= 36:
+        raise ArgumentFonctionError('base', "la base doit être comprise entre 2 et 36")
+
+    signe = '-' if n < 0 else ''
+    n = -n if n < 0 else n
+    tete = PREFIXES.get(base, '') if prefixe else ''
+
+    if base in (2, 8, 16):
+        chiffres = format(n, {2: 'b', 8: 'o', 16: 'x'}[base])
+    else:
+        chiffres = _vers_chiffres(n, base)
+
+    return signe + tete + chiffres
+
+
+def lire_entier(texte: str, base=10) -> int:
+    """
+    Lit un entier écrit dans une base de 2 à 36 (sans préfixe).
+
+    Examples:
+        >>> lire_entier('ff', 16)
+        255
+        >>> lire_entier('123')
+        123
+    """
+    # Bases puissances de 2 : int() est linéaire et sans limite de taille
+    if base & (base - 1) == 0 or len(texte) <= SEUIL_CONVERSION:
+        return int(texte, base)
+
+    # Diviser pour régner : haut * base^m + bas
+    m = len(texte) // 2
+    haut = lire_entier(texte[:-m], base)
+    bas = lire_entier(texte[-m:], base)
+    return haut * base ** m + bas
+
+
+#=============================================================================
+# FONCTIONS UTILITAIRES
+#=============================================================================
+
+def _entier(operateur: str, valeur) -> int:
+    """
+    Convertit un opérande en int, sans perte (12.0 -> 12, 1.5 -> erreur).
+
+    Un float de valeur absolue au moins ENTIER_EXACT_MAX est refusé : il a
+    pu être arrondi (2^61 - 1 vaut 2^61 en float). Le mode programmeur
+    garde ces entiers exacts.
+    """
+    if isinstance(valeur, int):
+        return valeur
+    if isinstance(valeur, float) and valeur == int(valeur):
+        if abs(valeur) >= ENTIER_EXACT_MAX:
+            raise ArgumentFonctionError(
+                operateur, "entier trop grand pour être exact (moins de 2^53), utiliser le mode programmeur")
+        return int(valeur)
+    raise ArgumentFonctionError(operateur, "nécessite des nombres entiers")
+
+
+def _vers_chiffres(n: int, base: int) -> str:
+    """
+    Chiffres de n >= 0 en base quelconque, par découpage récursif.
+
+    puissances[k] = base^(2^k) : n est coupé en deux moitiés de 2^k
+    chiffres, chacune convertie récursivement.
+    """
+    puissances = [base]
+    while puissances[-1] <= n:
+        puissances.append(puissances[-1] * puissances[-1])
+    return _convertir(n, base, puissances, len(puissances) - 2) or '0'
+
+
+def _convertir(n: int, base: int, puissances: list, k: int) -> str:
+    """Chiffres de n < base^(2^(k+1)), sans zéros de tête."""
+    if k < 0 or (1 << (k + 1)) <= SEUIL_CONVERSION:
+        chiffres = []
+        while n:
+            n, chiffre = divmod(n, base)
+            chiffres.append(CHIFFRES[chiffre])
+        return ''.join(reversed(chiffres))
+
+    haut, bas = divmod(n, puissances[k])
+    chiffres_bas = _convertir(bas, base, puissances, k - 1)
+    if not haut:
+        return chiffres_bas
+    return _convertir(haut, base, puissances, k - 1) + chiffres_bas.rjust(1 << k, '0')
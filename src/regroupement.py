@@ -0,0 +1,205 @@
+# src/regroupement.py
+"""
+================================================================================
+Regroupement des calculs simultanés d'une même formule - VERSION 4.0
+================================================================================
+
+Cas typique : plusieurs threads (ou clients) calculent la même formule
+pour des valeurs différentes (table de prix, simulation...) :
+
+    regroupeur = Regroupeur(fenetre=0.002)
+    # dans chaque thread :
+    prix = regroupeur.calculer("p * (1 + t)^n", {'p': 100, 't': 0.05, 'n': k})
+
+Au lieu d'analyser et d'évaluer chaque appel séparément, les appels
+arrivés pendant la même FENÊTRE pour la même expression (et les mêmes
+noms de variables) forment un lot :
+
+    - l'expression est compilée une seule fois (et gardée en cache) ;
+    - le lot est évalué en UNE passe NumPy (src.vectoriel), chaque
+      variable devenant un tableau d'une valeur par appel ;
+    - chaque appelant reçoit sa valeur.
+
+Le premier appel d'un lot l'évalue lui-même à la fin de la fenêtre (ou
+dès que le lot atteint taille_max) ; les suivants attendent son résultat.
+Un appel seul est évalué par evaluer_rpn, sans NumPy.
+
+Les éléments pour lesquels NumPy donne NaN (1/0, sqrt(-1)...) sont
+recalculés par evaluer_rpn : l'appelant reçoit la même erreur
+(CalculatriceError) qu'avec calculer(). Les noyaux NumPy peuvent différer
+de quelques ULP de ceux de src.calculateur (voir src.vectoriel). ANS
+n'est pas modifié.
+
+statistiques() donne le nombre d'appels, de lots, et le taux de
+regroupement (appels par lot).
+
+================================================================================
+"""
+
+import threading
+
+from src.calculateur import tokenize, infix_to_rpn, evaluer_rpn
+from src.exceptions import CalculatriceError
+from src import polynomes
+from src import vectoriel
+
+
+# Durée pendant laquelle un lot accepte de nouveaux appels, en secondes
+FENETRE = 0.001
+
+# Appels au plus par lot (un lot plein est évalué sans attendre)
+TAILLE_MAX = 4096
+
+# Expressions compilées gardées en cache
+TAILLE_CACHE = 1000
+
+
+class _Lot:
+    """Appels d'une même expression en attente d'évaluation."""
+
+    def __init__(self):
+        self.valeurs = []                  # Variables de chaque appel
+        self.resultats = None              # Valeur ou exception de chaque appel
+        self.plein = threading.Event()     # Lot fermé avant la fin de la fenêtre
+        self.termine = threading.Event()   # Résultats disponibles
+
+
+class Regroupeur:
+    """
+    Point d'entrée thread-safe qui regroupe les calculs d'une même formule.
+
+    Examples:
+        >>> regroupeur = Regroupeur()
+        >>> regroupeur.calculer("x^2 + 1", {'x': 3})
+        10.0
+    """
+
+    def __init__(self, fenetre=FENETRE, taille_max=TAILLE_MAX, utiliser_degres=False):
+        """
+        Args:
+            fenetre: Durée d'attente des autres appels, en secondes
+            taille_max: Appels au plus par lot
+            utiliser_degres: Mode angulaire
+        """
+        self.fenetre = fenetre
+        self.taille_max = taille_max
+        self.utiliser_degres = utiliser_degres
+        self._verrou = threading.Lock()
+        self._lots = {}         # (expression, noms) -> _Lot ouvert
+        self._programmes = {}   # expression -> RPN compilée
+        self._appels = 0
+        self._nombre_lots = 0
+        self._elements_vectorises = 0
+        self._replis = 0
+
+    def calculer(self, expression: str, variables=None):
+        """
+        Calcule une expression, regroupée avec les appels simultanés.
+
+        Args:
+            expression: Expression (ex: "p * (1 + t)^n")
+            variables: Valeurs {nom: nombre} de cet appel
+
+        Returns:
+            float: Le résultat (comme calculer())
+
+        Raises:
+            CalculatriceError: Expression invalide, ou erreur de calcul pour
+                               ces valeurs
+        """
+        variables = variables or {}
+        cle = (expression, tuple(sorted(variables)))
+
+        with self._verrou:
+            self._appels += 1
+            lot = self._lots.get(cle)
+            premier = lot is None
+            if premier:
+                lot = self._lots[cle] = _Lot()
+            indice = len(lot.valeurs)
+            lot.valeurs.append(variables)
+            if len(lot.valeurs) >= self.taille_max:
+                del self._lots[cle]
+                lot.plein.set()
+
+        if premier:
+            lot.plein.wait(self.fenetre)
+            with self._verrou:
+                if self._lots.get(cle) is lot:
+                    del self._lots[cle]
+                self._nombre_lots += 1
+            try:
+                lot.resultats = self._evaluer(expression, lot.valeurs)
+            except CalculatriceError as e:
+                lot.resultats = [e] * len(lot.valeurs)
+            finally:
+                lot.termine.set()
+        else:
+            lot.termine.wait()
+
+        resultat = lot.resultats[indice]
+        if isinstance(resultat, Exception):
+            raise resultat
+        return resultat
+
+    def statistiques(self) -> dict:
+        """
+        Compteurs du regroupement.
+
+        Returns:
+            dict: appels, lots, taux (appels par lot), vectorises (éléments
+                  évalués par NumPy), replis (éléments recalculés un par un)
+        """
+        with self._verrou:
+            return {
+                'appels': self._appels,
+                'lots': self._nombre_lots,
+                'taux': self._appels / self._nombre_lots if self._nombre_lots else 0.0,
+                'vectorises': self._elements_vectorises,
+                'replis': self._replis,
+            }
+
+    #=========================================================================
+    # ÉVALUATION D'UN LOT
+    #=========================================================================
+
+    def _compiler(self, expression: str) -> list:
+        """RPN de l'expression, compilée une seule fois."""
+        rpn = self._programmes.get(expression)
+        if rpn is None:
+            rpn = polynomes.compiler(infix_to_rpn(tokenize(expression)))
+            with self._verrou:
+                if len(self._programmes) >= TAILLE_CACHE:
+                    del self._programmes[next(iter(self._programmes))]
+                self._programmes[expression] = rpn
+        return rpn
+
+    def _evaluer(self, expression: str, valeurs: list) -> list:
+        """Une valeur (ou l'exception levée) par appel du lot."""
+        rpn = self._compiler(expression)
+        if len(valeurs) == 1 or not vectoriel.NUMPY_DISPONIBLE:
+            return [self._evaluer_un(rpn, variables) for variables in valeurs]
+
+        try:
+            tableaux = {nom: [variables[nom] for variables in valeurs] for nom in valeurs[0]}
+            tableaux[vectoriel.TIRAGES] = [0.0] * len(valeurs)  # Un tirage par appel
+            resultats = vectoriel.evaluer_rpn_vectoriel(rpn, tableaux, self.utiliser_degres).tolist()
+        except (CalculatriceError, ArithmeticError, ValueError, TypeError):
+            # Non vectorisable (matrices...) : un appel à la fois
+            resultats = [float('nan')] * len(valeurs)
+
+        replis = 0
+        for i, resultat in enumerate(resultats):
+            if resultat != resultat:  # NaN : l'erreur exacte vient d'evaluer_rpn
+                resultats[i] = self._evaluer_un(rpn, valeurs[i])
+                replis += 1
+        with self._verrou:
+            self._elements_vectorises += len(valeurs) - replis
+            self._replis += replis
+        return resultats
+
+    def _evaluer_un(self, rpn: list, variables: dict):
+        try:
+            return evaluer_rpn(rpn, self.utiliser_degres, variables)
+        except (CalculatriceError, ArithmeticError, ValueError, TypeError) as e:
+            return e
@@ -0,0 +1,684 @@
+# src/serveur.py
+"""
+================================================================================
+Service de calcul local : serveur asyncio en JSON lines - VERSION 4.0
+================================================================================
+
+Un processus Python garde le moteur chargé et répond aux outils qui
+l'interrogent, sans relancer Python à chaque calcul :
+
+    $ python -m src.serveur --unix /tmp/calculatrice.sock &
+    $ printf '{"id": 1, "expression": "x^2 + a", "variables": {"x": 3, "a": 1}}\\n' \\
+          | socat - UNIX-CONNECT:/tmp/calculatrice.sock
+    {"id": 1, "resultat": 10.0, "erreur": null}
+
+PROTOCOLE (un objet JSON par ligne, dans les deux sens) :
+---------------------------------------------------------
+    Requête :  {"id": ..., "expression": "f(2) + ANS",
+                "variables": {"x": 3},                       (optionnel)
+                "mode": {"degres": true, "complexe": false,
+                         "programmeur": false},              (optionnel)
+                "session": "feuille1",                       (optionnel)
+                "budget": 0.5}                               (optionnel, s)
+    Réponse :  {"id": ..., "resultat": 10.0, "erreur": null}
+
+    Les réponses d'une connexion peuvent arriver dans le désordre : "id"
+    les relie aux requêtes. Les requêtes d'une même session sont
+    calculées dans leur ordre d'arrivée.
+
+ÉTAT PAR CLIENT :
+-----------------
+    Chaque connexion a ses sessions (champ "session", "défaut" sinon) :
+    ANS, définitions (a = 3, f(x) = ...) et modes ne sont jamais partagés
+    entre clients (ni par le _dernier_resultat global du module
+    calculateur). Un mode donné dans "mode" reste celui de la session.
+    Les sessions sont oubliées à la fermeture de la connexion.
+
+RÉPARTITION ET LIMITES :
+------------------------
+    - Chaque session est affectée à un processus de calcul (toujours le
+      même : il garde la Session, ses caches et son ANS).
+    - Contre-pression : au plus EN_VOL requêtes en cours par connexion ;
+      au-delà, le serveur cesse de lire la connexion (le client est
+      ralenti par le système), et attend que les réponses soient lues.
+    - Budget : une expression plus longue que LONGUEUR_MAX est refusée,
+      comme un budget inférieur à BUDGET_MIN. Le budget (DELAI au plus)
+      court à partir du début du calcul, pas de l'arrivée de la requête :
+      le processus de calcul l'interrompt lui-même (SIGALRM) et garde ses
+      sessions. Un calcul en C qui ne s'interrompt pas est arrêté MARGE
+      secondes plus tard avec son processus ; le serveur reconstruit alors
+      les sessions du nouveau processus (définitions, modes et ANS).
+
+CHARGE ET BANC D'ESSAI :
+------------------------
+    python -m src.serveur --unix /tmp/calc.sock --charge   (serveur existant)
+    python -m src.serveur --banc                           (serveur intégré)
+
+    affichent le débit et les latences p50/p99 (voir generer_charge()).
+
+================================================================================
+"""
+
+import asyncio
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.calculateur import tokenize
+from src.console import valeur_json
+from src.lot import calculer_un
+from src.session import Session
+
+
+# Requêtes en cours au plus par connexion (au-delà, la lecture s'arrête)
+EN_VOL = 64
+
+# Budget maximal d'un calcul, en secondes
+DELAI = 5.0
+
+# Budget minimal d'une requête, en secondes
+BUDGET_MIN = 0.01
+
+# Délai accordé au-delà du budget avant d'arrêter le processus (calcul en
+# C que SIGALRM n'interrompt pas), en secondes
+MARGE = 1.0
+
+# Longueur maximale d'une expression, en caractères
+LONGUEUR_MAX = 10000
+
+# Expressions compilées gardées par session
+TAILLE_CACHE = 1000
+
+# Expressions du générateur de charge
+EXPRESSIONS_CHARGE = [
+    "2 + 3 * 4",
+    "sqrt(x^2 + 1) * sin(x)",
+    "sigma(k^2, k, 1, 50)",
+    "x^3 - 2*x + 1",
+    "ln(x + 1) / log(x + 10)",
+]
+
+# Modules chargés à la demande par le moteur : importés au démarrage d'un
+# processus de calcul (un import interrompu par SIGALRM resterait à moitié fait)
+MODULES_A_LA_DEMANDE = (
+    'src.aleatoire', 'src.arithmetique', 'src.canonique', 'src.complexes', 'src.intervalles',
+    'src.matrices', 'src.memo', 'src.mesures', 'src.polynomes', 'src.programmeur',
+    'src.vectoriel',
+)
+
+# Sessions d'un processus de calcul : (client, nom) -> [Session, degrés]
+_sessions = {}
+
+
+#=============================================================================
+# SERVEUR
+#=============================================================================
+
+class Serveur:
+    """
+    Serveur de calcul en JSON lines (socket Unix ou TCP).
+
+    Examples:
+        >>> serveur = Serveur(processus=2)
+        >>> await serveur.demarrer(chemin="/tmp/calculatrice.sock")
+        >>> await serveur.servir()   # jusqu'à l'arrêt
+    """
+
+    def __init__(self, processus=None, delai=DELAI, longueur_max=LONGUEUR_MAX, en_vol=EN_VOL):
+        """
+        Args:
+            processus: Nombre de processus de calcul (défaut : nombre de cœurs)
+            delai: Budget maximal d'un calcul, en secondes
+            longueur_max: Longueur maximale d'une expression
+            en_vol: Requêtes en cours au plus par connexion
+        """
+        self.travailleurs = [_Travailleur() for _ in range(processus or os.cpu_count() or 1)]
+        self.delai = delai
+        self.longueur_max = longueur_max
+        self.en_vol = en_vol
+        self.serveur = None
+        self._numeros = itertools.count(1)
+
+    async def demarrer(self, chemin=None, hote='127.0.0.1', port=0):
+        """
+        Écoute sur la socket Unix chemin, ou en TCP sur hote:port.
+
+        Returns:
+            str ou tuple: Adresse d'écoute (chemin, ou (hôte, port))
+        """
+        if chemin is not None:
+            self.serveur = await asyncio.start_unix_server(self._traiter_client, chemin)
+        else:
+            self.serveur = await asyncio.start_server(self._traiter_client, hote, port)
+        return self.serveur.sockets[0].getsockname()
+
+    async def servir(self):
+        """Répond aux clients jusqu'à l'annulation."""
+        async with self.serveur:
+            await self.serveur.serve_forever()
+
+    async def arreter(self):
+        """Ferme la socket et les processus de calcul."""
+        if self.serveur is not None:
+            self.serveur.close()
+            await self.serveur.wait_closed()
+        for travailleur in self.travailleurs:
+            travailleur.arreter()
+
+    #=========================================================================
+    # CONNEXIONS
+    #=========================================================================
+
+    async def _traiter_client(self, lecteur, ecrivain):
+        """Lit les requêtes d'une connexion, au plus en_vol à la fois."""
+        client = next(self._numeros)
+        place = asyncio.Semaphore(self.en_vol)
+        taches = set()
+        try:
+            while True:
+                await place.acquire()  # Contre-pression : plus de lecture
+                try:
+                    ligne = await lecteur.readline()
+                except ValueError:  # Ligne plus longue que la limite du lecteur
+                    place.release()
+                    await self._ecrire(ecrivain, {'id': None, 'resultat': None,
+                                                  'erreur': "Erreur : Requête trop longue"})
+                    break
+                if not ligne:
+                    place.release()
+                    break
+                tache = asyncio.create_task(self._repondre(client, ligne, ecrivain, place))
+                taches.add(tache)
+                tache.add_done_callback(taches.discard)
+        except ConnectionError:
+            pass
+        finally:
+            await asyncio.gather(*taches, return_exceptions=True)
+            for travailleur in self.travailleurs:
+                travailleur.oublier(client)
+            ecrivain.close()
+
+    async def _repondre(self, client: int, ligne: bytes, ecrivain, place):
+        """Calcule une requête et écrit sa réponse."""
+        try:
+            reponse = await self._executer(client, ligne)
+        finally:
+            place.release()
+        await self._ecrire(ecrivain, reponse)
+
+    async def _ecrire(self, ecrivain, reponse: dict):
+        """Écrit une réponse et attend que le client la lise (contre-pression)."""
+        ecrivain.write(json.dumps(reponse, ensure_ascii=False).encode('utf-8') + b'\n')
+        try:
+            await ecrivain.drain()
+        except ConnectionError:
+            pass
+
+    async def _executer(self, client: int, ligne: bytes) -> dict:
+        """Vérifie une requête, puis la calcule dans le processus de sa session."""
+        try:
+            requete = json.loads(ligne)
+        except (ValueError, UnicodeDecodeError):
+            return {'id': None, 'resultat': None, 'erreur': "Erreur : Requête JSON invalide"}
+        if not isinstance(requete, dict):
+            return {'id': None, 'resultat': None, 'erreur': "Erreur : Requête JSON invalide"}
+
+        identifiant = requete.get('id')
+        erreur = _verifier(requete, self.longueur_max)
+        if erreur is not None:
+            return {'id': identifiant, 'resultat': None, 'erreur': erreur}
+
+        cle = (client, str(requete.get('session', 'défaut')))
+        travailleur = self.travailleurs[hash(cle) % len(self.travailleurs)]
+        budget = min(float(requete.get('budget', self.delai)), self.delai)
+        resultat, erreur = await travailleur.calculer(
+            cle, requete['expression'].strip(), requete.get('variables'),
+            requete.get('mode') or {}, budget,
+        )
+        return {'id': identifiant, 'resultat': resultat, 'erreur': erreur}
+
+
+def _verifier(requete: dict, longueur_max: int):
+    """Message d'erreur d'une requête mal formée (None si elle est valide)."""
+    expression = requete.get('expression')
+    if not isinstance(expression, str):
+        return "Erreur : Champ 'expression' manquant"
+    if len(expression) > longueur_max:
+        return f"Erreur : Expression trop longue (plus de {longueur_max} caractères)"
+    variables = requete.get('variables')
+    if variables is not None and not (
+        isinstance(variables, dict)
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in variables.values())
+    ):
+        return "Erreur : 'variables' doit associer des noms à des nombres"
+    if not isinstance(requete.get('mode') or {}, dict):
+        return "Erreur : 'mode' doit être un objet"
+    budget = requete.get('budget', BUDGET_MIN)
+    if isinstance(budget, bool) or not isinstance(budget, (int, float)) or not budget >= BUDGET_MIN:
+        return f"Erreur : 'budget' doit être un nombre de secondes (au moins {BUDGET_MIN:g})"
+    return None
+
+
+def _contexte_processus():
+    """
+    Processus de calcul lancés par un serveur de fork (ou spawn) : un fork
+    direct hériterait des sockets ouvertes des clients, et une connexion
+    fermée par le serveur resterait ouverte dans le processus de calcul.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+class _Journal:
+    """Ce qui reconstruit une session dans un nouveau processus de calcul."""
+
+    def __init__(self):
+        self.definitions = []  # (définition, modes au moment de la définition)
+        self.mode = {}
+        self.ans = None
+
+
+class _Tache:
+    """Un calcul soumis à un processus (et à nouveau s'il est relancé)."""
+
+    def __init__(self, arguments: tuple):
+        self.arguments = arguments
+        self.future = None
+        self.precedente = None  # Tâche soumise juste avant dans le même processus
+
+
+class _Travailleur:
+    """
+    Un processus de calcul : ses calculs sont exécutés dans leur ordre
+    d'arrivée, et le budget de chacun court à partir de son début.
+    """
+
+    def __init__(self):
+        self.executeur = self._nouvel_executeur()
+        self.journaux = {}
+        self._taches = []  # Calculs en cours, dans l'ordre de soumission
+        self._derniere = None
+
+    @staticmethod
+    def _nouvel_executeur():
+        executeur = ProcessPoolExecutor(1, mp_context=_contexte_processus(),
+                                        initializer=_initialiser_processus)
+        executeur.submit(int)  # Démarre le processus tout de suite
+        return executeur
+
+    def _soumettre(self, tache: _Tache):
+        tache.precedente = self._derniere
+        tache.future = asyncio.get_running_loop().run_in_executor(self.executeur, *tache.arguments)
+        self._derniere = tache.future
+
+    async def calculer(self, cle: tuple, expression: str, variables, mode: dict, budget: float) -> tuple:
+        """
+        Calcule une requête dans la session cle, en au plus budget secondes.
+
+        Returns:
+            tuple: (résultat JSON, None) ou (None, message d'erreur)
+        """
+        journal = self.journaux.setdefault(cle, _Journal())
+        tache = _Tache((_calculer, cle, expression, variables, mode, budget))
+        self._soumettre(tache)
+        self._taches.append(tache)
+        try:
+            resultat, erreur, ans, definition = await self._attendre(tache, budget, journal)
+        finally:
+            self._taches.remove(tache)
+            journal.mode.update(_modes(mode))
+        journal.ans = ans
+        if definition:
+            journal.definitions.append((expression, dict(journal.mode)))
+        return resultat, erreur
+
+    async def _attendre(self, tache: _Tache, budget: float, journal: _Journal) -> tuple:
+        """Résultat de _calculer(), le processus arrêté au-delà de budget + MARGE."""
+        while True:
+            future = tache.future
+            try:
+                # Le calcul commence quand le précédent se termine
+                if tache.precedente is not None:
+                    await asyncio.wait([tache.precedente])
+                return await asyncio.wait_for(asyncio.shield(future), budget + MARGE)
+            except asyncio.TimeoutError:
+                if tache.future is future:
+                    # Le processus n'a pas interrompu le calcul : on l'arrête
+                    await self.relancer(sauf=tache)
+                    return None, f"Erreur : Budget de calcul dépassé ({budget:g} s)", journal.ans, False
+            except (BrokenProcessPool, asyncio.CancelledError):
+                if not future.cancelled() and not isinstance(future.exception(), BrokenProcessPool):
+                    raise
+                if tache.future is future:
+                    await self.relancer(sauf=tache)
+                    return None, "Erreur : Calcul interrompu (processus relancé)", journal.ans, False
+            except Exception as e:  # Levée hors de _calculer() (résultat non transmissible...)
+                return None, _erreur_inattendue(e), journal.ans, False
+            # Processus relancé pour un autre calcul : la tâche a été soumise à nouveau
+
+    def oublier(self, client: int):
+        """Oublie les sessions d'un client (après sa déconnexion)."""
+        for cle in [cle for cle in self.journaux if cle[0] == client]:
+            del self.journaux[cle]
+        try:
+            self.executeur.submit(_oublier, client)
+        except RuntimeError:  # Serveur arrêté
+            pass
+
+    async def relancer(self, sauf=None):
+        """
+        Remplace le processus, y reconstruit les sessions de l'ancien, puis
+        soumet à nouveau ses calculs inachevés (sauf la tâche sauf).
+        """
+        ancien = self.executeur
+        self.executeur = self._nouvel_executeur()
+        sessions = [(cle, journal.definitions, journal.mode, journal.ans)
+                    for cle, journal in self.journaux.items()]
+        restauration = asyncio.get_running_loop().run_in_executor(self.executeur, _restaurer, sessions)
+        self._derniere = restauration
+        for tache in self._taches:
+            if tache is not sauf and not (tache.future.done() and tache.future.exception() is None):
+                self._soumettre(tache)
+        for processus in list(ancien._processes.values()):
+            processus.terminate()
+        ancien.shutdown(wait=False, cancel_futures=True)
+        await asyncio.wait([restauration])
+        if sauf is not None:
+            await asyncio.wait([sauf.future])  # Arrêtée avec l'ancien processus
+            if not sauf.future.cancelled():
+                sauf.future.exception()
+
+    def arreter(self):
+        self.executeur.shutdown(wait=False, cancel_futures=True)
+
+
+#=============================================================================
+# CALCUL DANS UN PROCESSUS
+#=============================================================================
+
+class _BudgetDepasse(Exception):
+    """Le calcul n'a pas fini dans son budget."""
+
+
+def _interrompre(signal_recu, pile):
+    raise _BudgetDepasse()
+
+
+def _initialiser_processus():
+    """Prépare un processus de calcul : modules du moteur et minuterie."""
+    for module in MODULES_A_LA_DEMANDE:
+        importlib.import_module(module)
+    if hasattr(signal, 'setitimer'):
+        signal.signal(signal.SIGALRM, _interrompre)
+
+
+def _modes(mode: dict) -> dict:
+    """Modes reconnus d'un champ "mode" de requête."""
+    return {nom: bool(mode[nom]) for nom in ('degres', 'complexe', 'programmeur') if nom in mode}
+
+
+def _session(cle: tuple, mode: dict) -> list:
+    """[Session, degrés] de la session cle du processus, modes appliqués."""
+    if cle not in _sessions:
+        _sessions[cle] = [Session(taille_cache=TAILLE_CACHE), False]
+    etat = _sessions[cle]
+    session = etat[0]
+    mode = _modes(mode)
+    if 'degres' in mode:
+        etat[1] = mode['degres']
+    if 'complexe' in mode:
+        session.mode_complexe = mode['complexe']
+    if 'programmeur' in mode:
+        session.mode_programmeur = mode['programmeur']
+    return etat
+
+
+def _calculer(cle: tuple, expression: str, variables, mode: dict, budget: float) -> tuple:
+    """
+    Calcule une requête dans la session (client, nom) du processus.
+
+    Returns:
+        tuple: (résultat JSON, erreur, ANS de la session, vrai pour une
+               définition enregistrée)
+    """
+    etat = _session(cle, mode)
+    session = etat[0]
+    minuterie = hasattr(signal, 'setitimer')
+    try:
+        try:
+            if minuterie:
+                signal.setitimer(signal.ITIMER_REAL, budget)
+            resultat, erreur = calculer_un(expression, session, etat[1], variables)
+        finally:
+            if minuterie:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except _BudgetDepasse:
+        resultat, erreur = None, f"Erreur : Budget de calcul dépassé ({budget:g} s)"
+    except Exception as e:  # MemoryError, RecursionError... : le client attend une réponse
+        resultat, erreur = None, _erreur_inattendue(e)
+    if erreur is not None:
+        return None, erreur, session.dernier_resultat, False
+    definition = '=' in expression and '=' in tokenize(expression)
+    return valeur_json(resultat, session), None, session.dernier_resultat, definition
+
+
+def _erreur_inattendue(e: Exception) -> str:
+    """Message d'erreur d'une exception étrangère à la calculatrice."""
+    return f"Erreur inattendue :  {type(e).__name__} {e}".rstrip()
+
+
+def _restaurer(sessions: list):
+    """Reconstruit des sessions (après la relance du processus)."""
+    for cle, definitions, mode, ans in sessions:
+        for expression, mode_definition in definitions:
+            etat = _session(cle, mode_definition)
+            calculer_un(expression, etat[0], etat[1])
+        etat = _session(cle, mode)
+        etat[0].dernier_resultat = ans
+
+
+def _oublier(client: int):
+    """Oublie les sessions d'un client."""
+    for cle in [cle for cle in _sessions if cle[0] == client]:
+        del _sessions[cle]
+
+
+#=============================================================================
+# CLIENT ET GÉNÉRATEUR DE CHARGE
+#=============================================================================
+
+class Client:
+    """
+    Client asyncio du serveur : plusieurs requêtes peuvent être en cours.
+
+    Examples:
+        >>> client = await Client.connecter(chemin="/tmp/calculatrice.sock")
+        >>> await client.calculer("x^2", variables={'x': 3})
+        {'id': 1, 'resultat': 9.0, 'erreur': None}
+        >>> await client.fermer()
+    """
+
+    def __init__(self, lecteur, ecrivain):
+        self.lecteur = lecteur
+        self.ecrivain = ecrivain
+        self._numeros = itertools.count(1)
+        self._attentes = {}
+        self._lecture = asyncio.create_task(self._lire())
+
+    @classmethod
+    async def connecter(cls, chemin=None, hote='127.0.0.1', port=None):
+        """Se connecte à la socket Unix chemin, ou en TCP à hote:port."""
+        if chemin is not None:
+            lecteur, ecrivain = await asyncio.open_unix_connection(chemin)
+        else:
+            lecteur, ecrivain = await asyncio.open_connection(hote, port)
+        return cls(lecteur, ecrivain)
+
+    async def calculer(self, expression: str, **champs) -> dict:
+        """
+        Envoie une requête et attend sa réponse.
+
+        Args:
+            expression: Expression à calculer
+            **champs: variables, mode, session, budget (voir le protocole)
+
+        Returns:
+            dict: La réponse {"id", "resultat", "erreur"}
+        """
+        identifiant = next(self._numeros)
+        attente = asyncio.get_running_loop().create_future()
+        self._attentes[identifiant] = attente
+        requete = dict(champs, id=identifiant, expression=expression)
+        self.ecrivain.write(json.dumps(requete).encode('utf-8') + b'\n')
+        await self.ecrivain.drain()
+        return await attente
+
+    async def fermer(self):
+        self.ecrivain.close()
+        await self._lecture
+
+    async def _lire(self):
+        """Transmet chaque réponse à la requête de même id."""
+        async for ligne in self.lecteur:
+            reponse = json.loads(ligne)
+            attente = self._attentes.pop(reponse.get('id'), None)
+            if attente is not None and not attente.done():
+                attente.set_result(reponse)
+        for attente in self._attentes.values():
+            if not attente.done():
+                attente.set_exception(ConnectionError("Connexion fermée par le serveur"))
+
+
+async def generer_charge(chemin=None, hote='127.0.0.1', port=None, requetes=10000, connexions=8,
+                         en_vol=16, expressions=None) -> dict:
+    """
+    Envoie requetes requêtes sur plusieurs connexions et mesure les latences.
+
+    Args:
+        chemin, hote, port: Adresse du serveur
+        requetes: Nombre total de requêtes
+        connexions: Connexions simultanées
+        en_vol: Requêtes en cours au plus par connexion
+        expressions: Expressions envoyées à tour de rôle, avec x variable
+                     (défaut : EXPRESSIONS_CHARGE)
+
+    Returns:
+        dict: requetes, erreurs, duree (s), debit (requêtes/s),
+              p50_ms, p99_ms, max_ms
+    """
+    expressions = expressions or EXPRESSIONS_CHARGE
+    latences = []
+    erreurs = 0
+
+    async def connexion(numero: int):
+        nonlocal erreurs
+        client = await Client.connecter(chemin, hote, port)
+        place = asyncio.Semaphore(en_vol)
+
+        async def requete(k: int):
+            nonlocal erreurs
+            debut = time.perf_counter()
+            try:
+                reponse = await client.calculer(expressions[k % len(expressions)], variables={'x': k % 100 / 10})
+            finally:
+                place.release()
+            latences.append(time.perf_counter() - debut)
+            if reponse['erreur'] is not None:
+                erreurs += 1
+
+        taches = []
+        for k in range(numero, requetes, connexions):
+            await place.acquire()
+            taches.append(asyncio.create_task(requete(k)))
+        await asyncio.gather(*taches)
+        await client.fermer()
+
+    debut = time.perf_counter()
+    await asyncio.gather(*(connexion(numero) for numero in range(connexions)))
+    duree = time.perf_counter() - debut
+
+    latences.sort()
+    return {
+        'requetes': len(latences),
+        'erreurs': erreurs,
+        'duree': duree,
+        'debit': len(latences) / duree,
+        'p50_ms': 1000 * latences[len(latences) // 2],
+        'p99_ms': 1000 * latences[min(len(latences) - 1, len(latences) * 99 // 100)],
+        'max_ms': 1000 * latences[-1],
+    }
+
+
+def formater_rapport(rapport: dict) -> str:
+    """Rapport de generer_charge() sur une ligne."""
+    return (f"{rapport['requetes']} requêtes en {rapport['duree']:.2f} s : "
+            f"{rapport['debit']:.0f} req/s, p50 {rapport['p50_ms']:.2f} ms, "
+            f"p99 {rapport['p99_ms']:.2f} ms, max {rapport['max_ms']:.2f} ms, "
+            f"{rapport['erreurs']} erreur(s)")
+
+
+#=============================================================================
+# LIGNE DE COMMANDE
+#=============================================================================
+
+async def _banc(options) -> str:
+    """Démarre un serveur intégré sur une socket temporaire et le met en charge."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, 'calculatrice.sock')
+        serveur = Serveur(options.processus, options.delai)
+        await serveur.demarrer(chemin=chemin)
+        try:
+            rapport = await generer_charge(chemin, requetes=options.requetes, connexions=options.connexions)
+        finally:
+            await serveur.arreter()
+    return formater_rapport(rapport)
+
+
+def main(arguments=None):
+    """Point d'entrée de python -m src.serveur."""
+    import argparse
+
+    analyseur = argparse.ArgumentParser(prog='python -m src.serveur',
+                                        description="Service de calcul en JSON lines.")
+    analyseur.add_argument('--unix', help="chemin de la socket Unix")
+    analyseur.add_argument('--hote', default='127.0.0.1', help="hôte TCP (sans --unix)")
+    analyseur.add_argument('--port', type=int, default=8765, help="port TCP (sans --unix)")
+    analyseur.add_argument('--processus', type=int, help="processus de calcul (défaut : nombre de cœurs)")
+    analyseur.add_argument('--delai', type=float, default=DELAI, help="budget maximal d'un calcul (s)")
+    analyseur.add_argument('--charge', action='store_true', help="met en charge un serveur existant")
+    analyseur.add_argument('--banc', action='store_true', help="met en charge un serveur intégré")
+    analyseur.add_argument('--requetes', type=int, default=10000, help="requêtes envoyées (--charge, --banc)")
+    analyseur.add_argument('--connexions', type=int, default=8, help="connexions simultanées (--charge, --banc)")
+    options = analyseur.parse_args(arguments)
+
+    if options.banc:
+        print(asyncio.run(_banc(options)))
+    elif options.charge:
+        rapport = asyncio.run(generer_charge(options.unix, options.hote, options.port,
+                                             options.requetes, options.connexions))
+        print(formater_rapport(rapport))
+    else:
+        asyncio.run(_servir(options))
+
+
+async def _servir(options):
+    serveur = Serveur(options.processus, options.delai)
+    adresse = await serveur.demarrer(options.unix, options.hote, options.port)
+    print(f"Serveur de calcul à l'écoute sur {adresse}", flush=True)
+    try:
+        await serveur.servir()
+    finally:
+        await serveur.arreter()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+# src/session.py
+"""
+Module de session de calcul : variables et fonctions de l'utilisateur.
+
+Une session mémorise les définitions saisies par l'utilisateur :
+    a = 3
+    f(x) = x^2 + 1
+    g(x, y) = f(x) + a*y
+
+Chaque définition est analysée une seule fois (tokenize + RPN) ; les
+expressions qui l'utilisent appellent directement sa RPN compilée.
+
+Un graphe de dépendances relie chaque nom aux définitions et aux
+résultats mis en cache qui l'utilisent : redéfinir « a » ne recalcule
+que ce qui dépend de « a ».
+
+VERSION 4.0 - NOUVEAUTÉS :
+--------------------------
+    - Variables et fonctions de l'utilisateur
+    - Cache des expressions compilées et des résultats
+    - Invalidation ciblée par graphe de dépendances
+    - Mode complexe propre à chaque session
+    - Mode programmeur (entiers exacts) et base d'affichage par session
+    - Polynômes compilés pour le schéma de Horner (voir src.polynomes)
+    - Générateur aléatoire par session, de graine choisie (voir src.aleatoire)
+    - Texte déjà compilé : ni tokenize ni RPN ; caches bornés (taille_cache)
+    - Expressions compilées conservées sur disque (voir src.cache_rpn)
+    - Résultats des expressions pures partagés entre sessions (voir src.memo)
+"""
+
+import random
+
+from src.calculateur import (
+    tokenize,
+    infix_to_rpn,
+    evaluer_rpn,
+    SEPARATEUR_ARITE,
+    FONCTIONS_VARIADIQUES,
+    FONCTIONS_PAR_MORCEAUX,
+    FONCTIONS_RECONNUES,
+    LITTERAL_TABLEAU,
+    FONCTIONS_ALEATOIRES,
+    OPERATEURS_BITS,
+    NEGATION_BITS,
+)
+from src.exceptions import ExpressionInvalideError
+from src import canonique, polynomes
+from src.polynomes import Polynome
+
+
+# Noms que l'utilisateur ne peut pas redéfinir
+NOMS_RESERVES = FONCTIONS_RECONNUES | OPERATEURS_BITS | {NEGATION_BITS, 'PI', 'E', 'ANS'}
+
+
+class Definition:
+    """
+    Une définition de l'utilisateur, déjà compilée.
+
+    Attributs :
+        nom: Nom défini (ex: "f")
+        parametres: Noms des paramètres (liste vide pour une variable)
+        rpn: Corps compilé en notation polonaise inversée
+        dependances: Noms libres utilisés par le corps
+    """
+
+    def __init__(self, nom: str, parametres: list, rpn: list, dependances: set):
+        self.nom = nom
+        self.parametres = parametres
+        self.rpn = rpn
+        self.dependances = dependances
+
+
+class Session:
+    """
+    Session de calcul avec définitions de l'utilisateur.
+
+    Fonctionnalités :
+        - Définition de variables (a = 3) et de fonctions (f(x) = x^2)
+        - Cache des expressions compilées (une analyse par texte)
+        - Cache des résultats, invalidé selon les dépendances
+        - ANS propre à la session
+        - Mode réel ou complexe
+        - Mode programmeur : entiers exacts, affichés dans base_affichage
+        - rand(), randn(), randint() tirés de son propre générateur
+    """
+
+    def __init__(self, mode_complexe=False, mode_programmeur=False, graine=None, taille_cache=None,
+                 cache_rpn=None, memo=None):
+        """
+        Initialise une session vide.
+        
+        Args:
+            mode_complexe: Si True, sqrt(-4), ln(-1) et i sont calculés
+                           dans les complexes (voir src.complexes)
+            mode_programmeur: Si True, les entiers sont exacts et '/' est
+                              la division entière (voir src.programmeur)
+            graine: Graine du générateur aléatoire (None : imprévisible)
+            taille_cache: Nombre maximal d'expressions compilées gardées
+                          (None : sans limite) ; au-delà, les plus anciennes
+                          sont oubliées avec leurs résultats
+            cache_rpn: CacheRPN optionnel (src.cache_rpn) : expressions
+                       compilées conservées d'une exécution à l'autre
+            memo: MemoResultats optionnel (src.memo) : résultats des
+                  expressions pures, partagés entre sessions
+        """
+        self.dernier_resultat = 0.0
+        self._mode_complexe = mode_complexe
+        self._mode_programmeur = mode_programmeur
+        self.base_affichage = 10  # Base des résultats entiers (2 à 36)
+        self.fonctions = {}
+        self.variables = {}
+        self.graine = graine
+        self.taille_cache = taille_cache
+        self.cache_rpn = cache_rpn
+        self.memo = memo
+
+        # Valeurs des variables : (nom, utiliser_degres) -> valeur
+        self._valeurs = {}
+        # Graphe inverse : nom -> noms des définitions qui l'utilisent
+        self._dependants = {}
+        # Expressions compilées : texte -> (rpn, dépendances, utilise ANS)
+        self._programmes = {}
+        # Résultats : (texte, utiliser_degres) -> valeur
+        self._resultats = {}
+        # Index inverse : nom -> clés de _resultats qui l'utilisent
+        self._resultats_dependants = {}
+
+    @property
+    def mode_complexe(self) -> bool:
+        """Mode complexe actif (sqrt(-4) = 2i) ou mode réel (erreur)."""
+        return self._mode_complexe
+
+    @mode_complexe.setter
+    def mode_complexe(self, actif: bool):
+        if actif != self._mode_complexe:
+            self._vider_caches()
+        self._mode_complexe = actif
+
+    @property
+    def mode_programmeur(self) -> bool:
+        """Mode programmeur actif (7 / 2 = 3) ou mode normal (3.5)."""
+        return self._mode_programmeur
+
+    @mode_programmeur.setter
+    def mode_programmeur(self, actif: bool):
+        if actif != self._mode_programmeur:
+            self._vider_caches()
+        self._mode_programmeur = actif
+
+    @property
+    def graine(self):
+        """Graine des tirages : la redéfinir rejoue la même suite."""
+        return self._graine
+
+    @graine.setter
+    def graine(self, graine):
+        self._graine = graine
+        self.generateur = random.Random(graine)
+        self.generateur_numpy = None  # Créé au besoin (voir src.aleatoire)
+
+    def formater(self, resultat) -> str:
+        """
+        Affiche un résultat entier dans la base de la session.
+
+        Examples:
+            >>> session = Session(mode_programmeur=True)
+            >>> session.base_affichage = 16
+            >>> session.formater(session.calculer("0b1111 + 1"))
+            '0x10'
+        """
+        from src.arithmetique import Factorisation
+        from src.programmeur import formater_entier
+        if isinstance(resultat, Factorisation):
+            return str(resultat)  # factor(n) : forme factorisée 2^3 * 3^2 * 5
+        return formater_entier(resultat, self.base_affichage)
+
+    def calculer(self, expression: str, utiliser_degres=False, variables=None):
+        """
+        Calcule une expression ou enregistre une définition.
+
+        Args:
+            expression: Expression (ex: "f(2) + a") ou définition
+                        (ex: "a = 3", "f(x) = x^2 + 1")
+            utiliser_degres: Mode angulaire
+            variables: Valeurs optionnelles {nom: valeur} pour ce seul calcul
+                       (prioritaires sur les variables de la session)
+
+        Returns:
+            float: Le résultat, ou la valeur de la variable définie
+                   (complex en mode complexe si la partie imaginaire est non nulle,
+                   int pour les entiers exacts du mode programmeur)
+            None: Pour une définition de fonction
+
+        Raises:
+            ExpressionInvalideError: Définition invalide ou circulaire
+
+        Examples:
+            >>> session = Session()
+            >>> session.calculer("a = 3")
+            3.0
+            >>> session.calculer("f(x) = x^2 + a")
+            >>> session.calculer("f(2)")
+            7.0
+        """
+        programme = self._programmes.get(expression)
+        if programme is None:
+            # Déjà compilée lors d'une session précédente : ni tokenize ni
+            # RPN (une définition n'est jamais mise en cache disque)
+            rpn = self.cache_rpn.obtenir(expression) if self.cache_rpn is not None else None
+            if rpn is None:
+                tokens = tokenize(expression)
+                if '=' in tokens:
+                    return self._definir(tokens, utiliser_degres)
+                rpn = polynomes.compiler(infix_to_rpn(tokens))
+                if self.cache_rpn is not None:
+                    self.cache_rpn.ajouter(expression, rpn)
+            programme = self._compiler(expression, rpn)
+
+        rpn, dependances, utilise_ans = programme
+        cle = (expression, utiliser_degres)
+
+        if variables:
+            # Résultat propre à ces valeurs : pas de cache
+            resultat = evaluer_rpn(rpn, utiliser_degres, variables, session=self)
+        elif cle in self._resultats:
+            resultat = self._resultats[cle]
+        else:
+            resultat = self._evaluer_pur(rpn, utiliser_degres) if self._est_pur(programme) else None
+            if resultat is None:
+                resultat = evaluer_rpn(rpn, utiliser_degres, session=self)
+            # Un résultat qui dépend de ANS ou d'un tirage (même dans une
+            # fonction appelée) change à chaque calcul
+            if not utilise_ans and not self._fermeture(dependances) & FONCTIONS_ALEATOIRES:
+                self._resultats[cle] = resultat
+                for nom in dependances:
+                    self._resultats_dependants.setdefault(nom, set()).add(cle)
+
+        self.dernier_resultat = resultat
+        return resultat
+
+    def valeur(self, nom: str, utiliser_degres=False) -> float:
+        """
+        Retourne la valeur d'une variable (recalculée si invalidée).
+
+        Raises:
+            ExpressionInvalideError: Si la variable n'est pas définie
+        """
+        cle = (nom, utiliser_degres)
+        if cle not in self._valeurs:
+            if nom not in self.variables:
+                raise ExpressionInvalideError(f"Variable inconnue :  '{nom}'")
+            definition = self.variables[nom]
+            self._valeurs[cle] = evaluer_rpn(definition.rpn, utiliser_degres, session=self)
+        return self._valeurs[cle]
+
+    #=========================================================================
+    # DÉFINITIONS
+    #=========================================================================
+
+    def _definir(self, tokens: list, utiliser_degres: bool):
+        """Enregistre « nom = expr » ou « nom(p1, p2) = expr »."""
+        position = tokens.index('=')
+        gauche, droite = tokens[:position], tokens[position + 1:]
+
+        if not droite:
+            raise ExpressionInvalideError("Définition sans expression après '='")
+
+        nom, parametres = self._analyser_entete(gauche)
+        rpn = polynomes.compiler(infix_to_rpn(droite))
+        dependances = _noms_libres(rpn) - set(parametres)
+
+        if nom in self._fermeture(dependances):
+            raise ExpressionInvalideError(f"Définition circulaire de '{nom}'")
+
+        # La valeur d'une variable est calculée (la structure du corps d'une
+        # fonction vérifiée) avant de remplacer l'ancienne définition : une
+        # erreur laisse la session intacte
+        definition = Definition(nom, parametres, rpn, dependances)
+        if parametres:
+            canonique.canoniser(rpn)  # « q(x) = x + » : opérande manquant
+        else:
+            valeur = evaluer_rpn(rpn, utiliser_degres, session=self)
+
+        self._oublier(nom)
+        self._invalider(nom)
+        for dependance in dependances:
+            self._dependants.setdefault(dependance, set()).add(nom)
+
+        if parametres:
+            self.fonctions[nom] = definition
+            return None
+
+        self.variables[nom] = definition
+        self._valeurs[(nom, utiliser_degres)] = valeur
+        self.dernier_resultat = valeur
+        return valeur
+
+    def _analyser_entete(self, gauche: list) -> tuple:
+        """Lit « nom » ou « nom(p1, p2, ...) » à gauche du '='."""
+        if not gauche or not _est_nom(gauche[0]):
+            raise ExpressionInvalideError("Définition invalide - nom attendu avant '='")
+
+        nom = gauche[0]
+        if nom in NOMS_RESERVES:
+            raise ExpressionInvalideError(f"'{nom}' est un nom réservé")
+
+        if len(gauche) == 1:
+            return nom, []
+
+        # nom ( p1 , p2 , ... )
+        if len(gauche) < 4 or gauche[1] != '(' or gauche[-1] != ')':
+            raise ExpressionInvalideError(f"Définition invalide de '{nom}'")
+
+        parametres = gauche[2:-1:2]
+        separateurs = gauche[3:-1:2]
+        if any(s != ',' for s in separateurs) or not all(_est_nom(p) for p in parametres):
+            raise ExpressionInvalideError(f"Paramètres invalides pour '{nom}'")
+        if len(set(parametres)) != len(parametres):
+            raise ExpressionInvalideError(f"Paramètre répété dans '{nom}'")
+        for parametre in parametres:
+            if parametre in NOMS_RESERVES:
+                raise ExpressionInvalideError(f"'{parametre}' est un nom réservé")
+
+        return nom, parametres
+
+    def _oublier(self, nom: str):
+        """Retire l'ancienne définition de nom du graphe."""
+        ancienne = self.variables.pop(nom, None) or self.fonctions.pop(nom, None)
+        if ancienne is not None:
+            for dependance in ancienne.dependances:
+                self._dependants.get(dependance, set()).discard(nom)
+
+    def _invalider(self, nom: str):
+        """Invalide les valeurs et résultats qui dépendent (transitivement) de nom."""
+        a_invalider = [nom]
+        vus = {nom}
+        while a_invalider:
+            courant = a_invalider.pop()
+            self._valeurs.pop((courant, False), None)
+            self._valeurs.pop((courant, True), None)
+            for cle in self._resultats_dependants.pop(courant, ()):
+                self._resultats.pop(cle, None)
+            for dependant in self._dependants.get(courant, ()):
+                if dependant not in vus:
+                    vus.add(dependant)
+                    a_invalider.append(dependant)
+
+    #=========================================================================
+    # ÉVALUATION
+    #=========================================================================
+
+    def _vider_caches(self):
+        """Oublie les valeurs et résultats calculés (changement de mode)."""
+        self._valeurs.clear()
+        self._resultats.clear()
+        self._resultats_dependants.clear()
+
+    def _est_pur(self, programme: tuple) -> bool:
+        """Résultat partageable par le memo : ni nom, ni ANS (ni tirage, qui est un nom)."""
+        _, dependances, utilise_ans = programme
+        return self.memo is not None and not dependances and not utilise_ans
+
+    def _evaluer_pur(self, rpn: list, utiliser_degres: bool):
+        """Résultat d'une expression pure, par le memo."""
+        from src.memo import moteur
+        cle = self.memo.cle(rpn, utiliser_degres, moteur(self._mode_complexe, self._mode_programmeur))
+        if cle is None:
+            return None
+        resultat = self.memo.obtenir(cle)
+        if resultat is None:
+            resultat = evaluer_rpn(rpn, utiliser_degres, session=self)
+            self.memo.ajouter(cle, resultat)
+        return resultat
+
+    def _compiler(self, expression: str, rpn: list) -> tuple:
+        """Mémorise une expression compilée, avec ses noms libres."""
+        if expression not in self._programmes:
+            if self.taille_cache is not None and len(self._programmes) >= self.taille_cache:
+                self._oublier_programme(next(iter(self._programmes)))
+            noms = _noms_libres(rpn)
+            utilise_ans = 'ANS' in noms
+            noms.discard('ANS')
+            self._programmes[expression] = (rpn, noms, utilise_ans)
+        return self._programmes[expression]
+
+    def _oublier_programme(self, expression: str):
+        """Retire une expression compilée et ses résultats des caches."""
+        _, noms, _ = self._programmes.pop(expression)
+        for cle in ((expression, False), (expression, True)):
+            if self._resultats.pop(cle, None) is not None:
+                for nom in noms:
+                    self._resultats_dependants.get(nom, set()).discard(cle)
+
+    def _fermeture(self, noms: set) -> set:
+        """Noms atteints depuis noms en suivant les définitions."""
+        atteints = set()
+        a_visiter = list(noms)
+        while a_visiter:
+            nom = a_visiter.pop()
+            if nom in atteints:
+                continue
+            atteints.add(nom)
+            definition = self.variables.get(nom) or self.fonctions.get(nom)
+            if definition is not None:
+                a_visiter.extend(definition.dependances)
+        return atteints
+
+
+#=============================================================================
+# FONCTIONS UTILITAIRES
+#=============================================================================
+
+def _est_nom(token) -> bool:
+    """Vérifie si un token est un nom (variable, fonction ou paramètre)."""
+    return isinstance(token, str) and token.isalpha()
+
+
+def _noms_libres(rpn: list) -> set:
+    """
+    Collecte les noms utilisés par une RPN (variables et fonctions appelées).
+
+    Les sous-programmes (arguments différés) sont parcourus aussi.
+    """
+    noms = set()
+    for token in rpn:
+        if isinstance(token, list):
+            noms |= _noms_libres(token)
+        elif isinstance(token, Polynome):
+            noms |= _noms_libres(token.rpn)
+        elif isinstance(token, str) and SEPARATEUR_ARITE in token:
+            nom = token.split(SEPARATEUR_ARITE)[0]
+            if (nom not in FONCTIONS_VARIADIQUES and nom not in FONCTIONS_PAR_MORCEAUX
+                    and nom != LITTERAL_TABLEAU):
+                noms.add(nom)
+        # ANS et les tirages sont gardés : un résultat qui les utilise
+        # n'est jamais mis en cache
+        elif _est_nom(token) and (token == 'ANS' or token in FONCTIONS_ALEATOIRES
+                                  or token not in NOMS_RESERVES):
+            noms.add(token)
+    return noms
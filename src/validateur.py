@@ -29,6 +29,19 @@ VERSION 3.0 - NOUVEAUTÉS :
     - Support des constantes PI, E, ANS
     - Validation des noms de fonctions trigonométriques en degrés
 
+VERSION 4.0 - NOUVEAUTÉS :
+--------------------------
+    - Fonctions statistiques : sum, mean, var, stdev, median
+    - Somme et produit indicés : sigma(expr, k, a, b), prod(expr, k, a, b)
+    - Comparaisons (<, >, <=, >=, ==, !=), if(c, a, b) et piecewise(...)
+    - Nombres complexes : re, im, arg, conj
+    - Matrices [[1,2],[3,4]] : crochets équilibrés, det, transpose, dot, solve
+    - Arithmétique : gcd, lcm, powmod, isprime, factor, nCr, nPr, fact
+    - Encadrement garanti : bounds(expr, x, a, b)
+    - Racines d'un polynôme : roots(expr)
+    - Aléatoire : rand(), randn(), randint(a, b), mc(expr, n) ; les
+      parenthèses vides sont permises après rand et randn
+
 ================================================================================
 """
 
@@ -79,7 +92,8 @@ class Validateur:
         # Chiffres, opérateurs, parenthèses, point, virgule, espace
         # + lettres minuscules pour les noms de fonctions (sqrt, sin, etc.)
         # Accent circonflexe pour la puissance ^
-        self.caracteres_autorises = "0123456789+-*/%^()., abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        # Version 4.0 : comparaisons < > = ! et crochets des matrices [ ]
+        self.caracteres_autorises = "0123456789+-*/%^()., abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ<>=![]"
         
         # =====================================================================
         # OPÉRATEURS RECONNUS
@@ -116,8 +130,29 @@ class Validateur:
             # Autres
             'inv', 'sqr',
             # Min/Max
-            'min', 'max'
+            'min', 'max',
+            # Statistiques (nombre variable d'arguments)
+            'sum', 'mean', 'var', 'stdev', 'median',
+            # Somme et produit indicés
+            'sigma', 'prod',
+            # Conditions
+            'if', 'piecewise',
+            # Nombres complexes
+            're', 'im', 'arg', 'conj',
+            # Matrices
+            'det', 'transpose', 'dot', 'solve',
+            # Arithmétique des entiers
+            'gcd', 'lcm', 'powmod', 'isprime', 'factor', 'ncr', 'npr', 'fact',
+            # Encadrement garanti
+            'bounds',
+            # Racines d'un polynôme
+            'roots',
+            # Aléatoire et Monte-Carlo
+            'rand', 'randn', 'randint', 'mc'
         }
+        
+        # Fonctions appelées sans argument : rand() n'a pas de parenthèses vides
+        self.fonctions_sans_argument = {'rand', 'randn'}
     
     def valider_expression(self, expression: str) -> Tuple[bool, str]: 
         """
@@ -158,11 +193,9 @@ class Validateur:
             if not expression or expression.strip() == "":
                 raise ExpressionVideError()
             
-            # =================================================================
-            # NORMALISATION
-            # =================================================================
-            # Remplacer les virgules par des points pour les décimaux
-            expression_norm = expression.replace(',', '.')
+            # La virgule sépare les arguments ("min(1, 2, 3)") et les éléments
+            # de matrice ("[1, 2, 3]") : ce n'est jamais une virgule décimale
+            expression_norm = expression
             
             # =================================================================
             # TEST 2 : Caractères invalides
@@ -224,6 +257,8 @@ class Validateur:
             - ')' sans '(' correspondante
             - '(' sans ')' correspondante
             - Parenthèses vides "()"
+            - Crochets de matrice mal appariés ("[1, 2)", "[]")
+            - Virgule hors de parenthèses ou de crochets ("1,5")
         
         Args: 
             expression: L'expression à valider
@@ -231,7 +266,8 @@ class Validateur:
         Raises: 
             ParenthesesError:  Si les parenthèses ne sont pas équilibrées
         """
-        pile = []  # Pile pour stocker les positions des '('
+        pile = []  # Pile pour stocker les positions des '(' et '['
+        crochets = []  # Pile pour stocker les positions des '[' (matrices)
         
         for i, char in enumerate(expression):
             if char == '(':
@@ -240,7 +276,7 @@ class Validateur:
                 
             elif char == ')':
                 # Vérifier qu'il y a une ouvrante correspondante
-                if not pile:
+                if not pile or expression[pile[-1]] == '[':
                     raise ParenthesesError(
                         f"Parenthèse fermante ')' sans ouvrante à la position {i}"
                     )
@@ -250,10 +286,36 @@ class Validateur:
                 # Vérifier que les parenthèses ne sont pas vides
                 # On extrait le contenu entre ( et ) et on vérifie qu'il n'est pas vide
                 contenu = expression[position_ouvrante + 1:i].strip()
-                if not contenu:
+                nom = re.search(r'[a-zA-Z]*$', expression[:position_ouvrante].rstrip()).group()
+                if not contenu and nom.lower() not in self.fonctions_sans_argument:
                     raise ParenthesesError(
                         f"Parenthèses vides '()' à la position {position_ouvrante}"
                     )
+            
+            elif char == '[':
+                pile.append(i)
+                crochets.append(i)
+            
+            elif char == ']':
+                if not pile or expression[pile[-1]] != '[':
+                    raise ParenthesesError(
+                        f"Crochet fermant ']' sans ouvrant à la position {i}"
+                    )
+                position_ouvrante = pile.pop()
+                crochets.pop()
+                if not expression[position_ouvrante + 1:i].strip():
+                    raise ParenthesesError(
+                        f"Matrice vide '[]' à la position {position_ouvrante}"
+                    )
+        
+            elif char == ',' and not pile:
+                raise ParenthesesError(
+                    f"Virgule ',' hors d'un appel de fonction ou d'une matrice "
+                    f"à la position {i} (le séparateur décimal est le point)"
+                )
+        
+        if crochets:
+            raise ParenthesesError("Crochet fermant ']' manquant")
         
         # Vérifier qu'il ne reste pas de '(' non fermées
         if pile:
@@ -345,14 +407,11 @@ class Validateur:
         # =====================================================================
         # Vérifier qu'il n'y a pas de *, /, % ou ^ au début (+ et - sont OK)
         # =====================================================================
-        # On ignore les lettres au début (fonctions comme sqrt, sin, etc.)
-        premier_non_lettre = 0
-        while premier_non_lettre < len(expr_clean) and expr_clean[premier_non_lettre].isalpha():
-            premier_non_lettre += 1
-        
-        if premier_non_lettre < len(expr_clean) and expr_clean[premier_non_lettre] in "*/%^":
+        # Un nom en tête est un opérande ("a*2", "PI*2") ou une fonction
+        # suivie de '(' ("sqrt(4)") : seul le premier caractère compte
+        if expr_clean[0] in "*/%^":
             raise OperateurError(
-                f"Opérateur '{expr_clean[premier_non_lettre]}' invalide en début d'expression"
+                f"Opérateur '{expr_clean[0]}' invalide en début d'expression"
             )
     
     def _valider_nombres(self, expression: str) -> None:
@@ -378,11 +437,11 @@ class Validateur:
         
         # Séparer par opérateurs, parenthèses et virgules pour isoler les nombres
         # Le regex capture les séparateurs pour ne pas les perdre
-        tokens = re.split(r'([+\-*/%^(),])', expr_clean)
+        tokens = re.split(r'([+\-*/%^(),<>=!\[\]])', expr_clean)
         
         for token in tokens:
             # Ignorer les tokens vides, opérateurs, parenthèses, virgules
-            if not token or token in '+-*/%^(),':
+            if not token or token in '+-*/%^(),<>=![]':
                 continue
             
             # Ignorer les fonctions et constantes
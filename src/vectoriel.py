@@ -0,0 +1,535 @@
+# src/vectoriel.py
+"""
+================================================================================
+Module d'évaluation vectorisée (NumPy) - VERSION 4.0
+================================================================================
+
+Évalue une expression déjà compilée en RPN sur des TABLEAUX de valeurs
+d'un seul coup, au lieu d'appeler evaluer_rpn() pour chaque valeur.
+
+Exemple : calculer sigma(k^2, k, 1, 1000) revient à évaluer "k^2" pour
+k = [1, 2, ..., 1000] en une seule opération NumPy.
+
+DIFFÉRENCES AVEC evaluer_rpn :
+------------------------------
+    - Les erreurs de domaine (sqrt(-1), ln(0), 1/0, tan(π/2)) ne lèvent pas
+      d'exception : l'élément concerné vaut NaN. L'appelant peut repasser
+      par evaluer_rpn pour obtenir le message d'erreur exact.
+    - Les noyaux sont ceux de NumPy : les résultats peuvent différer de
+      quelques ULP de ceux des séries de Taylor de src.calculateur.
+    - if() et piecewise() sont évalués par masques : chaque branche n'est
+      calculée que sur les éléments qui la choisissent.
+    - Les fonctions de l'utilisateur (src.session) reçoivent des tableaux
+      comme arguments.
+    - Les fonctions de src.arithmetique (isprime, fact, gcd...) sont
+      appliquées élément par élément en Python (np.frompyfunc) : exactes,
+      mais sans gain de vitesse.
+    - rand(), randn() et randint(a, b) renvoient un tirage par élément
+      (générateur NumPy de la session, voir src.aleatoire).
+
+NumPy est OPTIONNEL : si absent, NUMPY_DISPONIBLE vaut False et les
+appelants utilisent l'évaluation scalaire classique.
+
+================================================================================
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from src.calculateur import (
+    PI, E, SEPARATEUR_ARITE, FONCTIONS_VARIADIQUES, ARITES_FIXES, FONCTIONS_ARITHMETIQUES,
+    est_nombre, valeur_nombre, nom_variable, obtenir_dernier_resultat, evaluer_rpn,
+    TAILLE_BLOC_INDICE,
+)
+from src.exceptions import CalculatriceError, ExpressionInvalideError, ArgumentFonctionError
+from src import arithmetique, aleatoire
+from src.polynomes import Polynome, horner
+
+
+NUMPY_DISPONIBLE = np is not None
+
+# Variable cachée (jamais un nom de l'utilisateur : '#' n'est pas une
+# lettre) qui donne leur forme aux tirages quand l'expression n'a pas de
+# variable : mc(rand()^2, n) évalue un lot de tirages d'un coup
+TIRAGES = '#tirages'
+
+
+#=============================================================================
+# FONCTION PRINCIPALE
+#=============================================================================
+
+def evaluer_rpn_vectoriel(rpn: list, variables=None, utiliser_degres=False, session=None):
+    """
+    Évalue une RPN sur des tableaux NumPy (valeur par valeur, en parallèle).
+
+    Args:
+        rpn: Liste de tokens en notation RPN (sortie de infix_to_rpn)
+        variables: Dictionnaire {nom: tableau ou nombre}
+        utiliser_degres: Mode angulaire (comme evaluer_rpn)
+        session: Session optionnelle (fonctions de l'utilisateur, ANS)
+
+    Returns:
+        numpy.ndarray: Résultats, de la forme commune des variables
+                       (NaN là où le calcul scalaire lèverait une erreur)
+
+    Raises:
+        ExpressionInvalideError: Si l'expression est mal formée
+
+    Examples:
+        >>> evaluer_rpn_vectoriel(['x', '2', '*'], {'x': np.array([1.0, 2.0])})
+        array([2., 4.])
+    """
+    if not NUMPY_DISPONIBLE:
+        raise ImportError("NumPy est nécessaire pour l'évaluation vectorisée")
+
+    variables = {
+        nom: np.asarray(valeur, dtype=float)
+        for nom, valeur in (variables or {}).items()
+    }
+    forme = np.broadcast_shapes(*(v.shape for v in variables.values()))
+
+    with np.errstate(all='ignore'):
+        resultat = _evaluer(rpn, variables, utiliser_degres, session)
+
+    return np.broadcast_to(np.asarray(resultat, dtype=float), forme)
+
+
+def _evaluer(rpn: list, variables: dict, utiliser_degres: bool, session):
+    """Boucle d'évaluation (appelée sous np.errstate)."""
+    stack = []
+
+    for token in rpn:
+        # Sous-programme (argument différé)
+        if isinstance(token, list):
+            stack.append(token)
+
+        # Polynôme compilé : schéma de Horner, élément par élément
+        elif isinstance(token, Polynome):
+            x = _evaluer([token.variable], variables, utiliser_degres, session)
+            stack.append(horner(token.coefficients, x))
+
+        # Nombre
+        elif est_nombre(token):
+            stack.append(np.float64(valeur_nombre(token)))
+
+        # Constantes
+        elif token == 'PI':
+            stack.append(np.float64(PI))
+        elif token == 'E':
+            stack.append(np.float64(E))
+        elif token == 'ANS':
+            if session is not None:
+                stack.append(np.float64(session.dernier_resultat))
+            else:
+                stack.append(np.float64(obtenir_dernier_resultat()))
+
+        # Opérateurs binaires
+        elif token in _BINAIRES:
+            if len(stack) < 2:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(_BINAIRES[token](a, b))
+
+        # Fonctions unaires
+        elif token in _UNAIRES:
+            if len(stack) < 1:
+                raise ExpressionInvalideError(f"Fonction {token}() sans argument")
+            stack.append(_UNAIRES[token](stack.pop()))
+
+        # Arithmétique à plusieurs arguments : powmod, nCr, nPr
+        elif token in FONCTIONS_ARITHMETIQUES:
+            nb_arguments = ARITES_FIXES[token]
+            if len(stack) < nb_arguments:
+                raise ArgumentFonctionError(token, f"nécessite {nb_arguments} arguments")
+            debut = len(stack) - nb_arguments
+            arguments = stack[debut:]
+            del stack[debut:]
+            stack.append(_arithmetique(token)(*arguments))
+
+        # Tirages aléatoires : un par élément
+        elif token in ('rand', 'randn'):
+            stack.append(aleatoire.tirages(token, _forme(variables), session))
+        elif token == 'randint':
+            if len(stack) < 2:
+                raise ArgumentFonctionError(token, "nécessite 2 arguments")
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(aleatoire.entiers_aleatoires(a, b, _forme(variables), session))
+
+        # Condition : chaque branche sur son sous-ensemble d'éléments
+        elif token == 'if':
+            if len(stack) < 3:
+                raise ArgumentFonctionError(token, "nécessite 3 arguments (condition, si_vrai, si_faux)")
+            si_faux = stack.pop()
+            si_vrai = stack.pop()
+            condition = stack.pop()
+            stack.append(_par_morceaux([condition, si_vrai, si_faux], variables, utiliser_degres, session))
+
+        # Fonction par morceaux
+        elif isinstance(token, str) and token.startswith('piecewise' + SEPARATEUR_ARITE):
+            nb_arguments = int(token.split(SEPARATEUR_ARITE)[1])
+            if nb_arguments < 1:
+                raise ArgumentFonctionError('piecewise', "nécessite au moins 1 argument")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            debut = len(stack) - nb_arguments
+            morceaux = stack[debut:]
+            del stack[debut:]
+            stack.append(_par_morceaux(morceaux, variables, utiliser_degres, session))
+
+        # Fonction de l'utilisateur
+        elif (isinstance(token, str) and SEPARATEUR_ARITE in token
+                and token.split(SEPARATEUR_ARITE)[0] not in FONCTIONS_VARIADIQUES):
+            nom, arite = token.split(SEPARATEUR_ARITE)
+            nb_arguments = int(arite)
+            if session is None or nom not in session.fonctions:
+                raise ExpressionInvalideError(f"Fonction inconnue :  '{nom}'")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            definition = session.fonctions[nom]
+            if nb_arguments != len(definition.parametres):
+                attendus = len(definition.parametres)
+                raise ArgumentFonctionError(
+                    nom, f"attend exactement {attendus} argument{'s' if attendus > 1 else ''}"
+                )
+            debut = len(stack) - nb_arguments
+            variables_locales = dict(variables)
+            variables_locales.update(zip(definition.parametres, stack[debut:]))
+            del stack[debut:]
+            stack.append(_evaluer(definition.rpn, variables_locales, utiliser_degres, session))
+
+        # Fonctions variadiques
+        elif isinstance(token, str) and SEPARATEUR_ARITE in token:
+            nom, arite = token.split(SEPARATEUR_ARITE)
+            nb_arguments = int(arite)
+            if nom not in FONCTIONS_VARIADIQUES:
+                raise ExpressionInvalideError(f"Token inconnu :  '{token}'")
+            if nb_arguments < 1:
+                raise ArgumentFonctionError(nom, "nécessite au moins 1 argument")
+            if len(stack) < nb_arguments:
+                raise ExpressionInvalideError("Expression incomplète - opérandes manquants")
+            debut = len(stack) - nb_arguments
+            arguments = np.stack(np.broadcast_arrays(*stack[debut:]))
+            del stack[debut:]
+            stack.append(_VARIADIQUES[nom](arguments))
+
+        # Somme et produit indicés
+        elif token in ('sigma', 'prod'):
+            if len(stack) < 4:
+                raise ArgumentFonctionError(token, "nécessite 4 arguments (expr, k, a, b)")
+            fin = stack.pop()
+            debut = stack.pop()
+            indice = stack.pop()
+            corps = stack.pop()
+            stack.append(_indice(token, corps, indice, debut, fin, variables, utiliser_degres, session))
+
+        # Variables
+        elif token in variables:
+            stack.append(variables[token])
+        elif session is not None and token in session.variables:
+            stack.append(np.float64(session.valeur(token, utiliser_degres)))
+
+        elif isinstance(token, str) and token.isalpha():
+            raise ExpressionInvalideError(f"Variable inconnue :  '{token}'")
+
+        else:
+            raise ExpressionInvalideError(f"Token inconnu :  '{token}'")
+
+    if len(stack) != 1 or isinstance(stack[0], list):
+        raise ExpressionInvalideError("Expression invalide - vérifiez la syntaxe")
+
+    return stack[0]
+
+
+def evaluer_points(rpn: list, variable: str, valeurs, utiliser_degres=False, session=None) -> list:
+    """
+    Évalue une RPN pour chaque valeur d'une variable (ex: points d'un graphique).
+
+    Utilise NumPy si disponible, sinon boucle sur evaluer_rpn (la RPN n'est
+    jamais re-tokenisée). Fonctionne donc avec ou sans NumPy.
+
+    Args:
+        rpn: Expression compilée
+        variable: Nom de la variable (ex: 'x')
+        valeurs: Liste des valeurs de la variable
+        utiliser_degres: Mode angulaire
+        session: Session optionnelle (fonctions de l'utilisateur, ANS)
+
+    Returns:
+        list: Un float par valeur (NaN quand le calcul est impossible)
+    """
+    if NUMPY_DISPONIBLE:
+        return evaluer_rpn_vectoriel(rpn, {variable: valeurs}, utiliser_degres, session).tolist()
+
+    resultats = []
+    for valeur in valeurs:
+        try:
+            resultats.append(float(evaluer_rpn(rpn, utiliser_degres, {variable: valeur}, session)))
+        except (CalculatriceError, ArithmeticError, ValueError, TypeError):
+            resultats.append(float('nan'))
+    return resultats
+
+
+def _forme(variables: dict) -> tuple:
+    """Forme commune des variables (celle du résultat)."""
+    return np.broadcast_shapes(*(np.shape(v) for v in variables.values()))
+
+
+#=============================================================================
+# ÉVALUATION PAR MASQUES (if, piecewise)
+#=============================================================================
+
+def _par_morceaux(morceaux: list, variables: dict, utiliser_degres: bool, session):
+    """
+    Évalue [c1, v1, c2, v2, ..., (défaut)] par masques.
+
+    Chaque condition n'est calculée que sur les éléments encore sans
+    valeur, et chaque valeur uniquement sur les éléments qui la choisissent :
+    if(x>0, ln(x), 0) n'appelle jamais ln() sur les x négatifs.
+    """
+    forme = _forme(variables)
+    resultat = np.full(forme, np.nan)
+    restants = np.ones(forme, dtype=bool)  # Éléments encore sans valeur
+
+    def sur(masque, morceau):
+        # Évalue un morceau (déjà calculé ou sous-programme) sur les éléments du masque
+        if not isinstance(morceau, list):
+            return np.broadcast_to(morceau, forme)[masque]
+        sous_variables = {
+            nom: np.broadcast_to(valeur, forme)[masque]
+            for nom, valeur in variables.items()
+        }
+        return np.broadcast_to(
+            _evaluer(morceau, sous_variables, utiliser_degres, session),
+            np.shape(resultat[masque])
+        )
+
+    for i in range(0, len(morceaux) - 1, 2):
+        if not restants.any():
+            break
+        condition = np.zeros(forme, dtype=bool)
+        condition[restants] = sur(restants, morceaux[i]) != 0
+        if condition.any():
+            resultat[condition] = sur(condition, morceaux[i + 1])
+        restants &= ~condition
+
+    if len(morceaux) % 2 == 1 and restants.any():
+        resultat[restants] = sur(restants, morceaux[-1])
+
+    return resultat
+
+
+#=============================================================================
+# SOMME COMPENSÉE SUR TABLEAUX
+#=============================================================================
+
+def somme_compensee_tableau(valeurs, axe=0):
+    """
+    Somme compensée d'un tableau le long d'un axe.
+
+    Somme par paires (a[0]+a[1], a[2]+a[3], ...) répétée jusqu'à ce
+    qu'il ne reste qu'une ligne ; à chaque niveau, l'erreur d'arrondi
+    de chaque addition est récupérée exactement (algorithme TwoSum)
+    puis ajoutée à la fin. Chaque niveau est une seule opération NumPy.
+
+    Args:
+        valeurs: Tableau NumPy
+        axe: Axe de sommation
+
+    Returns:
+        numpy.ndarray ou float: La somme
+
+    Examples:
+        >>> somme_compensee_tableau(np.array([1e16, 1.0, -1e16]))
+        1.0
+    """
+    valeurs = np.moveaxis(np.asarray(valeurs, dtype=float), axe, 0)
+    if valeurs.shape[0] == 0:
+        return np.zeros(valeurs.shape[1:])
+
+    erreurs = np.zeros(valeurs.shape[1:])
+    while valeurs.shape[0] > 1:
+        if valeurs.shape[0] % 2 == 1:
+            # Nombre impair : on met de côté la dernière ligne
+            reste = valeurs[-1:]
+            valeurs = valeurs[:-1]
+        else:
+            reste = None
+
+        a = valeurs[0::2]
+        b = valeurs[1::2]
+        s = a + b
+        # TwoSum : (a + b) = s + erreur, exactement
+        bb = s - a
+        erreurs = erreurs + ((a - (s - bb)) + (b - bb)).sum(axis=0)
+
+        valeurs = s if reste is None else np.concatenate((s, reste))
+
+    return valeurs[0] + erreurs
+
+
+#=============================================================================
+# NOYAUX VECTORISÉS
+#=============================================================================
+# Chaque noyau reproduit le domaine de son équivalent scalaire :
+# là où la version scalaire lève une erreur, on renvoie NaN.
+
+def _masquer(valeurs, invalide):
+    """Remplace par NaN les éléments où `invalide` est vrai."""
+    return np.where(invalide, np.nan, valeurs)
+
+
+def _division(a, b):
+    return _masquer(a / b, b == 0)
+
+
+def _modulo(a, b):
+    return _masquer(np.mod(a, b), b == 0)
+
+
+def _puissance(base, exposant):
+    # Mêmes cas particuliers que calculateur.puissance()
+    resultat = np.power(base, exposant)
+    resultat = np.where(base == 0, 0.0, resultat)
+    return np.where(exposant == 0, 1.0, resultat)
+
+
+def _racine(x):
+    return _masquer(np.sqrt(x), x < 0)
+
+
+def _tangente(x):
+    return _masquer(np.tan(x), np.abs(np.cos(x)) < 1e-10)
+
+
+def _logarithme(x):
+    return _masquer(np.log(x), x <= 0)
+
+
+def _logarithme_base10(x):
+    return _masquer(np.log10(x), x <= 0)
+
+
+def _inverse(x):
+    return _masquer(1.0 / x, x == 0)
+
+
+def _variance(arguments):
+    if arguments.shape[0] < 2:
+        raise ArgumentFonctionError('var', "nécessite au moins 2 arguments")
+    return arguments.var(axis=0, ddof=1)
+
+
+def _ecart_type(arguments):
+    if arguments.shape[0] < 2:
+        raise ArgumentFonctionError('stdev', "nécessite au moins 2 arguments")
+    return arguments.std(axis=0, ddof=1)
+
+
+def _arithmetique(nom, variadique=False):
+    """
+    Fonction de src.arithmetique élément par élément (NaN si indéfinie ou
+    trop grande pour un float, comme fact(200)).
+    """
+    def element(*arguments):
+        try:
+            if variadique:
+                return float(arithmetique.variadique(nom, arguments))
+            return float(arithmetique.fonction(nom, *arguments))
+        except (CalculatriceError, OverflowError):
+            return np.nan
+
+    def appliquer(*tableaux):
+        return np.asarray(np.frompyfunc(element, len(tableaux), 1)(*tableaux), dtype=float)
+
+    return appliquer
+
+
+def _indice(fonction, corps, indice, debut, fin, variables, utiliser_degres, session):
+    """
+    sigma/prod vectorisés : k prend toutes ses valeurs sur un axe
+    supplémentaire, puis on somme (ou multiplie) le long de cet axe.
+    """
+    nom = nom_variable(fonction, indice)
+    if np.ndim(debut) or np.ndim(fin):
+        raise ArgumentFonctionError(fonction, "les bornes doivent être constantes")
+    if debut != int(debut) or fin != int(fin):
+        raise ArgumentFonctionError(fonction, "les bornes doivent être entières")
+
+    forme = np.broadcast_shapes(*(np.shape(v) for v in variables.values()))
+
+    # Par blocs d'environ TAILLE_BLOC_INDICE termes : (valeurs de k) x forme
+    taille_bloc = max(1, TAILLE_BLOC_INDICE // max(1, int(np.prod(forme))))
+    variables_locales = dict(variables)
+    sommes = []
+    produit = np.ones(forme)
+    for bloc in range(int(debut), int(fin) + 1, taille_bloc):
+        k = np.arange(bloc, min(bloc + taille_bloc, int(fin) + 1), dtype=float)
+        variables_locales[nom] = k.reshape(k.shape + (1,) * len(forme))
+        termes = np.broadcast_to(
+            _evaluer(corps, variables_locales, utiliser_degres, session),
+            k.shape + forme
+        )
+        if fonction == 'sigma':
+            sommes.append(somme_compensee_tableau(termes))
+        else:
+            produit = produit * termes.prod(axis=0)
+
+    if fonction == 'sigma':
+        return somme_compensee_tableau(np.reshape(sommes, (len(sommes),) + forme))
+    return produit
+
+
+_BINAIRES = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': _division,
+    '%': _modulo,
+    '^': _puissance,
+    '<': lambda a, b: np.less(a, b).astype(float),
+    '>': lambda a, b: np.greater(a, b).astype(float),
+    '<=': lambda a, b: np.less_equal(a, b).astype(float),
+    '>=': lambda a, b: np.greater_equal(a, b).astype(float),
+    '==': lambda a, b: np.equal(a, b).astype(float),
+    '!=': lambda a, b: np.not_equal(a, b).astype(float),
+}
+
+_UNAIRES = {
+    're': lambda x: x,
+    'im': lambda x: np.zeros_like(x),
+    'arg': lambda x: np.where(x < 0, PI, 0.0),
+    'conj': lambda x: x,
+    'sqrt': _racine,
+    'abs': lambda x: np.abs(x),
+    'sin': lambda x: np.sin(x),
+    'cos': lambda x: np.cos(x),
+    'tan': _tangente,
+    'sind': lambda x: np.sin(x * PI / 180.0),
+    'cosd': lambda x: np.cos(x * PI / 180.0),
+    'tand': lambda x: _tangente(x * PI / 180.0),
+    'ln': _logarithme,
+    'log': _logarithme_base10,
+    'exp': lambda x: np.exp(x),
+    'inv': _inverse,
+    'sqr': lambda x: x * x,
+    'isprime': _arithmetique('isprime'),
+    'factor': _arithmetique('factor'),
+    'fact': _arithmetique('fact'),
+    'UNARY_MINUS': lambda x: -x,
+}
+
+_VARIADIQUES = {
+    'min': lambda arguments: arguments.min(axis=0),
+    'max': lambda arguments: arguments.max(axis=0),
+    'sum': lambda arguments: somme_compensee_tableau(arguments),
+    'mean': lambda arguments: somme_compensee_tableau(arguments) / arguments.shape[0],
+    'var': _variance,
+    'stdev': _ecart_type,
+    'median': lambda arguments: np.median(arguments, axis=0),
+    'gcd': lambda arguments: _arithmetique('gcd', True)(*arguments),
+    'lcm': lambda arguments: _arithmetique('lcm', True)(*arguments),
+}
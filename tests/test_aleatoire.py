@@ -0,0 +1,93 @@
+"""
+Tests unitaires pour le module aleatoire (tirages et Monte-Carlo).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer, tokenize, infix_to_rpn
+from src.session import Session
+from src.validateur import Validateur
+from src.aleatoire import monte_carlo
+from src.exceptions import ArgumentFonctionError
+from src import matrices
+
+
+class TestAleatoire(unittest.TestCase):
+    """Tests des tirages aléatoires"""
+
+    def test_graine_par_session(self):
+        """Test même graine, mêmes tirages ; sessions indépendantes"""
+        a, b = Session(graine=42), Session(graine=42)
+        tirages = [a.calculer("rand()") for _ in range(3)]
+        self.assertEqual(tirages, [b.calculer("rand()") for _ in range(3)])
+        self.assertEqual(len(set(tirages)), 3)  # Jamais mis en cache
+        a.graine = 42
+        self.assertEqual(a.calculer("rand()"), tirages[0])
+
+    def test_tirages(self):
+        """Test rand dans [0, 1[, randint dans [a, b]"""
+        session = Session(graine=1)
+        for _ in range(200):
+            self.assertTrue(0 <= session.calculer("rand()") < 1)
+            self.assertIn(session.calculer("randint(1, 6)"), range(1, 7))
+        self.assertIsInstance(session.calculer("randn()"), float)
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("randint(3, 1)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("randint(1.5, 3)")
+
+    def test_fonction_aleatoire_pas_en_cache(self):
+        """Test f(x) = x + rand() : f(1) change à chaque calcul"""
+        session = Session(graine=7)
+        session.calculer("f(x) = x + rand()")
+        self.assertNotEqual(session.calculer("f(1)"), session.calculer("f(1)"))
+
+    def test_validateur_parentheses_vides(self):
+        """Test rand() est valide, pas sin() ni ()"""
+        validateur = Validateur()
+        self.assertTrue(validateur.valider_expression("rand() + randn ()")[0])
+        self.assertFalse(validateur.valider_expression("sin()")[0])
+        self.assertFalse(validateur.valider_expression("2 + ()")[0])
+
+    @unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+    def test_monte_carlo(self):
+        """Test mc : moyenne et intervalle de confiance à 95 %"""
+        session = Session(graine=3)
+        moyenne, bas, haut = session.calculer("mc(rand()^2, 200000)")
+        self.assertLess(bas, moyenne)
+        self.assertLess(moyenne, haut)
+        self.assertLess(bas, 1 / 3)
+        self.assertLess(1 / 3, haut)
+        moyenne, bas, haut = session.calculer("mc(if(rand()^2 + rand()^2 < 1, 4, 0), 200000)")
+        self.assertLess(abs(moyenne - 3.14159), 0.03)
+        # Constante : intervalle de largeur nulle
+        self.assertEqual(list(calculer("mc(2, 10)")), [2.0, 2.0, 2.0])
+
+    def test_monte_carlo_par_lots_et_boucle(self):
+        """Test plusieurs lots (TAILLE_LOT), et boucle scalaire en mode complexe"""
+        corps = infix_to_rpn(tokenize("randint(1, 6)"))
+        for taille, session in [(150000, Session(graine=5)), (5000, Session(mode_complexe=True, graine=5))]:
+            moyenne, bas, haut = monte_carlo(corps, taille, session=session)
+            self.assertLess(abs(moyenne - 3.5), haut - bas)
+
+    @unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+    def test_monte_carlo_erreurs(self):
+        """Test n trop petit ou trop grand, expression non définie"""
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("mc(rand(), 1)")
+        for n in ("2^70", "10^8 + 1"):
+            with self.assertRaises(ArgumentFonctionError):
+                calculer(f"mc(rand(), {n})")
+        with self.assertRaises(ArgumentFonctionError):
+            Session(mode_programmeur=True).calculer("mc(rand(), 2^70)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("mc(ln(rand() - 0.5), 1000)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests unitaires pour le module arithmetique (théorie des nombres).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer
+from src.session import Session
+from src.arithmetique import est_premier, factoriser, factorielle, combinaisons
+from src.exceptions import ArgumentFonctionError, ModuloParZeroError
+
+
+class TestArithmetique(unittest.TestCase):
+    """Tests des fonctions sur entiers exacts"""
+
+    def test_pgcd_ppcm(self):
+        """Test gcd et lcm à plusieurs arguments"""
+        self.assertEqual(calculer("gcd(12, 18, 8)"), 2)
+        self.assertEqual(calculer("lcm(4, 6, 10)"), 60)
+        self.assertEqual(calculer("gcd(0, 5)"), 5)
+
+    def test_powmod(self):
+        """Test powmod exact, y compris inverse modulaire"""
+        self.assertEqual(calculer("powmod(2, 100, 1000000007)"), pow(2, 100, 1000000007))
+        self.assertEqual(calculer("powmod(3, -1, 7)"), 5)
+        with self.assertRaises(ModuloParZeroError):
+            calculer("powmod(2, 3, 0)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("powmod(2, -1, 4)")
+
+    def test_isprime(self):
+        """Test Miller-Rabin contre divisions d'essai, et grands premiers"""
+        premiers = [n for n in range(2000) if n > 1 and all(n % d for d in range(2, int(n ** 0.5) + 1))]
+        self.assertEqual([n for n in range(2000) if est_premier(n)], premiers)
+        self.assertTrue(est_premier(2 ** 61 - 1))
+        self.assertTrue(est_premier(2 ** 127 - 1))
+        self.assertFalse(est_premier(3215031751))  # Pseudo-premier fort en bases 2, 3, 5, 7
+        self.assertEqual(calculer("isprime(97) + isprime(91)"), 1)
+
+    def test_factor_semi_premier_20_chiffres(self):
+        """Test rho de Pollard sur un semi-premier de 20 chiffres"""
+        self.assertEqual(factoriser(10000000019 * 10000000033), {10000000019: 1, 10000000033: 1})
+        resultat = calculer("factor(100000000520000000627)")
+        self.assertEqual(str(resultat), "10000000019 * 10000000033")
+        self.assertEqual(resultat, 100000000520000000627)
+
+    def test_factor_affichage(self):
+        """Test factor vaut n dans les calculs et s'affiche factorisé"""
+        self.assertEqual(str(calculer("factor(360)")), "2^3 * 3^2 * 5")
+        self.assertEqual(calculer("factor(360) + 1"), 361)
+        self.assertEqual(Session().formater(calculer("factor(-12)")), "-2^2 * 3")
+
+    def test_factorielle(self):
+        """Test fact exacte, y compris fact(100000)"""
+        resultat = 1
+        for n in range(1, 60):
+            resultat *= n
+            self.assertEqual(factorielle(n), resultat)
+        grande = factorielle(100000)
+        self.assertEqual(grande % 10 ** 24999, 0)  # 24999 zéros finaux
+        self.assertNotEqual(grande % 10 ** 25000, 0)
+        self.assertEqual(calculer("fact(5) / fact(3)"), 20)
+
+    def test_combinaisons(self):
+        """Test nCr et nPr (noms insensibles à la casse)"""
+        self.assertEqual(calculer("nCr(52, 5)"), 2598960)
+        self.assertEqual(calculer("nPr(10, 3)"), 720)
+        self.assertEqual(calculer("ncr(3, 5)"), 0)
+        self.assertEqual(combinaisons(60, 30), 118264581564861424)
+
+    def test_grand_litteral_exact(self):
+        """Test un littéral au-delà de 2^53 reste un entier exact"""
+        self.assertEqual(calculer("isprime(18446744073709551557)"), 1)
+        self.assertIsInstance(calculer("9007199254740993"), int)
+        self.assertIsInstance(calculer("12"), float)
+
+    def test_arguments_invalides(self):
+        """Test argument non entier ou hors domaine"""
+        for expression in ["fact(-1)", "isprime(1.5)", "factor(0)", "nCr(-1, 2)"]:
+            with self.assertRaises(ArgumentFonctionError):
+                calculer(expression)
+
+    def test_float_inexact_refuse(self):
+        """Test 2^61 - 1 (float arrondi à 2^61) refusé, exact en mode programmeur"""
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("isprime(2^61 - 1)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("gcd(2^60, 6)")
+        self.assertEqual(calculer("isprime(2^31 - 1)"), 1)
+        self.assertEqual(Session(mode_programmeur=True).calculer("isprime(2^61 - 1)"), 1)
+
+    def test_dans_sigma(self):
+        """Test sigma(isprime(k)) : nombre de premiers <= 1000"""
+        self.assertEqual(calculer("sigma(isprime(k), k, 1, 1000)"), 168)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests unitaires pour le module balayage (tables de valeurs multi-processus).
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import matrices
+from src.exceptions import ExpressionInvalideError
+
+if matrices.NUMPY_DISPONIBLE:
+    import numpy as np
+    from src.balayage import balayer
+
+
+@unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+class TestBalayage(unittest.TestCase):
+    """Tests du balayage sur le produit cartésien des grilles"""
+
+    def setUp(self):
+        self.x = np.linspace(-2, 2, 301)
+        self.a = np.array([0.5, 1.0, 3.0])
+        self.attendu = self.a[None, :] * np.sin(self.x[:, None]) + self.x[:, None] ** 2
+
+    def test_produit_cartesien(self):
+        """Test un axe par grille, dans l'ordre du dictionnaire"""
+        table = balayer("a*sin(x) + x^2", {'x': self.x, 'a': self.a}, processus=1, taille_morceau=100)
+        self.assertEqual(table.shape, (301, 3))
+        np.testing.assert_allclose(table, self.attendu, rtol=1e-14)
+        table = balayer("a*sin(x) + x^2", {'a': self.a, 'x': self.x}, processus=1)
+        np.testing.assert_allclose(table, self.attendu.T, rtol=1e-14)
+
+    def test_processus(self):
+        """Test plusieurs processus écrivent la même table"""
+        table = balayer("a*sin(x) + x^2", {'x': self.x, 'a': self.a}, processus=2, taille_morceau=100)
+        np.testing.assert_allclose(table, self.attendu, rtol=1e-14)
+
+    def test_sortie_et_reprise(self):
+        """Test la table sur disque et la reprise des morceaux manquants"""
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = Path(dossier) / 'table.npy'
+            avancement = []
+            balayer("a*sin(x) + x^2", {'x': self.x, 'a': self.a}, sortie=sortie, processus=1,
+                    taille_morceau=100, progression=lambda fait, total: avancement.append((fait, total)))
+            self.assertEqual(avancement, [(k, 10) for k in range(1, 11)])
+            np.testing.assert_allclose(np.load(sortie), self.attendu, rtol=1e-14)
+
+            # Interruption simulée : deux morceaux non terminés
+            termines = np.load(Path(dossier) / 'table.progression.npy', mmap_mode='r+')
+            termines[[3, 7]] = False
+            termines.flush()
+            del termines
+            avancement.clear()
+            table = balayer("a*sin(x) + x^2", {'x': self.x, 'a': self.a}, sortie=sortie, reprendre=True,
+                            processus=1, taille_morceau=100,
+                            progression=lambda fait, total: avancement.append((fait, total)))
+            self.assertEqual(avancement, [(9, 10), (10, 10)])
+            self.assertIsInstance(table, np.memmap)
+            np.testing.assert_allclose(table, self.attendu, rtol=1e-14)
+
+            with self.assertRaises(ExpressionInvalideError):
+                balayer("x", {'x': self.x}, sortie=sortie, reprendre=True)
+
+    def test_reprise_d_un_autre_balayage(self):
+        """Test reprendre une table d'une autre expression ou d'autres grilles est refusé"""
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = Path(dossier) / 'table.npy'
+            grilles = {'x': [10, 20], 'a': [1, 2, 3]}
+            balayer("x + a", grilles, sortie=sortie, processus=1)
+            for expression, autres in (("x * a", grilles), ("x + a", {'x': [30, 40], 'a': [1, 2, 3]})):
+                with self.assertRaises(ExpressionInvalideError):
+                    balayer(expression, autres, sortie=sortie, processus=1, reprendre=True)
+            table = balayer("x * a", grilles, sortie=sortie, processus=1)
+            np.testing.assert_array_equal(table, [[10, 20, 30], [20, 40, 60]])
+
+    def test_erreurs(self):
+        """Test les erreurs sont levées avant de lancer les processus"""
+        with self.assertRaises(ExpressionInvalideError):
+            balayer("x + b", {'x': self.x}, processus=2)
+        with self.assertRaises(ExpressionInvalideError):
+            balayer("x", {'x': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests unitaires pour la suite de bancs de performance (benchmarks).
+"""
+
+import io
+import json
+import unittest
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import comparer, suite
+
+
+def mesure(bancs):
+    return {'version': suite.VERSION_FORMAT, 'environnement': {}, 'bancs': bancs}
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests des bancs et de la barrière de régression"""
+
+    def test_executer_sans_affichage(self):
+        """Les bancs s'exécutent sans interface et donnent un temps par répétition"""
+        resultats = suite.executer(r'analyse\.tokenize|historique\.ajouter\.10$|graphique',
+                                   repetitions=3, duree_min=0.001)
+        self.assertEqual(set(resultats['bancs']), {
+            'analyse.tokenize', 'historique.ajouter.10',
+            'graphique.abscisses_adaptatives', 'graphique.evaluer_points',
+        })
+        for banc in resultats['bancs'].values():
+            self.assertEqual(len(banc['temps']), 3)
+            self.assertTrue(all(temps > 0 for temps in banc['temps']))
+        self.assertNotIn('tkinter', sys.modules)
+        json.dumps(resultats)
+
+    def test_noms_des_bancs(self):
+        """Chaque noyau et chaque taille d'historique a son banc"""
+        for nom in ('noyau.exponentielle', 'noyau.mediane', 'analyse.evaluer_rpn',
+                    'validateur.valider_expression', 'fractions.decimal_vers_fraction',
+                    'historique.ajouter.10000', 'historique.ajouter.1000000'):
+            self.assertIn(nom, suite.BANCS)
+        if suite.NUMPY_DISPONIBLE:
+            self.assertIn('tableaux.vectoriel', suite.BANCS)
+            self.assertIn('tableaux.blocs', suite.BANCS)
+
+    def test_mann_whitney(self):
+        """Séries séparées : p petit dans le bon sens seulement ; séries égales : p = 1"""
+        self.assertLess(comparer.mann_whitney([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]), 0.01)
+        self.assertGreater(comparer.mann_whitney([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]), 0.99)
+        self.assertEqual(comparer.mann_whitney([1, 1, 1], [1, 1, 1]), 1.0)
+
+    def test_verdicts_et_code_de_sortie(self):
+        """Régression significative et importante : code de sortie 1"""
+        bruit = [1.00, 1.01, 0.99, 1.02, 0.98, 1.00, 1.01, 0.99]
+        reference = mesure({
+            'lent': {'temps': bruit}, 'rapide': {'temps': bruit},
+            'infime': {'temps': bruit}, 'retire': {'temps': bruit},
+        })
+        actuel = mesure({
+            'lent': {'temps': [t * 1.5 for t in bruit]},
+            'rapide': {'temps': [t * 0.5 for t in bruit]},
+            'infime': {'temps': [t + 0.03 for t in bruit]},  # Certain, mais 3 %
+            'ajoute': {'temps': bruit},
+        })
+        verdicts = {ligne['nom']: ligne['verdict'] for ligne in comparer.comparer(reference, actuel)}
+        self.assertEqual(verdicts, {'lent': 'regression', 'rapide': 'amelioration', 'infime': 'stable',
+                                    'retire': 'absent', 'ajoute': 'nouveau'})
+
+        with tempfile.TemporaryDirectory() as dossier:
+            fichiers = []
+            for nom, contenu in (('reference', reference), ('actuel', actuel)):
+                fichiers.append(str(Path(dossier) / f'{nom}.json'))
+                Path(fichiers[-1]).write_text(json.dumps(contenu), encoding='utf-8')
+            sortie = io.StringIO()
+            with redirect_stdout(sortie):
+                self.assertEqual(comparer.main(fichiers), 1)
+                self.assertEqual(comparer.main([fichiers[0], fichiers[0]]), 0)
+        self.assertIn('RÉGRESSION', sortie.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests unitaires pour le module blocs (évaluation par blocs).
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import tokenize, infix_to_rpn
+from src.session import Session
+from src.polynomes import compiler
+from src.exceptions import ExpressionInvalideError
+from src import vectoriel
+
+if vectoriel.NUMPY_DISPONIBLE:
+    import numpy as np
+    from src.blocs import evaluer_par_blocs, _compiler
+
+
+def rpn(expression):
+    return compiler(infix_to_rpn(tokenize(expression)))
+
+
+@unittest.skipUnless(vectoriel.NUMPY_DISPONIBLE, "NumPy non installé")
+class TestBlocs(unittest.TestCase):
+    """Tests de l'évaluation par blocs"""
+
+    def verifier(self, expression, taille_bloc=1000, **variables):
+        """Mêmes résultats (y compris NaN) que evaluer_rpn_vectoriel."""
+        attendu = vectoriel.evaluer_rpn_vectoriel(rpn(expression), variables)
+        obtenu = evaluer_par_blocs(rpn(expression), variables, taille_bloc=taille_bloc)
+        self.assertTrue(np.array_equal(attendu, obtenu, equal_nan=True), expression)
+
+    def test_identique_au_vectoriel(self):
+        """Test tous les noyaux en place, dernier bloc incomplet compris"""
+        x = np.linspace(-4, 4, 10001)
+        for expression in [
+            "x^3 - 2*x + 1", "sin(x)*exp(-x^2/2) + sqrt(abs(x))", "ln(x) + log(x) - 1/x",
+            "tan(x) + tand(x) + sind(x) - cosd(x)", "x % 1.5 + (x > 0.5) + (x == 0)",
+            "x^0.5 + 0^x + x^0 + inv(x - 1)", "arg(x) + re(x) + im(x) + conj(x) - sqr(-x)",
+        ]:
+            self.verifier(expression, x=x)
+
+    def test_constantes_calculees_d_avance(self):
+        """Test les opérations sur des constantes ne sont pas des instructions"""
+        instructions, profondeur, resultat = _compiler(rpn("x + 2*PI + sqrt(4)"), {'x': np.zeros(3)}, {}, None)
+        self.assertEqual(len(instructions), 2)  # Les deux '+' ; '*' et sqrt sont calculés
+        self.verifier("a*x + sqrt(a)", x=np.arange(5.0), a=4.0)
+
+    def test_repli_sans_noyau_en_place(self):
+        """Test if, sigma et fonctions de l'utilisateur : bloc par bloc aussi"""
+        x = np.linspace(-2, 2, 2501)
+        self.verifier("if(x > 0, ln(x), 0) + sigma(k*x, k, 1, 3)", x=x)
+        session = Session()
+        session.calculer("f(t) = t^2 + 1")
+        resultat = evaluer_par_blocs(rpn("f(x) / 2"), {'x': x}, taille_bloc=100, session=session)
+        self.assertTrue(np.allclose(resultat, (x ** 2 + 1) / 2))
+
+    def test_sortie_memmap(self):
+        """Test écriture dans un np.memmap fourni par l'appelant"""
+        x = np.linspace(0, 1, 50000)
+        with tempfile.TemporaryDirectory() as dossier:
+            y = np.lib.format.open_memmap(str(Path(dossier) / 'y.npy'), mode='w+', shape=x.shape)
+            self.assertIs(evaluer_par_blocs(rpn("x^2 + 1"), {'x': x}, sortie=y), y)
+            y.flush()
+            relu = np.load(str(Path(dossier) / 'y.npy'))
+            self.assertTrue(np.allclose(relu, x ** 2 + 1))
+            del y, relu
+
+    def test_longueurs_differentes(self):
+        """Test tableaux de longueurs différentes refusés"""
+        with self.assertRaises(ExpressionInvalideError):
+            evaluer_par_blocs(rpn("x + y"), {'x': np.zeros(3), 'y': np.zeros(4)})
+        with self.assertRaises(ExpressionInvalideError):
+            evaluer_par_blocs(rpn("x"), {'x': np.zeros(3)}, sortie=np.zeros(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests unitaires pour le module cache_rpn (cache disque des expressions compilées).
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import cache_rpn
+from src.cache_rpn import CacheRPN
+from src.calculateur import tokenize, infix_to_rpn
+from src.polynomes import Polynome, compiler
+from src.session import Session
+
+
+def rpn(expression):
+    return compiler(infix_to_rpn(tokenize(expression)))
+
+
+class TestCacheRPN(unittest.TestCase):
+    """Tests du cache disque des RPN"""
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = str(Path(self.dossier.name) / 'cache_rpn.bin')
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_relecture(self):
+        """Test les RPN (polynômes, sous-programmes) sont relues à l'identique"""
+        expressions = ["2 + 3", "sin(x^2 + 1)", "sigma(k^2, k, 1, 3)", "max(1, 2, 3)"]
+        cache = CacheRPN(self.fichier)
+        for expression in expressions:
+            cache.ajouter(expression, rpn(expression))
+        cache.sauvegarder()
+
+        relu = CacheRPN(self.fichier)
+        for expression in expressions:
+            self.assertEqual(relu.obtenir(expression), rpn(expression))
+        self.assertIsInstance(relu.obtenir("sin(x^2 + 1)")[0], Polynome)
+        self.assertIsNone(relu.obtenir("1 + 1"))
+        self.assertEqual((relu.succes, relu.echecs), (5, 1))
+
+    def test_session_sans_tokenize(self):
+        """Test une session relit les expressions compilées par une autre"""
+        session = Session(cache_rpn=CacheRPN(self.fichier))
+        self.assertEqual(session.calculer("x = 2"), 2.0)
+        self.assertEqual(session.calculer("x^2 + 1"), 5.0)
+        session.cache_rpn.sauvegarder()
+
+        session = Session(cache_rpn=CacheRPN(self.fichier))
+        session.calculer("x = 3")
+        with mock.patch('src.session.tokenize', side_effect=AssertionError("re-tokenisée")):
+            self.assertEqual(session.calculer("x^2 + 1"), 10.0)
+
+    def test_moteur_modifie(self):
+        """Test un fichier d'une autre version du moteur est ignoré"""
+        cache = CacheRPN(self.fichier)
+        cache.ajouter("2 + 3", rpn("2 + 3"))
+        cache.sauvegarder()
+        with mock.patch.object(cache_rpn, 'VERSION_RPN', cache_rpn.VERSION_RPN + 1):
+            self.assertIsNone(CacheRPN(self.fichier).obtenir("2 + 3"))
+        Path(self.fichier).write_bytes(b'CRPN abime')
+        self.assertIsNone(CacheRPN(self.fichier).obtenir("2 + 3"))
+
+    def test_taille_max(self):
+        """Test les expressions relues passent avant les anciennes non utilisées"""
+        cache = CacheRPN(self.fichier, taille_max=3)
+        for k in range(3):
+            cache.ajouter(f"{k} + 1", rpn(f"{k} + 1"))
+        cache.sauvegarder()
+
+        cache = CacheRPN(self.fichier, taille_max=3)
+        cache.obtenir("0 + 1")
+        cache.ajouter("9 + 1", rpn("9 + 1"))
+        cache.sauvegarder()
+        relu = CacheRPN(self.fichier)
+        self.assertEqual(len(relu), 3)
+        self.assertIsNotNone(relu.obtenir("0 + 1"))
+        self.assertIsNotNone(relu.obtenir("9 + 1"))
+
+    def test_oubli_des_plus_anciennes(self):
+        """Test au-delà de taille_max, les plus anciennes non utilisées sont oubliées"""
+        for k in range(6):  # Une expression nouvelle par exécution
+            cache = CacheRPN(self.fichier, taille_max=3)
+            cache.ajouter(f"{k} + 1", rpn(f"{k} + 1"))
+            cache.sauvegarder()
+        relu = CacheRPN(self.fichier)
+        self.assertEqual([k for k in range(6) if relu.obtenir(f"{k} + 1") is not None], [3, 4, 5])
+
+    def test_dossier_utilisateur(self):
+        """Test le fichier par défaut est dans le dossier de cache, créé à la sauvegarde"""
+        with mock.patch.dict('os.environ', {'XDG_CACHE_HOME': self.dossier.name, 'LOCALAPPDATA': self.dossier.name}), \
+                mock.patch('os.path.expanduser', return_value=self.dossier.name):
+            fichier = cache_rpn.fichier_utilisateur()
+        self.assertTrue(fichier.startswith(self.dossier.name))
+        self.assertEqual(Path(fichier).name, 'cache_rpn.bin')
+        cache = CacheRPN(fichier)
+        cache.ajouter("2 + 3", rpn("2 + 3"))
+        cache.sauvegarder()
+        self.assertIsNotNone(CacheRPN(fichier).obtenir("2 + 3"))
+
+
+if __name__ == '__main__':
+    unittest.main()
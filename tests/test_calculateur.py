@@ -5,13 +5,19 @@ Tests unitaires pour le module calculateur.
 
 import unittest
 import sys
+import tracemalloc
 from pathlib import Path
 
 # Ajouter le dossier parent au path pour pouvoir importer src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.calculateur import calculer, tokenize, infix_to_rpn, evaluer_rpn
-from src.exceptions import DivisionParZeroError
+from src.calculateur import calculer, tokenize, infix_to_rpn, evaluer_rpn, TAILLE_BLOC_INDICE
+from src.exceptions import (
+    DivisionParZeroError,
+    ArgumentFonctionError,
+    ExpressionInvalideError,
+    DepassementCapaciteError
+)
 
 
 class TestCalculateur(unittest.TestCase):
@@ -58,6 +64,122 @@ class TestCalculateur(unittest.TestCase):
         """Test avec nombres décimaux"""
         self.assertAlmostEqual(calculer("3.5 + 2.5"), 6.0)
     
+    # ========== Fonctions variadiques et statistiques ==========
+    
+    def test_rpn_arite_variadique(self):
+        """Test comptage des arguments dans la RPN"""
+        rpn = infix_to_rpn(tokenize("min(3, 7, 1)"))
+        self.assertEqual(rpn, ['3', '7', '1', 'min#3'])
+    
+    def test_min_max_variadiques(self):
+        """Test min et max avec plus de deux arguments"""
+        self.assertEqual(calculer("min(5, 2, 8, 1)"), 1)
+        self.assertEqual(calculer("max(5, 2, 8, 1) + min(4)"), 12)
+    
+    def test_statistiques(self):
+        """Test sum, mean, var, stdev, median"""
+        self.assertEqual(calculer("sum(0.1,0.1,0.1,0.1,0.1,0.1,0.1,0.1,0.1,0.1)"), 1.0)
+        self.assertEqual(calculer("mean(1, 2, 3, 4)"), 2.5)
+        self.assertAlmostEqual(calculer("var(2,4,4,4,5,5,7,9)"), 32 / 7)
+        self.assertAlmostEqual(calculer("stdev(1, 3)"), 1.4142135623730951)
+        self.assertEqual(calculer("median(5, 1, 3)"), 3)
+        self.assertEqual(calculer("median(4, 1, 3, 2)"), 2.5)
+    
+    def test_nombre_arguments_invalide(self):
+        """Test arité invalide"""
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("sqrt(4, 9)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("var(1)")
+    
+    def test_grand_nombre_arguments(self):
+        """Test 100 000 arguments (données collées)"""
+        valeurs = ",".join(str(i % 1000) for i in range(100000))
+        self.assertEqual(calculer(f"sum({valeurs})"), 49950000)
+        self.assertEqual(calculer(f"median({valeurs})"), 499.5)
+    
+    # ========== Variables, somme et produit indicés ==========
+    
+    def test_variables(self):
+        """Test évaluation avec variables"""
+        self.assertEqual(calculer("x^2 + 1", variables={'x': 3}), 10)
+        with self.assertRaises(ExpressionInvalideError):
+            calculer("2 + a")
+    
+    def test_constante_e(self):
+        """Test constante E au milieu d'une expression"""
+        self.assertAlmostEqual(calculer("E + 1"), 3.718281828459045)
+    
+    def test_rpn_sigma_sous_programme(self):
+        """Test le corps de sigma est capturé en sous-programme RPN"""
+        rpn = infix_to_rpn(tokenize("sigma(k^2, k, 1, 10)"))
+        self.assertEqual(rpn, [['k', '2', '^'], ['k'], '1', '10', 'sigma'])
+    
+    def test_sigma_prod(self):
+        """Test somme et produit indicés"""
+        self.assertEqual(calculer("sigma(k^2, k, 1, 10)"), 385)
+        self.assertEqual(calculer("prod(k, k, 1, 5)"), 120)
+        self.assertEqual(calculer("sigma(k, k, 5, 1)"), 0)
+        self.assertEqual(calculer("sigma(sigma(j*k, j, 1, 3), k, 1, 3)"), 36)
+        self.assertEqual(calculer("sigma(x*k, k, 1, 3)", variables={'x': 2}), 12)
+    
+    def test_sigma_prod_par_blocs(self):
+        """Test sigma/prod sur plusieurs blocs, mémoire indépendante du nombre de termes"""
+        n = 3 * TAILLE_BLOC_INDICE + 5
+        self.assertEqual(calculer(f"sigma(k, k, 1, {n})"), n * (n + 1) / 2)
+        self.assertEqual(calculer(f"prod(1 + (k == {n}), k, 1, {n})"), 2)
+        with self.assertRaises(DivisionParZeroError):
+            calculer(f"sigma(1/(k - {n}), k, 1, {n})")  # Dernier bloc
+
+        tracemalloc.start()
+        try:
+            self.assertEqual(calculer("sigma(k, k, 1, 10^7)"), 50000005000000)
+            _, pic = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(pic, 10 ** 7)  # Les 10^7 indices d'un coup : 80 Mo
+    
+    def test_sigma_erreurs(self):
+        """Test erreurs de sigma"""
+        with self.assertRaises(DivisionParZeroError):
+            calculer("sigma(1/k, k, 0, 3)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("sigma(k, 2, 1, 3)")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("sigma(k, k, 1)")
+    
+    # ========== Comparaisons et conditions ==========
+    
+    def test_comparaisons(self):
+        """Test comparaisons : 1 si vrai, 0 si faux"""
+        self.assertEqual(calculer("2 + 1 == 3"), 1)
+        self.assertEqual(calculer("3 < 2"), 0)
+        self.assertEqual(calculer("-1 >= -2"), 1)
+    
+    def test_if_paresseux(self):
+        """Test la branche non choisie n'est pas évaluée"""
+        rpn = infix_to_rpn(tokenize("if(x > 0, ln(x), 0)"))
+        self.assertEqual(rpn, ['x', '0', '>', ['x', 'ln'], ['0'], 'if'])
+        # ln(-2) lèverait LogarithmeError si la branche était évaluée
+        self.assertEqual(calculer("if(x > 0, ln(x), 0)", variables={'x': -2}), 0)
+        self.assertEqual(calculer("if(1 < 2, 5, 1/0)"), 5)
+    
+    def test_piecewise(self):
+        """Test fonction par morceaux avec valeur par défaut"""
+        expression = "piecewise(x < 0, -x, x < 1, x^2, 1)"
+        self.assertEqual(calculer(expression, variables={'x': -2}), 2)
+        self.assertEqual(calculer(expression, variables={'x': 0.5}), 0.25)
+        self.assertEqual(calculer(expression, variables={'x': 3}), 1)
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("piecewise(x > 5, 1)", variables={'x': 0})
+    
+    def test_entier_trop_grand_pour_float(self):
+        """Test un entier exact mêlé à un float au-delà de 1e308 : erreur de calculatrice"""
+        for expression in ["fact(200) + 0.5", "sqrt(fact(200))", "fact(200) * 1.5"]:
+            with self.assertRaises(DepassementCapaciteError):
+                calculer(expression)
+        self.assertEqual(calculer("fact(5) + 0.5"), 120.5)
+    
     # TODO: Ajouter 10+ tests supplémentaires
 
 
@@ -0,0 +1,89 @@
+"""
+Tests unitaires pour le module canonique (forme canonique des expressions).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import calculateur
+from src.canonique import forme_canonique, empreinte, cle, taux_de_succes
+from src.exceptions import ExpressionInvalideError
+
+
+class TestFormeCanonique(unittest.TestCase):
+    """Tests de la forme canonique"""
+
+    def test_ecritures_equivalentes(self):
+        """Espaces, parenthèses, ordre et casse donnent la même forme"""
+        for expression in ("2+3", " 2 + 3 ", "3+2", "(2)+3", "((3)) + (2)"):
+            self.assertEqual(forme_canonique(expression), "2+3")
+        self.assertEqual(forme_canonique("pi * 2"), forme_canonique("2*PI"))
+        self.assertEqual(forme_canonique("x > 1"), forme_canonique("1 < x"))
+        self.assertEqual(forme_canonique("1.50 + 007"), "1.5+7")
+
+    def test_calculs_distincts(self):
+        """Ni associativité, ni produit de matrices ou de variables réordonné"""
+        self.assertNotEqual(forme_canonique("(1+2)+3"), forme_canonique("1+(2+3)"))
+        self.assertNotEqual(forme_canonique("x*y"), forme_canonique("y*x"))
+        self.assertNotEqual(forme_canonique("[1,2]*[3,4]"), forme_canonique("[3,4]*[1,2]"))
+        self.assertNotEqual(forme_canonique("2-3"), forme_canonique("3-2"))
+        self.assertNotEqual(forme_canonique("2"), forme_canonique("2.0"))
+
+    def test_forme_stable_et_calculable(self):
+        """La forme canonique se relit en elle-même et donne le même résultat"""
+        for expression in ("sigma(k^2, k, 1, 3) + 1", "if(x > 0, ln(x), 0)", "-2^2 * sqrt(3)",
+                           "max(3, 1) == 3 and 1", "[[1, 2], [3, 4]]", "rand()"):
+            forme = forme_canonique(expression)
+            self.assertEqual(forme_canonique(forme), forme)
+        for expression in ("3 * sqrt(2) + 1/7", "not 5 + 0x1F", "sum(3, 2, 1) >= 2*pi"):
+            self.assertEqual(calculateur.calculer(forme_canonique(expression)),
+                             calculateur.calculer(expression))
+
+    def test_empreinte_et_cle(self):
+        """Empreinte stable ; clé tolérante aux expressions invalides"""
+        self.assertEqual(empreinte("2+3"), empreinte(" 3 + 2"))
+        self.assertEqual(len(empreinte("2+3")), 32)
+        self.assertRaises(ExpressionInvalideError, forme_canonique, "2 3")
+        self.assertEqual(cle(" 2 3 "), "2 3")
+
+    def test_taux_de_succes(self):
+        """La forme canonique améliore le taux de succès"""
+        taux = taux_de_succes(["2+3", "3+2", " 2 + 3", "(2)+3", "2+3"])
+        self.assertEqual((taux['textes'], taux['formes']), (4, 1))
+        self.assertAlmostEqual(taux['taux_texte'], 0.2)
+        self.assertAlmostEqual(taux['taux_canonique'], 0.8)
+
+
+class TestCacheAnalyse(unittest.TestCase):
+    """Tests du cache d'analyse de src.calculateur"""
+
+    def setUp(self):
+        calculateur.vider_cache_analyse()
+
+    def tearDown(self):
+        calculateur.vider_cache_analyse()
+
+    def test_succes_par_texte_et_par_forme(self):
+        """Un texte revu, puis une autre écriture, ne sont pas recompilés"""
+        rpn = calculateur.compiler_expression("x^2 + 1")
+        self.assertIs(calculateur.compiler_expression("x^2 + 1"), rpn)
+        self.assertIs(calculateur.compiler_expression("1 + x^2"), rpn)
+        self.assertEqual(calculateur.calculer("1+x^2", variables={'x': 3}), 10.0)
+        statistiques = calculateur.statistiques_analyse()
+        self.assertEqual((statistiques['textes'], statistiques['formes'], statistiques['analyses']), (1, 2, 1))
+
+    def test_taille_bornee_et_erreurs(self):
+        """Le cache est borné ; une expression invalide lève toujours son erreur"""
+        for i in range(calculateur.TAILLE_CACHE_ANALYSE + 10):
+            calculateur.compiler_expression(f"{i} + 1")
+        self.assertLessEqual(len(calculateur._analyses_par_texte), calculateur.TAILLE_CACHE_ANALYSE)
+        for _ in range(2):
+            self.assertRaises(ExpressionInvalideError, calculateur.calculer, "2 3")
+
+
+if __name__ == '__main__':
+    unittest.main()
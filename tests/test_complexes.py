@@ -0,0 +1,98 @@
+"""
+Tests unitaires pour le module complexes (mode complexe).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.session import Session
+from src import complexes
+from src.exceptions import (
+    RacineNegativeError,
+    ArgumentFonctionError,
+    ExpressionInvalideError,
+    LogarithmeError,
+)
+
+PI_APPROX = 3.141592653589793
+
+
+class TestModeComplexe(unittest.TestCase):
+    """Tests du mode complexe d'une session"""
+
+    def setUp(self):
+        self.session = Session(mode_complexe=True)
+
+    def assertComplexeEgal(self, z, attendu, places=7):
+        self.assertAlmostEqual(complex(z).real, attendu.real, places=places)
+        self.assertAlmostEqual(complex(z).imag, attendu.imag, places=places)
+
+    def test_racine_negative(self):
+        """Test sqrt(-4) = 2i"""
+        self.assertEqual(self.session.calculer("sqrt(-4)"), 2j)
+
+    def test_logarithme_negatif(self):
+        """Test ln(-1) = πi (branche principale)"""
+        self.assertComplexeEgal(self.session.calculer("ln(-1)"), complex(0, PI_APPROX))
+
+    def test_unite_imaginaire(self):
+        """Test i^2 = -1 redevient un réel"""
+        resultat = self.session.calculer("i^2")
+        self.assertIsInstance(resultat, float)
+        self.assertEqual(resultat, -1.0)
+        self.assertEqual(self.session.calculer("(1 + 2*i) * (3 - i)"), complex(5, 5))
+
+    def test_fonctions_complexes(self):
+        """Test re, im, arg, conj, abs"""
+        self.assertEqual(self.session.calculer("re(3 + 4*i)"), 3.0)
+        self.assertEqual(self.session.calculer("im(3 + 4*i)"), 4.0)
+        self.assertAlmostEqual(self.session.calculer("abs(3 + 4*i)"), 5.0)
+        self.assertEqual(self.session.calculer("conj(2 + i)"), complex(2, -1))
+        self.assertAlmostEqual(self.session.calculer("arg(i)"), PI_APPROX / 2)
+        self.assertAlmostEqual(self.session.calculer("arg(-1 - i)"), -3 * PI_APPROX / 4)
+
+    def test_puissance_principale(self):
+        """Test (-8)^(1/3) = 1 + i*sqrt(3) et formule d'Euler"""
+        self.assertComplexeEgal(self.session.calculer("(-8)^(1/3)"), complex(1, 3 ** 0.5))
+        self.assertAlmostEqual(self.session.calculer("re(exp(i*PI))"), -1.0)
+
+    def test_chemin_reel_inchange(self):
+        """Test une expression réelle donne le même float qu'en mode réel"""
+        reel = Session().calculer("sqrt(2) + ln(3) * sin(1)")
+        self.assertEqual(self.session.calculer("sqrt(2) + ln(3) * sin(1)"), reel)
+
+    def test_indice_nomme_i(self):
+        """Test sigma(i, i, 1, 3) : l'indice masque l'unité imaginaire"""
+        self.assertEqual(self.session.calculer("sigma(i, i, 1, 3)"), 6.0)
+        self.assertComplexeEgal(self.session.calculer("sigma(k*i, k, 1, 3)"), 6j)
+
+    def test_erreurs(self):
+        """Test min, comparaisons d'ordre et ln(0) sur des complexes"""
+        with self.assertRaises(ArgumentFonctionError):
+            self.session.calculer("min(i, 1)")
+        with self.assertRaises(ExpressionInvalideError):
+            self.session.calculer("i < 1")
+        with self.assertRaises(LogarithmeError):
+            self.session.calculer("ln(0)")
+
+    def test_mode_par_session(self):
+        """Test le mode réel lève toujours RacineNegativeError"""
+        session_reelle = Session()
+        with self.assertRaises(RacineNegativeError):
+            session_reelle.calculer("sqrt(-4)")
+        session_reelle.mode_complexe = True
+        self.assertEqual(session_reelle.calculer("sqrt(-4)"), 2j)
+
+    def test_formater(self):
+        """Test affichage a + bi"""
+        self.assertEqual(complexes.formater(complex(3, -2)), "3 - 2i")
+        self.assertEqual(complexes.formater(2j), "2i")
+        self.assertEqual(complexes.formater(complex(0.5, 1)), "0.5 + i")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests unitaires pour le module console (calcul en flux, python -m src).
+"""
+
+import unittest
+import sys
+import io
+import json
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.console import calculer_lignes, main
+
+
+def executer(entree, *arguments):
+    sortie = io.StringIO()
+    code = main(list(arguments), io.StringIO(entree), sortie)
+    return code, sortie.getvalue()
+
+
+class TestConsole(unittest.TestCase):
+    """Tests du mode console"""
+
+    def test_format_texte(self):
+        """Test une ligne de sortie par ligne lue, définitions comprises"""
+        code, sortie = executer("2 + 3\na = 4\n\nsqrt(a) * 10\nf(x) = x^2\nf(3)\n")
+        self.assertEqual(code, 0)
+        self.assertEqual(sortie, "5.0\n4.0\n\n20.0\n\n9.0\n")
+
+    def test_erreurs_par_ligne(self):
+        """Test une erreur est écrite à sa place sans arrêter le flux"""
+        code, sortie = executer("1/0\n2 * 3\nsqrt(-1)\n")
+        self.assertEqual(code, 1)
+        lignes = sortie.splitlines()
+        self.assertIn("Division par zéro", lignes[0])
+        self.assertEqual(lignes[1], "6.0")
+        self.assertIn("Racine carrée", lignes[2])
+
+    def test_format_csv(self):
+        """Test en-tête et virgules de l'expression protégées"""
+        _, sortie = executer("max(1, 2)\n\n1/0\n", "--format", "csv")
+        lignes = sortie.splitlines()
+        self.assertEqual(lignes[0], "ligne,expression,resultat,erreur")
+        self.assertEqual(lignes[1], '1,"max(1, 2)",2.0,')
+        self.assertTrue(lignes[2].startswith("3,1/0,,Erreur"))
+        self.assertEqual(len(lignes), 3)
+
+    def test_format_json(self):
+        """Test un objet JSON par ligne, nombres JSON pour les réels finis"""
+        _, sortie = executer("0.5\n1/0\n0xFF\n", "-f", "json", "--programmeur")
+        objets = [json.loads(ligne) for ligne in sortie.splitlines()]
+        self.assertEqual(objets[0], {'ligne': 1, 'expression': '0.5', 'resultat': 0.5, 'erreur': None})
+        self.assertIsNone(objets[1]['resultat'])
+        self.assertIn("Division par zéro", objets[1]['erreur'])
+        self.assertEqual(objets[2]['resultat'], 255)
+
+    def test_processus(self):
+        """Test --processus : lignes indépendantes, sortie dans l'ordre"""
+        code, sortie = executer("2 + 3\n\n1/0\nfactor(12)\n", "--processus", "2")
+        self.assertEqual(code, 1)
+        lignes = sortie.splitlines()
+        self.assertEqual(lignes[:2], ["5.0", ""])
+        self.assertIn("Division par zéro", lignes[2])
+        self.assertEqual(lignes[3], "2^2 * 3")
+
+    def test_flux_paresseux(self):
+        """Test chaque ligne est calculée dès qu'elle est lue"""
+        lues = []
+
+        def lignes():
+            for ligne in ["1 + 1\n", "2 + 2\n"]:
+                lues.append(ligne)
+                yield ligne
+
+        calculs = calculer_lignes(lignes())
+        self.assertEqual(next(calculs), (1, "1 + 1", 2.0, None))
+        self.assertEqual(len(lues), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests unitaires pour le test différentiel (benchmarks.differentiel).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import differentiel
+from benchmarks.differentiel import Noeud, Reference, ecrire
+
+
+def nombre(texte):
+    return Noeud('nombre', texte, ())
+
+
+def operation(operateur, gauche, droite):
+    return Noeud('operateur', operateur, (gauche, droite))
+
+
+def fonction(nom, *arguments):
+    return Noeud('fonction', nom, arguments)
+
+
+class TestDifferentiel(unittest.TestCase):
+    """Tests de la grammaire, de la référence, de la réduction et des lots"""
+
+    def test_ecriture_suit_les_priorites(self):
+        """Le texte écrit est analysé par la calculatrice comme l'arbre"""
+        moins_deux = Noeud('neg', None, (nombre('2'),))
+        cas = [
+            (operation('^', moins_deux, nombre('2')), '-2 ^ 2', 4.0),
+            (operation('^', nombre('2'), operation('^', nombre('3'), nombre('2'))), '2 ^ 3 ^ 2', 512.0),
+            (operation('-', nombre('1'), operation('-', nombre('2'), nombre('3'))), '1 - (2 - 3)', 2.0),
+            (operation('-', operation('-', nombre('1'), nombre('2')), nombre('3')), '1 - 2 - 3', -4.0),
+            (Noeud('neg', None, (moins_deux,)), '-(-2)', 2.0),
+        ]
+        for arbre, texte, valeur in cas:
+            self.assertEqual(ecrire(arbre), texte)
+            self.assertEqual(differentiel.executer('calculer', texte).valeur, valeur)
+            self.assertEqual(Reference().evaluer(arbre).valeur, valeur)
+
+    def test_classes_de_la_reference(self):
+        """Erreurs, dépassement et résultats complexes de la référence"""
+        cas = [
+            (fonction('sqrt', Noeud('neg', None, (nombre('1'),))), 'RacineNegativeError'),
+            (operation('/', nombre('1'), nombre('0')), 'DivisionParZeroError'),
+            (operation('%', nombre('5'), nombre('0')), 'ModuloParZeroError'),
+            (fonction('ln', nombre('0')), 'LogarithmeError'),
+            (fonction('tand', nombre('90')), 'TangenteDomainError'),
+            (fonction('var', nombre('1')), 'ArgumentFonctionError'),
+            (fonction('fact', nombre('2.5')), 'ArgumentFonctionError'),
+            (operation('^', Noeud('neg', None, (nombre('8'),)), nombre('0.5')), 'complexe'),
+        ]
+        for arbre, classe in cas:
+            self.assertEqual(Reference().evaluer(arbre).classe, classe, ecrire(arbre))
+        self.assertEqual(Reference().evaluer(operation('^', nombre('10'), nombre('400'))).valeur, float('inf'))
+        self.assertEqual(Reference().evaluer(fonction('sind', nombre('30'))).valeur, 0.5)
+
+    def test_verifier(self):
+        """Accord malgré l'annulation, désaccord sur la perte de précision de exp(100)"""
+        annulation = operation('-', operation('+', nombre('10000000000000000'), nombre('1')),
+                               nombre('10000000000000000'))
+        self.assertEqual(differentiel.verifier(annulation)[0], 'accord')
+        self.assertEqual(differentiel.verifier(fonction('sqrt', nombre('2')))[0], 'accord')
+        statut, obtenu, attendu = differentiel.verifier(fonction('exp', nombre('100')))
+        self.assertEqual(statut, 'desaccord')
+        self.assertEqual(attendu.valeur[0], 2.6881171418161356e+43)
+        # Un délai dépassé est une classe de résultat (sin(inf) ne finit pas)
+        self.assertEqual(differentiel.executer('calculer', 'sin(10^400)', delai=0.05).classe, 'delai')
+
+    def test_reduction(self):
+        """Un désaccord enfoui est réduit à la fonction en cause"""
+        arbre = fonction('max', nombre('1'), operation('*', fonction('exp', nombre('100.25')), nombre('2')))
+        _, obtenu, attendu = differentiel.verifier(arbre)
+        nature = (obtenu.classe, attendu.classe)
+
+        def echoue(candidat):
+            statut, obtenu, attendu = differentiel.verifier(candidat)
+            return statut == 'desaccord' and (obtenu.classe, attendu.classe) == nature
+
+        reduit = differentiel.reduire(arbre, echoue)
+        self.assertEqual(differentiel.gabarit(reduit), 'exp(#)')
+        self.assertTrue(echoue(reduit))
+
+    def test_lots_independants_du_nombre_de_processus(self):
+        """Mêmes expressions et même bilan avec 1 ou 2 processus"""
+        options = dict(constructions=('+', '-', '*', 'min', 'max', 'neg'), taille_lot=50)
+        un = differentiel.explorer(200, processus=1, **options)
+        deux = differentiel.explorer(200, processus=2, **options)
+        for cle in ('expressions', 'accords', 'ignorees', 'desaccords'):
+            self.assertEqual(un[cle], deux[cle])
+        self.assertEqual(un['expressions'], 200)
+        self.assertEqual(un['desaccords'], 0)
+        self.assertIn('200 expressions', differentiel.formater_rapport(un))
+
+
+if __name__ == '__main__':
+    unittest.main()
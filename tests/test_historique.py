@@ -115,6 +115,20 @@ class TestHistorique(unittest. TestCase):
         operations = self.historique.afficher()
         self.assertEqual(operations[0]['resultat'], 6.0)
 
+    def test_doublon_canonique(self):
+        """Test même calcul écrit autrement : pas de doublon, retrouvé"""
+        self.historique.ajouter("2 + 3", 5.0)
+        self.historique.ajouter("3+2", 5.0)
+        self.assertEqual(self.historique.compter(), 1)
+        
+        self.historique.ajouter("ANS + 1", 6.0)
+        self.historique.ajouter("ANS+1", 7.0)  # Résultat différent : gardé
+        self.assertEqual(self.historique.compter(), 3)
+        
+        recharge = Historique(fichier=self.fichier_test)
+        self.assertEqual(recharge.trouver("(3) + 2")['expression'], "2 + 3")
+        self.assertIsNone(recharge.trouver("2 - 3"))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Tests unitaires pour le module intervalles (encadrements garantis).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer, tokenize, infix_to_rpn
+from src.intervalles import Intervalle, evaluer_intervalle, bornes, abscisses_adaptatives
+from src.exceptions import ExpressionInvalideError, RacineNegativeError, LogarithmeError
+from src import matrices
+
+
+class TestIntervalles(unittest.TestCase):
+    """Tests de l'arithmétique d'intervalles"""
+
+    def evaluer(self, expression, **variables):
+        return evaluer_intervalle(infix_to_rpn(tokenize(expression)), variables)
+
+    def verifier_encadrement(self, expression, bas, haut, nb_points=200):
+        """Chaque valeur ponctuelle de [bas, haut] est dans l'encadrement."""
+        y = self.evaluer(expression, x=(bas, haut))
+        for i in range(nb_points + 1):
+            x = bas + (haut - bas) * i / nb_points
+            valeur = calculer(expression, variables={'x': x})
+            self.assertIn(valeur, y, f"{expression} en x = {x}")
+
+    def test_operations(self):
+        """Test encadrement de + - * / ^ sur des boîtes"""
+        for expression in ["x^2 - 2*x", "(x + 1) / (x + 3)", "x^3 - x", "2^x", "x % 3"]:
+            self.verifier_encadrement(expression, -1.0, 2.5)
+
+    def test_arrondi_vers_exterieur(self):
+        """Test 0.1 et PI sont encadrés, pas arrondis"""
+        dixieme = self.evaluer("0.1")
+        self.assertLess(dixieme.bas, 0.1)
+        self.assertGreater(dixieme.haut, 0.1)
+        self.assertEqual(self.evaluer("0.5"), Intervalle(0.5))
+        self.assertLess(self.evaluer("PI").bas, 3.141592653589793)
+
+    def test_trigonometrie_segments_monotones(self):
+        """Test les extremums ne sont ajoutés que s'ils sont dans l'intervalle"""
+        y = self.evaluer("sin(x)", x=(0.0, 1.0))
+        self.assertAlmostEqual(y.haut, 0.8414709848078965)
+        self.assertLessEqual(y.bas, 0.0)
+        self.assertEqual(self.evaluer("cos(x)", x=(-1.0, 1.0)).haut, 1.0)
+        self.assertEqual(self.evaluer("sin(x)", x=(1.0, 5.0)), Intervalle(-1.0, 1.0))
+        self.assertEqual(self.evaluer("tan(x)", x=(1.0, 2.0)).haut, float('inf'))
+        self.verifier_encadrement("sin(x) * cos(3*x)", -4.0, 4.0)
+
+    def test_domaine_partiel(self):
+        """Test ln(x) sur [-1, e] encadre la partie définie"""
+        y = self.evaluer("ln(x)", x=(-1.0, 2.718281828459045))
+        self.assertEqual(y.bas, float('-inf'))
+        self.assertAlmostEqual(y.haut, 1.0)
+        self.assertEqual(self.evaluer("sqrt(x)", x=(-4.0, 4.0)).bas, 0.0)
+        with self.assertRaises(RacineNegativeError):
+            self.evaluer("sqrt(x)", x=(-3.0, -1.0))
+        with self.assertRaises(LogarithmeError):
+            self.evaluer("ln(x)", x=(-3.0, 0.0))
+
+    def test_conditions(self):
+        """Test if avec condition incertaine : réunion des branches définies"""
+        y = self.evaluer("if(x > 0, ln(x), 5)", x=(-1.0, 1.0))
+        self.assertEqual((y.bas, y.haut), (float('-inf'), 5.0))
+        # Condition toujours vraie : seule la première branche compte
+        self.assertAlmostEqual(self.evaluer("if(x > 0, sqrt(x), 5)", x=(1.0, 4.0)).haut, 2.0)
+        self.assertEqual(self.evaluer("x < 2", x=(0.0, 1.0)), Intervalle(1.0))
+
+    def test_bornes_resserrees(self):
+        """Test bounds() découpe pour limiter la surestimation"""
+        rpn = infix_to_rpn(tokenize("x - x^2"))
+        self.assertGreater(evaluer_intervalle(rpn, {"x": (0, 1)}).haut, 0.9)
+        bas, haut = bornes(rpn, 'x', 0, 1)
+        self.assertLessEqual(bas, 0.0)
+        self.assertLessEqual(haut - 0.25, 1e-4)
+        self.assertGreaterEqual(haut, 0.25)
+
+    @unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+    def test_bounds_dans_une_expression(self):
+        """Test bounds(expr, x, a, b) renvoie le vecteur [bas, haut]"""
+        resultat = calculer("bounds(sin(x), x, 0, 2*PI)")
+        self.assertEqual(list(resultat), [-1.0, 1.0])
+
+    def test_fonction_non_supportee(self):
+        """Test isprime n'a pas de règle d'intervalle"""
+        with self.assertRaises(ExpressionInvalideError):
+            self.evaluer("isprime(x)", x=(1.0, 2.0))
+
+    def test_abscisses_adaptatives(self):
+        """Test zones hors écran sautées, raffinement là où la courbe varie"""
+        rpn = infix_to_rpn(tokenize("x^2 + 20"))
+        self.assertEqual(abscisses_adaptatives(rpn, 'x', -10, 10, -10, 10, 800, 600), [])
+
+        rpn = infix_to_rpn(tokenize("ln(x)"))
+        xs = abscisses_adaptatives(rpn, 'x', -10, 10, -10, 10, 800, 600)
+        self.assertTrue(all(x >= 0 for x in xs))
+        self.assertLess(len(xs), 400)
+
+        # Droite horizontale : deux points suffisent
+        rpn = infix_to_rpn(tokenize("0*x + 1"))
+        self.assertEqual(abscisses_adaptatives(rpn, 'x', -10, 10, -10, 10, 800, 600), [-10, 10])
+
+
+if __name__ == '__main__':
+    unittest.main()
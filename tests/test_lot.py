@@ -0,0 +1,60 @@
+"""
+Tests unitaires pour le module lot (calcul par lots multi-processus).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lot import calculer_lot
+from src.session import Session
+
+
+class TestLot(unittest.TestCase):
+    """Tests de calculer_lot"""
+
+    def setUp(self):
+        self.expressions = [f"{k} * 2 + 1" for k in range(50)] + ["1/0", "", "sqrt(16)"]
+
+    def test_ordre_et_erreurs(self):
+        """Test résultats dans l'ordre, erreurs rendues avec leur expression"""
+        calculs = list(calculer_lot(self.expressions, processus=1, taille_morceau=7))
+        self.assertEqual(len(calculs), 53)
+        self.assertEqual([r for _, r, _ in calculs[:50]], [k * 2 + 1.0 for k in range(50)])
+        expression, resultat, erreur = calculs[50]
+        self.assertEqual((expression, resultat), ("1/0", None))
+        self.assertIn("Division par zéro", erreur)
+        self.assertEqual(calculs[51], ("", None, None))
+        self.assertEqual(calculs[52], ("sqrt(16)", 4.0, None))
+
+    def test_processus(self):
+        """Test plusieurs processus donnent les mêmes résultats, dans l'ordre"""
+        attendus = list(calculer_lot(self.expressions, processus=1))
+        self.assertEqual(list(calculer_lot(iter(self.expressions), processus=2, taille_morceau=5)), attendus)
+
+    def test_session_modele(self):
+        """Test définitions et modes de la session copiés, session intacte"""
+        session = Session(mode_programmeur=True)
+        session.calculer("a = 7")
+        calculs = list(calculer_lot(["a / 2", "b = 1"], processus=2, taille_morceau=1, session=session))
+        self.assertEqual(calculs[0], ("a / 2", 3, None))
+        self.assertNotIn("b", session.variables)
+
+    def test_graine_reproductible(self):
+        """Test une session avec graine : mêmes tirages quel que soit le nombre de processus"""
+        expressions = ["rand()"] * 40
+        attendus = list(calculer_lot(expressions, processus=1, taille_morceau=6, session=Session(graine=42)))
+        for processus in (2, 3):
+            calculs = list(calculer_lot(expressions, processus=processus, taille_morceau=6,
+                                        session=Session(graine=42)))
+            self.assertEqual(calculs, attendus)
+        self.assertEqual(len({r for _, r, _ in attendus}), 40)
+        autres = list(calculer_lot(expressions, processus=2, taille_morceau=6, session=Session(graine=43)))
+        self.assertNotEqual(autres, attendus)
+
+
+if __name__ == '__main__':
+    unittest.main()
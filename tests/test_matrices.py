@@ -0,0 +1,100 @@
+"""
+Tests unitaires pour le module matrices (vecteurs et matrices).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer, tokenize, infix_to_rpn
+from src import matrices
+from src.exceptions import (
+    DivisionParZeroError,
+    RacineNegativeError,
+    ArgumentFonctionError,
+    ExpressionInvalideError,
+)
+
+
+class TestLitteraux(unittest.TestCase):
+    """Tests de la conversion des crochets en RPN"""
+
+    def test_rpn_vecteur(self):
+        """Test [1, -2] -> 1 -2 TABLEAU#2"""
+        self.assertEqual(
+            infix_to_rpn(tokenize("[1, -2]")),
+            ['1', '2', 'UNARY_MINUS', 'TABLEAU#2']
+        )
+
+    def test_rpn_matrice(self):
+        """Test une matrice est un tableau de tableaux"""
+        self.assertEqual(
+            infix_to_rpn(tokenize("[[1,2],[3,4]]")),
+            ['1', '2', 'TABLEAU#2', '3', '4', 'TABLEAU#2', 'TABLEAU#2']
+        )
+
+
+@unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+class TestMatrices(unittest.TestCase):
+    """Tests des opérations matricielles"""
+
+    def assertTableauEgal(self, tableau, attendu):
+        self.assertEqual(matrices.np.asarray(tableau).tolist(), attendu)
+
+    def test_produit_matriciel(self):
+        """Test matrice * vecteur et matrice * matrice"""
+        self.assertTableauEgal(calculer("[[1,2],[3,4]] * [5,6]"), [17.0, 39.0])
+        self.assertTableauEgal(calculer("[[1,2],[3,4]] * [[0,1],[1,0]]"), [[2.0, 1.0], [4.0, 3.0]])
+
+    def test_fonctions_matricielles(self):
+        """Test det, inv, transpose, dot, puissance"""
+        self.assertAlmostEqual(calculer("det([[1,2],[3,4]])"), -2.0)
+        self.assertTableauEgal(calculer("transpose([[1,2],[3,4]])"), [[1.0, 3.0], [2.0, 4.0]])
+        self.assertEqual(calculer("dot([1,2,3], [4,5,6])"), 32.0)
+        self.assertTableauEgal(calculer("[[1,1],[0,1]]^5"), [[1.0, 5.0], [0.0, 1.0]])
+        produit = calculer("inv([[4,7],[2,6]]) * [[4,7],[2,6]]")
+        self.assertTrue(matrices.np.allclose(produit, matrices.np.eye(2)))
+
+    def test_resoudre(self):
+        """Test solve(A, b) sur un grand système"""
+        np = matrices.np
+        generateur = np.random.default_rng(0)
+        a = generateur.random((200, 200)) + 200 * np.eye(200)
+        b = generateur.random(200)
+        x = calculer("solve(a, b)", variables={'a': a, 'b': b})
+        self.assertTrue(np.allclose(a @ x, b))
+
+    def test_element_par_element(self):
+        """Test fonctions scalaires et opérations avec un scalaire"""
+        self.assertTableauEgal(calculer("sqrt([1, 4, 9])"), [1.0, 2.0, 3.0])
+        self.assertTableauEgal(calculer("2 * [1, 2] + 1"), [3.0, 5.0])
+        self.assertEqual(calculer("sum([1, 2], 3)"), 6.0)
+
+    def test_erreurs_de_domaine(self):
+        """Test les erreurs scalaires sont levées élément par élément"""
+        with self.assertRaises(RacineNegativeError):
+            calculer("sqrt([1, -4])")
+        with self.assertRaises(DivisionParZeroError):
+            calculer("[1, 2] / 0")
+
+    def test_erreurs_de_dimensions(self):
+        """Test dimensions incompatibles, matrice non carrée ou singulière"""
+        with self.assertRaises(ExpressionInvalideError):
+            calculer("[1, 2] * [1, 2, 3]")
+        with self.assertRaises(ExpressionInvalideError):
+            calculer("[[1, 2], [3]]")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("det([1, 2])")
+        with self.assertRaises(ExpressionInvalideError):
+            calculer("inv([[1, 2], [2, 4]])")
+
+    def test_formater(self):
+        """Test affichage d'une matrice"""
+        self.assertEqual(matrices.formater(calculer("[[1, 0.5], [-0, 4]]")), "[[1, 0.5],\n [0, 4]]")
+
+
+if __name__ == '__main__':
+    unittest.main()
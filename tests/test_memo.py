@@ -0,0 +1,79 @@
+"""
+Tests unitaires pour le module memo (résultats des expressions pures).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import calculateur
+from src.memo import MemoResultats, contexte
+from src.session import Session
+
+
+class TestMemoResultats(unittest.TestCase):
+    """Tests de la mémoire des résultats"""
+
+    def setUp(self):
+        self.memo = MemoResultats()
+
+    def test_partage_entre_sessions(self):
+        """Une autre écriture du même calcul, dans une autre session, est relue"""
+        attendu = Session(memo=self.memo).calculer("max(3, 7, 1)^2 + sqrt(2)")
+        with mock.patch('src.session.evaluer_rpn') as evaluer:
+            resultat = Session(memo=self.memo).calculer(" sqrt(2)+(max(3,7,1))^2 ")
+        evaluer.assert_not_called()
+        self.assertEqual(resultat, attendu)
+        self.assertEqual(self.memo.statistiques()['succes'], 1)
+
+    def test_expressions_non_pures(self):
+        """ANS, tirages et variables ne passent pas par la mémoire"""
+        session = Session(memo=self.memo, graine=1)
+        session.calculer("a = 2")
+        for expression in ("ANS + 1", "rand()", "a * 3"):
+            session.calculer(expression)
+        self.assertEqual(len(self.memo), 0)
+
+    def test_cle_par_mode_et_moteur(self):
+        """Le moteur (mode complexe, programmeur) fait partie de la clé"""
+        self.assertEqual(Session(memo=self.memo).calculer("7/2"), 3.5)
+        self.assertEqual(Session(mode_programmeur=True, memo=self.memo).calculer("7/2"), 3)
+        self.assertEqual(len(self.memo), 2)
+
+    def test_lru_et_version_des_noyaux(self):
+        """Taille bornée (LRU) ; changer de version des noyaux vide la mémoire"""
+        memo = MemoResultats(taille_max=2)
+        cles = [memo.cle([str(i)]) for i in range(3)]
+        memo.ajouter(cles[0], 0.0)
+        memo.ajouter(cles[1], 1.0)
+        memo.obtenir(cles[0])
+        memo.ajouter(cles[2], 2.0)
+        self.assertEqual((memo.obtenir(cles[0]), memo.obtenir(cles[1])), (0.0, None))
+        with mock.patch.object(calculateur, 'VERSION_NOYAUX', calculateur.VERSION_NOYAUX + 1):
+            self.assertIsNone(memo.obtenir(cles[2]))
+            self.assertEqual(len(memo), 0)
+
+    def test_prechauffer(self):
+        """Seules les opérations pures, de contexte connu et à jour, sont reprises"""
+        actuel = contexte(Session())
+        ancien = dict(actuel, noyaux=calculateur.VERSION_NOYAUX - 1)
+        operations = [
+            {'expression': "2 + 3", 'resultat': 5.0, 'contexte': actuel},
+            {'expression': "sqrt(2)", 'resultat': 1.4142135623730951},        # Contexte inconnu
+            {'expression': "ln(2)", 'resultat': 0.6931471805599453, 'contexte': ancien},
+            {'expression': "ANS + 1", 'resultat': 6.0, 'contexte': actuel},
+            {'expression': "2 + 2i", 'resultat': "2 + 2i", 'contexte': actuel},  # Texte affiché
+            {'expression': "a = 3", 'resultat': 3.0, 'contexte': actuel},
+        ]
+        self.assertEqual(self.memo.prechauffer(operations), 1)
+        with mock.patch('src.session.evaluer_rpn') as evaluer:
+            self.assertEqual(Session(memo=self.memo).calculer("3+2"), 5.0)
+        evaluer.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests unitaires pour le module mesures (instrumentation de calculer()).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import calculateur
+from src.exceptions import DivisionParZeroError
+from src.mesures import Histogramme
+
+
+class TestMesures(unittest.TestCase):
+    """Tests des mesures des étapes"""
+
+    def setUp(self):
+        calculateur.vider_cache_analyse()
+        calculateur.activer_mesures()
+
+    def tearDown(self):
+        calculateur.desactiver_mesures()
+        calculateur.vider_cache_analyse()
+
+    def test_etapes_tokens_et_erreurs(self):
+        """Chaque étape est mesurée ; un texte revu ne mesure que l'évaluation"""
+        calculateur.calculer("sqrt(2) * 3")
+        calculateur.calculer("sqrt(2) * 3")
+        self.assertRaises(DivisionParZeroError, calculateur.calculer, "1/0")
+
+        statistiques = calculateur.statistiques()
+        etapes = statistiques['etapes']
+        self.assertEqual(statistiques['calculs'], 3)
+        self.assertEqual(etapes['tokenize']['nombre'], 2)
+        self.assertEqual(etapes['evaluation']['nombre'], 2)
+        self.assertEqual(etapes['total']['nombre'], 2)
+        self.assertGreater(etapes['total']['somme'], 0)
+        self.assertEqual(statistiques['tokens']['nombre'], 2)
+        self.assertEqual(statistiques['erreurs'], {'DivisionParZeroError': 1})
+        self.assertEqual(statistiques['cache_analyse']['textes'], 1)
+
+    def test_exposition_prometheus(self):
+        """Histogrammes cumulés, sommes, comptes et compteurs d'erreurs"""
+        calculateur.calculer("2 + 3")
+        self.assertRaises(DivisionParZeroError, calculateur.calculer, "1/0")
+        texte = calculateur.exposition_prometheus()
+        self.assertIn("# TYPE calculatrice_etape_secondes histogram", texte)
+        self.assertIn('calculatrice_etape_secondes_bucket{etape="total",le="+Inf"} 1\n', texte)
+        self.assertIn('calculatrice_etape_secondes_count{etape="tokenize"} 2\n', texte)
+        self.assertIn('calculatrice_tokens_bucket{le="4.0"} 2\n', texte)
+        self.assertIn('calculatrice_erreurs_total{type="DivisionParZeroError"} 1\n', texte)
+        self.assertIn('calculatrice_cache_analyse_total{issue="analyses"} 2\n', texte)
+
+    def test_desactivees(self):
+        """Désactivées : rien n'est mesuré, le calcul est inchangé"""
+        calculateur.desactiver_mesures()
+        self.assertEqual(calculateur.calculer("2 + 3"), 5.0)
+        self.assertEqual(calculateur.statistiques(), {'actif': False})
+        self.assertEqual(calculateur.exposition_prometheus(), '')
+
+    def test_histogramme(self):
+        """Classes fixes et quantiles par borne supérieure"""
+        histogramme = Histogramme((1, 2, 4))
+        for valeur in (0.5, 1, 1.5, 3, 10):
+            histogramme.observer(valeur)
+        self.assertEqual(histogramme.comptes, [2, 1, 1, 1])
+        self.assertEqual(histogramme.quantile(0.5), 2)
+        self.assertEqual(histogramme.quantile(1), float('inf'))
+        self.assertIsNone(Histogramme((1,)).quantile(0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests unitaires pour le module polynomes (Horner et racines).
+"""
+
+import math
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer, tokenize, infix_to_rpn, evaluer_rpn
+from src.session import Session
+from src.polynomes import Polynome, coefficients, compiler, horner, racines
+from src.exceptions import ArgumentFonctionError
+from src import matrices
+
+
+def rpn(expression):
+    return infix_to_rpn(tokenize(expression))
+
+
+class TestPolynomes(unittest.TestCase):
+    """Tests de la reconnaissance et de l'évaluation des polynômes"""
+
+    def test_coefficients(self):
+        """Test coefficients d'une forme développée"""
+        self.assertEqual(coefficients(rpn("x^3 - 2*x + 1")), ('x', [1.0, -2.0, 0.0, 1.0]))
+        self.assertEqual(coefficients(rpn("-(3*t^2)/2 + sqr(t)")), ('t', [0.0, 0.0, -0.5]))
+        self.assertEqual(coefficients(rpn("x - x + 2")), (None, [2.0]))
+        for expression in ["x*y", "sin(x)", "x^0.5", "1/x", "x % 2"]:
+            self.assertIsNone(coefficients(rpn(expression)), expression)
+
+    def test_compiler_sous_expressions(self):
+        """Test seules les sous-expressions de degré >= 2 sont remplacées"""
+        compile = compiler(rpn("sin(x^2 + 1) + 2*x"))
+        self.assertIsInstance(compile[0], Polynome)
+        self.assertEqual(compile[0].coefficients, (1.0, 0.0, 1.0))
+        self.assertEqual(compile[1:], ['sin', '2', 'x', '*', '+'])
+        # Forme factorisée : gardée telle quelle (plus précise près de 1)
+        self.assertEqual(compiler(rpn("(x - 1)^10")), rpn("(x - 1)^10"))
+        # Dans un sous-programme (argument différé)
+        self.assertIsInstance(compiler(rpn("sigma(k^2 + k, k, 1, 3)"))[0][0], Polynome)
+
+    def test_horner_scalaire(self):
+        """Test Horner donne les mêmes valeurs que la RPN d'origine"""
+        for expression in ["x^3 - 2*x + 1", "0.5*x^4 - x^2/3 + PI", "-x^2 + 7*x"]:
+            for x in [-2.5, -1.0, 0.0, 0.3, 1.7, 10.0]:
+                attendu = evaluer_rpn(rpn(expression), variables={'x': x})
+                self.assertAlmostEqual(evaluer_rpn(compiler(rpn(expression)), variables={'x': x}), attendu)
+        self.assertEqual(horner([1.0, -2.0, 0.0, 1.0], 2.0), 5.0)
+        self.assertEqual(calculer("sigma(k^2, k, 1, 10)"), 385.0)
+
+    @unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+    def test_horner_vectoriel(self):
+        """Test Horner sur un tableau NumPy"""
+        from src.vectoriel import evaluer_points
+        xs = [-2.0, 0.0, 0.5, 3.0]
+        resultats = evaluer_points(compiler(rpn("x^3 - 2*x + 1")), 'x', xs)
+        self.assertEqual(resultats, [x ** 3 - 2 * x + 1 for x in xs])
+
+    def test_repli_sur_la_rpn_d_origine(self):
+        """Test matrice, complexe et mode programmeur gardent leur sens"""
+        session = Session(mode_programmeur=True)
+        session.calculer("a = 3")
+        self.assertEqual(session.calculer("a^2 + 7/2"), 12)
+        self.assertIsInstance(Session(mode_complexe=True).calculer("i^2"), float)
+        if matrices.NUMPY_DISPONIBLE:
+            session = Session()
+            session.calculer("m = [[1,2],[3,4]]")
+            self.assertEqual(session.calculer("m^2 + m").tolist(), [[8.0, 12.0], [18.0, 26.0]])
+
+    @unittest.skipUnless(matrices.NUMPY_DISPONIBLE, "NumPy non installé")
+    def test_roots(self):
+        """Test roots() : racines réelles croissantes"""
+        for racine, attendue in zip(calculer("roots(x^3 - 2*x + 1)"), [-1.618033988749895, 0.6180339887498949, 1.0]):
+            self.assertAlmostEqual(racine, attendue, places=12)
+        self.assertEqual(list(calculer("roots((x - 1)*(x + 2))")), [-2.0, 1.0])
+        self.assertEqual(len(calculer("roots(x^2 + 1)")), 0)
+        session = Session()
+        session.calculer("a = 2")
+        self.assertEqual(list(session.calculer("roots(a*x^2 - 8)")), [-2.0, 2.0])
+        self.assertEqual(sorted(z.imag for z in racines([1.0, 0.0, 1.0])), [-1.0, 1.0])
+
+    def test_roots_invalide(self):
+        """Test roots() d'une constante ou d'un non-polynôme"""
+        for expression in ["roots(5)", "roots(sin(x))", "roots(x*y)"]:
+            with self.assertRaises(ArgumentFonctionError):
+                calculer(expression)
+
+    def test_roots_degre_maximal(self):
+        """Test roots() au-delà du degré maximal : message qui nomme la limite"""
+        for expression in ["roots(x^40 - 1)", "roots((x + 1)^33)", "roots(x^20 * x^20 - 1)"]:
+            with self.assertRaisesRegex(ArgumentFonctionError, "degré supérieur au maximum"):
+                calculer(expression)
+        self.assertEqual(len(calculer("roots(x^32 - 1)")), 2)
+
+    def test_roots_zero_positif(self):
+        """Test roots(x) et roots(-x) rendent 0.0, pas -0.0"""
+        for expression in ["roots(x)", "roots(-x)", "roots(x^2 - x)"]:
+            zeros = [r for r in calculer(expression).tolist() if r == 0]
+            self.assertEqual([math.copysign(1.0, r) for r in zeros], [1.0], expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests unitaires pour le rapport de précision des noyaux (benchmarks.precision).
+"""
+
+import csv
+import io
+import math
+import unittest
+import sys
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+from decimal import Decimal
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import precision
+from src import calculateur
+
+
+class TestPrecision(unittest.TestCase):
+    """Tests des références, de l'erreur en ULP et du rapport"""
+
+    def test_erreur_ulp(self):
+        """Le flottant le plus proche est à moins d'un demi-ULP, son voisin à plus"""
+        self.assertAlmostEqual(precision.erreur_ulp(0.1, Decimal(1) / 10), 0.4)
+        self.assertAlmostEqual(precision.erreur_ulp(math.nextafter(0.1, 0), Decimal(1) / 10), 0.6)
+        self.assertEqual(precision.erreur_ulp(2.0, Decimal(2)), 0.0)
+
+    def test_references_trigonometriques(self):
+        """Les références (réduction par π à haute précision) s'accordent avec libm"""
+        for x in (1e-6, 0.5, -3.0, 1.5, 1234.5, -9999.0):
+            for noyau, fonction in (('sinus', math.sin), ('cosinus', math.cos), ('tangente', math.tan)):
+                exacte = precision._reference(noyau, (x,))
+                self.assertLessEqual(precision.erreur_ulp(fonction(x), exacte), 1.0, (noyau, x))
+
+    def test_perte_de_precision_detectee(self):
+        """exponentielle(50) : plus d'un million d'ULP pour le noyau, au plus un pour libm"""
+        exacte = precision._reference('exponentielle', (50.0,))
+        self.assertGreater(precision.erreur_ulp(calculateur.exponentielle(50.0), exacte), 1e6)
+        self.assertLessEqual(precision.erreur_ulp(math.exp(50.0), exacte), 1.0)
+
+    def test_resultats_aberrants_en_echecs(self):
+        """exp(-665) = -2.8e123 : compté en échec, le maximum et la moyenne restent finis"""
+        self.assertLess(calculateur.exponentielle(-665.0), 0)
+        lignes = precision.mesurer(['exponentielle'], ['calculatrice'], echantillons=5)
+        resume = precision.resumer(lignes)[0]
+        self.assertGreater(resume['echecs'], 0)
+        self.assertTrue(math.isfinite(resume['max_ulp']))
+        self.assertTrue(math.isfinite(resume['moyenne_ulp']))
+
+    def test_rapport_et_barriere(self):
+        """Une ligne par tranche dans le CSV ; --max-ulp échoue sur l'exponentielle"""
+        lignes = precision.mesurer(['racine_carree'], ['calculatrice', 'math'], echantillons=5)
+        self.assertEqual(len(lignes), 2 * len(precision.TRANCHES['racine_carree']))
+        self.assertTrue(all(ligne['ns_par_appel'] > 0 for ligne in lignes))
+        resume = {ligne['moteur']: ligne for ligne in precision.resumer(lignes)}
+        self.assertLessEqual(resume['math']['max_ulp'], 0.5)
+
+        with tempfile.TemporaryDirectory() as dossier:
+            fichier = str(Path(dossier) / 'precision.csv')
+            with redirect_stdout(io.StringIO()) as sortie, redirect_stderr(io.StringIO()):
+                code = precision.main(['--noyau', 'exponentielle', '--moteur', 'calculatrice',
+                                       '--echantillons', '5', '--csv', fichier, '--max-ulp', '4'])
+            with open(fichier, encoding='utf-8') as f:
+                rangees = list(csv.DictReader(f))
+        self.assertEqual(code, 1)
+        self.assertIn('exponentielle', sortie.getvalue())
+        self.assertEqual(len(rangees), len(precision.TRANCHES['exponentielle']))
+
+
+if __name__ == '__main__':
+    unittest.main()
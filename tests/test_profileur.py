@@ -0,0 +1,71 @@
+"""
+Tests unitaires pour le module profileur (profileur par échantillonnage).
+"""
+
+import io
+import unittest
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import profileur as module_profileur
+from src.console import main
+from src.profileur import Profileur, resume
+
+
+def travail_lent(duree):
+    """Boucle de calcul visible dans le profil."""
+    fin = time.perf_counter() + duree
+    total = 0
+    while time.perf_counter() < fin:
+        total += sum(i * i for i in range(1000))
+    return total
+
+
+class TestProfileur(unittest.TestCase):
+    """Tests du profileur"""
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.prefixe = str(Path(self.dossier.name) / 'profil')
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_piles_repliees_et_pstats(self):
+        """Les piles échantillonnées mènent à la fonction lente"""
+        with Profileur(intervalle=0.001) as profileur:
+            travail_lent(0.2)
+        self.assertFalse(profileur.actif)
+        self.assertGreater(profileur.echantillons, 10)
+
+        repliees, profil = profileur.ecrire(self.prefixe)
+        lignes = Path(repliees).read_text(encoding='utf-8').splitlines()
+        self.assertTrue(any('travail_lent (test_profileur.py:' in ligne for ligne in lignes))
+        self.assertEqual(sum(int(ligne.rsplit(' ', 1)[1]) for ligne in lignes), profileur.echantillons)
+        self.assertIn('travail_lent', resume(profil))
+
+    def test_taille_bornee(self):
+        """Au-delà de taille_max piles distinctes, les échantillons sont comptés à part"""
+        profileur = Profileur(taille_max=2)
+        for i in range(5):
+            profileur._ajouter(((__file__, i, f'f{i}'),))
+        self.assertEqual(len(profileur._piles), 3)
+        self.assertEqual(profileur._piles[module_profileur.PILE_PERDUE], 3)
+        self.assertEqual(profileur.echantillons, 5)
+
+    def test_option_console(self):
+        """python -m src --profil écrit les deux fichiers"""
+        sortie = io.StringIO()
+        self.assertEqual(main(['--profil', self.prefixe], io.StringIO("2 + 3\n"), sortie), 0)
+        self.assertEqual(sortie.getvalue(), "5.0\n")
+        self.assertTrue(Path(self.prefixe + '.folded').exists())
+        self.assertTrue(Path(self.prefixe + '.pstats').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests unitaires pour le mode programmeur (bases et opérations bit à bit).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer, tokenize
+from src.session import Session
+from src.programmeur import formater_entier, lire_entier
+from src.exceptions import ArgumentFonctionError
+
+
+class TestProgrammeur(unittest.TestCase):
+    """Tests du mode programmeur"""
+
+    def setUp(self):
+        self.session = Session(mode_programmeur=True)
+
+    def test_litteraux_bases(self):
+        """Test 0xFF, 0o17, 0b1010 sont des entiers exacts"""
+        self.assertEqual(tokenize("0xFF + 0b1010"), ['0xff', '+', '0b1010'])
+        resultat = calculer("0xFF + 0o17 + 0b1010")
+        self.assertEqual(resultat, 280)
+        self.assertIsInstance(resultat, int)
+
+    def test_operations_bits(self):
+        """Test and, or, xor, shl, shr et not"""
+        self.assertEqual(calculer("0b1100 and 0b1010"), 8)
+        self.assertEqual(calculer("0b1100 or 0b1010"), 14)
+        self.assertEqual(calculer("0b1100 xor 0b1010"), 6)
+        self.assertEqual(calculer("1 shl 4"), 16)
+        self.assertEqual(calculer("0x100 shr 4"), 16)
+        self.assertEqual(calculer("not 0"), -1)
+
+    def test_priorites(self):
+        """Test + avant shl avant and avant xor avant or"""
+        self.assertEqual(calculer("1 + 1 shl 2"), 8)
+        self.assertEqual(calculer("1 or 6 and 3"), 3)
+        self.assertEqual(calculer("0xFF and 0b1010 or not -1 shl 3"), 10)
+
+    def test_division_entiere(self):
+        """Test '/' entier en mode programmeur, réel sinon"""
+        self.assertEqual(self.session.calculer("7 / 2"), 3)
+        self.assertEqual(self.session.calculer("-7 / 2"), -4)
+        self.assertEqual(self.session.calculer("-7 % 3"), 2)
+        self.assertEqual(Session().calculer("7 / 2"), 3.5)
+
+    def test_grands_entiers_exacts(self):
+        """Test 2^10000 sans passage par float"""
+        self.assertEqual(self.session.calculer("2^10000 shr 9990"), 1024)
+        self.assertEqual(self.session.calculer("(1 shl 10000) - 1 and 0xFF"), 255)
+
+    def test_formater_dans_une_base(self):
+        """Test affichage du résultat dans la base de la session"""
+        self.session.base_affichage = 16
+        self.assertEqual(self.session.formater(self.session.calculer("255")), '0xff')
+        self.assertEqual(formater_entier(-10, 2), '-0b1010')
+        self.assertEqual(formater_entier(35, 36), 'z')
+
+    def test_conversions_aller_retour(self):
+        """Test formater_entier et lire_entier sur 10 000 bits"""
+        n = 3 ** 6300
+        for base in (10, 3, 16, 36):
+            texte = formater_entier(n, base, prefixe=False)
+            self.assertEqual(lire_entier(texte, base), n)
+        self.assertEqual(formater_entier(10 ** 5000, 10), '1' + '0' * 5000)
+
+    def test_operande_non_entier(self):
+        """Test 1.5 and 1 lève une erreur"""
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("1.5 and 1")
+        with self.assertRaises(ArgumentFonctionError):
+            calculer("1 shl -1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests unitaires pour le module regroupement (calculs simultanés d'une même formule).
+"""
+
+import unittest
+import sys
+import threading
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.regroupement import Regroupeur
+from src.calculateur import calculer
+from src.exceptions import CalculatriceError, DivisionParZeroError
+from src import vectoriel
+
+
+def en_parallele(fonction, arguments):
+    """Appelle fonction(*a) pour chaque a, chacun dans son thread, en même temps."""
+    resultats = [None] * len(arguments)
+    depart = threading.Barrier(len(arguments))
+
+    def appel(i):
+        depart.wait()
+        try:
+            resultats[i] = fonction(*arguments[i])
+        except CalculatriceError as e:
+            resultats[i] = e
+
+    threads = [threading.Thread(target=appel, args=(i,)) for i in range(len(arguments))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return resultats
+
+
+class TestRegroupement(unittest.TestCase):
+    """Tests du Regroupeur"""
+
+    def test_appel_seul(self):
+        """Test un appel seul donne le résultat de calculer()"""
+        regroupeur = Regroupeur(fenetre=0)
+        self.assertEqual(regroupeur.calculer("x^2 + 1", {'x': 3}), 10.0)
+        self.assertEqual(regroupeur.calculer("2 + 3"), 5.0)
+        with self.assertRaises(DivisionParZeroError):
+            regroupeur.calculer("1/x", {'x': 0})
+
+    def test_appels_simultanes(self):
+        """Test les appels simultanés sont regroupés et reçoivent chacun leur valeur"""
+        regroupeur = Regroupeur(fenetre=0.2)
+        arguments = [("p * (1 + t)^n", {'p': 100.0, 't': 0.05, 'n': float(n)}) for n in range(20)]
+        resultats = en_parallele(regroupeur.calculer, arguments)
+        for (expression, variables), resultat in zip(arguments, resultats):
+            self.assertAlmostEqual(resultat, calculer(expression, variables=variables), places=9)
+        statistiques = regroupeur.statistiques()
+        self.assertEqual(statistiques['appels'], 20)
+        self.assertLess(statistiques['lots'], 20)
+        if vectoriel.NUMPY_DISPONIBLE:
+            self.assertGreater(statistiques['vectorises'], 0)
+
+    def test_erreurs_par_appel(self):
+        """Test une erreur ne touche que l'appel concerné"""
+        regroupeur = Regroupeur(fenetre=0.2)
+        resultats = en_parallele(regroupeur.calculer, [("1/x", {'x': x}) for x in [1.0, 0.0, 4.0]])
+        self.assertEqual(resultats[0], 1.0)
+        self.assertIsInstance(resultats[1], DivisionParZeroError)
+        self.assertEqual(resultats[2], 0.25)
+
+    def test_taille_max(self):
+        """Test un lot plein est évalué sans attendre la fin de la fenêtre"""
+        regroupeur = Regroupeur(fenetre=60, taille_max=4)
+        resultats = en_parallele(regroupeur.calculer, [("2*x", {'x': float(x)}) for x in range(8)])
+        self.assertEqual(resultats, [2.0 * x for x in range(8)])
+        self.assertEqual(regroupeur.statistiques()['taux'], 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests unitaires pour le module serveur (service de calcul en JSON lines).
+"""
+
+import unittest
+import sys
+import asyncio
+import os
+import signal
+import tempfile
+import operator
+from pathlib import Path
+from unittest import mock
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.serveur import Serveur, Client, generer_charge, _calculer, _Tache, _Journal
+
+
+@unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), "Sockets Unix non disponibles")
+class TestServeur(unittest.IsolatedAsyncioTestCase):
+    """Tests du serveur et de son client"""
+
+    async def asyncSetUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, 'calculatrice.sock')
+        self.serveur = Serveur(processus=2, delai=2.0)
+        await self.serveur.demarrer(chemin=self.chemin)
+
+    async def asyncTearDown(self):
+        await self.serveur.arreter()
+        self.dossier.cleanup()
+
+    async def test_calcul_et_erreurs(self):
+        """Test résultat, variables et erreurs par requête"""
+        client = await Client.connecter(self.chemin)
+        reponses = await asyncio.gather(
+            client.calculer("x^2 + a", variables={'x': 3, 'a': 1}),
+            client.calculer("1/0"),
+            client.calculer("2 +"),
+        )
+        self.assertEqual(reponses[0], {'id': 1, 'resultat': 10.0, 'erreur': None})
+        self.assertIn("Division par zéro", reponses[1]['erreur'])
+        self.assertIsNone(reponses[2]['resultat'])
+        self.assertIsNotNone(reponses[2]['erreur'])
+        reponse = await client.calculer("1", variables={'x': "3"})
+        self.assertIn("variables", reponse['erreur'])
+        await client.fermer()
+
+    async def test_etat_par_client(self):
+        """Test ANS, définitions et modes propres à chaque client et session"""
+        premier = await Client.connecter(self.chemin)
+        second = await Client.connecter(self.chemin)
+        await premier.calculer("a = 5")
+        await premier.calculer("10 * 2")
+        await second.calculer("7")
+        self.assertEqual((await premier.calculer("ANS + a"))['resultat'], 25.0)
+        self.assertEqual((await second.calculer("ANS"))['resultat'], 7.0)
+        self.assertIsNotNone((await second.calculer("a"))['erreur'])
+
+        reponse = await premier.calculer("sqrt(-4)", mode={'complexe': True}, session="feuille")
+        self.assertEqual(reponse['resultat'], "2i")
+        self.assertEqual((await premier.calculer("sqrt(-9)", session="feuille"))['resultat'], "3i")
+        self.assertIsNotNone((await premier.calculer("sqrt(-9)"))['erreur'])
+        self.assertEqual((await premier.calculer("7 / 2", mode={'programmeur': True}))['resultat'], 3)
+        await premier.fermer()
+        await second.fermer()
+
+    async def test_budget(self):
+        """Test un calcul hors budget reçoit une erreur, le service continue"""
+        client = await Client.connecter(self.chemin)
+        reponse = await client.calculer("sigma(k, k, 1, 100000000)", budget=0.2)
+        self.assertIn("Budget", reponse['erreur'])
+        self.assertEqual((await client.calculer("2 + 2"))['resultat'], 4.0)
+        for budget in (0, -1, 0.001, "1", True):
+            reponse = await client.calculer("2 + 3", budget=budget)
+            self.assertIn("'budget'", reponse['erreur'])
+        await client.fermer()
+
+    async def test_budget_sessions_preservees(self):
+        """Test le budget d'un client ne coûte pas leurs sessions aux autres"""
+        chemin = os.path.join(self.dossier.name, 'unique.sock')
+        serveur = Serveur(processus=1, delai=10.0)  # Toutes les sessions dans un processus
+        await serveur.demarrer(chemin=chemin)
+        premier = await Client.connecter(chemin)
+        second = await Client.connecter(chemin)
+        try:
+            await premier.calculer("v = 42")
+            await premier.calculer("sqrt(-4)", mode={'complexe': True})
+            reponse = await second.calculer("sigma(k, k, 1, 100000000)", budget=0.2)
+            self.assertIn("Budget", reponse['erreur'])
+            self.assertEqual((await premier.calculer("v + 1"))['resultat'], 43.0)
+
+            # L'attente derrière un calcul long ne compte pas dans le budget
+            long, court = await asyncio.gather(
+                second.calculer("sigma(k, k, 1, 1000000)", budget=10),
+                premier.calculer("2 + 2", budget=0.1),
+            )
+            self.assertIsNone(long['erreur'])
+            self.assertEqual(court['resultat'], 4.0)
+
+            # Calcul que SIGALRM n'interrompt pas : son processus est arrêté,
+            # les sessions reconstruites et le calcul en attente soumis à nouveau
+            serveur.travailleurs[0].executeur.submit(signal.signal, signal.SIGALRM, signal.SIG_IGN).result()
+            bloque, suivant = await asyncio.gather(
+                second.calculer("sigma(k, k, 1, 100000000)", budget=0.2),
+                premier.calculer("w = v + 1"),
+            )
+            self.assertIn("Budget", bloque['erreur'])
+            self.assertEqual(suivant['resultat'], 43.0)
+            self.assertEqual((await premier.calculer("w + ANS"))['resultat'], 86.0)
+            self.assertEqual((await premier.calculer("sqrt(-9)"))['resultat'], "3i")
+        finally:
+            await premier.fermer()
+            await second.fermer()
+            await serveur.arreter()
+
+    async def test_exception_hors_calculatrice(self):
+        """Test une exception imprévue du processus reçoit une réponse d'erreur"""
+        with mock.patch('src.serveur.calculer_un', side_effect=MemoryError):
+            resultat, erreur, ans, definition = _calculer((0, 'défaut'), "sigma(k, k, 1, 10^9)", None, {}, 1.0)
+        self.assertIsNone(resultat)
+        self.assertIn("MemoryError", erreur)
+
+        travailleur = self.serveur.travailleurs[0]
+        tache = _Tache((operator.getitem, {}, 'absente'))  # KeyError dans le processus
+        travailleur._soumettre(tache)
+        resultat, erreur, ans, definition = await travailleur._attendre(tache, 1.0, _Journal())
+        self.assertIsNone(resultat)
+        self.assertIn("KeyError", erreur)
+
+        client = await Client.connecter(self.chemin)
+        self.assertEqual((await client.calculer("2 + 2"))['resultat'], 4.0)
+        await client.fermer()
+
+    async def test_charge(self):
+        """Test le générateur de charge mesure débit et latences"""
+        rapport = await generer_charge(self.chemin, requetes=200, connexions=4)
+        self.assertEqual(rapport['requetes'], 200)
+        self.assertEqual(rapport['erreurs'], 0)
+        self.assertLessEqual(rapport['p50_ms'], rapport['p99_ms'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Tests unitaires pour le module session (variables et fonctions de l'utilisateur).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.session import Session
+from src.exceptions import ExpressionInvalideError, ArgumentFonctionError
+
+
+class TestSession(unittest.TestCase):
+    """Tests de la classe Session"""
+
+    def setUp(self):
+        self.session = Session()
+
+    def test_definir_variable(self):
+        """Test a = 3 retourne la valeur et la mémorise"""
+        self.assertEqual(self.session.calculer("a = 3"), 3.0)
+        self.assertEqual(self.session.calculer("a * 2"), 6.0)
+
+    def test_definir_fonction(self):
+        """Test f(x) = x^2 + 1 puis appel"""
+        self.assertIsNone(self.session.calculer("f(x) = x^2 + 1"))
+        self.assertEqual(self.session.calculer("f(3)"), 10.0)
+        self.assertEqual(self.session.calculer("f(f(1))"), 5.0)
+
+    def test_fonction_plusieurs_parametres(self):
+        """Test g(x, y) qui appelle f"""
+        self.session.calculer("f(x) = x^2")
+        self.session.calculer("g(x, y) = f(x) + y")
+        self.assertEqual(self.session.calculer("g(3, 1)"), 10.0)
+
+    def test_redefinition_recalcule_dependants(self):
+        """Test redéfinir a met à jour b, f et les résultats en cache"""
+        self.session.calculer("a = 3")
+        self.session.calculer("b = a * 2")
+        self.session.calculer("f(x) = x + b")
+        self.assertEqual(self.session.calculer("f(1)"), 7.0)
+
+        self.session.calculer("a = 10")
+        self.assertEqual(self.session.calculer("b"), 20.0)
+        self.assertEqual(self.session.calculer("f(1)"), 21.0)
+
+    def test_redefinition_garde_independants(self):
+        """Test seules les valeurs dépendantes sont invalidées"""
+        self.session.calculer("a = 3")
+        self.session.calculer("c = 5")
+        self.session.calculer("c + 1")
+        self.session.calculer("a = 4")
+        self.assertIn(("c", False), self.session._valeurs)
+        self.assertIn(("c + 1", False), self.session._resultats)
+
+    def test_definition_circulaire(self):
+        """Test a = b + 1 quand b dépend de a"""
+        self.session.calculer("a = 1")
+        self.session.calculer("b = a + 1")
+        with self.assertRaises(ExpressionInvalideError):
+            self.session.calculer("a = b + 1")
+        # La session est intacte
+        self.assertEqual(self.session.calculer("b"), 2.0)
+
+    def test_corps_de_fonction_invalide(self):
+        """Test q(x) = x + refusé à la définition, l'ancien q conservé"""
+        self.session.calculer("q(x) = 2 * x")
+        for definition in ["q(x) = x +", "q(x) = x y", "q(x, y) = min(x, )"]:
+            with self.assertRaises(ExpressionInvalideError):
+                self.session.calculer(definition)
+        self.assertEqual(self.session.calculer("q(2)"), 4.0)
+
+    def test_noms_reserves(self):
+        """Test impossible de redéfinir sin, PI ou ANS"""
+        for definition in ["sin(x) = x", "PI = 3", "ANS = 1", "f(E) = 1"]:
+            with self.assertRaises(ExpressionInvalideError):
+                self.session.calculer(definition)
+
+    def test_mauvais_nombre_arguments(self):
+        """Test f(1, 2) pour f à un paramètre"""
+        self.session.calculer("f(x) = x")
+        with self.assertRaises(ArgumentFonctionError):
+            self.session.calculer("f(1, 2)")
+
+    def test_fonction_inconnue(self):
+        """Test appel d'une fonction non définie"""
+        with self.assertRaises(ExpressionInvalideError):
+            self.session.calculer("h(2)")
+
+    def test_ans_de_la_session(self):
+        """Test ANS suit les calculs de la session (jamais mis en cache)"""
+        self.session.calculer("2 + 3")
+        self.assertEqual(self.session.calculer("ANS * 2"), 10.0)
+        self.assertEqual(self.session.calculer("ANS * 2"), 20.0)
+
+    def test_fonction_dans_sigma(self):
+        """Test fonction de l'utilisateur dans sigma"""
+        self.session.calculer("f(k) = 2*k")
+        self.assertEqual(self.session.calculer("sigma(f(k), k, 1, 4)"), 20.0)
+
+    def test_cache_borne(self):
+        """Test taille_cache oublie les expressions les plus anciennes"""
+        session = Session(taille_cache=2)
+        session.calculer("a = 1")
+        for expression in ["a + 1", "a + 2", "a + 3"]:
+            session.calculer(expression)
+        self.assertEqual(list(session._programmes), ["a + 2", "a + 3"])
+        self.assertEqual(set(session._resultats), {("a + 2", False), ("a + 3", False)})
+        session.calculer("a = 10")
+        self.assertEqual(session.calculer("a + 1"), 11.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -141,6 +141,18 @@ class TestValidateur(unittest.TestCase):
         self.assertFalse(valide)
         self.assertIn("début", msg.lower())
     
+    def test_variable_en_debut(self):
+        """Test une variable de session en tête, suivie d'un opérateur"""
+        for expression in ["a*2", "x * 2", "rayon^2", "sqrt(4)*2"]:
+            valide, msg = self.validateur.valider_expression(expression)
+            self.assertTrue(valide, f"{expression} : {msg}")
+    
+    def test_unite_imaginaire_et_constantes_en_debut(self):
+        """Test i, PI, E et ANS en tête d'expression"""
+        for expression in ["i*2", "i*PI", "PI/2", "E^2", "ANS%3"]:
+            valide, msg = self.validateur.valider_expression(expression)
+            self.assertTrue(valide, f"{expression} : {msg}")
+    
     def test_operateur_apres_parenthese_ouvrante(self):
         """Test opérateur invalide après parenthèse ouvrante"""
         valide, msg = self.validateur.valider_expression("(* 5)")
@@ -152,6 +164,42 @@ class TestValidateur(unittest.TestCase):
         self.assertFalse(valide)
         self.assertIn("avant ')'", msg)
 
+    
+    # ========== Tests des virgules (séparateurs d'arguments) ==========
+    
+    def test_appels_plusieurs_arguments(self):
+        """Test la virgule sépare les arguments, même au-delà de deux"""
+        for expression in ["min(1, 2, 3)", "sum(1,2,3)", "mean(1.5, 2, 3)", "max(1,5, 2.25, 7)"]:
+            valide, msg = self.validateur.valider_expression(expression)
+            self.assertTrue(valide, f"{expression} : {msg}")
+    
+    def test_virgule_decimale_refusee(self):
+        """Test une virgule hors d'un appel n'est pas une virgule décimale"""
+        valide, msg = self.validateur.valider_expression("1,5 + 1")
+        self.assertFalse(valide)
+        self.assertIn("Virgule", msg)
+        valide, msg = self.validateur.valider_expression("min(1.2.3, 4)")
+        self.assertFalse(valide)
+        self.assertIn("1.2.3", msg)
+
+    
+    def test_matrices_trois_elements(self):
+        """Test les littéraux de matrice de trois éléments ou plus"""
+        for expression in ["[1, 2, 3]", "[[1,2,3],[4,5,6]]", "dot([1,2,3],[4,5,6])", "det([[1,2,3],[4,5,6],[7,8,10]])"]:
+            valide, msg = self.validateur.valider_expression(expression)
+            self.assertTrue(valide, f"{expression} : {msg}")
+    
+    def test_arithmetique_plusieurs_arguments(self):
+        """Test gcd, lcm et powmod à trois arguments"""
+        for expression in ["gcd(12,18,24)", "lcm(4, 6, 10)", "powmod(2,10,1000)"]:
+            valide, msg = self.validateur.valider_expression(expression)
+            self.assertTrue(valide, f"{expression} : {msg}")
+    
+    def test_conditionnelles_plusieurs_arguments(self):
+        """Test if et piecewise, arguments numériques ou comparaisons"""
+        for expression in ["if(1,2,3)", "if(2 > 1, 10, 20)", "piecewise(0,1,1,2,3)", "piecewise(1 < 0, 1, 2 >= 2, 2, 3)"]:
+            valide, msg = self.validateur.valider_expression(expression)
+            self.assertTrue(valide, f"{expression} : {msg}")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Tests unitaires pour le module vectoriel (évaluation NumPy).
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.calculateur import calculer, tokenize, infix_to_rpn
+from src import vectoriel
+from src.session import Session
+
+E_APPROX = 2.718281828459045
+
+
+@unittest.skipUnless(vectoriel.NUMPY_DISPONIBLE, "NumPy non installé")
+class TestVectoriel(unittest.TestCase):
+    """Tests du module vectoriel"""
+    
+    def evaluer(self, expression, **variables):
+        rpn = infix_to_rpn(tokenize(expression))
+        return vectoriel.evaluer_rpn_vectoriel(rpn, variables)
+    
+    def test_meme_resultat_que_scalaire(self):
+        """Test cohérence avec calculer() valeur par valeur"""
+        xs = [0.5, 1.0, 2.0, 3.5]
+        resultats = self.evaluer("x^3 - 2*x + sqrt(x) + max(x, 2, 1)", x=xs)
+        for x, y in zip(xs, resultats):
+            self.assertAlmostEqual(y, calculer("x^3 - 2*x + sqrt(x) + max(x, 2, 1)", variables={'x': x}))
+    
+    def test_erreurs_de_domaine_en_nan(self):
+        """Test sqrt(-1), ln(0), 1/0 donnent NaN au lieu d'une exception"""
+        resultats = self.evaluer("sqrt(x) + ln(x) + 1/x", x=[-1.0, 0.0, 1.0])
+        self.assertTrue(vectoriel.np.isnan(resultats[0]))
+        self.assertTrue(vectoriel.np.isnan(resultats[1]))
+        self.assertEqual(resultats[2], 2.0)
+    
+    def test_sigma_vectorise(self):
+        """Test sigma avec une variable extérieure en tableau"""
+        resultats = self.evaluer("sigma(x^k, k, 0, 3)", x=[1.0, 2.0])
+        self.assertEqual(list(resultats), [4.0, 15.0])
+    
+    def test_sigma_vectorise_par_blocs(self):
+        """Test sigma et prod vectorisés sur plusieurs blocs d'indices"""
+        n = 100000
+        resultats = self.evaluer(f"sigma(x*k, k, 1, {n})", x=[1.0, 2.0])
+        self.assertEqual(list(resultats), [n * (n + 1) / 2, n * (n + 1)])
+        resultats = self.evaluer(f"prod(1 + x*(k == {n}), k, 1, {n})", x=[1.0, 2.0])
+        self.assertEqual(list(resultats), [2.0, 3.0])
+    
+    def test_if_par_masques(self):
+        """Test chaque branche n'est calculée que sur ses éléments"""
+        resultats = self.evaluer("if(x > 0, ln(x), 0)", x=[-1.0, 1.0, E_APPROX])
+        self.assertEqual(resultats[0], 0.0)
+        self.assertEqual(resultats[1], 0.0)
+        self.assertAlmostEqual(resultats[2], 1.0)
+    
+    def test_piecewise_sans_defaut(self):
+        """Test piecewise : NaN quand aucune condition n'est vraie"""
+        resultats = self.evaluer("piecewise(x < 0, -x, x < 1, x^2)", x=[-2.0, 0.5, 3.0])
+        self.assertEqual(list(resultats[:2]), [2.0, 0.25])
+        self.assertTrue(vectoriel.np.isnan(resultats[2]))
+    
+    def test_evaluer_points(self):
+        """Test évaluation des points d'un graphique"""
+        rpn = infix_to_rpn(tokenize("exp(x) + max(x, 1)"))
+        ys = vectoriel.evaluer_points(rpn, 'x', [0.0, 1.0])
+        self.assertEqual(ys[0], 2.0)
+        self.assertAlmostEqual(ys[1], 3.718281828459045)
+
+    def test_evaluer_points_avec_session(self):
+        """Test tracé d'une fonction et d'une variable de l'utilisateur"""
+        session = Session()
+        session.calculer("a = 3")
+        session.calculer("f(x) = if(x > 0, ln(x), a)")
+        rpn = infix_to_rpn(tokenize("2*f(x)"))
+        ys = vectoriel.evaluer_points(rpn, 'x', [-1.0, 1.0], session=session)
+        self.assertEqual(ys, [6.0, 0.0])
+
+    def test_somme_compensee(self):
+        """Test somme compensée sans perte d'arrondi"""
+        valeurs = vectoriel.np.array([1e16, 1.0, -1e16] * 3)
+        self.assertEqual(vectoriel.somme_compensee_tableau(valeurs), 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()